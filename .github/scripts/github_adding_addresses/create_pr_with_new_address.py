@@ -9,7 +9,7 @@ import os
 import pathlib
 import re
 import subprocess
-from typing import Optional
+from typing import Any, List, Optional
 
 import requests
 from github import Github, InputGitTreeElement
@@ -17,6 +17,8 @@ from github.GithubException import GithubException
 from github.Repository import Repository
 
 from safe_eth.eth import EthereumClient
+from safe_eth.eth.utils import fast_to_checksum_address
+from safe_eth.safe.addresses import dump_addresses_json
 
 
 def convert_chain_name(name: str) -> str:
@@ -197,6 +199,42 @@ def upsert_explorer_client_url(
         print("Error: Class definition not found in the file.")
 
 
+def upsert_contract_address(
+    repo: Repository,
+    branch_name: str,
+    table_name: str,
+    chain_enum_name: str,
+    new_entry: List[Any],
+    commit_message: str,
+) -> None:
+    """
+    Add ``new_entry`` to the ``table_name`` table of ``addresses.json`` for ``chain_enum_name``,
+    if it's not already there. Address (first element of the entry) is stored checksummed
+    """
+    file_path = "safe_eth/safe/addresses.json"
+    file = repo.get_contents(file_path, ref=branch_name)
+    addresses = json.loads(file.decoded_content.decode("utf-8"))
+
+    if table_name not in addresses:
+        print(f"Error: {table_name} definition not found in the file.")
+        return None
+
+    new_entry = [fast_to_checksum_address(new_entry[0])] + new_entry[1:]
+    entries = addresses[table_name].setdefault(chain_enum_name, [])
+    if new_entry in entries:
+        print(f"Entry {new_entry} in chain {chain_enum_name} already exists.")
+        return None
+
+    entries.append(new_entry)
+    repo.update_file(
+        file_path,
+        commit_message,
+        dump_addresses_json(addresses),
+        file.sha,
+        branch_name,
+    )
+
+
 def upsert_contract_address_master_copy(
     repo: Repository,
     branch_name: str,
@@ -205,87 +243,18 @@ def upsert_contract_address_master_copy(
     block_number: int,
     version: str,
 ) -> None:
-    file_path = "safe_eth/safe/addresses.py"
-    file = repo.get_contents(file_path, ref=branch_name)
-    content = file.decoded_content.decode("utf-8")
-
     print(
         f"Updating Master Copy address chain {chain_enum_name} address '{address}' and block_number {block_number}"
     )
-
-    match_network = re.search(
-        r"(MASTER_COPIES: Dict\[EthereumNetwork, List\[Tuple\[str, int, str]]] = \{.+EthereumNetwork\."
-        + re.escape(chain_enum_name)
-        + r": \[)(.+?)(].+PROXY_FACTORIES.+)",
-        content,
-        re.MULTILINE | re.DOTALL,
+    upsert_contract_address(
+        repo,
+        branch_name,
+        "master_copies",
+        chain_enum_name,
+        [address, block_number, version],
+        f"Add new master copy address {address}",
     )
 
-    if match_network:
-        match_contract = re.search(
-            r"(\(\n?\s*\""
-            + re.escape(address)
-            + r"\",\n?\s*"
-            + re.escape(str(block_number))
-            + r",\n?\s*\""
-            + re.escape(version)
-            + r"\",?\n?\s*\))",
-            match_network.group(2),
-            re.MULTILINE | re.DOTALL,
-        )
-
-        if match_contract:
-            print(
-                f"Entry in chain {chain_enum_name} with address '{address}' and block_number {block_number}"
-                + f" and version {version} already exists."
-            )
-        else:
-            new_entry = (
-                f'    ("{address}", {block_number}, "{version}"),  # v{version}\n    '
-            )
-            updated_content = (
-                content[: match_network.start()]
-                + match_network.group(1)
-                + match_network.group(2)
-                + new_entry
-                + match_network.group(3)
-            )
-            repo.update_file(
-                file_path,
-                f"Add new master copy address {address}",
-                updated_content,
-                file.sha,
-                branch_name,
-            )
-    else:
-        match = re.search(
-            r"(MASTER_COPIES: Dict\[EthereumNetwork, List\[Tuple\[str, int, str]]] = \{)(.+?)(}.+PROXY_FACTORIES.+)",
-            content,
-            re.MULTILINE | re.DOTALL,
-        )
-
-        if match:
-            new_entry = (
-                f'    EthereumNetwork.{chain_enum_name}: [\n        ("{address}", {block_number}, '
-                + f'"{version}"),  # v{version}\n    ],\n'
-            )
-            updated_content = (
-                content[: match.start()]
-                + match.group(1)
-                + match.group(2)
-                + new_entry
-                + match.group(3)
-            )
-            repo.update_file(
-                file_path,
-                f"Add new master copy address {address}",
-                updated_content,
-                file.sha,
-                branch_name,
-            )
-        else:
-            print("Error: MASTER_COPIES definition not found in the file.")
-
 
 def upsert_contract_address_proxy_factory(
     repo: Repository,
@@ -295,83 +264,19 @@ def upsert_contract_address_proxy_factory(
     block_number: int,
     version: str,
 ) -> None:
-    file_path = "safe_eth/safe/addresses.py"
-    file = repo.get_contents(file_path, ref=branch_name)
-    content = file.decoded_content.decode("utf-8")
-    version = version.replace("+L2", "")
     print(
         f"Updating Proxy Factory address chain {chain_enum_name} address '{address}' and block_number {block_number}"
     )
-
-    match_network = re.search(
-        r"(PROXY_FACTORIES: Dict\[EthereumNetwork, List\[Tuple\[str, int]]] = \{.+EthereumNetwork\."
-        + re.escape(chain_enum_name)
-        + r": \[)(.+?)(].+)",
-        content,
-        re.MULTILINE | re.DOTALL,
+    # Version is not stored for proxy factories
+    upsert_contract_address(
+        repo,
+        branch_name,
+        "proxy_factories",
+        chain_enum_name,
+        [address, block_number],
+        f"Add new proxy address {address}",
     )
 
-    if match_network:
-        match_contract = re.search(
-            r"(\(\n?\s*\""
-            + re.escape(address)
-            + r"\",\n?\s*"
-            + re.escape(str(block_number))
-            + r",?\n?\s*\))",
-            match_network.group(2),
-            re.MULTILINE | re.DOTALL,
-        )
-
-        if match_contract:
-            print(
-                f"Entry in chain {chain_enum_name} with address '{address}' and block_number {block_number}"
-                + " already exists."
-            )
-        else:
-            new_entry = f'    ("{address}", {block_number}), # v{version}\n    '
-            updated_content = (
-                content[: match_network.start()]
-                + match_network.group(1)
-                + match_network.group(2)
-                + new_entry
-                + match_network.group(3)
-            )
-            repo.update_file(
-                file_path,
-                f"Add new proxy address {address}",
-                updated_content,
-                file.sha,
-                branch_name,
-            )
-    else:
-        match = re.search(
-            r"(PROXY_FACTORIES: Dict\[EthereumNetwork, List\[Tuple\[str, int]]] = \{)(.+?)(}.+)",
-            content,
-            re.MULTILINE | re.DOTALL,
-        )
-
-        if match:
-            new_entry = (
-                f'    EthereumNetwork.{chain_enum_name}: [\n        ("{address}", {block_number}'
-                + f"),  # v{version}\n    ],\n"
-            )
-            updated_content = (
-                content[: match.start()]
-                + match.group(1)
-                + match.group(2)
-                + new_entry
-                + match.group(3)
-            )
-            repo.update_file(
-                file_path,
-                f"Add new proxy address {address}",
-                updated_content,
-                file.sha,
-                branch_name,
-            )
-        else:
-            print("Error: PROXY_FACTORIES definition not found in the file.")
-
 
 def execute_issue_changes() -> None:
     github_token = os.environ.get("GITHUB_TOKEN")
@@ -4,6 +4,7 @@ from .async_ethereum_client import (
     get_auto_async_ethereum_client,
 )
 from .ethereum_client import (
+    BatchCallStrategy,
     EthereumClient,
     EthereumTxSent,
     FromAddressNotFound,
@@ -28,6 +29,7 @@ __all__ = [
     "AsyncEthereumClient",
     "get_auto_ethereum_client",
     "get_auto_async_ethereum_client",
+    "BatchCallStrategy",
     "EthereumTxSent",
     "FromAddressNotFound",
     "GasLimitExceeded",
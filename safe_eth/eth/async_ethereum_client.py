@@ -14,22 +14,27 @@ the inherited blocking ``w3``/``requests`` session.
 
 ``batch_call``/``batch_call_same_function`` mirror the sync dispatch: they use
 ``Multicall`` (via :class:`~safe_eth.eth.multicall.AsyncMulticall`) when available
-unless ``force_batch_call=True``, falling back to the JSON-RPC ``eth_call`` batch
-path otherwise — so results match the sync client, including raw revert bytes for
+following ``strategy`` (unless ``force_batch_call=True``), falling back to the
+JSON-RPC ``eth_call`` batch path otherwise — so results match the sync client, including raw revert bytes for
 failed calls on the Multicall path.
 """
 
 import asyncio
 import os
-from functools import cache, cached_property, wraps
+import time
+from functools import cache, cached_property, partial, wraps
 from logging import getLogger
 from typing import (
     Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
     Dict,
     List,
     Optional,
     Sequence,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -53,6 +58,7 @@ from web3.types import (
     BlockData,
     BlockIdentifier,
     BlockTrace,
+    FilterParams,
     FilterTrace,
     Nonce,
     TxData,
@@ -71,8 +77,10 @@ from safe_eth.util import chunks
 from ..util.util import to_0x_hex_str
 from .constants import SAFE_SINGLETON_FACTORY_ADDRESS
 from .contracts import get_erc20_contract, get_erc721_contract
+from .contracts.call_builders import ERC20_CALLS, ERC721_CALLS, ContractCall
 from .ethereum_client import (
     BatchCallManager,
+    BatchCallStrategy,
     Erc20Info,
     Erc20Manager,
     Erc721Info,
@@ -80,18 +88,26 @@ from .ethereum_client import (
     EthereumClient,
     EthereumClientManager,
     EthereumTxSent,
+    TraceFilterRequest,
+    TraceTree,
     TracingManager,
+    TransferHistoryWindow,
     TxSpeed,
     build_eth_call_queries,
     build_jsonrpc_batch_payload,
     decode_eth_call_results,
+    is_batch_too_large_error,
+    is_too_many_results_error,
     map_tx_exception,
+    plan_block_windows,
     process_raw_batch_results,
+    resolve_batch_call_strategy,
     validate_batch_chunk,
 )
 from .ethereum_network import EthereumNetwork, EthereumNetworkNotSupported
 from .exceptions import (
     BatchCallFunctionFailed,
+    BatchRequestTooLarge,
     ContractAlreadyDeployed,
     InvalidERC20Info,
     InvalidERC721Info,
@@ -104,6 +120,9 @@ from .utils import decode_string_or_bytes32
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def async_tx_with_exception_handling(func):
     """Async counterpart of ``tx_with_exception_handling``."""
@@ -135,35 +154,62 @@ class AsyncBatchCallManager(BatchCallManager, AsyncEthereumClientManager):
         raise_exception: bool = True,
         block_identifier: Optional[BlockIdentifier] = "latest",
         batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[Optional[Any]]:
         payloads = list(payloads)
         if not payloads:
             return []
 
         queries = build_eth_call_queries(payloads, block_identifier)
-        batch_size = batch_size or self.ethereum_client.batch_request_max_size
-        session = await self.ethereum_client.get_async_session()
         all_results: List[Any] = []
-        for chunk in chunks(queries, batch_size):
-            async with session.post(
-                self.ethereum_node_url,
-                json=chunk,
-                timeout=aiohttp.ClientTimeout(total=self.slow_timeout),
-            ) as response:
-                if not response.ok:
-                    raise ConnectionError(
-                        f"Error connecting to {self.ethereum_node_url}: {await response.text()}"
-                    )
-                all_results.extend(validate_batch_chunk(await response.json(), chunk))
+        for chunk_results in await self.ethereum_client.async_batch_request_chunks(
+            self._async_batch_call_chunk, queries, batch_size, max_concurrency
+        ):
+            all_results.extend(chunk_results)
 
         return_values, errors = decode_eth_call_results(payloads, all_results)
         if errors and raise_exception:
             raise BatchCallFunctionFailed(f"Errors returned {errors}")
         return return_values
 
+    async def async_batch_request_responses(
+        self,
+        payload: Sequence[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async version of :meth:`BatchCallManager.batch_request_responses`."""
+        responses: List[Dict[str, Any]] = []
+        for chunk_results in await self.ethereum_client.async_batch_request_chunks(
+            self._async_batch_call_chunk, payload, batch_size, max_concurrency
+        ):
+            responses.extend(sorted(chunk_results, key=lambda x: x["id"]))
+        return responses
+
+    async def _async_batch_call_chunk(
+        self, chunk: Sequence[Dict[str, Any]]
+    ) -> List[Any]:
+        """Async version of :meth:`BatchCallManager._batch_call_chunk`."""
+        session = await self.ethereum_client.get_async_session()
+        async with session.post(
+            self.ethereum_node_url,
+            json=chunk,
+            timeout=aiohttp.ClientTimeout(total=self.slow_timeout),
+        ) as response:
+            if not response.ok:
+                text = await response.text()
+                if response.status == 413 or is_batch_too_large_error(text):
+                    raise BatchRequestTooLarge(
+                        f"Error connecting to {self.ethereum_node_url}: {text}"
+                    )
+                raise ConnectionError(
+                    f"Error connecting to {self.ethereum_node_url}: {text}"
+                )
+            return validate_batch_chunk(await response.json(), chunk)
+
     async def async_batch_call(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         block_identifier: Optional[BlockIdentifier] = "latest",
@@ -177,7 +223,7 @@ class AsyncBatchCallManager(BatchCallManager, AsyncEthereumClientManager):
 
     async def async_batch_call_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
@@ -212,7 +258,7 @@ class AsyncErc20Manager(Erc20Manager, AsyncEthereumClientManager):
         include_native_balance: bool = True,
     ) -> List[BalanceDict]:
         balances = await self.ethereum_client.async_batch_call_same_function(
-            get_erc20_contract(self.w3).functions.balanceOf(address),
+            ERC20_CALLS["balanceOf"].build(address),
             token_addresses,
             raise_exception=False,
         )
@@ -225,13 +271,13 @@ class AsyncErc20Manager(Erc20Manager, AsyncEthereumClientManager):
         ] + return_balances
 
     async def async_get_name(self, erc20_address: ChecksumAddress) -> str:
-        data = self._build_fn_call_data(self.w3, erc20_address, "name")
+        data = self._build_fn_call_data("name")
         return decode_string_or_bytes32(
             await self.async_w3.eth.call({"to": erc20_address, "data": data})
         )
 
     async def async_get_symbol(self, erc20_address: ChecksumAddress) -> str:
-        data = self._build_fn_call_data(self.w3, erc20_address, "symbol")
+        data = self._build_fn_call_data("symbol")
         return decode_string_or_bytes32(
             await self.async_w3.eth.call({"to": erc20_address, "data": data})
         )
@@ -261,7 +307,25 @@ class AsyncErc20Manager(Erc20Manager, AsyncEthereumClientManager):
         from_block: BlockIdentifier = BlockNumber(0),
         to_block: Optional[BlockIdentifier] = None,
         token_address: Optional[ChecksumAddress] = None,
+        block_window: Optional[int] = None,
     ) -> List[LogReceiptDecoded]:
+        if block_window:
+            return [
+                event
+                async for window in self.async_iter_total_transfer_history(
+                    addresses,
+                    from_block=await self._async_get_block_number(from_block),
+                    to_block=(
+                        None
+                        if to_block is None
+                        else await self._async_get_block_number(to_block)
+                    ),
+                    token_address=token_address,
+                    block_window=block_window,
+                )
+                for event in window.events
+            ]
+
         all_topics, parameters = self._build_transfer_history_filters(
             addresses, from_block, to_block, token_address
         )
@@ -271,6 +335,114 @@ class AsyncErc20Manager(Erc20Manager, AsyncEthereumClientManager):
         ]
         return self._decode_and_sort_transfer_events(events_per_topic)
 
+    async def async_iter_total_transfer_history(
+        self,
+        addresses: Optional[Sequence[ChecksumAddress]] = None,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+        token_address: Optional[ChecksumAddress] = None,
+        block_window: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[TransferHistoryWindow]:
+        """
+        Async counterpart of :meth:`Erc20Manager.iter_total_transfer_history`
+        """
+        max_block_window = block_window or self.TRANSFER_HISTORY_BLOCK_WINDOW
+        max_concurrency = (
+            max_concurrency or self.ethereum_client.batch_request_max_concurrency
+        )
+        all_topics, parameters = self._build_transfer_history_filters(
+            addresses, from_block, to_block, token_address
+        )
+        if to_block is None:
+            to_block = await self.ethereum_client.async_get_block_number()
+
+        window_size = max_block_window
+        while from_block <= to_block:
+            windows = plan_block_windows(
+                from_block, to_block, window_size, max_concurrency
+            )
+            results = await self.ethereum_client.async_map_batch_chunks(
+                partial(
+                    self._async_get_transfer_history_window, all_topics, parameters
+                ),
+                windows,
+                max_concurrency,
+            )
+            for (window_from_block, window_to_block), (events, _) in zip(
+                windows, results
+            ):
+                yield TransferHistoryWindow(events, window_from_block, window_to_block)
+            from_block = windows[-1][1] + 1
+            window_size = self._next_transfer_history_window_size(
+                window_size,
+                max_block_window,
+                [fetched_window_size for _, fetched_window_size in results],
+            )
+
+    async def _async_get_block_number(self, block_identifier: BlockIdentifier) -> int:
+        """
+        Async counterpart of :meth:`Erc20Manager._get_block_number`
+        """
+        if isinstance(block_identifier, int):
+            return block_identifier
+        return self._parse_block_number(
+            block_identifier,
+            await self.ethereum_client.async_get_block(block_identifier),
+        )
+
+    async def _async_get_transfer_history_window(
+        self,
+        all_topics: Sequence[Sequence[Any]],
+        parameters: FilterParams,
+        window: Tuple[int, int],
+    ) -> Tuple[List[LogReceiptDecoded], int]:
+        """
+        Async counterpart of :meth:`Erc20Manager._get_transfer_history_window`
+        """
+        from_block, to_block = window
+        try:
+            events_per_topic = [
+                await self.async_slow_w3.eth.get_logs(
+                    {
+                        **parameters,
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                        "topics": topics,
+                    }
+                )
+                for topics in all_topics
+            ]
+        except (Web3Exception, ValueError, asyncio.TimeoutError) as exc:
+            if from_block == to_block or not (
+                isinstance(exc, asyncio.TimeoutError) or is_too_many_results_error(exc)
+            ):
+                raise
+            middle_block = (from_block + to_block) // 2
+            logger.info(
+                "Cannot get transfer history for blocks %d-%d, splitting the range: %s",
+                from_block,
+                to_block,
+                exc,
+            )
+            first_events, first_window_size = (
+                await self._async_get_transfer_history_window(
+                    all_topics, parameters, (from_block, middle_block)
+                )
+            )
+            second_events, second_window_size = (
+                await self._async_get_transfer_history_window(
+                    all_topics, parameters, (middle_block + 1, to_block)
+                )
+            )
+            return first_events + second_events, min(
+                first_window_size, second_window_size
+            )
+        return (
+            self._decode_and_sort_transfer_events(events_per_topic),
+            to_block - from_block + 1,
+        )
+
     async def async_send_tokens(
         self,
         to: str,
@@ -312,23 +484,21 @@ class AsyncErc721Manager(Erc721Manager, AsyncEthereumClientManager):
     async def async_get_balances(
         self, address: ChecksumAddress, token_addresses: Sequence[ChecksumAddress]
     ) -> List:
-        function = get_erc721_contract(self.w3).functions.balanceOf(address)
         balances = await self.ethereum_client.async_batch_call_same_function(
-            function,
+            ERC721_CALLS["balanceOf"].build(address),
             token_addresses,
             raise_exception=False,
         )
         return self._build_token_balances(token_addresses, balances)
 
     async def async_get_info(self, token_address: ChecksumAddress) -> Erc721Info:
-        erc721_contract = get_erc721_contract(self.w3, token_address)
         try:
             name, symbol = cast(
                 List[str],
                 await self.ethereum_client.async_batch_call(
                     [
-                        erc721_contract.functions.name(),
-                        erc721_contract.functions.symbol(),
+                        ERC721_CALLS["name"].build(address=token_address),
+                        ERC721_CALLS["symbol"].build(address=token_address),
                     ]
                 ),
             )
@@ -404,19 +574,37 @@ class AsyncTracingManager(TracingManager, AsyncEthereumClientManager):
         return trace_list_result_formatter(result)
 
     async def async_trace_blocks(
-        self, block_identifiers: Sequence[BlockIdentifier]
+        self,
+        block_identifiers: Sequence[BlockIdentifier],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[List[BlockTrace]]:
         if not block_identifiers:
             return []
-        payload = build_jsonrpc_batch_payload(
-            [
-                ("trace_block", [hex(b) if isinstance(b, int) else b])
-                for b in block_identifiers
-            ]
+        payload = self._build_trace_blocks_payload(block_identifiers)
+        results = await self.ethereum_client.async_raw_batch_request(
+            payload, batch_size=batch_size, max_concurrency=max_concurrency
         )
-        results = await self.ethereum_client.async_raw_batch_request(payload)
         return [trace_list_result_formatter(block_traces) for block_traces in results]
 
+    async def async_iter_blocks_transaction_traces(
+        self,
+        block_identifiers: Sequence[BlockIdentifier],
+        filter_errored: bool = True,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[List[BlockTrace]]:
+        """
+        Async counterpart of :meth:`TracingManager.iter_blocks_transaction_traces`
+        """
+        for block_traces in await self.async_trace_blocks(
+            block_identifiers, batch_size=batch_size, max_concurrency=max_concurrency
+        ):
+            for tx_traces in self.group_traces_by_transaction(
+                block_traces, filter_errored
+            ):
+                yield tx_traces
+
     async def async_trace_transaction(self, tx_hash: EthereumHash) -> List[FilterTrace]:
         result = await self._async_trace_rpc(
             "trace_transaction", [to_0x_hex_str(HexBytes(tx_hash))]
@@ -457,6 +645,89 @@ class AsyncTracingManager(TracingManager, AsyncEthereumClientManager):
         result = await self._async_trace_rpc("trace_filter", [parameters])
         return trace_list_result_formatter(result)
 
+    async def async_iter_trace_filter(
+        self,
+        from_block: int = 1,
+        to_block: Optional[int] = None,
+        from_address: Optional[Sequence[ChecksumAddress]] = None,
+        to_address: Optional[Sequence[ChecksumAddress]] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[FilterTrace]:
+        """
+        Async counterpart of :meth:`TracingManager.iter_trace_filter`. The next page is
+        requested as a background task while the current one is being consumed
+        """
+        if to_block is None:
+            to_block = await self.ethereum_client.async_get_block_number()
+        pending_requests = [
+            TraceFilterRequest(
+                from_block, to_block, 0, page_size or self.TRACE_FILTER_PAGE_SIZE
+            )
+        ]
+
+        def get_page(
+            request: TraceFilterRequest,
+        ) -> "asyncio.Future[List[FilterTrace]]":
+            return asyncio.ensure_future(
+                self.async_trace_filter(
+                    request.from_block,
+                    request.to_block,
+                    from_address=from_address,
+                    to_address=to_address,
+                    after=request.after,
+                    count=request.page_size,
+                )
+            )
+
+        request = pending_requests.pop()
+        future = get_page(request)
+        try:
+            while True:
+                try:
+                    traces = await future
+                except (Web3Exception, ValueError, asyncio.TimeoutError) as exc:
+                    smaller_requests = request.split()
+                    if smaller_requests is None or not (
+                        isinstance(exc, asyncio.TimeoutError)
+                        or is_too_many_results_error(exc)
+                    ):
+                        raise
+                    logger.info(
+                        "Cannot get traces for %s, splitting the request: %s",
+                        request,
+                        exc,
+                    )
+                    traces = []
+                    pending_requests.extend(smaller_requests)
+                else:
+                    # Only an empty page ends the range, nodes can cap ``count`` below
+                    # the requested page size
+                    if traces:
+                        pending_requests.append(
+                            request._replace(after=request.after + len(traces))
+                        )
+
+                if not pending_requests:
+                    for trace in traces:
+                        yield trace
+                    return
+                request = pending_requests.pop()
+                future = get_page(request)  # Prefetch next page
+                for trace in traces:
+                    yield trace
+        finally:
+            future.cancel()
+
+    async def async_get_trace_tree(self, tx_hash: EthereumHash) -> TraceTree:
+        """
+        Async counterpart of :meth:`TracingManager.get_trace_tree`, sharing the same cache
+        """
+        trace_tree = self._get_cached_trace_tree(tx_hash)
+        if trace_tree is None:
+            trace_tree = TraceTree(await self.async_trace_transaction(tx_hash))
+            self._cache_trace_tree(tx_hash, trace_tree)
+        return trace_tree
+
     async def async_get_previous_trace(
         self,
         tx_hash: EthereumHash,
@@ -466,11 +737,9 @@ class AsyncTracingManager(TracingManager, AsyncEthereumClientManager):
     ) -> Optional[Dict[str, Any]]:
         if len(trace_address) < number_traces:
             return None
-        return self._select_previous_trace(
-            await self.async_trace_transaction(tx_hash),
-            trace_address,
-            number_traces,
-            skip_delegate_calls,
+        trace_tree = await self.async_get_trace_tree(tx_hash)
+        return trace_tree.get_previous_trace(
+            trace_address, number_traces, skip_delegate_calls
         )
 
     async def async_get_next_traces(
@@ -480,11 +749,9 @@ class AsyncTracingManager(TracingManager, AsyncEthereumClientManager):
         remove_delegate_calls: bool = False,
         remove_calls: bool = False,
     ) -> List[FilterTrace]:
-        return self._select_next_traces(
-            await self.async_trace_transaction(tx_hash),
-            trace_address,
-            remove_delegate_calls,
-            remove_calls,
+        trace_tree = await self.async_get_trace_tree(tx_hash)
+        return trace_tree.get_next_traces(
+            trace_address, remove_delegate_calls, remove_calls
         )
 
 
@@ -519,6 +786,8 @@ class AsyncEthereumClient(EthereumClient):
         retry_count: int = 1,
         use_request_caching: bool = True,
         batch_request_max_size: int = 500,
+        batch_request_max_concurrency: int = 1,
+        adaptive_batch_size: bool = False,
     ):
         # Builds the blocking w3/slow_w3
         super().__init__(
@@ -528,6 +797,8 @@ class AsyncEthereumClient(EthereumClient):
             retry_count=retry_count,
             use_request_caching=use_request_caching,
             batch_request_max_size=batch_request_max_size,
+            batch_request_max_concurrency=batch_request_max_concurrency,
+            adaptive_batch_size=adaptive_batch_size,
         )
 
         # aiohttp sessions for raw JSON-RPC batches, one per event loop
@@ -651,32 +922,125 @@ class AsyncEthereumClient(EthereumClient):
 
     # --- Raw batch --------------------------------------------------------
 
+    async def async_map_batch_chunks(
+        self,
+        fn: Callable[[T], Awaitable[R]],
+        payload_chunks: Sequence[T],
+        max_concurrency: Optional[int] = None,
+    ) -> List[R]:
+        """
+        Async version of :meth:`EthereumClient.map_batch_chunks`: chunks are
+        awaited with ``asyncio.gather``, bounding the chunks in flight with a
+        semaphore. Results keep the order of ``payload_chunks``. If one chunk
+        fails the exception is raised and the pending chunks are cancelled.
+        """
+        max_concurrency = max_concurrency or self.batch_request_max_concurrency
+        if max_concurrency <= 1 or len(payload_chunks) <= 1:
+            return [await fn(payload_chunk) for payload_chunk in payload_chunks]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_fn(payload_chunk: T) -> R:
+            async with semaphore:
+                return await fn(payload_chunk)
+
+        tasks = [
+            asyncio.ensure_future(bounded_fn(payload_chunk))
+            for payload_chunk in payload_chunks
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def async_batch_request_chunks(
+        self,
+        fn: Callable[[Sequence[T]], Awaitable[List[R]]],
+        payload: Sequence[T],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[List[R]]:
+        """Async version of :meth:`EthereumClient.batch_request_chunks`."""
+        if not batch_size and self.batch_size_controller:
+            batch_size = self.batch_size_controller.size
+            fn = partial(self._async_send_adaptive_chunk, fn)
+        payload_chunks = list(
+            chunks(payload, batch_size or self.batch_request_max_size)
+        )
+        return await self.async_map_batch_chunks(fn, payload_chunks, max_concurrency)
+
+    async def _async_send_adaptive_chunk(
+        self,
+        fn: Callable[[Sequence[T]], Awaitable[List[R]]],
+        payload_chunk: Sequence[T],
+    ) -> List[R]:
+        """Async version of :meth:`EthereumClient._send_adaptive_chunk`."""
+        assert self.batch_size_controller is not None
+        start = time.monotonic()
+        try:
+            results = await fn(payload_chunk)
+        except (BatchRequestTooLarge, asyncio.TimeoutError) as exc:
+            if len(payload_chunk) <= self.batch_size_controller.min_size:
+                raise
+            batch_size = self.batch_size_controller.decrease(len(payload_chunk))
+            logger.warning(
+                "Batch request of %d elements failed for %s, retrying with batch size %d: %s",
+                len(payload_chunk),
+                self.ethereum_node_url,
+                batch_size,
+                exc,
+            )
+            return [
+                result
+                for payload_sub_chunk in chunks(payload_chunk, batch_size)
+                for result in await self._async_send_adaptive_chunk(
+                    fn, payload_sub_chunk
+                )
+            ]
+        self.batch_size_controller.increase(time.monotonic() - start)
+        return results
+
     async def async_raw_batch_request(
-        self, payload: Sequence[Dict[str, Any]], batch_size: Optional[int] = None
+        self,
+        payload: Sequence[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[Any]:
         """Async version of :meth:`EthereumClient.raw_batch_request` (returns a list)."""
-        batch_size = batch_size or self.batch_request_max_size
-        session = await self.get_async_session()
         all_results: List[Any] = []
-        for payload_chunk in chunks(payload, batch_size):
-            async with session.post(
-                self.ethereum_node_url,
-                json=payload_chunk,
-                timeout=aiohttp.ClientTimeout(total=self.slow_timeout),
-            ) as response:
-                if not response.ok:
-                    content = await response.read()
-                    logger.error(
-                        "Problem doing raw batch request with payload=%s status_code=%d result=%s",
-                        payload_chunk,
-                        response.status,
-                        content,
-                    )
-                    raise ValueError(f"Batch request error: {content!r}")
-                results = await response.json()
-            all_results.extend(process_raw_batch_results(results, payload_chunk))
+        for results in await self.async_batch_request_chunks(
+            self._async_raw_batch_request_chunk, payload, batch_size, max_concurrency
+        ):
+            all_results.extend(results)
         return all_results
 
+    async def _async_raw_batch_request_chunk(
+        self, payload_chunk: Sequence[Dict[str, Any]]
+    ) -> List[Any]:
+        """Async version of :meth:`EthereumClient._raw_batch_request_chunk`."""
+        session = await self.get_async_session()
+        async with session.post(
+            self.ethereum_node_url,
+            json=payload_chunk,
+            timeout=aiohttp.ClientTimeout(total=self.slow_timeout),
+        ) as response:
+            if not response.ok:
+                content = await response.read()
+                logger.error(
+                    "Problem doing raw batch request with payload=%s status_code=%d result=%s",
+                    payload_chunk,
+                    response.status,
+                    content,
+                )
+                if response.status == 413 or is_batch_too_large_error(content):
+                    raise BatchRequestTooLarge(f"Batch request error: {content!r}")
+                raise ValueError(f"Batch request error: {content!r}")
+            results = await response.json()
+        return list(process_raw_batch_results(results, payload_chunk))
+
     # --- Cached / metadata getters ---------------------------------------
 
     async def async_get_block_number(self) -> int:
@@ -820,6 +1184,19 @@ class AsyncEthereumClient(EthereumClient):
     async def async_is_contract(self, contract_address: ChecksumAddress) -> bool:
         return bool(await self.async_w3.eth.get_code(contract_address))
 
+    async def async_get_codes(
+        self,
+        addresses: Sequence[ChecksumAddress],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[HexBytes]:
+        if not addresses:
+            return []
+        block_identifier_str = self._parse_block_identifier(block_identifier)
+        payload = build_jsonrpc_batch_payload(
+            [("eth_getCode", [address, block_identifier_str]) for address in addresses]
+        )
+        return self._format_codes(await self.async_raw_batch_request(payload))
+
     async def async_get_nonce_for_account(
         self,
         address: ChecksumAddress,
@@ -888,20 +1265,40 @@ class AsyncEthereumClient(EthereumClient):
 
     # --- Batch call (no Multicall, always JSON-RPC batch path) ------------
 
+    async def _async_get_multicall_for_strategy(
+        self,
+        strategy: Union[BatchCallStrategy, str],
+        force_batch_call: bool,
+        from_address: Optional[ChecksumAddress],
+    ) -> Optional["AsyncMulticall"]:  # type: ignore # noqa F821
+        """
+        Async counterpart of :meth:`EthereumClient._get_multicall_for_strategy`
+        """
+        strategy = resolve_batch_call_strategy(strategy, force_batch_call, from_address)
+        if strategy == BatchCallStrategy.JSONRPC:
+            return None
+        multicall = await self.async_get_multicall()
+        if not multicall and strategy == BatchCallStrategy.MULTICALL:
+            raise EthereumNetworkNotSupported("Multicall contract not available")
+        return multicall
+
     async def async_batch_call(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         force_batch_call: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
+        strategy: Union[BatchCallStrategy, str] = BatchCallStrategy.AUTO,
     ) -> List[Optional[Union[bytes, Any]]]:
         """
         Async counterpart of :meth:`EthereumClient.batch_call`. Uses ``Multicall``
-        when available (unless ``force_batch_call=True``), matching the sync client,
+        following ``strategy`` (unless ``force_batch_call=True``), matching the sync client,
         including raw revert bytes for failed calls on the Multicall path.
         """
-        multicall = None if force_batch_call else await self.async_get_multicall()
+        multicall = await self._async_get_multicall_for_strategy(
+            strategy, force_batch_call, from_address
+        )
         if multicall:  # Multicall is more optimal
             return [
                 result.return_data_decoded
@@ -920,19 +1317,22 @@ class AsyncEthereumClient(EthereumClient):
 
     async def async_batch_call_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         force_batch_call: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
+        strategy: Union[BatchCallStrategy, str] = BatchCallStrategy.AUTO,
     ) -> List[Optional[Union[bytes, Any]]]:
         """
         Async counterpart of :meth:`EthereumClient.batch_call_same_function`. Uses
-        ``Multicall`` when available (unless ``force_batch_call=True``), matching the
-        sync client.
+        ``Multicall`` following ``strategy`` (unless ``force_batch_call=True``), matching
+        the sync client.
         """
-        multicall = None if force_batch_call else await self.async_get_multicall()
+        multicall = await self._async_get_multicall_for_strategy(
+            strategy, force_batch_call, from_address
+        )
         if multicall:  # Multicall is more optimal
             return [
                 result.return_data_decoded
@@ -1170,4 +1570,10 @@ def get_auto_async_ethereum_client() -> "AsyncEthereumClient":
         batch_request_max_size=int(
             os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_MAX_SIZE", 500)
         ),
+        batch_request_max_concurrency=int(
+            os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_MAX_CONCURRENCY", 1)
+        ),
+        adaptive_batch_size=bool(
+            int(os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_ADAPTIVE_SIZE", 0))
+        ),
     )
@@ -136,6 +136,79 @@ def generate_contract_fn(
     return fn
 
 
+@cache
+def get_contract_interface(contract_name: str) -> Dict[str, Any]:
+    """
+    JSON files are only loaded the first time they are needed
+
+    :param contract_name: Key of ``contracts``, e.g. ``erc20``
+    :return: Parsed JSON with the ABI and bytecode for the contract
+    :raises: ValueError if contract is not known or its JSON is empty
+    """
+    try:
+        json_contract_filename = contracts[contract_name]
+    except KeyError as exc:
+        raise ValueError(f"{contract_name} is not a known contract") from exc
+    contract_dict = load_contract_interface(json_contract_filename)
+    if not contract_dict:
+        raise ValueError(f"{contract_name} json cannot be empty")
+    return contract_dict
+
+
+# Attribute of the ``w3`` instances used to store their contract factories
+_CONTRACT_FACTORIES_ATTRIBUTE = "_safe_eth_contract_factories"
+
+
+def get_contract_factory(w3: Web3, contract_name: str) -> Type[Contract]:
+    """
+    Building a Web3 contract factory from an ABI is expensive, so one factory is built and cached
+    for every ``w3`` and contract. Use ``factory(address)`` to get a contract bound to an address.
+
+    Factories are stored in the ``w3`` instance and not in a global cache, as they keep a reference
+    to ``w3``, so they are released when ``w3`` is garbage collected
+
+    :param w3:
+    :param contract_name: Key of ``contracts``, e.g. ``erc20``
+    :return: Web3 contract factory (not bound to any address). It's shared, so it must not be modified
+    :raises: ValueError if contract is not known
+    """
+    contract_factories: Dict[str, Type[Contract]] = w3.__dict__.setdefault(
+        _CONTRACT_FACTORIES_ATTRIBUTE, {}
+    )
+    contract_factory = contract_factories.get(contract_name)
+    if contract_factory is None:
+        contract = get_contract_interface(contract_name)
+        contract_factory = contract_factories.setdefault(
+            contract_name,
+            w3.eth.contract(abi=contract["abi"], bytecode=contract.get("bytecode")),
+        )
+    return contract_factory
+
+
+def generate_lazy_contract_fn(
+    contract_name: str,
+) -> Callable[[Web3, Optional[ChecksumAddress]], Union[Type[Contract], Contract]]:
+    """
+    Same as ``generate_contract_fn``, but the contract JSON is loaded on the first call and the
+    contract factory is reused using ``get_contract_factory``
+
+    :param contract_name: Key of ``contracts``, e.g. ``erc20``
+    :return: function that will return a Web3 Contract for ``contract_name``
+    """
+
+    def fn(
+        w3: Web3, address: Optional[ChecksumAddress] = None
+    ) -> Union[Type[Contract], Contract]:
+        contract_factory = get_contract_factory(w3, contract_name)
+        if address:
+            return contract_factory(address=address)
+        # Subclass the shared factory, so it's not modified by the caller
+        return type(contract_factory.__name__, (contract_factory,), {})
+
+    fn.__name__ = f"get_{contract_name}_contract"
+    return fn
+
+
 # Annotate functions that will be generated later with `setattr` so typing does not complain
 def get_safe_contract(w3: Web3, address: Optional[ChecksumAddress] = None) -> Contract:
     """
@@ -478,10 +551,7 @@ def get_paying_proxy_deployed_bytecode() -> bytes:
     return HexBytes(load_contract_interface("PayingProxy.json")["deployedBytecode"])
 
 
-# Dynamically create the functions for getting the contracts
-for contract_name, json_contract_filename in contracts.items():
+# Dynamically create the functions for getting the contracts. JSON files are loaded lazily
+for contract_name in contracts:
     fn_name = "get_{}_contract".format(contract_name)
-    contract_dict = load_contract_interface(json_contract_filename)
-    if not contract_dict:
-        raise ValueError(f"{contract_name} json cannot be empty")
-    setattr(current_module, fn_name, generate_contract_fn(contract_dict))
+    setattr(current_module, fn_name, generate_lazy_contract_fn(contract_name))
@@ -0,0 +1,191 @@
+"""
+Precompiled contract calls for the most used view functions (ERC20, ERC721, ERC1155 and Safe).
+
+Building calldata using web3.py ``ContractFunction`` objects is slow, as a contract and a function
+object are created and the ABI is parsed for every call. ``ContractCallBuilder`` precomputes the
+function selector, so calldata is built as ``selector + encoded arguments``, e.g.
+``balanceOf(owner)`` is just the selector and the padded ``owner`` address.
+"""
+
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+import eth_abi
+from eth_typing import ChecksumAddress, HexStr
+from web3.contract.contract import ContractFunction
+
+from ..utils import fast_is_checksum_address, fast_keccak_text
+
+_ADDRESS_PADDING = "0" * 24
+
+
+def _encode_address(value: Any) -> Optional[str]:
+    # Not checksummed addresses are validated by `eth_abi`
+    if fast_is_checksum_address(value):
+        return _ADDRESS_PADDING + value[2:].lower()
+    return None
+
+
+def _encode_uint256(value: Any) -> Optional[str]:
+    if isinstance(value, int) and 0 <= value < 2**256:
+        return f"{value:064x}"
+    return None
+
+
+# Encoders returning the 32 bytes hex encoded argument, or `None` if `eth_abi` must be used
+_FAST_ENCODERS: Dict[str, Callable[[Any], Optional[str]]] = {
+    "address": _encode_address,
+    "uint256": _encode_uint256,
+}
+
+
+class ContractCall(NamedTuple):
+    """
+    Contract call with its calldata already built. It can be used instead of a web3.py
+    ``ContractFunction`` for ``batch_call``, ``batch_call_same_function`` and ``Multicall``
+    """
+
+    address: Optional[ChecksumAddress]
+    data: HexStr
+    output_types: Tuple[str, ...]
+    fn_name: str
+
+
+class ContractCallBuilder:
+    """
+    Precompiled contract function, to build ``ContractCall`` without web3.py
+    """
+
+    __slots__ = ("fn_name", "input_types", "output_types", "selector", "_encoders")
+
+    def __init__(
+        self,
+        fn_name: str,
+        input_types: Sequence[str] = (),
+        output_types: Sequence[str] = (),
+    ):
+        """
+        :param fn_name: e.g. ``balanceOf``
+        :param input_types: e.g. ``("address",)``
+        :param output_types: e.g. ``("uint256",)``
+        """
+        self.fn_name = fn_name
+        self.input_types = tuple(input_types)
+        self.output_types = tuple(output_types)
+        self.selector = HexStr(
+            "0x"
+            + fast_keccak_text(f"{fn_name}({','.join(self.input_types)})")[:4].hex()
+        )
+        # Only use fast encoders if all the types are supported
+        self._encoders = (
+            [_FAST_ENCODERS[input_type] for input_type in self.input_types]
+            if all(input_type in _FAST_ENCODERS for input_type in self.input_types)
+            else None
+        )
+
+    def __repr__(self):
+        return f"ContractCallBuilder {self.fn_name}({','.join(self.input_types)})"
+
+    def build_data(self, *args: Any) -> HexStr:
+        """
+        :param args: Function arguments
+        :return: Calldata for the function, ``0x`` prefixed
+        :raises: ValueError if arguments cannot be encoded
+        """
+        if len(args) != len(self.input_types):
+            raise ValueError(
+                f"{self.fn_name} expects {len(self.input_types)} arguments, {len(args)} were provided"
+            )
+        if self._encoders is not None:
+            encoded_args = []
+            for encoder, arg in zip(self._encoders, args):
+                encoded_arg = encoder(arg)
+                if encoded_arg is None:
+                    break
+                encoded_args.append(encoded_arg)
+            else:
+                return HexStr(self.selector + "".join(encoded_args))
+        try:
+            return HexStr(self.selector + eth_abi.encode(self.input_types, args).hex())
+        except eth_abi.exceptions.EncodingError as exc:
+            raise ValueError(
+                f"Cannot encode arguments {args} for {self.fn_name}"
+            ) from exc
+
+    def build(
+        self, *args: Any, address: Optional[ChecksumAddress] = None
+    ) -> ContractCall:
+        """
+        :param args: Function arguments
+        :param address: Contract address. Not required for ``batch_call_same_function``
+        :return: ``ContractCall`` for the function and ``args``
+        :raises: ValueError if arguments cannot be encoded
+        """
+        return ContractCall(
+            address, self.build_data(*args), self.output_types, self.fn_name
+        )
+
+
+def get_contract_call(
+    contract_function: Union[ContractFunction, ContractCall],
+) -> ContractCall:
+    """
+    :param contract_function: web3.py ``ContractFunction`` or an already built ``ContractCall``
+    :return: ``ContractCall`` for ``contract_function``. Calldata of web3.py functions is
+        encoded without building a transaction, so no RPC calls are done
+    """
+    if isinstance(contract_function, ContractCall):
+        return contract_function
+    return ContractCall(
+        contract_function.address,
+        HexStr(contract_function._encode_transaction_data()),
+        tuple(output["type"] for output in contract_function.abi["outputs"]),
+        contract_function.fn_name,
+    )
+
+
+def _build_call_builders(
+    *call_builders: ContractCallBuilder,
+) -> Dict[str, ContractCallBuilder]:
+    return {call_builder.fn_name: call_builder for call_builder in call_builders}
+
+
+ERC20_CALLS = _build_call_builders(
+    ContractCallBuilder("name", (), ("string",)),
+    ContractCallBuilder("symbol", (), ("string",)),
+    ContractCallBuilder("decimals", (), ("uint8",)),
+    ContractCallBuilder("totalSupply", (), ("uint256",)),
+    ContractCallBuilder("balanceOf", ("address",), ("uint256",)),
+    ContractCallBuilder("allowance", ("address", "address"), ("uint256",)),
+)
+
+ERC721_CALLS = _build_call_builders(
+    ContractCallBuilder("name", (), ("string",)),
+    ContractCallBuilder("symbol", (), ("string",)),
+    ContractCallBuilder("totalSupply", (), ("uint256",)),
+    ContractCallBuilder("balanceOf", ("address",), ("uint256",)),
+    ContractCallBuilder("ownerOf", ("uint256",), ("address",)),
+    ContractCallBuilder("tokenURI", ("uint256",), ("string",)),
+    ContractCallBuilder("getApproved", ("uint256",), ("address",)),
+    ContractCallBuilder("isApprovedForAll", ("address", "address"), ("bool",)),
+)
+
+ERC1155_CALLS = _build_call_builders(
+    ContractCallBuilder("balanceOf", ("address", "uint256"), ("uint256",)),
+    ContractCallBuilder("balanceOfBatch", ("address[]", "uint256[]"), ("uint256[]",)),
+    ContractCallBuilder("uri", ("uint256",), ("string",)),
+    ContractCallBuilder("isApprovedForAll", ("address", "address"), ("bool",)),
+)
+
+SAFE_CALLS = _build_call_builders(
+    ContractCallBuilder("VERSION", (), ("string",)),
+    ContractCallBuilder("nonce", (), ("uint256",)),
+    ContractCallBuilder("getOwners", (), ("address[]",)),
+    ContractCallBuilder("getThreshold", (), ("uint256",)),
+    ContractCallBuilder("isOwner", ("address",), ("bool",)),
+    ContractCallBuilder("getModules", (), ("address[]",)),
+    ContractCallBuilder(
+        "getModulesPaginated", ("address", "uint256"), ("address[]", "address")
+    ),
+    ContractCallBuilder("isModuleEnabled", ("address",), ("bool",)),
+    ContractCallBuilder("domainSeparator", (), ("bytes32",)),
+)
@@ -25,15 +25,20 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import os
 import re
-from typing import Any, Dict, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple, cast
 
 from eth_abi import encode as encode_abi
+from eth_abi.registry import registry as eth_abi_registry
 from eth_typing import Hash32
 from hexbytes import HexBytes
 
 from ..utils import fast_keccak
 
+_ZERO_HASH = bytes(32)
+
 
 def encode_data(primary_type: str, data, types):
     """
@@ -139,6 +144,246 @@ def hash_struct(primary_type: str, data, types) -> Hash32:
     return fast_keccak(encode_data(primary_type, data, types))
 
 
+class EIP712Schema:
+    """
+    Compiled EIP712 ``types``. Dependencies, type string, type hash and field encoders are
+    computed only once for every struct the first time it's used, so many messages can be
+    encoded for the same ``types`` without repeating that work. As in ``encode_data``, only
+    the structs reachable from the encoded ones are compiled, so unused types are ignored.
+    Encoding is the same as ``encode_data`` and ``hash_struct``.
+    """
+
+    def __init__(self, types: Dict[str, List[Dict[str, str]]]):
+        """
+        :param types: EIP712 ``types``, e.g. ``{"EIP712Domain": [{"name": "name", "type": "string"}], ...}``
+        :raises: ValueError if ``types`` are not well formed
+        """
+        self.types = types
+        # Field types are only validated when their struct is compiled
+        try:
+            for fields in types.values():
+                for field in fields:
+                    if not isinstance(field["name"], str) or not isinstance(
+                        field["type"], str
+                    ):
+                        raise TypeError(f"Not valid field {field}")
+        except (KeyError, AttributeError, TypeError) as exc:
+            raise ValueError(f"Not valid types {types}") from exc
+        self._field_encoders: Dict[str, List[Tuple[str, Callable[[Any], bytes]]]] = {}
+        self._encoded_types: Dict[str, str] = {}
+        self._type_hashes: Dict[str, Hash32] = {}
+
+    def _get_field_encoders(
+        self, primary_type: str
+    ) -> List[Tuple[str, Callable[[Any], bytes]]]:
+        """
+        :return: Field names and encoders for ``primary_type``, built the first time it's used
+        :raises: ValueError if ``primary_type`` is not defined or its fields are not valid
+        """
+        field_encoders = self._field_encoders.get(primary_type)
+        if field_encoders is None:
+            if primary_type not in self.types:
+                raise ValueError(f"No type definition specified: {primary_type}")
+            field_encoders = [
+                (field["name"], self._build_field_encoder(field["name"], field["type"]))
+                for field in self.types[primary_type]
+            ]
+            self._field_encoders[primary_type] = field_encoders
+        return field_encoders
+
+    def _build_encoded_type(self, primary_type: str) -> str:
+        """
+        :return: Type string for ``primary_type`` and its dependencies, sorted by name
+        """
+        dependencies = set()
+        pending = [primary_type]
+        while pending:
+            type_name = re.split(r"\W", pending.pop())[0]
+            if type_name not in dependencies and self.types.get(type_name):
+                dependencies.add(type_name)
+                pending.extend(field["type"] for field in self.types[type_name])
+        dependencies.discard(primary_type)
+        return "".join(
+            type_name
+            + "("
+            + ",".join(
+                f"{field['type']} {field['name']}" for field in self.types[type_name]
+            )
+            + ")"
+            for type_name in [primary_type] + sorted(dependencies)
+        )
+
+    def _build_field_encoder(self, name: str, typ: str) -> Callable[[Any], bytes]:
+        """
+        :return: Function to encode a value of type ``typ`` as a 32 bytes word
+        :raises: ValueError if ``typ`` is not valid
+        """
+        if typ in self.types:
+
+            def encode_struct(value: Any) -> bytes:
+                if value is None:
+                    return _ZERO_HASH
+                return fast_keccak(self.encode_data(typ, value))
+
+            return encode_struct
+
+        if typ.endswith("]"):
+            encode_element = self._build_field_encoder(name, typ[: typ.rindex("[")])
+
+            def encode_array(value: Any) -> bytes:
+                if value is None:
+                    raise ValueError(f"Missing value for field {name} of type {typ}")
+                return fast_keccak(
+                    b"".join(encode_element(element) for element in value)
+                )
+
+            return encode_array
+
+        if typ == "bytes":
+
+            def encode_bytes(value: Any) -> bytes:
+                if value is None:
+                    raise ValueError(f"Missing value for field {name} of type {typ}")
+                return fast_keccak(HexBytes(value) if isinstance(value, str) else value)
+
+            return encode_bytes
+
+        if typ == "string":
+
+            def encode_string(value: Any) -> bytes:
+                if value is None:
+                    raise ValueError(f"Missing value for field {name} of type {typ}")
+                return fast_keccak(value.encode("utf-8"))
+
+            return encode_string
+
+        try:
+            # Registry returns initialized encoders, callable with the value
+            encoder = cast(Callable[[Any], bytes], eth_abi_registry.get_encoder(typ))
+        except ValueError as exc:
+            raise ValueError(f"Not valid type {typ} for field {name}") from exc
+        # Accept string bytes, uint and int
+        parse_str: Callable[[str], Any] = (
+            HexBytes if "bytes" in typ else int if "int" in typ else str
+        )
+
+        def encode_atomic(value: Any) -> bytes:
+            if value is None:
+                raise ValueError(f"Missing value for field {name} of type {typ}")
+            if isinstance(value, str):
+                value = parse_str(value)
+            return encoder(value)
+
+        return encode_atomic
+
+    def encode_type(self, primary_type: str) -> str:
+        """
+        :param primary_type:
+        :return: Type string for ``primary_type``, same as ``encode_type``
+        :raises: ValueError if ``primary_type`` is not defined
+        """
+        encoded_type = self._encoded_types.get(primary_type)
+        if encoded_type is None:
+            if not self.types.get(primary_type):
+                raise ValueError(f"No type definition specified: {primary_type}")
+            encoded_type = self._build_encoded_type(primary_type)
+            self._encoded_types[primary_type] = encoded_type
+        return encoded_type
+
+    def hash_type(self, primary_type: str) -> Hash32:
+        """
+        :param primary_type:
+        :return: Type hash for ``primary_type``, same as ``hash_type``
+        :raises: ValueError if ``primary_type`` is not defined
+        """
+        type_hash = self._type_hashes.get(primary_type)
+        if type_hash is None:
+            type_hash = fast_keccak(self.encode_type(primary_type).encode())
+            self._type_hashes[primary_type] = type_hash
+        return type_hash
+
+    def encode_data(self, primary_type: str, data: Dict[str, Any]) -> bytes:
+        """
+        :param primary_type:
+        :param data: Struct values
+        :return: Encoded struct, same as ``encode_data``
+        :raises: ValueError if ``primary_type`` is not defined or values are missing
+        """
+        encoded: List[bytes] = [self.hash_type(primary_type)]
+        for name, encode_field in self._get_field_encoders(primary_type):
+            encoded.append(encode_field(data[name]))
+        return b"".join(encoded)
+
+    def hash_struct(self, primary_type: str, data: Dict[str, Any]) -> Hash32:
+        """
+        :return: Keccak256 hash of the encoded struct, same as ``hash_struct``
+        """
+        return fast_keccak(self.encode_data(primary_type, data))
+
+    def encode(
+        self, domain: Dict[str, Any], primary_type: str, message: Dict[str, Any]
+    ) -> Tuple[bytes, Hash32, Hash32]:
+        """
+        :param domain: ``EIP712Domain`` values
+        :param primary_type:
+        :param message: ``primary_type`` values
+        :return: Same as ``eip712_encode``
+        :raises: ValueError if data is not valid for the schema
+        """
+        if primary_type == "EIP712Domain":
+            raise ValueError("primaryType cannot be EIP712Domain")
+        try:
+            return (
+                bytes.fromhex("1901"),
+                self.hash_struct("EIP712Domain", domain),
+                self.hash_struct(primary_type, message),
+            )
+        except (KeyError, AttributeError, TypeError, IndexError) as exc:
+            raise ValueError(
+                f"Not valid {primary_type} message {message} for domain {domain}"
+            ) from exc
+
+    def encode_hash(
+        self, domain: Dict[str, Any], primary_type: str, message: Dict[str, Any]
+    ) -> Hash32:
+        """
+        :return: Keccak256 hash of encoded signable data, same as ``eip712_encode_hash``
+        """
+        return fast_keccak(b"".join(self.encode(domain, primary_type, message)))
+
+
+@lru_cache(maxsize=int(os.getenv("CACHE_EIP712_SCHEMA", 128)))
+def _get_eip712_schema(
+    types_key: Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...],
+) -> EIP712Schema:
+    return EIP712Schema(
+        {
+            type_name: [{"name": name, "type": typ} for name, typ in fields]
+            for type_name, fields in types_key
+        }
+    )
+
+
+def get_eip712_schema(types: Dict[str, List[Dict[str, str]]]) -> EIP712Schema:
+    """
+    :param types: EIP712 ``types``
+    :return: Compiled schema for ``types``. Schemas are cached, so the same schema is returned
+        for equal ``types``
+    :raises: ValueError if ``types`` are not valid
+    """
+    try:
+        types_key = tuple(
+            (
+                type_name,
+                tuple((field["name"], field["type"]) for field in fields),
+            )
+            for type_name, fields in types.items()
+        )
+    except (KeyError, AttributeError, TypeError) as exc:
+        raise ValueError(f"Not valid types {types}") from exc
+    return _get_eip712_schema(types_key)
+
+
 def eip712_encode(typed_data: Dict[str, Any]) -> Tuple[bytes, Hash32, Hash32]:
     """
     Given a dict of structured data and types, return a 3-element tuple of
@@ -149,22 +394,9 @@ def eip712_encode(typed_data: Dict[str, Any]) -> Tuple[bytes, Hash32, Hash32]:
       2: The encoded data
     """
     try:
-        parts = (
-            bytes.fromhex("1901"),
-            hash_struct("EIP712Domain", typed_data["domain"], typed_data["types"]),
-        )
-        if typed_data["primaryType"] == "EIP712Domain":
-            raise TypeError("primaryType cannot be EIP712Domain")
-
-        return (
-            *parts,
-            hash_struct(
-                typed_data["primaryType"],
-                typed_data["message"],
-                typed_data["types"],
-            ),
+        return get_eip712_schema(typed_data["types"]).encode(
+            typed_data["domain"], typed_data["primaryType"], typed_data["message"]
         )
-
     except (KeyError, AttributeError, TypeError, IndexError) as exc:
         raise ValueError(f"Not valid {typed_data}") from exc
 
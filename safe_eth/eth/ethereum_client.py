@@ -1,11 +1,17 @@
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import cache, cached_property, wraps
+from functools import cache, cached_property, partial, wraps
 from logging import getLogger
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     NamedTuple,
     NoReturn,
@@ -13,25 +19,25 @@ from typing import (
     Sequence,
     Tuple,
     Type,
+    TypeVar,
     Union,
     cast,
 )
 
 import eth_abi
+import requests
 from eth_abi.exceptions import DecodingError
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_typing import URI, BlockNumber, ChecksumAddress, Hash32, HexAddress, HexStr
 from hexbytes import HexBytes
 from web3 import AsyncWeb3, HTTPProvider, Web3
-from web3._utils.abi import map_abi_data
 from web3._utils.method_formatters import (
     block_result_formatter,
     receipt_formatter,
     trace_list_result_formatter,
     transaction_result_formatter,
 )
-from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.contract.contract import ContractFunction
 from web3.exceptions import (
     BlockNotFound,
@@ -56,8 +62,9 @@ from web3.types import (
 )
 
 from safe_eth.eth.utils import (
+    fast_bytes_to_checksum_address,
     fast_is_checksum_address,
-    fast_to_checksum_address,
+    get_abi_decoder,
     mk_contract_address,
     mk_contract_address_2,
 )
@@ -73,9 +80,16 @@ from .constants import (
     SAFE_SINGLETON_FACTORY_ADDRESS,
 )
 from .contracts import get_erc20_contract, get_erc721_contract
+from .contracts.call_builders import (
+    ERC20_CALLS,
+    ERC721_CALLS,
+    ContractCall,
+    get_contract_call,
+)
 from .ethereum_network import EthereumNetwork, EthereumNetworkNotSupported
 from .exceptions import (
     BatchCallFunctionFailed,
+    BatchRequestTooLarge,
     ChainIdIsRequired,
     ContractAlreadyDeployed,
     FromAddressNotFound,
@@ -98,6 +112,9 @@ from .utils import decode_string_or_bytes32
 
 logger = getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 # Mapping of node error messages (Geth / Parity / OpenEthereum) to typed exceptions.
 #     - https://github.com/openethereum/openethereum/blob/main/rpc/src/v1/helpers/errors.rs
@@ -171,6 +188,172 @@ def tx_with_exception_handling(func):
 # duplicated logic.
 
 
+# Node error messages (lowercase) when a JSON RPC Batch request is too big for the provider,
+# e.g. Ankr `you can't send more than 1000 requests in a batch`, Nodereal `batch length does
+# not support more than 500` or Alchemy `Batch size is too large`
+_BATCH_TOO_LARGE_ERRORS: Tuple[str, ...] = (
+    "too large",
+    "too big",
+    "requests in a batch",
+    "batch limit",
+    "batch size",
+    "batch length",
+)
+
+
+def is_batch_too_large_error(message: Any) -> bool:
+    """
+    :param message: Node error message or response body
+    :return: ``True`` if the node rejected the batch request due to its size
+    """
+    message = str(message).lower()
+    return any(reason in message for reason in _BATCH_TOO_LARGE_ERRORS)
+
+
+_TOO_MANY_RESULTS_ERRORS: Tuple[str, ...] = (
+    "query returned more than",
+    "too many results",
+    "max results",
+    "exceeds limit",
+    "response size",
+    "response is too large",
+    "block range",
+    "range is too large",
+    "range too large",
+    "too wide",
+    "query timeout",
+)
+
+# Providers throttling requests, splitting the range would only send more of them
+_RATE_LIMIT_ERRORS: Tuple[str, ...] = (
+    "429 client error",
+    "'code': 429",
+    "rate limit",
+    "rate exceeded",
+    "too many requests",
+    "compute units",
+    "capacity",
+    "throttl",
+)
+
+
+def is_too_many_results_error(message: Any) -> bool:
+    """
+    :param message: Node error message
+    :return: ``True`` if the node rejected a ranged request (``eth_getLogs``, ``trace_filter``...)
+        because the block range or the number of results is too big. ``False`` for rate limit
+        errors
+    """
+    message = str(message).lower()
+    if any(reason in message for reason in _RATE_LIMIT_ERRORS):
+        return False
+    return any(reason in message for reason in _TOO_MANY_RESULTS_ERRORS)
+
+
+def plan_block_windows(
+    from_block: int, to_block: int, window_size: int, max_windows: int
+) -> List[Tuple[int, int]]:
+    """
+    :param from_block:
+    :param to_block: Last block, included
+    :param window_size: Max number of blocks of every window
+    :param max_windows:
+    :return: Up to ``max_windows`` consecutive ``(from_block, to_block)`` windows (both included)
+        starting at ``from_block`` and not going beyond ``to_block``
+    """
+    windows: List[Tuple[int, int]] = []
+    window_size = max(1, window_size)
+    while from_block <= to_block and len(windows) < max(1, max_windows):
+        window_to_block = min(from_block + window_size - 1, to_block)
+        windows.append((from_block, window_to_block))
+        from_block = window_to_block + 1
+    return windows
+
+
+class AdaptiveBatchSize:
+    """
+    AIMD (additive increase, multiplicative decrease) controller for the size of JSON RPC
+    Batch chunks. The size is halved when a chunk is rejected because of its size or times out,
+    and increased by ``increase_step`` after every chunk answered within ``target_latency``.
+
+    Learned sizes are shared by every client using the same node url, use :meth:`for_node`
+    to get the controller for a node.
+    """
+
+    _controllers: Dict[str, "AdaptiveBatchSize"] = {}
+    _controllers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_size: int,
+        min_size: int = 1,
+        increase_step: Optional[int] = None,
+        target_latency: Optional[float] = None,
+    ):
+        """
+        :param max_size: Size will never grow over this value
+        :param min_size: Size will never shrink under this value
+        :param increase_step: Size increase after a successful chunk. By default, 10% of ``max_size``
+        :param target_latency: Seconds. If a chunk takes longer, size is not increased
+        """
+        self.max_size = max_size
+        self.min_size = min(min_size, max_size)
+        self.increase_step = increase_step or max(1, max_size // 10)
+        self.target_latency = target_latency
+        self.size = max_size
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_node(
+        cls, ethereum_node_url: str, max_size: int, **kwargs
+    ) -> "AdaptiveBatchSize":
+        """
+        :param ethereum_node_url:
+        :param max_size:
+        :param kwargs: Rest of the parameters used when building the controller
+        :return: Controller for ``ethereum_node_url``, built if it does not exist. If it exists
+            with a different ``max_size``, it's clamped to the new one keeping the learned size
+        """
+        with cls._controllers_lock:
+            controller = cls._controllers.get(ethereum_node_url)
+            if controller is None:
+                controller = cls(max_size, **kwargs)
+                cls._controllers[ethereum_node_url] = controller
+            elif controller.max_size != max_size:
+                controller.clamp(max_size)
+            return controller
+
+    def clamp(self, max_size: int) -> int:
+        """
+        :param max_size: New max size
+        :return: New size, the learned size if it's not bigger than ``max_size``
+        """
+        with self._lock:
+            self.max_size = max_size
+            self.min_size = min(self.min_size, max_size)
+            self.size = min(self.size, max_size)
+            return self.size
+
+    def decrease(self, failed_size: int) -> int:
+        """
+        :param failed_size: Size of the chunk that failed
+        :return: New size, half of ``failed_size`` (or lower if it was already decreased)
+        """
+        with self._lock:
+            self.size = max(self.min_size, min(self.size, failed_size // 2))
+            return self.size
+
+    def increase(self, elapsed: float) -> int:
+        """
+        :param elapsed: Seconds taken by the successful chunk
+        :return: New size
+        """
+        with self._lock:
+            if self.target_latency is None or elapsed <= self.target_latency:
+                self.size = min(self.max_size, self.size + self.increase_step)
+            return self.size
+
+
 def build_jsonrpc_batch_payload(
     entries: Sequence[Tuple[str, Sequence[Any]]],
 ) -> List[Dict[str, Any]]:
@@ -205,6 +388,8 @@ def process_raw_batch_results(
         logger.error(
             "Batch request problem with payload=%s, result=%s)", payload_chunk, results
         )
+        if is_batch_too_large_error(results):
+            raise BatchRequestTooLarge(f"Batch request error: {results}")
         raise ValueError(f"Batch request error: {results}")
 
     if len(results) != len(payload_chunk):
@@ -273,8 +458,17 @@ def validate_batch_chunk(results: Any, chunk: Sequence[Dict[str, Any]]) -> List[
         logger.error(
             "Batch call custom problem with payload=%s, result=%s)", chunk, results
         )
+        if is_batch_too_large_error(results):
+            raise BatchRequestTooLarge(f"Batch request error: {results}")
         raise ValueError(f"Batch request error: {results}")
     if len(results) != len(chunk):
+        # Some nodes return a list of one element on error
+        if (
+            len(results) == 1
+            and "error" in results[0]
+            and is_batch_too_large_error(results[0]["error"])
+        ):
+            raise BatchRequestTooLarge(f"Batch request error: {results}")
         logger.error(
             "Different number of results than payload requests were returned "
             "doing batch call custom with payload=%s result=%s",
@@ -305,16 +499,9 @@ def decode_eth_call_results(
             errors.append(f'`{fn_name}`: {result["error"]}')
             return_values.append(None)
         else:
-            output_type = payload["output_type"]
+            decoder = get_abi_decoder(tuple(payload["output_type"]))
             try:
-                decoded_values = eth_abi.decode(output_type, HexBytes(result["result"]))
-                normalized_data = map_abi_data(
-                    BASE_RETURN_NORMALIZERS, output_type, decoded_values
-                )
-                if len(normalized_data) == 1:
-                    return_values.append(normalized_data[0])
-                else:
-                    return_values.append(normalized_data)
+                return_values.append(decoder(HexBytes(result["result"])))
             except (DecodingError, OverflowError):
                 fn_name = payload.get(
                     "fn_name", to_0x_hex_str(HexBytes(payload["data"]))
@@ -346,6 +533,184 @@ class TokenBalance(NamedTuple):
     balance: int
 
 
+class TransferLogColumns(NamedTuple):
+    """
+    Decoded ERC20/ERC721 ``Transfer`` logs in columnar form. Every list has one element
+    per valid ``Transfer`` log, in the same order the logs were provided
+    """
+
+    positions: List[int]  # Position of every log in the decoded logs sequence
+    token_addresses: List[ChecksumAddress]
+    from_addresses: List[ChecksumAddress]
+    to_addresses: List[ChecksumAddress]
+    values: List[int]
+    # ``value`` for ERC20, ``tokenId`` for ERC721 and ``unknown`` if nothing is indexed
+    value_names: List[str]
+    block_numbers: List[BlockNumber]
+    log_indexes: List[int]
+
+    def get_args(self, i: int) -> Dict[str, Any]:
+        """
+        :param i:
+        :return: ``args`` of the ``i`` decoded log, e.g. ``{"from": ..., "to": ..., "value": ...}``
+        """
+        return {
+            "from": self.from_addresses[i],
+            "to": self.to_addresses[i],
+            self.value_names[i]: self.values[i],
+        }
+
+
+class TransferHistoryWindow(NamedTuple):
+    """
+    Transfer events of a block range, yielded in block order by
+    ``Erc20Manager.iter_total_transfer_history``
+    """
+
+    events: List[LogReceiptDecoded]
+    from_block: int
+    to_block: int
+
+    @property
+    def next_block(self) -> int:
+        """
+        :return: Resume cursor, ``from_block`` to continue the history after this window
+        """
+        return self.to_block + 1
+
+
+class TraceFilterRequest(NamedTuple):
+    """
+    One ``trace_filter`` page request, used by ``TracingManager.iter_trace_filter``
+    """
+
+    from_block: int
+    to_block: int
+    after: int
+    page_size: int
+
+    def split(self) -> Optional[List["TraceFilterRequest"]]:
+        """
+        :return: Smaller requests to retry with when the node rejects this one. The block range
+            is bisected if possible (only when no pages were consumed yet, as the offset refers
+            to the whole range), otherwise the page size is halved. Requests are returned
+            in stack order (last one must be requested first). ``None`` if it cannot be
+            split anymore
+        """
+        if not self.after and self.from_block < self.to_block:
+            middle_block = (self.from_block + self.to_block) // 2
+            return [
+                self._replace(from_block=middle_block + 1),
+                self._replace(to_block=middle_block),
+            ]
+        if self.page_size > 1:
+            return [self._replace(page_size=self.page_size // 2)]
+        return None
+
+
+class TraceTree:
+    """
+    Traces of a transaction indexed by `traceAddress`, so parents and children of a trace are
+    retrieved with dictionary lookups instead of scanning all the traces
+    """
+
+    def __init__(self, traces: Sequence[FilterTrace]):
+        """
+        :param traces: Traces for the SAME ethereum tx, as returned by `trace_transaction`
+        """
+        self.traces = traces
+        self.traces_by_address: Dict[Tuple[int, ...], FilterTrace] = {}
+        self.children_by_address: Dict[Tuple[int, ...], List[FilterTrace]] = {}
+        for trace in traces:
+            trace_address = tuple(trace["traceAddress"])
+            self.traces_by_address[trace_address] = trace
+            if trace_address:
+                self.children_by_address.setdefault(trace_address[:-1], []).append(
+                    trace
+                )
+
+    def __len__(self) -> int:
+        return len(self.traces)
+
+    def get_trace(self, trace_address: Sequence[int]) -> Optional[FilterTrace]:
+        """
+        :param trace_address:
+        :return: Trace for ``trace_address`` if found, ``None`` otherwise
+        """
+        return self.traces_by_address.get(tuple(trace_address))
+
+    def get_previous_trace(
+        self,
+        trace_address: Sequence[int],
+        number_traces: int = 1,
+        skip_delegate_calls: bool = False,
+    ) -> Optional[FilterTrace]:
+        """
+        :param trace_address:
+        :param number_traces: Number of traces to skip, by default get the immediately previous one
+        :param skip_delegate_calls: If True filter out delegate calls
+        :return: Parent trace for a trace
+        """
+        if len(trace_address) < number_traces:
+            return None
+        previous_trace_address = tuple(trace_address[:-number_traces])
+        while (trace := self.traces_by_address.get(previous_trace_address)) is not None:
+            if not (
+                skip_delegate_calls
+                and trace["action"].get("callType") == "delegatecall"
+            ):
+                return trace
+            if not previous_trace_address:
+                break
+            previous_trace_address = previous_trace_address[:-1]
+        return None
+
+    def get_ancestors(
+        self, trace_address: Sequence[int], skip_delegate_calls: bool = False
+    ) -> List[FilterTrace]:
+        """
+        :param trace_address:
+        :param skip_delegate_calls: If True filter out delegate calls
+        :return: Ancestors for a trace, starting with the parent and ending with the root trace
+        """
+        trace_address = tuple(trace_address)
+        ancestors: List[FilterTrace] = []
+        for length in range(len(trace_address) - 1, -1, -1):
+            trace = self.traces_by_address.get(trace_address[:length])
+            if trace is not None and not (
+                skip_delegate_calls
+                and trace["action"].get("callType") == "delegatecall"
+            ):
+                ancestors.append(trace)
+        return ancestors
+
+    def get_next_traces(
+        self,
+        trace_address: Sequence[int],
+        remove_delegate_calls: bool = False,
+        remove_calls: bool = False,
+    ) -> List[FilterTrace]:
+        """
+        :param trace_address:
+        :param remove_delegate_calls: If True remove delegate calls from result
+        :param remove_calls: If True remove calls from result
+        :return: Children for a trace, E.g. if address is [0, 1] it will return [0, 1, x]
+        """
+        children = self.children_by_address.get(tuple(trace_address), [])
+        if not (remove_delegate_calls or remove_calls):
+            return list(children)
+        removed_call_types = set()
+        if remove_delegate_calls:
+            removed_call_types.add("delegatecall")
+        if remove_calls:
+            removed_call_types.add("call")
+        return [
+            trace
+            for trace in children
+            if trace["action"].get("callType") not in removed_call_types
+        ]
+
+
 class TxSpeed(Enum):
     SLOWEST = 0
     VERY_SLOW = 1
@@ -356,6 +721,43 @@ class TxSpeed(Enum):
     FASTEST = 6
 
 
+class BatchCallStrategy(str, Enum):
+    """
+    How ``EthereumClient.batch_call`` sends the calls:
+        - ``AUTO``: ``Multicall`` if available and no ``from`` is overridden, JSON-RPC batch otherwise.
+        - ``MULTICALL``: Always ``Multicall``.
+        - ``JSONRPC``: Always JSON-RPC batch of ``eth_call``.
+    """
+
+    AUTO = "auto"
+    MULTICALL = "multicall"
+    JSONRPC = "jsonrpc"
+
+
+def resolve_batch_call_strategy(
+    strategy: Union[BatchCallStrategy, str],
+    force_batch_call: bool = False,
+    from_address: Optional[ChecksumAddress] = None,
+) -> BatchCallStrategy:
+    """
+    :param strategy:
+    :param force_batch_call: Legacy flag, same as ``BatchCallStrategy.JSONRPC``
+    :param from_address:
+    :return: ``JSONRPC`` if ``Multicall`` must not be used, ``MULTICALL`` if it's required and
+        ``AUTO`` if it must be used only when available
+    :raises ValueError: If ``strategy`` is not valid or ``MULTICALL`` is requested with ``from_address``,
+        as ``Multicall`` is always the ``msg.sender`` of the calls
+    """
+    strategy = BatchCallStrategy(strategy)
+    if force_batch_call or strategy == BatchCallStrategy.JSONRPC:
+        return BatchCallStrategy.JSONRPC
+    if from_address:
+        if strategy == BatchCallStrategy.MULTICALL:
+            raise ValueError("`from_address` cannot be used with Multicall")
+        return BatchCallStrategy.JSONRPC
+    return strategy
+
+
 @cache
 def get_auto_ethereum_client() -> "EthereumClient":
     """
@@ -365,6 +767,8 @@ def get_auto_ethereum_client() -> "EthereumClient":
         - `ETHEREUM_RPC_SLOW_TIMEOUT`: `60` by default.
         - `ETHEREUM_RPC_RETRY_COUNT`: `1` by default.
         - `ETHEREUM_RPC_BATCH_REQUEST_MAX_SIZE`: `500` by default.
+        - `ETHEREUM_RPC_BATCH_REQUEST_MAX_CONCURRENCY`: `1` by default (chunks are sent serially).
+        - `ETHEREUM_RPC_BATCH_REQUEST_ADAPTIVE_SIZE`: `0` by default (batch size is not adapted).
 
     :return: A configured singleton of EthereumClient
     """
@@ -382,6 +786,12 @@ def get_auto_ethereum_client() -> "EthereumClient":
         batch_request_max_size=int(
             os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_MAX_SIZE", 500)
         ),
+        batch_request_max_concurrency=int(
+            os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_MAX_CONCURRENCY", 1)
+        ),
+        adaptive_batch_size=bool(
+            int(os.environ.get("ETHEREUM_RPC_BATCH_REQUEST_ADAPTIVE_SIZE", 0))
+        ),
     )
 
 
@@ -403,6 +813,7 @@ class BatchCallManager(EthereumClientManager):
         raise_exception: bool = True,
         block_identifier: Optional[BlockIdentifier] = "latest",
         batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[Optional[Any]]:
         """
         Do batch requests of multiple contract calls (`eth_call`)
@@ -414,7 +825,9 @@ class BatchCallManager(EthereumClientManager):
             be returned as the value
         :param block_identifier: `latest` by default
         :param batch_size: If `payload` length is bigger than size, it will be split into smaller chunks before
-            sending to the server
+            sending to the server. If not provided, ``EthereumClient`` batch size (adaptive or not) will be used
+        :param max_concurrency: Max number of chunks in flight at the same time. If not provided,
+            ``EthereumClient.batch_request_max_concurrency`` will be used
         :return: List with the ABI decoded return values
         :raises: ValueError if raise_exception=True
         """
@@ -423,26 +836,67 @@ class BatchCallManager(EthereumClientManager):
             return []
 
         queries = build_eth_call_queries(payloads, block_identifier)
-        batch_size = batch_size or self.ethereum_client.batch_request_max_size
         all_results = []
-        for chunk in chunks(queries, batch_size):
-            response = self.http_session.post(
-                self.ethereum_node_url, json=chunk, timeout=self.slow_timeout
-            )
-            if not response.ok:
-                raise ConnectionError(
-                    f"Error connecting to {self.ethereum_node_url}: {response.text}"
-                )
-            all_results.extend(validate_batch_chunk(response.json(), chunk))
+        for chunk_results in self.ethereum_client.batch_request_chunks(
+            self._batch_call_chunk, queries, batch_size, max_concurrency
+        ):
+            all_results.extend(chunk_results)
 
         return_values, errors = decode_eth_call_results(payloads, all_results)
         if errors and raise_exception:
             raise BatchCallFunctionFailed(f"Errors returned {errors}")
         return return_values
 
+    def batch_request_responses(
+        self,
+        payload: Sequence[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send JSON RPC requests (any method, e.g. ``eth_call`` mixed with ``eth_getStorageAt``) in
+        batches, without raising an exception if some of them fail
+
+        :param payload: Batch request payload. Make sure all provided `ids` inside the payload are different.
+            Check ``build_jsonrpc_batch_payload``
+        :param batch_size: If `payload` length is bigger than size, it will be split into smaller chunks before
+            sending to the server. If not provided, ``EthereumClient`` batch size (adaptive or not) will be used
+        :param max_concurrency: Max number of chunks in flight at the same time. If not provided,
+            ``EthereumClient.batch_request_max_concurrency`` will be used
+        :return: JSON RPC responses (with ``result`` or ``error``), sorted as the ``payload``
+        :raises: ConnectionError, ValueError if a batch request fails
+        """
+        responses: List[Dict[str, Any]] = []
+        for chunk_results in self.ethereum_client.batch_request_chunks(
+            self._batch_call_chunk, payload, batch_size, max_concurrency
+        ):
+            responses.extend(sorted(chunk_results, key=lambda x: x["id"]))
+        return responses
+
+    def _batch_call_chunk(self, chunk: Sequence[Dict[str, Any]]) -> List[Any]:
+        """
+        Send one chunk of ``eth_call`` queries
+
+        :param chunk:
+        :return: Validated JSON-RPC results for ``chunk``
+        :raises: ConnectionError, ValueError
+        """
+        response = self.http_session.post(
+            self.ethereum_node_url, json=chunk, timeout=self.slow_timeout
+        )
+        if not response.ok:
+            if response.status_code == 413 or is_batch_too_large_error(response.text):
+                raise BatchRequestTooLarge(
+                    f"Error connecting to {self.ethereum_node_url}: {response.text}"
+                )
+            raise ConnectionError(
+                f"Error connecting to {self.ethereum_node_url}: {response.text}"
+            )
+        return validate_batch_chunk(response.json(), chunk)
+
     def batch_call(
         self,
-        contract_functions: Iterable[ContractFunction],
+        contract_functions: Iterable[Union[ContractFunction, ContractCall]],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         block_identifier: Optional[BlockIdentifier] = "latest",
@@ -451,7 +905,9 @@ class BatchCallManager(EthereumClientManager):
         Do batch requests of multiple contract calls
 
         :param contract_functions: Iterable of contract functions using web3.py contracts. For instance, a valid
-            argument would be [erc20_contract.functions.balanceOf(address), erc20_contract.functions.decimals()]
+            argument would be [erc20_contract.functions.balanceOf(address), erc20_contract.functions.decimals()].
+            Precompiled ``ContractCall`` (e.g. ``ERC20_CALLS["decimals"].build(address=token_address)``)
+            are also supported and way faster to build
         :param from_address: Use this address as `from` in every call if provided
         :param block_identifier: `latest` by default
         :param raise_exception: If False, exception will not be raised if there's any problem and instead `None` will
@@ -467,24 +923,22 @@ class BatchCallManager(EthereumClientManager):
 
     @staticmethod
     def _build_call_payloads(
-        contract_functions: Iterable[ContractFunction],
+        contract_functions: Iterable[Union[ContractFunction, ContractCall]],
         from_address: Optional[ChecksumAddress] = None,
     ) -> List[Dict[str, Any]]:
         """Build ``batch_call_custom`` payloads from contract functions (pure, shared with async)."""
-        params: TxParams = {"gas": Wei(0), "gasPrice": Wei(0)}
         payloads = []
         for contract_function in contract_functions:
-            if not contract_function.address:
+            contract_call = get_contract_call(contract_function)
+            if not contract_call.address:
                 raise ValueError(
-                    f"Missing address for batch_call in `{contract_function.fn_name}`"
+                    f"Missing address for batch_call in `{contract_call.fn_name}`"
                 )
             payload = {
-                "to": contract_function.address,
-                "data": contract_function.build_transaction(params)["data"],
-                "output_type": [
-                    output["type"] for output in contract_function.abi["outputs"]
-                ],
-                "fn_name": contract_function.fn_name,  # For debugging purposes
+                "to": contract_call.address,
+                "data": contract_call.data,
+                "output_type": list(contract_call.output_types),
+                "fn_name": contract_call.fn_name,  # For debugging purposes
             }
             if from_address:
                 payload["from"] = from_address
@@ -493,7 +947,7 @@ class BatchCallManager(EthereumClientManager):
 
     def batch_call_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
@@ -504,7 +958,7 @@ class BatchCallManager(EthereumClientManager):
         but generating the ContractFunction is slow, so this function allows to use the same contract_function for
         multiple addresses
 
-        :param contract_function:
+        :param contract_function: web3.py ``ContractFunction`` or precompiled ``ContractCall``
         :param contract_addresses:
         :param from_address:
         :param raise_exception:
@@ -527,7 +981,7 @@ class BatchCallManager(EthereumClientManager):
 
     @staticmethod
     def _build_same_function_payloads(
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         from_address: Optional[ChecksumAddress] = None,
     ) -> List[Dict[str, Any]]:
@@ -535,19 +989,10 @@ class BatchCallManager(EthereumClientManager):
         Build ``batch_call_custom`` payloads reusing the same function for many addresses
         (pure, shared with async).
         """
-        # Build transaction needs an `address` set, but we don't want to mutate
-        # the caller's contract_function — preserve and restore it.
-        original_address = contract_function.address
-        contract_function.address = NULL_ADDRESS  # It's required by web3.py
-        try:
-            params: TxParams = {"gas": Wei(0), "gasPrice": Wei(0)}
-            data = contract_function.build_transaction(params)["data"]
-            output_type = [
-                output["type"] for output in contract_function.abi["outputs"]
-            ]
-            fn_name = contract_function.fn_name
-        finally:
-            contract_function.address = original_address
+        contract_call = get_contract_call(contract_function)
+        data = contract_call.data
+        output_type = list(contract_call.output_types)
+        fn_name = contract_call.fn_name
 
         payloads = []
         for contract_address in contract_addresses:
@@ -571,86 +1016,97 @@ class Erc20Manager(EthereumClientManager):
     # keccak('Transfer(address,address,uint256)')
     # ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef
     TRANSFER_TOPIC = HexBytes(ERC20_721_TRANSFER_TOPIC)
+    # Default max number of blocks for every ``eth_getLogs`` of ``iter_total_transfer_history``
+    TRANSFER_HISTORY_BLOCK_WINDOW = 10_000
 
     def decode_logs(self, logs: Sequence[LogReceipt]):
+        columns = self.decode_transfer_logs_columns(logs)
         decoded_logs = []
-        for log in logs:
-            decoded = self._decode_transfer_log(log["data"], log["topics"])
-            if decoded:
-                log_copy = dict(log)
-                log_copy["args"] = decoded
-                decoded_logs.append(log_copy)
+        for i, position in enumerate(columns.positions):
+            log_copy = dict(logs[position])
+            log_copy["args"] = columns.get_args(i)
+            decoded_logs.append(log_copy)
         return decoded_logs
 
-    def _decode_transfer_log(
-        self, data: EthereumData, topics: Sequence[bytes]
-    ) -> Optional[Dict[str, Any]]:
-        topics_len = len(topics)
-        if topics_len and topics[0] == self.TRANSFER_TOPIC:
+    def decode_transfer_logs_columns(
+        self, logs: Sequence[LogReceipt]
+    ) -> TransferLogColumns:
+        """
+        Decode ERC20/ERC721 ``Transfer`` logs in batch. As every field is a 32 bytes word,
+        topics and data are sliced directly instead of using ``eth_abi``, and every
+        address is checksummed only once per batch. Logs that are not valid ``Transfer``
+        events are ignored.
+
+        :param logs: Logs as returned by ``eth_getLogs``
+        :return: Decoded logs in columnar form
+        """
+        columns = TransferLogColumns([], [], [], [], [], [], [], [])
+        checksum_addresses: Dict[bytes, ChecksumAddress] = {}
+        transfer_topic = self.TRANSFER_TOPIC
+        for position, log in enumerate(logs):
+            topics = log["topics"]
+            topics_len = len(topics)
+            if not topics_len or topics[0] != transfer_topic:
+                continue
+
             if topics_len == 1:
                 # Not standard Transfer(address from, address to, uint256 unknown)
                 # 1 topic (transfer topic)
-                try:
-                    _from, to, unknown = eth_abi.decode(
-                        ["address", "address", "uint256"], HexBytes(data)
-                    )
-                    return {
-                        "from": fast_to_checksum_address(_from),
-                        "to": fast_to_checksum_address(to),
-                        "unknown": unknown,
-                    }
-                except DecodingError:
-                    logger.warning(
-                        "Cannot decode Transfer event `address from, address to, uint256 unknown` from data=%s",
-                        data.hex() if isinstance(data, bytes) else data,
-                    )
-                    return None
+                data = bytes(HexBytes(log["data"]))
+                words = [data[:32], data[32:64], data[64:96]]
+                value_name = "unknown"
             elif topics_len == 3:
                 # ERC20 Transfer(address indexed from, address indexed to, uint256 value)
                 # 3 topics (transfer topic + from + to)
-                value_data = HexBytes(data)
-                try:
-                    value = eth_abi.decode(["uint256"], value_data)[0]
-                except DecodingError:
-                    logger.warning(
-                        "Cannot decode Transfer event `uint256 value` from data=%s",
-                        to_0x_hex_str(value_data),
-                    )
-                    return None
-                from_to_data = b"".join(topics[1:])
-                try:
-                    _from, to = (
-                        fast_to_checksum_address(address)
-                        for address in eth_abi.decode(
-                            ["address", "address"], from_to_data
-                        )
-                    )
-                    return {"from": _from, "to": to, "value": value}
-                except DecodingError:
-                    logger.warning(
-                        "Cannot decode Transfer event `address from, address to` from topics=%s",
-                        to_0x_hex_str(from_to_data),
-                    )
-                    return None
+                data = bytes(HexBytes(log["data"]))
+                words = [bytes(topics[1]), bytes(topics[2]), data[:32]]
+                value_name = "value"
             elif topics_len == 4:
                 # ERC712 Transfer(address indexed from, address indexed to, uint256 indexed tokenId)
                 # 4 topics (transfer topic + from + to + tokenId)
-                from_to_token_id_data = b"".join(topics[1:])
-                try:
-                    _from, to, token_id = eth_abi.decode(
-                        ["address", "address", "uint256"], from_to_token_id_data
-                    )
-                    _from, to = [
-                        fast_to_checksum_address(address) for address in (_from, to)
-                    ]
-                    return {"from": _from, "to": to, "tokenId": token_id}
-                except DecodingError:
-                    logger.warning(
-                        "Cannot decode Transfer event `address from, address to` from topics=%s",
-                        to_0x_hex_str(from_to_token_id_data),
+                words = [bytes(topic) for topic in topics[1:]]
+                value_name = "tokenId"
+            else:
+                continue
+
+            from_word, to_word, value_word = words
+            if (
+                len(from_word) != 32
+                or len(to_word) != 32
+                or len(value_word) != 32
+                or any(from_word[:12])
+                or any(to_word[:12])
+            ):
+                logger.warning(
+                    "Cannot decode Transfer event from topics=%s and data=%s",
+                    [to_0x_hex_str(topic) for topic in topics],
+                    (
+                        log["data"].hex()
+                        if isinstance(log["data"], bytes)
+                        else log["data"]
+                    ),
+                )
+                continue
+
+            addresses = []
+            for word in (from_word, to_word):
+                address = word[12:]
+                checksum_address = checksum_addresses.get(address)
+                if checksum_address is None:
+                    checksum_address = checksum_addresses[address] = (
+                        fast_bytes_to_checksum_address(address)
                     )
-                    return None
-        return None
+                addresses.append(checksum_address)
+
+            columns.positions.append(position)
+            columns.token_addresses.append(log["address"])
+            columns.from_addresses.append(addresses[0])
+            columns.to_addresses.append(addresses[1])
+            columns.values.append(int.from_bytes(value_word, "big"))
+            columns.value_names.append(value_name)
+            columns.block_numbers.append(log["blockNumber"])
+            columns.log_indexes.append(log["logIndex"])
+        return columns
 
     def get_balance(
         self, address: ChecksumAddress, token_address: ChecksumAddress
@@ -684,7 +1140,7 @@ class Erc20Manager(EthereumClientManager):
         """
 
         balances = self.ethereum_client.batch_call_same_function(
-            get_erc20_contract(self.ethereum_client.w3).functions.balanceOf(address),
+            ERC20_CALLS["balanceOf"].build(address),
             token_addresses,
             raise_exception=False,
         )
@@ -714,24 +1170,21 @@ class Erc20Manager(EthereumClientManager):
         ]
 
     @staticmethod
-    def _build_fn_call_data(w3: Web3, erc20_address: ChecksumAddress, fn_name: str):
+    def _build_fn_call_data(fn_name: str) -> HexStr:
         """
         Build the calldata for a no-arg ERC20 function (``name``, ``symbol``...).
         Pure helper (no I/O) shared with the async client.
         """
-        erc20 = get_erc20_contract(w3, erc20_address)
-        return getattr(erc20.functions, fn_name)().build_transaction(
-            {"gas": Wei(0), "gasPrice": Wei(0)}
-        )["data"]
+        return ERC20_CALLS[fn_name].build_data()
 
     def get_name(self, erc20_address: ChecksumAddress) -> str:
-        data = self._build_fn_call_data(self.w3, erc20_address, "name")
+        data = self._build_fn_call_data("name")
         return decode_string_or_bytes32(
             self.w3.eth.call({"to": erc20_address, "data": data})
         )
 
     def get_symbol(self, erc20_address: ChecksumAddress) -> str:
-        data = self._build_fn_call_data(self.w3, erc20_address, "symbol")
+        data = self._build_fn_call_data("symbol")
         return decode_string_or_bytes32(
             self.w3.eth.call({"to": erc20_address, "data": data})
         )
@@ -763,15 +1216,9 @@ class Erc20Manager(EthereumClientManager):
         self, erc20_address: ChecksumAddress
     ) -> List[Dict[str, Any]]:
         """Build the ``eth_call`` batch payload to fetch ``name``, ``symbol`` and ``decimals``."""
-        erc20 = get_erc20_contract(self.w3, erc20_address)
-        params: TxParams = {
-            "gas": Wei(0),
-            "gasPrice": Wei(0),
-        }  # Prevent executing tx, we are just interested on `data`
         datas = [
-            erc20.functions.name().build_transaction(params)["data"],
-            erc20.functions.symbol().build_transaction(params)["data"],
-            erc20.functions.decimals().build_transaction(params)["data"],
+            ERC20_CALLS[fn_name].build_data()
+            for fn_name in ("name", "symbol", "decimals")
         ]
         return [
             {
@@ -807,6 +1254,7 @@ class Erc20Manager(EthereumClientManager):
         from_block: BlockIdentifier = BlockNumber(0),
         to_block: Optional[BlockIdentifier] = None,
         token_address: Optional[ChecksumAddress] = None,
+        block_window: Optional[int] = None,
     ) -> List[LogReceiptDecoded]:
         """
         Get events for erc20 and erc721 transfers from and to an `address`. We decode it manually.
@@ -876,8 +1324,27 @@ class Erc20Manager(EthereumClientManager):
         :param from_block: Block to start querying from
         :param to_block: Block to stop querying from
         :param token_address: Address of the token
+        :param block_window: If provided, the block range is split in windows of ``block_window`` blocks
+            at most, shrinking them if the node returns too many results. Check
+            ``iter_total_transfer_history``. Block tags and hashes are resolved to block numbers first
         :return: List of events sorted by blockNumber
+        :raises: ValueError if ``block_window`` is provided and a block cannot be found
         """
+        if block_window:
+            return [
+                event
+                for window in self.iter_total_transfer_history(
+                    addresses,
+                    from_block=self._get_block_number(from_block),
+                    to_block=(
+                        None if to_block is None else self._get_block_number(to_block)
+                    ),
+                    token_address=token_address,
+                    block_window=block_window,
+                )
+                for event in window.events
+            ]
+
         all_topics, parameters = self._build_transfer_history_filters(
             addresses, from_block, to_block, token_address
         )
@@ -888,6 +1355,157 @@ class Erc20Manager(EthereumClientManager):
         ]
         return self._decode_and_sort_transfer_events(events_per_topic)
 
+    def iter_total_transfer_history(
+        self,
+        addresses: Optional[Sequence[ChecksumAddress]] = None,
+        from_block: int = 0,
+        to_block: Optional[int] = None,
+        token_address: Optional[ChecksumAddress] = None,
+        block_window: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[TransferHistoryWindow]:
+        """
+        Sharded version of ``get_total_transfer_history``. Block range is split in windows that are
+        requested concurrently, and every window is yielded in block order as soon as it's available.
+        If the node rejects a window because of too many results (or times out), it's bisected and the
+        window size is reduced for the next ones. Window size grows back to ``block_window`` afterwards.
+
+        To resume an interrupted backfill, call it again using the ``next_block`` of the last
+        window processed as ``from_block``.
+
+        :param addresses: Search events `from` and `to` these `addresses`. If not, every transfer event within the
+            range will be retrieved
+        :param from_block: Block to start querying from
+        :param to_block: Block to stop querying from (included). If not provided, current block number
+            will be used
+        :param token_address: Address of the token
+        :param block_window: Max number of blocks for every ``eth_getLogs`` request. If not provided,
+            ``TRANSFER_HISTORY_BLOCK_WINDOW`` will be used
+        :param max_concurrency: Max number of windows in flight at the same time. If not provided,
+            ``EthereumClient.batch_request_max_concurrency`` will be used
+        :return: Generator of ``TransferHistoryWindow``, with the events of every window sorted by blockNumber
+        """
+        max_block_window = block_window or self.TRANSFER_HISTORY_BLOCK_WINDOW
+        max_concurrency = (
+            max_concurrency or self.ethereum_client.batch_request_max_concurrency
+        )
+        all_topics, parameters = self._build_transfer_history_filters(
+            addresses, from_block, to_block, token_address
+        )
+        if to_block is None:
+            to_block = self.ethereum_client.current_block_number
+
+        window_size = max_block_window
+        while from_block <= to_block:
+            windows = plan_block_windows(
+                from_block, to_block, window_size, max_concurrency
+            )
+            fetched_window_sizes = []
+            for (window_from_block, window_to_block), (
+                events,
+                fetched_window_size,
+            ) in zip(
+                windows,
+                self.ethereum_client.map_batch_chunks(
+                    partial(self._get_transfer_history_window, all_topics, parameters),
+                    windows,
+                    max_concurrency,
+                ),
+            ):
+                fetched_window_sizes.append(fetched_window_size)
+                yield TransferHistoryWindow(events, window_from_block, window_to_block)
+            from_block = windows[-1][1] + 1
+            window_size = self._next_transfer_history_window_size(
+                window_size, max_block_window, fetched_window_sizes
+            )
+
+    @staticmethod
+    def _next_transfer_history_window_size(
+        window_size: int, max_block_window: int, fetched_window_sizes: Sequence[int]
+    ) -> int:
+        """
+        :return: Window size for the next windows: the smallest size that worked if some window
+            had to be split, or double ``window_size`` (up to ``max_block_window``) otherwise
+        """
+        min_fetched_window_size = min(fetched_window_sizes)
+        if min_fetched_window_size < window_size:
+            return min_fetched_window_size
+        return min(window_size * 2, max_block_window)
+
+    def _get_transfer_history_window(
+        self,
+        all_topics: Sequence[Sequence[Any]],
+        parameters: FilterParams,
+        window: Tuple[int, int],
+    ) -> Tuple[List[LogReceiptDecoded], int]:
+        """
+        :param all_topics:
+        :param parameters:
+        :param window: ``(from_block, to_block)``, both included
+        :return: Tuple with the decoded events for the window sorted by blockNumber and the size
+            of the smallest window requested, as the window is bisected if the node returns too
+            many results
+        """
+        from_block, to_block = window
+        try:
+            events_per_topic = [
+                self.slow_w3.eth.get_logs(
+                    {
+                        **parameters,
+                        "fromBlock": from_block,
+                        "toBlock": to_block,
+                        "topics": topics,
+                    }
+                )
+                for topics in all_topics
+            ]
+        except (Web3Exception, ValueError, requests.exceptions.Timeout) as exc:
+            if from_block == to_block or not (
+                isinstance(exc, requests.exceptions.Timeout)
+                or is_too_many_results_error(exc)
+            ):
+                raise
+            middle_block = (from_block + to_block) // 2
+            logger.info(
+                "Cannot get transfer history for blocks %d-%d, splitting the range: %s",
+                from_block,
+                to_block,
+                exc,
+            )
+            first_events, first_window_size = self._get_transfer_history_window(
+                all_topics, parameters, (from_block, middle_block)
+            )
+            second_events, second_window_size = self._get_transfer_history_window(
+                all_topics, parameters, (middle_block + 1, to_block)
+            )
+            return first_events + second_events, min(
+                first_window_size, second_window_size
+            )
+        return (
+            self._decode_and_sort_transfer_events(events_per_topic),
+            to_block - from_block + 1,
+        )
+
+    def _get_block_number(self, block_identifier: BlockIdentifier) -> int:
+        """
+        :param block_identifier: Block number, tag (e.g. ``latest``) or hash
+        :return: Block number for ``block_identifier``
+        :raises: ValueError if block is not found
+        """
+        if isinstance(block_identifier, int):
+            return block_identifier
+        return self._parse_block_number(
+            block_identifier, self.ethereum_client.get_block(block_identifier)
+        )
+
+    @staticmethod
+    def _parse_block_number(
+        block_identifier: BlockIdentifier, block: Optional[BlockData]
+    ) -> int:
+        if not block or block.get("number") is None:
+            raise ValueError(f"Cannot get block number for {block_identifier!r}")
+        return block["number"]
+
     def _build_transfer_history_filters(
         self,
         addresses: Optional[Sequence[ChecksumAddress]],
@@ -924,17 +1542,19 @@ class Erc20Manager(EthereumClientManager):
         (both share the same signature) and deduplicating events that match more than
         one topics filter (e.g. a transfer where both ``from`` and ``to`` are searched).
         """
-        erc20_events: List[LogReceiptDecoded] = []
+        events: List[LogReceipt] = []
         seen: set = set()
-        for events in events_per_topic:
-            for event in events:
-                key = (event["transactionHash"], event["logIndex"])
-                if key in seen:
-                    continue
-                event_args = self._decode_transfer_log(event["data"], event["topics"])
-                if event_args:
-                    seen.add(key)
-                    erc20_events.append(LogReceiptDecoded(**event, args=event_args))
+        for event in (event for events in events_per_topic for event in events):
+            key = (event["transactionHash"], event["logIndex"])
+            if key not in seen:
+                seen.add(key)
+                events.append(event)
+
+        columns = self.decode_transfer_logs_columns(events)
+        erc20_events = [
+            LogReceiptDecoded(**events[position], args=columns.get_args(i))
+            for i, position in enumerate(columns.positions)
+        ]
         erc20_events.sort(key=lambda x: x["blockNumber"])
         return erc20_events
 
@@ -1065,11 +1685,8 @@ class Erc721Manager(EthereumClientManager):
         :param token_addresses: token addresses to check
         :return:
         """
-        function = get_erc721_contract(self.ethereum_client.w3).functions.balanceOf(
-            address
-        )
         balances = self.ethereum_client.batch_call_same_function(
-            function,
+            ERC721_CALLS["balanceOf"].build(address),
             token_addresses,
             raise_exception=False,
         )
@@ -1089,13 +1706,11 @@ class Erc721Manager(EthereumClientManager):
         self,
         fn_name: str,
         token_addresses_with_token_ids: Sequence[Tuple[ChecksumAddress, int]],
-    ) -> List[ContractFunction]:
-        """Build the ``ownerOf``/``tokenURI`` contract functions (pure, shared with async)."""
+    ) -> List[ContractCall]:
+        """Build the ``ownerOf``/``tokenURI`` contract calls (pure, shared with async)."""
+        call_builder = ERC721_CALLS[fn_name]
         return [
-            getattr(
-                get_erc721_contract(self.ethereum_client.w3, token_address).functions,
-                fn_name,
-            )(token_id)
+            call_builder.build(token_id, address=token_address)
             for token_address, token_id in token_addresses_with_token_ids
         ]
 
@@ -1107,14 +1722,13 @@ class Erc721Manager(EthereumClientManager):
         :param token_address:
         :return: Erc721Info
         """
-        erc721_contract = get_erc721_contract(self.w3, token_address)
         try:
             name, symbol = cast(
                 List[str],
                 self.ethereum_client.batch_call(
                     [
-                        erc721_contract.functions.name(),
-                        erc721_contract.functions.symbol(),
+                        ERC721_CALLS["name"].build(address=token_address),
+                        ERC721_CALLS["symbol"].build(address=token_address),
                     ]
                 ),
             )
@@ -1169,32 +1783,109 @@ class Erc721Manager(EthereumClientManager):
 
 
 class TracingManager(EthereumClientManager):
+    TRACE_FILTER_PAGE_SIZE = 1_000  # Default ``count`` for ``iter_trace_filter`` pages
+    # Trace trees LRU cache is disabled by default, as traces can be reorged
+    TRACE_TREE_CACHE_SIZE = int(os.getenv("CACHE_TRACE_TREE", 0))
+
+    def __init__(self, ethereum_client: "EthereumClient"):
+        super().__init__(ethereum_client)
+        self._trace_tree_cache: "OrderedDict[HexBytes, TraceTree]" = OrderedDict()
+        self._trace_tree_cache_lock = threading.Lock()
+
     def filter_out_errored_traces(
         self, internal_txs: Sequence[Dict[str, Any]]
     ) -> Sequence[Dict[str, Any]]:
         """
         Filter out errored transactions (traces that are errored or that have an errored parent)
 
-        :param internal_txs: Traces for the SAME ethereum tx, sorted ascending by `trace_address`
-            `sorted(t, key = lambda i: i['traceAddress'])`. It's the default output from methods returning `traces` like
-            `trace_block` or `trace_transaction`
-        :return: List of not errored traces
+        Traces are indexed in a trie keyed by `trace_address`, so input does not need to be sorted
+        and errored subtrees are discarded without scanning the traces again.
+
+        :param internal_txs: Traces for the SAME ethereum tx. It's the default output from methods returning
+            `traces` like `trace_block` or `trace_transaction`
+        :return: List of not errored traces, sorted ascending by `trace_address`
         """
-        new_list = []
-        errored_trace_address: Optional[List[int]] = None
+        # Every trie node is a list ``[trace, children_by_index]``
+        root: List[Any] = [None, {}]
         for internal_tx in internal_txs:
-            if internal_tx.get("error") is not None:
-                errored_trace_address = internal_tx["traceAddress"]
-            elif (
-                errored_trace_address is not None
-                and internal_tx["traceAddress"][: len(errored_trace_address)]
-                == errored_trace_address
-            ):
-                continue
-            else:
+            node = root
+            for index in internal_tx["traceAddress"]:
+                node = node[1].setdefault(index, [None, {}])
+            node[0] = internal_tx
+
+        new_list = []
+        pending_nodes = [root]
+        while pending_nodes:
+            internal_tx, children = pending_nodes.pop()
+            if internal_tx is not None:
+                if internal_tx.get("error") is not None:
+                    continue
                 new_list.append(internal_tx)
+            pending_nodes.extend(
+                children[index] for index in sorted(children, reverse=True)
+            )
         return new_list
 
+    def group_traces_by_transaction(
+        self, traces: Iterable[BlockTrace], filter_errored: bool = True
+    ) -> Iterator[List[BlockTrace]]:
+        """
+        Group block traces by `transactionHash` in one pass. Traces not linked to a transaction
+        (e.g. block rewards) are ignored
+
+        :param traces: Traces for a block, as returned by `trace_block`
+        :param filter_errored: If ``True``, use :meth:`filter_out_errored_traces` for every transaction
+        :return: List of traces for every transaction, in the same order transactions appear on ``traces``
+        """
+        traces_by_tx_hash: Dict[Any, List[BlockTrace]] = {}
+        for trace in traces:
+            tx_hash = trace.get("transactionHash")
+            if tx_hash is not None:
+                traces_by_tx_hash.setdefault(tx_hash, []).append(trace)
+        for tx_traces in traces_by_tx_hash.values():
+            yield (
+                self.filter_out_errored_traces(tx_traces)  # type: ignore[misc]
+                if filter_errored
+                else tx_traces
+            )
+
+    def get_trace_tree(self, tx_hash: EthereumHash) -> TraceTree:
+        """
+        If ``TRACE_TREE_CACHE_SIZE`` (``CACHE_TRACE_TREE`` env variable) is set, trees are kept
+        in a LRU cache by `tx_hash`, so traces for a transaction are only requested once while
+        walking them. Empty traces (transaction not traced yet) are never cached.
+        Use :meth:`clear_trace_tree_cache` if transactions can be reorged
+
+        :param tx_hash:
+        :return: :class:`TraceTree` for the internal txs of `tx_hash`
+        :raises: ``ValueError`` if tracing is not supported
+        """
+        trace_tree = self._get_cached_trace_tree(tx_hash)
+        if trace_tree is None:
+            trace_tree = TraceTree(self.trace_transaction(tx_hash))
+            self._cache_trace_tree(tx_hash, trace_tree)
+        return trace_tree
+
+    def clear_trace_tree_cache(self) -> None:
+        with self._trace_tree_cache_lock:
+            self._trace_tree_cache.clear()
+
+    def _get_cached_trace_tree(self, tx_hash: EthereumHash) -> Optional[TraceTree]:
+        key = HexBytes(tx_hash)
+        with self._trace_tree_cache_lock:
+            trace_tree = self._trace_tree_cache.get(key)
+            if trace_tree is not None:
+                self._trace_tree_cache.move_to_end(key)
+            return trace_tree
+
+    def _cache_trace_tree(self, tx_hash: EthereumHash, trace_tree: TraceTree) -> None:
+        if self.TRACE_TREE_CACHE_SIZE <= 0 or not len(trace_tree):
+            return
+        with self._trace_tree_cache_lock:
+            self._trace_tree_cache[HexBytes(tx_hash)] = trace_tree
+            while len(self._trace_tree_cache) > self.TRACE_TREE_CACHE_SIZE:
+                self._trace_tree_cache.popitem(last=False)
+
     def get_previous_trace(
         self,
         tx_hash: EthereumHash,
@@ -1212,33 +1903,10 @@ class TracingManager(EthereumClientManager):
         """
         if len(trace_address) < number_traces:
             return None
-        return self._select_previous_trace(
-            self.trace_transaction(tx_hash),
-            trace_address,
-            number_traces,
-            skip_delegate_calls,
+        return self.get_trace_tree(tx_hash).get_previous_trace(
+            trace_address, number_traces, skip_delegate_calls
         )
 
-    @staticmethod
-    def _select_previous_trace(
-        traces: Sequence[FilterTrace],
-        trace_address: Sequence[int],
-        number_traces: int = 1,
-        skip_delegate_calls: bool = False,
-    ) -> Optional[Dict[str, Any]]:
-        """Pure selection logic shared with the async client."""
-        trace_address = trace_address[:-number_traces]
-        for trace in reversed(list(traces)):
-            if trace_address == trace["traceAddress"]:
-                if (
-                    skip_delegate_calls
-                    and trace["action"].get("callType") == "delegatecall"
-                ):
-                    trace_address = trace_address[:-1]
-                else:
-                    return trace
-        return None
-
     def get_next_traces(
         self,
         tx_hash: EthereumHash,
@@ -1254,48 +1922,50 @@ class TracingManager(EthereumClientManager):
         :return: Children for a trace, E.g. if address is [0, 1] and number_traces = 1, it will return [0, 1, x]
         :raises: ``ValueError`` if tracing is not supported
         """
-        return self._select_next_traces(
-            self.trace_transaction(tx_hash),
-            trace_address,
-            remove_delegate_calls,
-            remove_calls,
+        return self.get_trace_tree(tx_hash).get_next_traces(
+            trace_address, remove_delegate_calls, remove_calls
         )
 
-    @staticmethod
-    def _select_next_traces(
-        all_traces: Sequence[FilterTrace],
-        trace_address: Sequence[int],
-        remove_delegate_calls: bool = False,
-        remove_calls: bool = False,
-    ) -> List[FilterTrace]:
-        """Pure selection logic shared with the async client."""
-        trace_address_len = len(trace_address)
-        traces: List[FilterTrace] = []
-        for trace in all_traces:
-            if (
-                trace_address_len + 1 == len(trace["traceAddress"])
-                and trace_address == trace["traceAddress"][:-1]
-            ):
-                if (
-                    remove_delegate_calls
-                    and trace["action"].get("callType") == "delegatecall"
-                ):
-                    pass
-                elif remove_calls and trace["action"].get("callType") == "call":
-                    pass
-                else:
-                    traces.append(trace)
-        return traces
-
     def trace_block(self, block_identifier: BlockIdentifier) -> List[BlockTrace]:
         return self.slow_w3.tracing.trace_block(block_identifier)  # type: ignore[attr-defined]
 
     def trace_blocks(
-        self, block_identifiers: Sequence[BlockIdentifier]
+        self,
+        block_identifiers: Sequence[BlockIdentifier],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> List[List[BlockTrace]]:
+        """
+        :param block_identifiers:
+        :param batch_size: Blocks traced per JSON RPC Batch request. If not provided,
+            ``batch_request_max_size`` will be used
+        :param max_concurrency: Max number of JSON RPC Batch requests in flight at the same time.
+            If not provided, ``batch_request_max_concurrency`` will be used
+        :return: For every block a list of traces (in the same order as the `block_identifiers` were provided)
+        """
+        return list(
+            self._iter_trace_blocks(block_identifiers, batch_size, max_concurrency)
+        )
+
+    def _iter_trace_blocks(
+        self,
+        block_identifiers: Sequence[BlockIdentifier],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[List[BlockTrace]]:
         if not block_identifiers:
-            return []
-        payload = build_jsonrpc_batch_payload(
+            return
+        payload = self._build_trace_blocks_payload(block_identifiers)
+        for block_traces in self.ethereum_client.raw_batch_request(
+            payload, batch_size=batch_size, max_concurrency=max_concurrency
+        ):
+            yield trace_list_result_formatter(block_traces)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _build_trace_blocks_payload(
+        block_identifiers: Sequence[BlockIdentifier],
+    ) -> List[Dict[str, Any]]:
+        return build_jsonrpc_batch_payload(
             [
                 (
                     "trace_block",
@@ -1304,8 +1974,32 @@ class TracingManager(EthereumClientManager):
                 for b in block_identifiers
             ]
         )
-        results = self.ethereum_client.raw_batch_request(payload)
-        return [trace_list_result_formatter(block_traces) for block_traces in results]  # type: ignore[arg-type]
+
+    def iter_blocks_transaction_traces(
+        self,
+        block_identifiers: Sequence[BlockIdentifier],
+        filter_errored: bool = True,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterator[List[BlockTrace]]:
+        """
+        Trace blocks concurrently and yield the traces grouped by transaction. Traces for a block
+        are processed as soon as the batch request including the block is received, while the
+        next batch requests are still in flight.
+
+        :param block_identifiers:
+        :param filter_errored: If ``True`` (default), errored traces and their children are removed,
+            check :meth:`filter_out_errored_traces`
+        :param batch_size: Blocks traced per JSON RPC Batch request. If not provided,
+            ``batch_request_max_size`` will be used
+        :param max_concurrency: Max number of JSON RPC Batch requests in flight at the same time.
+            If not provided, ``batch_request_max_concurrency`` will be used
+        :return: Iterator with the traces for every transaction, sorted by block and transaction
+        """
+        for block_traces in self._iter_trace_blocks(
+            block_identifiers, batch_size, max_concurrency
+        ):
+            yield from self.group_traces_by_transaction(block_traces, filter_errored)
 
     def trace_transaction(self, tx_hash: EthereumHash) -> List[FilterTrace]:
         """
@@ -1419,6 +2113,86 @@ class TracingManager(EthereumClientManager):
         )
         return self.slow_w3.tracing.trace_filter(parameters)  # type: ignore[attr-defined]
 
+    def iter_trace_filter(
+        self,
+        from_block: int = 1,
+        to_block: Optional[int] = None,
+        from_address: Optional[Sequence[ChecksumAddress]] = None,
+        to_address: Optional[Sequence[ChecksumAddress]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[FilterTrace]:
+        """
+        Lazily iterate ``trace_filter`` results, paginating with ``after`` and ``count``. Only one
+        page is kept in memory, and the next one is requested in a background thread while the
+        current one is being consumed. If the node rejects a request because of its size
+        or it times out, the block range is bisected or the page size is halved and the request retried.
+        A range is exhausted when an empty page is returned, as nodes can cap ``count``.
+
+        :param from_block: From this block. `0` is not working, it needs to be `>= 1`
+        :param to_block: To this block (included). If not provided, current block number is used
+        :param from_address: Sent from these addresses
+        :param to_address: Sent to these addresses
+        :param page_size: Number of traces requested per page. If not provided,
+            ``TRACE_FILTER_PAGE_SIZE`` is used
+        :return: Iterator of traces, in the same order as ``trace_filter`` returns them
+        :raises: ``ValueError`` if tracing is not supported
+        """
+        if to_block is None:
+            to_block = self.ethereum_client.current_block_number
+        pending_requests = [
+            TraceFilterRequest(
+                from_block, to_block, 0, page_size or self.TRACE_FILTER_PAGE_SIZE
+            )
+        ]
+
+        def get_page(request: TraceFilterRequest) -> List[FilterTrace]:
+            return self.trace_filter(
+                request.from_block,
+                request.to_block,
+                from_address=from_address,
+                to_address=to_address,
+                after=request.after,
+                count=request.page_size,
+            )
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            request = pending_requests.pop()
+            future = executor.submit(get_page, request)
+            while True:
+                try:
+                    traces = future.result()
+                except (Web3Exception, ValueError, requests.exceptions.Timeout) as exc:
+                    smaller_requests = request.split()
+                    if smaller_requests is None or not (
+                        isinstance(exc, requests.exceptions.Timeout)
+                        or is_too_many_results_error(exc)
+                    ):
+                        raise
+                    logger.info(
+                        "Cannot get traces for %s, splitting the request: %s",
+                        request,
+                        exc,
+                    )
+                    traces = []
+                    pending_requests.extend(smaller_requests)
+                else:
+                    # Only an empty page ends the range, nodes can cap ``count`` below
+                    # the requested page size
+                    if traces:
+                        pending_requests.append(
+                            request._replace(after=request.after + len(traces))
+                        )
+
+                if not pending_requests:
+                    yield from traces
+                    return
+                request = pending_requests.pop()
+                future = executor.submit(get_page, request)  # Prefetch next page
+                yield from traces
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     @staticmethod
     def _build_trace_filter_params(
         from_block: int = 1,
@@ -1463,6 +2237,8 @@ class EthereumClient:
         retry_count: int = 1,
         use_request_caching: bool = True,
         batch_request_max_size: int = 500,
+        batch_request_max_concurrency: int = 1,
+        adaptive_batch_size: bool = False,
     ):
         """
         :param ethereum_node_url: Ethereum RPC uri
@@ -1471,6 +2247,11 @@ class EthereumClient:
         :param retry_count: Retry count for failed requests
         :param use_request_caching: Use web3 request caching https://web3py.readthedocs.io/en/latest/internals.html#request-caching
         :param batch_request_max_size: Max size for JSON RPC Batch requests. Some providers have a limitation on 500
+        :param batch_request_max_concurrency: Max number of JSON RPC Batch chunks in flight at the same time
+            when a batch is bigger than ``batch_request_max_size``. ``1`` (default) sends the chunks serially
+        :param adaptive_batch_size: If ``True``, chunks rejected by the node due to their size or timing out
+            are split in halves and retried, and the batch size learned for the node is reused for the next
+            batches (never exceeding ``batch_request_max_size``). Check :class:`AdaptiveBatchSize`
 
         Constructing the client performs no network I/O, the RPC is first contacted
         when a method requiring it is called.
@@ -1507,6 +2288,16 @@ class EthereumClient:
         self.tracing: TracingManager = TracingManager(self)
         self.batch_call_manager: BatchCallManager = BatchCallManager(self)
         self.batch_request_max_size = batch_request_max_size
+        self.batch_request_max_concurrency = batch_request_max_concurrency
+        self.batch_size_controller: Optional[AdaptiveBatchSize] = (
+            AdaptiveBatchSize.for_node(
+                self.ethereum_node_url,
+                batch_request_max_size,
+                target_latency=slow_provider_timeout / 2,
+            )
+            if adaptive_batch_size
+            else None
+        )
 
     @staticmethod
     def _adjust_middlewares(*w3s: Union[Web3, AsyncWeb3]) -> None:
@@ -1532,36 +2323,147 @@ class EthereumClient:
         if getattr(self, "http_session", None):
             self.http_session.close()
 
+    def map_batch_chunks(
+        self,
+        fn: Callable[[T], R],
+        payload_chunks: Sequence[T],
+        max_concurrency: Optional[int] = None,
+    ) -> Iterable[R]:
+        """
+        Apply ``fn`` (usually a blocking POST of a JSON RPC Batch chunk) to every chunk, yielding the
+        results in the same order as ``payload_chunks``. If more than one chunk can be in flight a thread
+        pool is used, otherwise chunks are processed serially.
+
+        If ``fn`` raises for one chunk the exception is raised when that chunk is reached, after the results
+        of the previous chunks were yielded, and pending chunks are cancelled.
+
+        :param fn:
+        :param payload_chunks:
+        :param max_concurrency: Max number of chunks in flight at the same time. If not provided,
+            ``batch_request_max_concurrency`` will be used
+        :return: Generator with the result of ``fn`` for every chunk
+        """
+        max_concurrency = min(
+            max_concurrency or self.batch_request_max_concurrency, len(payload_chunks)
+        )
+        if max_concurrency <= 1:
+            yield from map(fn, payload_chunks)
+        else:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                yield from executor.map(fn, payload_chunks)
+
+    def batch_request_chunks(
+        self,
+        fn: Callable[[Sequence[T]], List[R]],
+        payload: Sequence[T],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> Iterable[List[R]]:
+        """
+        Split ``payload`` in chunks and send them using ``fn``. If ``batch_size`` is not provided and
+        ``adaptive_batch_size`` is enabled, the learned batch size for the node is used and chunks
+        rejected due to their size are split and retried.
+
+        :param fn: Sends a chunk of the JSON RPC Batch request and returns its results
+        :param payload:
+        :param batch_size:
+        :param max_concurrency:
+        :return: Generator with the results for every chunk, in the same order as ``payload``
+        """
+        if not batch_size and self.batch_size_controller:
+            batch_size = self.batch_size_controller.size
+            fn = partial(self._send_adaptive_chunk, fn)
+        payload_chunks = list(
+            chunks(payload, batch_size or self.batch_request_max_size)
+        )
+        return self.map_batch_chunks(fn, payload_chunks, max_concurrency)
+
+    def _send_adaptive_chunk(
+        self, fn: Callable[[Sequence[T]], List[R]], payload_chunk: Sequence[T]
+    ) -> List[R]:
+        """
+        Send ``payload_chunk`` using ``fn``. If it's rejected due to its size or times out, batch size is
+        decreased and only that chunk is retried in smaller chunks. Otherwise, batch size is increased.
+
+        :param fn:
+        :param payload_chunk:
+        :return: Results for ``payload_chunk``
+        """
+        assert self.batch_size_controller is not None
+        start = time.monotonic()
+        try:
+            results = fn(payload_chunk)
+        except (BatchRequestTooLarge, requests.exceptions.Timeout) as exc:
+            if len(payload_chunk) <= self.batch_size_controller.min_size:
+                raise
+            batch_size = self.batch_size_controller.decrease(len(payload_chunk))
+            logger.warning(
+                "Batch request of %d elements failed for %s, retrying with batch size %d: %s",
+                len(payload_chunk),
+                self.ethereum_node_url,
+                batch_size,
+                exc,
+            )
+            return [
+                result
+                for payload_sub_chunk in chunks(payload_chunk, batch_size)
+                for result in self._send_adaptive_chunk(fn, payload_sub_chunk)
+            ]
+        self.batch_size_controller.increase(time.monotonic() - start)
+        return results
+
     def raw_batch_request(
-        self, payload: Sequence[Dict[str, Any]], batch_size: Optional[int] = None
+        self,
+        payload: Sequence[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
     ) -> Iterable[Union[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
         """
         Perform a raw batch JSON RPC call
 
         :param payload: Batch request payload. Make sure all provided `ids` inside the payload are different
         :param batch_size: If `payload` length is bigger than size, it will be split into smaller chunks before
-            sending to the server
+            sending to the server. If not provided, ``batch_request_max_size`` or the adaptive batch size
+            will be used
+        :param max_concurrency: Max number of chunks in flight at the same time. If not provided,
+            ``batch_request_max_concurrency`` will be used
         :return:
         :raises: ValueError
         """
 
-        batch_size = batch_size or self.batch_request_max_size
+        for results in self.batch_request_chunks(
+            self._raw_batch_request_chunk, payload, batch_size, max_concurrency
+        ):
+            yield from results
 
-        for payload_chunk in chunks(payload, batch_size):
-            response = self.http_session.post(
-                self.ethereum_node_url, json=payload_chunk, timeout=self.slow_timeout
-            )
+    def _raw_batch_request_chunk(
+        self, payload_chunk: Sequence[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Send one chunk of a raw batch JSON RPC call
 
-            if not response.ok:
-                logger.error(
-                    "Problem doing raw batch request with payload=%s status_code=%d result=%s",
-                    payload_chunk,
-                    response.status_code,
-                    response.content,
-                )
-                raise ValueError(f"Batch request error: {response.content!r}")
+        :param payload_chunk:
+        :return: Results for ``payload_chunk``, sorted as the payload
+        :raises: ValueError
+        """
+        response = self.http_session.post(
+            self.ethereum_node_url, json=payload_chunk, timeout=self.slow_timeout
+        )
 
-            yield from process_raw_batch_results(response.json(), payload_chunk)
+        if not response.ok:
+            logger.error(
+                "Problem doing raw batch request with payload=%s status_code=%d result=%s",
+                payload_chunk,
+                response.status_code,
+                response.content,
+            )
+            if response.status_code == 413 or is_batch_too_large_error(
+                response.content
+            ):
+                raise BatchRequestTooLarge(f"Batch request error: {response.content!r}")
+            raise ValueError(f"Batch request error: {response.content!r}")
+
+        return list(process_raw_batch_results(response.json(), payload_chunk))
 
     def clear_cache(self) -> None:
         """
@@ -1640,31 +2542,57 @@ class EthereumClient:
             logger.warning("Multicall not supported for this network")
             return None
 
+    def _get_multicall_for_strategy(
+        self,
+        strategy: Union[BatchCallStrategy, str],
+        force_batch_call: bool,
+        from_address: Optional[ChecksumAddress],
+    ) -> Optional["Multicall"]:  # type: ignore # noqa F821
+        """
+        :return: ``Multicall`` to use for a batch call, ``None`` if JSON-RPC batching must be used
+        :raises ValueError: If ``strategy`` is not valid or cannot be used with ``from_address``
+        :raises EthereumNetworkNotSupported: If ``Multicall`` is required but not available
+        """
+        strategy = resolve_batch_call_strategy(strategy, force_batch_call, from_address)
+        if strategy == BatchCallStrategy.JSONRPC:
+            return None
+        if not self.multicall and strategy == BatchCallStrategy.MULTICALL:
+            raise EthereumNetworkNotSupported("Multicall contract not available")
+        return self.multicall
+
     def batch_call(
         self,
-        contract_functions: Iterable[ContractFunction],
+        contract_functions: Iterable[Union[ContractFunction, ContractCall]],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         force_batch_call: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
+        strategy: Union[BatchCallStrategy, str] = BatchCallStrategy.AUTO,
     ) -> List[Optional[Union[bytes, Any]]]:
         """
-        Call multiple functions. ``Multicall`` contract by MakerDAO will be used by default if available
+        Call multiple functions. ``Multicall`` contract by MakerDAO will be used by default if available,
+        packing the calls in as few ``tryAggregate`` calls as possible
 
         :param contract_functions:
-        :param from_address: Only available when ``Multicall`` is not used
+        :param from_address: Only available when ``Multicall`` is not used. If provided with
+            ``strategy=auto`` JSON-RPC batching will be used
         :param raise_exception: If ``True``, raise ``BatchCallException`` if one of the calls fails
         :param force_batch_call: If ``True``, ignore multicall and always use batch calls to get the
-            result (less optimal). If ``False``, more optimal way will be tried.
+            result (less optimal). If ``False``, more optimal way will be tried. Same as ``strategy=jsonrpc``
         :param block_identifier:
+        :param strategy: ``auto``, ``multicall`` or ``jsonrpc``. Check ``BatchCallStrategy``
         :return: List of elements decoded to their types, ``None`` if they cannot be decoded and
             bytes if a revert error is returned and ``raise_exception=False``
         :raises: BatchCallException
+        :raises EthereumNetworkNotSupported: If ``strategy=multicall`` and ``Multicall`` is not available
         """
-        if self.multicall and not force_batch_call:  # Multicall is more optimal
+        multicall = self._get_multicall_for_strategy(
+            strategy, force_batch_call, from_address
+        )
+        if multicall:  # Multicall is more optimal
             return [
                 result.return_data_decoded
-                for result in self.multicall.try_aggregate(
+                for result in multicall.try_aggregate(
                     contract_functions,
                     require_success=raise_exception,
                     block_identifier=block_identifier,
@@ -1680,12 +2608,13 @@ class EthereumClient:
 
     def batch_call_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         from_address: Optional[ChecksumAddress] = None,
         raise_exception: bool = True,
         force_batch_call: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
+        strategy: Union[BatchCallStrategy, str] = BatchCallStrategy.AUTO,
     ) -> List[Optional[Union[bytes, Any]]]:
         """
         Call the same function in multiple contracts. Way more optimal than using ``batch_call`` generating multiple
@@ -1693,19 +2622,25 @@ class EthereumClient:
 
         :param contract_function:
         :param contract_addresses:
-        :param from_address: Only available when ``Multicall`` is not used
+        :param from_address: Only available when ``Multicall`` is not used. If provided with
+            ``strategy=auto`` JSON-RPC batching will be used
         :param raise_exception: If ``True``, raise ``BatchCallException`` if one of the calls fails
         :param force_batch_call: If ``True``, ignore multicall and always use batch calls to get the
-            result (less optimal). If ``False``, more optimal way will be tried.
+            result (less optimal). If ``False``, more optimal way will be tried. Same as ``strategy=jsonrpc``
         :param block_identifier:
+        :param strategy: ``auto``, ``multicall`` or ``jsonrpc``. Check ``BatchCallStrategy``
         :return: List of elements decoded to the same type, ``None`` if they cannot be decoded and
             bytes if a revert error is returned and ``raise_exception=False``
         :raises: BatchCallException
+        :raises EthereumNetworkNotSupported: If ``strategy=multicall`` and ``Multicall`` is not available
         """
-        if self.multicall and not force_batch_call:  # Multicall is more optimal
+        multicall = self._get_multicall_for_strategy(
+            strategy, force_batch_call, from_address
+        )
+        if multicall:  # Multicall is more optimal
             return [
                 result.return_data_decoded
-                for result in self.multicall.try_aggregate_same_function(
+                for result in multicall.try_aggregate_same_function(
                     contract_function,
                     contract_addresses,
                     require_success=raise_exception,
@@ -2065,6 +3000,31 @@ class EthereumClient:
     def is_contract(self, contract_address: ChecksumAddress) -> bool:
         return bool(self.w3.eth.get_code(contract_address))
 
+    def get_codes(
+        self,
+        addresses: Sequence[ChecksumAddress],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> List[HexBytes]:
+        """
+        Get the code of many addresses using a batch ``eth_getCode`` request
+
+        :param addresses:
+        :param block_identifier:
+        :return: Code for every address, in the same order as ``addresses``. Empty if the address
+            is not a contract
+        """
+        if not addresses:
+            return []
+        block_identifier_str = self._parse_block_identifier(block_identifier)
+        payload = build_jsonrpc_batch_payload(
+            [("eth_getCode", [address, block_identifier_str]) for address in addresses]
+        )
+        return self._format_codes(self.raw_batch_request(payload))
+
+    @staticmethod
+    def _format_codes(results: Iterable[Any]) -> List[HexBytes]:
+        return [HexBytes(code or b"") for code in results]
+
     @staticmethod
     def build_tx_params(
         from_address: Optional[ChecksumAddress] = None,
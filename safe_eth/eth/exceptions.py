@@ -77,3 +77,13 @@ class BatchCallException(EthereumClientException):
 
 class BatchCallFunctionFailed(BatchCallException):
     pass
+
+
+class BatchRequestTooLarge(BatchCallException, ConnectionError):
+    """
+    The node rejected a JSON RPC Batch request due to its size (HTTP 413 or an
+    error message about the batch length). It's also a ``ConnectionError``, as that was
+    raised for those responses before
+    """
+
+    pass
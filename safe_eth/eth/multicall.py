@@ -6,7 +6,7 @@ https://github.com/mds1/multicall
 import logging
 from dataclasses import dataclass
 from functools import cached_property
-from typing import Any, Callable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import eth_abi
 from eth_abi.exceptions import DecodingError
@@ -14,16 +14,16 @@ from eth_account.signers.local import LocalAccount
 from eth_typing import BlockIdentifier, BlockNumber, ChecksumAddress
 from hexbytes import HexBytes
 from web3 import AsyncWeb3, Web3
-from web3._utils.abi import map_abi_data
-from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.contract.contract import Contract, ContractFunction
-from web3.exceptions import ContractLogicError, Web3RPCError, Web3ValueError
+from web3.exceptions import ContractLogicError
 
+from ..util.util import to_0x_hex_str
 from . import EthereumClient, EthereumNetwork, EthereumNetworkNotSupported
 from .contracts import ContractBase, get_multicall_v3_contract
+from .contracts.call_builders import ContractCall, get_contract_call
 from .ethereum_client import EthereumTxSent
 from .exceptions import BatchCallFunctionFailed, ContractAlreadyDeployed
-from .utils import fast_to_checksum_address, get_empty_tx_params
+from .utils import fast_to_checksum_address, get_abi_decoder, get_empty_tx_params
 
 logger = logging.getLogger(__name__)
 
@@ -349,11 +349,34 @@ class Multicall(ContractBase):
         EthereumNetwork.REDDIO: "0xcA11bde05977b3631167028862bE2a173976CA11",
     }
 
+    # ``tryAggregate(bool,(address,bytes)[])``
+    TRY_AGGREGATE_SELECTOR = HexBytes("0xbce38bd7")
+    # ``tryAggregate`` calls are split into chunks so a single ``eth_call`` does not
+    # exceed the node's request size limit nor its ``eth_call`` gas cap. Every call is
+    # assumed to use ``gas_per_call`` gas, as its real cost is unknown beforehand
+    MAX_CALLDATA_BYTES = 128 * 1024
+    GAS_PER_CALL = 100_000
+    MAX_GAS_PER_AGGREGATE = 30_000_000
+
     def __init__(
         self,
         ethereum_client: EthereumClient,
         multicall_contract_address: Optional[ChecksumAddress] = None,
+        max_calldata_bytes: int = MAX_CALLDATA_BYTES,
+        gas_per_call: int = GAS_PER_CALL,
+        max_gas_per_aggregate: int = MAX_GAS_PER_AGGREGATE,
+        max_concurrency: Optional[int] = None,
     ):
+        """
+        :param ethereum_client:
+        :param multicall_contract_address: If not provided, it will be detected for the network
+        :param max_calldata_bytes: Max size of the calls encoded in a single ``tryAggregate``
+        :param gas_per_call: Estimated gas budget for every call
+        :param max_gas_per_aggregate: Max estimated gas for a single ``tryAggregate``
+        :param max_concurrency: Max number of ``tryAggregate`` chunks in flight at the same time. If
+            not provided, ``EthereumClient.batch_request_max_concurrency`` will be used. If ``1``,
+            all the chunks are sent in the same JSON-RPC batch request
+        """
         # Only detect the address when not provided, as it requires network requests
         # (`eth_chainId` if not cached, maybe `eth_getCode`)
         address = (
@@ -362,6 +385,10 @@ class Multicall(ContractBase):
             else self._detect_multicall_address(ethereum_client)
         )
         super().__init__(address, ethereum_client)
+        self.max_calldata_bytes = max_calldata_bytes
+        self.gas_per_call = gas_per_call
+        self.max_gas_per_aggregate = max_gas_per_aggregate
+        self.max_concurrency = max_concurrency
 
     @classmethod
     def _multicall_address_candidate(
@@ -439,36 +466,34 @@ class Multicall(ContractBase):
 
     @staticmethod
     def _build_payload(
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
     ) -> Tuple[List[Tuple[ChecksumAddress, HexBytes]], List[List[Any]]]:
         targets_with_data = []
         output_types = []
         for contract_function in contract_functions:
+            contract_call = get_contract_call(contract_function)
             targets_with_data.append(
                 (
-                    contract_function.address,
-                    HexBytes(contract_function._encode_transaction_data()),
+                    cast(ChecksumAddress, contract_call.address),
+                    HexBytes(contract_call.data),
                 )
             )
-            output_types.append(
-                [output["type"] for output in contract_function.abi["outputs"]]
-            )
+            output_types.append(list(contract_call.output_types))
 
         return targets_with_data, output_types
 
     def _build_payload_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
     ) -> Tuple[List[Tuple[ChecksumAddress, HexBytes]], List[List[Any]]]:
         targets_with_data = []
         output_types = []
-        tx_data = HexBytes(contract_function._encode_transaction_data())
+        contract_call = get_contract_call(contract_function)
+        tx_data = HexBytes(contract_call.data)
         for contract_address in contract_addresses:
             targets_with_data.append((contract_address, tx_data))
-            output_types.append(
-                [output["type"] for output in contract_function.abi["outputs"]]
-            )
+            output_types.append(list(contract_call.output_types))
 
         return targets_with_data, output_types
 
@@ -482,14 +507,7 @@ class Multicall(ContractBase):
         """
         if data:
             try:
-                decoded_values = eth_abi.decode(output_type, data)
-                normalized_data = map_abi_data(
-                    BASE_RETURN_NORMALIZERS, output_type, decoded_values
-                )
-                if len(normalized_data) == 1:
-                    return normalized_data[0]
-                else:
-                    return normalized_data
+                return get_abi_decoder(tuple(output_type))(data)
             except DecodingError:
                 logger.warning(
                     "Cannot decode %s using output-type %s", data, output_type
@@ -521,7 +539,7 @@ class Multicall(ContractBase):
 
     def aggregate(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> Tuple[BlockNumber, List[Optional[Any]]]:
         """
@@ -542,6 +560,158 @@ class Multicall(ContractBase):
         ]
         return block_number, decoded_results
 
+    @staticmethod
+    def _get_call_encoded_size(data: bytes) -> int:
+        """
+        :param data:
+        :return: Bytes used by a ``(address,bytes)`` element in the ``tryAggregate``
+            ABI encoded calldata: offset, address, data offset, data length and the
+            data padded to 32 bytes
+        """
+        return 4 * 32 + (len(data) + 31) // 32 * 32
+
+    def _chunk_targets_with_data(
+        self,
+        targets_with_data: Sequence[Tuple[ChecksumAddress, bytes]],
+    ) -> List[Sequence[Tuple[ChecksumAddress, bytes]]]:
+        """
+        Split calls in chunks that fit in ``max_calldata_bytes`` and ``max_gas_per_aggregate``.
+        Every chunk will contain at least one call.
+
+        :param targets_with_data:
+        :return: List of chunks, keeping the order of ``targets_with_data``
+        """
+        max_calls = max(1, self.max_gas_per_aggregate // self.gas_per_call)
+        chunks: List[Sequence[Tuple[ChecksumAddress, bytes]]] = []
+        chunk: List[Tuple[ChecksumAddress, bytes]] = []
+        chunk_size = 0
+        for target, data in targets_with_data:
+            call_size = self._get_call_encoded_size(data)
+            if chunk and (
+                len(chunk) >= max_calls
+                or chunk_size + call_size > self.max_calldata_bytes
+            ):
+                chunks.append(chunk)
+                chunk = []
+                chunk_size = 0
+            chunk.append((target, data))
+            chunk_size += call_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _build_try_aggregate_payloads(
+        self,
+        chunks: Sequence[Sequence[Tuple[ChecksumAddress, bytes]]],
+        require_success: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Build a ``batch_call_custom`` payload calling ``tryAggregate`` for every chunk of calls.
+        Calldata is ABI encoded directly, as building a web3 ``ContractFunction`` for every chunk
+        is way more demanding
+
+        :param chunks:
+        :param require_success:
+        :return: List of payloads for ``BatchCallManager.batch_call_custom``
+        """
+        return [
+            {
+                "to": self.address,
+                "data": to_0x_hex_str(
+                    self.TRY_AGGREGATE_SELECTOR
+                    + eth_abi.encode(
+                        ["bool", "(address,bytes)[]"], [require_success, chunk]
+                    )
+                ),
+                "output_type": ["(bool,bytes)[]"],
+                "fn_name": "tryAggregate",
+            }
+            for chunk in chunks
+        ]
+
+    def _get_try_aggregate_batch_params(self, number_chunks: int) -> Dict[str, Any]:
+        """
+        :param number_chunks:
+        :return: ``batch_size`` and ``max_concurrency`` for ``batch_call_custom``. If chunks can be sent
+            concurrently, every chunk is sent in its own request so they are executed in parallel
+            by the node
+        """
+        max_concurrency = (
+            self.max_concurrency or self.ethereum_client.batch_request_max_concurrency
+        )
+        if max_concurrency <= 1 or number_chunks <= 1:
+            return {"batch_size": None, "max_concurrency": 1}
+        return {"batch_size": 1, "max_concurrency": max_concurrency}
+
+    @staticmethod
+    def _process_try_aggregate_chunk_results(
+        pending: Sequence[Tuple[int, Sequence[Tuple[ChecksumAddress, bytes]]]],
+        chunk_results: Sequence[Optional[Sequence[Tuple[bool, bytes]]]],
+        results: List[Optional[MulticallResult]],
+        require_success: bool = False,
+    ) -> List[Tuple[int, Sequence[Tuple[ChecksumAddress, bytes]]]]:
+        """
+        Store the results of every ``tryAggregate`` chunk in ``results`` (pure, shared with the async client).
+        A chunk failing as a whole (e.g. it ran out of gas or the response was too big) is bisected, so
+        the failure is isolated to the calls causing it
+
+        :param pending: ``(offset, chunk)`` tuples sent, ``offset`` is the position of the first call of
+            the chunk in ``results``
+        :param chunk_results: Decoded ``tryAggregate`` result for every chunk, ``None`` if it failed
+        :param results: Results for every call, updated in place
+        :param require_success:
+        :return: ``(offset, chunk)`` tuples that must be retried
+        :raises: BatchCallFunctionFailed
+        """
+        retry: List[Tuple[int, Sequence[Tuple[ChecksumAddress, bytes]]]] = []
+        for (offset, chunk), chunk_result in zip(pending, chunk_results):
+            if chunk_result is None or len(chunk_result) != len(chunk):
+                if require_success:
+                    raise BatchCallFunctionFailed
+                if len(chunk) == 1:
+                    results[offset] = MulticallResult(False, None)
+                else:
+                    logger.info(
+                        "tryAggregate of %d calls failed, splitting it", len(chunk)
+                    )
+                    middle = len(chunk) // 2
+                    retry.append((offset, chunk[:middle]))
+                    retry.append((offset + middle, chunk[middle:]))
+                continue
+
+            for i, (success, data) in enumerate(chunk_result):
+                if require_success and not data:
+                    # `b''` values are decoding errors/missing contracts/missing functions
+                    raise BatchCallFunctionFailed
+                results[offset + i] = MulticallResult(success, data if data else None)
+        return retry
+
+    def _try_aggregate_chunks(
+        self,
+        chunks: Sequence[Sequence[Tuple[ChecksumAddress, bytes]]],
+        require_success: bool = False,
+        block_identifier: Optional[BlockIdentifier] = "latest",
+    ) -> List[Optional[Sequence[Tuple[bool, bytes]]]]:
+        """
+        :param chunks:
+        :param require_success:
+        :param block_identifier:
+        :return: Decoded ``tryAggregate`` result for every chunk, ``None`` if it failed
+        :raises: BatchCallFunctionFailed
+        """
+        payloads = self._build_try_aggregate_payloads(chunks, require_success)
+        try:
+            return self.ethereum_client.batch_call_manager.batch_call_custom(
+                payloads,
+                raise_exception=require_success,
+                block_identifier=block_identifier or "latest",
+                **self._get_try_aggregate_batch_params(len(payloads)),
+            )
+        except BatchCallFunctionFailed:
+            raise
+        except ValueError as exc:
+            raise BatchCallFunctionFailed from exc
+
     def _try_aggregate(
         self,
         targets_with_data: Sequence[Tuple[ChecksumAddress, bytes]],
@@ -549,37 +719,46 @@ class Multicall(ContractBase):
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> List[MulticallResult]:
         """
-        Calls ``try_aggregate`` on MakerDAO's Multicall contract.
+        Calls ``try_aggregate`` on MakerDAO's Multicall contract. If calls don't fit in one
+        ``tryAggregate`` they are split in chunks, executed concurrently if configured.
 
         :param targets_with_data:
         :param require_success: If ``True``, an exception in any of the functions will stop the execution. Also, an
             invalid decoded value will stop the execution
         :param block_identifier:
-        :return: A list with the decoded return values
+        :return: A list with the decoded return values, in the same order as ``targets_with_data``
+        :raises: BatchCallFunctionFailed
         """
+        results: List[Optional[MulticallResult]] = [None] * len(targets_with_data)
+        pending = self._get_initial_pending_chunks(targets_with_data)
+        while pending:
+            chunk_results = self._try_aggregate_chunks(
+                [chunk for _, chunk in pending],
+                require_success=require_success,
+                block_identifier=block_identifier,
+            )
+            pending = self._process_try_aggregate_chunk_results(
+                pending, chunk_results, results, require_success
+            )
+        return cast(List[MulticallResult], results)
 
-        aggregate_parameter = [
-            {"target": target, "callData": data} for target, data in targets_with_data
-        ]
-        try:
-            result = self.contract.functions.tryAggregate(
-                require_success, aggregate_parameter
-            ).call(block_identifier=block_identifier or "latest")
-
-            if require_success and b"" in (data for _, data in result):
-                # `b''` values are decoding errors/missing contracts/missing functions
-                raise BatchCallFunctionFailed
-
-            return [
-                MulticallResult(success, data if data else None)
-                for success, data in result
-            ]
-        except (ContractLogicError, OverflowError, Web3ValueError, Web3RPCError):
-            raise BatchCallFunctionFailed
+    def _get_initial_pending_chunks(
+        self, targets_with_data: Sequence[Tuple[ChecksumAddress, bytes]]
+    ) -> List[Tuple[int, Sequence[Tuple[ChecksumAddress, bytes]]]]:
+        """
+        :param targets_with_data:
+        :return: ``(offset, chunk)`` tuples for every chunk of ``targets_with_data``
+        """
+        pending = []
+        offset = 0
+        for chunk in self._chunk_targets_with_data(targets_with_data):
+            pending.append((offset, chunk))
+            offset += len(chunk)
+        return pending
 
     def try_aggregate(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         require_success: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> List[MulticallDecodedResult]:
@@ -623,7 +802,7 @@ class Multicall(ContractBase):
 
     def try_aggregate_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         require_success: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
@@ -665,8 +844,9 @@ class AsyncMulticall(Multicall):
         self,
         ethereum_client: "AsyncEthereumClient",  # type: ignore # noqa F821
         multicall_contract_address: Optional[ChecksumAddress] = None,
+        **kwargs,
     ):
-        super().__init__(ethereum_client, multicall_contract_address)
+        super().__init__(ethereum_client, multicall_contract_address, **kwargs)
         self.async_w3: AsyncWeb3 = ethereum_client.async_w3
 
     @classmethod
@@ -674,17 +854,18 @@ class AsyncMulticall(Multicall):
         cls,
         ethereum_client: "AsyncEthereumClient",  # type: ignore # noqa F821
         multicall_contract_address: Optional[ChecksumAddress] = None,
+        **kwargs,
     ) -> "AsyncMulticall":
         """
         Build an ``AsyncMulticall`` detecting the address through the async RPC
         methods, so a running event loop is never blocked (``__init__`` detects
-        it with the blocking sync methods).
+        it with the blocking sync methods). ``kwargs`` are passed to ``__init__``.
         """
         address = (
             multicall_contract_address
             or await cls._async_detect_multicall_address(ethereum_client)
         )
-        return cls(ethereum_client, address)
+        return cls(ethereum_client, address, **kwargs)
 
     @classmethod
     async def _async_detect_multicall_address(
@@ -723,7 +904,7 @@ class AsyncMulticall(Multicall):
 
     async def async_aggregate(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> Tuple[BlockNumber, List[Optional[Any]]]:
         targets_with_data, output_types = self._build_payload(contract_functions)
@@ -736,34 +917,49 @@ class AsyncMulticall(Multicall):
         ]
         return block_number, decoded_results
 
+    async def _async_try_aggregate_chunks(
+        self,
+        chunks: Sequence[Sequence[Tuple[ChecksumAddress, bytes]]],
+        require_success: bool = False,
+        block_identifier: Optional[BlockIdentifier] = "latest",
+    ) -> List[Optional[Sequence[Tuple[bool, bytes]]]]:
+        payloads = self._build_try_aggregate_payloads(chunks, require_success)
+        try:
+            return (
+                await self.ethereum_client.batch_call_manager.async_batch_call_custom(
+                    payloads,
+                    raise_exception=require_success,
+                    block_identifier=block_identifier or "latest",
+                    **self._get_try_aggregate_batch_params(len(payloads)),
+                )
+            )
+        except BatchCallFunctionFailed:
+            raise
+        except ValueError as exc:
+            raise BatchCallFunctionFailed from exc
+
     async def _async_try_aggregate(
         self,
         targets_with_data: Sequence[Tuple[ChecksumAddress, bytes]],
         require_success: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> List[MulticallResult]:
-        aggregate_parameter = [
-            {"target": target, "callData": data} for target, data in targets_with_data
-        ]
-        try:
-            result = await self.async_contract.functions.tryAggregate(
-                require_success, aggregate_parameter
-            ).call(block_identifier=block_identifier or "latest")
-
-            if require_success and b"" in (data for _, data in result):
-                # `b''` values are decoding errors/missing contracts/missing functions
-                raise BatchCallFunctionFailed
-
-            return [
-                MulticallResult(success, data if data else None)
-                for success, data in result
-            ]
-        except (ContractLogicError, OverflowError, Web3ValueError, Web3RPCError):
-            raise BatchCallFunctionFailed
+        results: List[Optional[MulticallResult]] = [None] * len(targets_with_data)
+        pending = self._get_initial_pending_chunks(targets_with_data)
+        while pending:
+            chunk_results = await self._async_try_aggregate_chunks(
+                [chunk for _, chunk in pending],
+                require_success=require_success,
+                block_identifier=block_identifier,
+            )
+            pending = self._process_try_aggregate_chunk_results(
+                pending, chunk_results, results, require_success
+            )
+        return cast(List[MulticallResult], results)
 
     async def async_try_aggregate(
         self,
-        contract_functions: Sequence[ContractFunction],
+        contract_functions: Sequence[Union[ContractFunction, ContractCall]],
         require_success: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
     ) -> List[MulticallDecodedResult]:
@@ -777,7 +973,7 @@ class AsyncMulticall(Multicall):
 
     async def async_try_aggregate_same_function(
         self,
-        contract_function: ContractFunction,
+        contract_function: Union[ContractFunction, ContractCall],
         contract_addresses: Sequence[ChecksumAddress],
         require_success: bool = False,
         block_identifier: Optional[BlockIdentifier] = "latest",
@@ -1,6 +1,12 @@
 from unittest import TestCase
 
-from safe_eth.eth.eip712 import eip712_encode_hash
+from safe_eth.eth.eip712 import (
+    EIP712Schema,
+    eip712_encode_hash,
+    encode_type,
+    get_eip712_schema,
+    hash_struct,
+)
 from safe_eth.util.util import to_0x_hex_str
 
 
@@ -324,3 +330,84 @@ class TestEIP712(TestCase):
             to_0x_hex_str(eip712_encode_hash(payload)),
             "0x9a55335a1d86221594e96018fc3df611a1485d95b5b2afbef1540ac51f63d249",
         )
+
+    def test_eip712_schema(self):
+        domain = {
+            "name": "MyDApp",
+            "version": "3.0",
+            "chainId": 41,
+            "verifyingContract": self.address,
+        }
+        schema = get_eip712_schema(self.types)
+        self.assertIs(get_eip712_schema(self.types), schema)
+        self.assertIs(get_eip712_schema(dict(self.types)), schema)
+        self.assertEqual(
+            schema.encode_type("Mailbox"),
+            encode_type("Mailbox", self.types),
+        )
+        self.assertEqual(
+            schema.encode_type("Mailbox"),
+            "Mailbox(address owner,Message[] messages)"
+            "Message(address sender,string subject,bool isSpam,string body)",
+        )
+        self.assertEqual(
+            schema.hash_struct("Mailbox", self.mailbox),
+            hash_struct("Mailbox", self.mailbox, self.types),
+        )
+        self.assertEqual(
+            to_0x_hex_str(schema.encode_hash(domain, "Mailbox", self.mailbox)),
+            "0x7c02fe79823722257b42ea95720e7dd31d51c3f6769dc0f56a271800dd030ef1",
+        )
+
+        with self.assertRaisesRegex(ValueError, "No type definition specified"):
+            schema.hash_type("NotDefined")
+
+        with self.assertRaises(ValueError):
+            schema.encode(domain, "EIP712Domain", domain)
+
+        with self.assertRaises(ValueError):
+            schema.encode(domain, "Mailbox", {"owner": self.address})
+
+        for not_valid_types in (
+            {"Message": [{"name": "subject"}]},
+            {"Message": [{"name": "subject", "type": None}]},
+            {"Message": None},
+        ):
+            with self.subTest(types=not_valid_types):
+                with self.assertRaises(ValueError):
+                    EIP712Schema(not_valid_types)
+                with self.assertRaises(ValueError):
+                    get_eip712_schema(not_valid_types)
+
+        # Field types are validated when the struct is used
+        for not_valid_types in (
+            {"Message": [{"name": "subject", "type": "stringa"}]},
+            {"Message": [{"name": "messages", "type": "Mesage[]"}]},
+        ):
+            with self.subTest(types=not_valid_types):
+                with self.assertRaises(ValueError):
+                    get_eip712_schema(not_valid_types).hash_struct(
+                        "Message", {"subject": "", "messages": []}
+                    )
+
+    def test_eip712_encode_unused_types(self):
+        payload = {
+            "types": self.types,
+            "primaryType": "Mailbox",
+            "domain": {
+                "name": "MyDApp",
+                "version": "3.0",
+                "chainId": 41,
+                "verifyingContract": self.address,
+            },
+            "message": self.mailbox,
+        }
+        # Types not reachable from the primary type or the domain are ignored, even if not valid
+        payload_with_unused_types = {
+            **payload,
+            "types": {**self.types, "Unused": [{"name": "x", "type": "Foo"}]},
+        }
+        self.assertEqual(
+            eip712_encode_hash(payload_with_unused_types),
+            eip712_encode_hash(payload),
+        )
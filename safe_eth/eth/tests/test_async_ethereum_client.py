@@ -14,10 +14,17 @@ transport) need a thin override here to target the async equivalent.
 """
 
 import asyncio
+from typing import Optional
 from unittest import mock
 
+from django.test import TestCase
+
 import aiohttp
+import eth_abi
 from eth_account import Account
+from eth_typing import URI
+from hexbytes import HexBytes
+from web3.eth import AsyncEth
 
 from ..async_ethereum_client import (
     AsyncEthereumClient,
@@ -26,6 +33,8 @@ from ..async_ethereum_client import (
 )
 from ..contracts import get_erc20_contract
 from ..ethereum_network import EthereumNetwork
+from ..exceptions import BatchRequestTooLarge
+from ..multicall import AsyncMulticall, MulticallResult
 from .mocks.mock_internal_txs import creation_internal_txs, internal_txs_errored
 from .test_ethereum_client import (
     FAILED_BATCH_CALL_RESULT,
@@ -35,6 +44,8 @@ from .test_ethereum_client import (
     TestEthereumClientConstruction,
     TestTracingManager,
     forbid_rpc_calls,
+    get_logs_one_transfer_per_block,
+    trace_filter_two_traces_per_block,
 )
 
 # Manager attributes that must themselves be wrapped in a proxy
@@ -319,3 +330,204 @@ class TestAsyncEthereumClientConstruction(TestEthereumClientConstruction):
 
         with forbid_rpc_calls():
             asyncio.run(run())
+
+
+class TestAsyncEthereumClientBatchDispatch(TestCase):
+    def test_async_raw_batch_request_concurrency(self):
+        in_flight = {"current": 0, "max": 0}
+
+        async def raw_batch_request_chunk(payload_chunk):
+            in_flight["current"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            # Finish in reverse order, results must keep the payload order
+            await asyncio.sleep(0.01 / (payload_chunk[0]["id"] + 1))
+            in_flight["current"] -= 1
+            return [hex(query["id"]) for query in payload_chunk]
+
+        payload = [
+            {"id": i, "jsonrpc": "2.0", "method": "eth_blockNumber", "params": []}
+            for i in range(50)
+        ]
+        for max_concurrency in (1, 4):
+            with self.subTest(max_concurrency=max_concurrency):
+                in_flight["max"] = 0
+                async_ethereum_client = AsyncEthereumClient(
+                    UNREACHABLE_NODE_URL,
+                    batch_request_max_size=5,
+                    batch_request_max_concurrency=max_concurrency,
+                )
+                with mock.patch.object(
+                    async_ethereum_client,
+                    "_async_raw_batch_request_chunk",
+                    side_effect=raw_batch_request_chunk,
+                ):
+                    self.assertEqual(
+                        asyncio.run(
+                            async_ethereum_client.async_raw_batch_request(payload)
+                        ),
+                        [hex(i) for i in range(50)],
+                    )
+                self.assertEqual(in_flight["max"], max_concurrency)
+
+    def test_async_map_batch_chunks_error(self):
+        finished = []
+
+        async def fn(chunk):
+            if chunk == 2:
+                raise ValueError("Batch request error")
+            await asyncio.sleep(0.1)
+            finished.append(chunk)
+            return chunk
+
+        async_ethereum_client = AsyncEthereumClient(
+            UNREACHABLE_NODE_URL, batch_request_max_concurrency=3
+        )
+        with self.assertRaisesMessage(ValueError, "Batch request error"):
+            asyncio.run(async_ethereum_client.async_map_batch_chunks(fn, range(6)))
+        # Chunks in flight are cancelled instead of left running
+        self.assertEqual(finished, [])
+
+    def test_async_raw_batch_request_adaptive_batch_size(self):
+        posted_sizes = []
+
+        async def raw_batch_request_chunk(payload_chunk):
+            posted_sizes.append(len(payload_chunk))
+            if len(payload_chunk) > 8:
+                raise BatchRequestTooLarge(
+                    "Batch request error: Batch size is too large"
+                )
+            return [hex(query["id"]) for query in payload_chunk]
+
+        async_ethereum_client = AsyncEthereumClient(
+            URI("http://async-adaptive-node.invalid:8545"),
+            batch_request_max_size=20,
+            adaptive_batch_size=True,
+        )
+        payload = [
+            {"id": i, "jsonrpc": "2.0", "method": "eth_blockNumber", "params": []}
+            for i in range(50)
+        ]
+        with mock.patch.object(
+            async_ethereum_client,
+            "_async_raw_batch_request_chunk",
+            side_effect=raw_batch_request_chunk,
+        ):
+            self.assertEqual(
+                asyncio.run(async_ethereum_client.async_raw_batch_request(payload)),
+                [hex(i) for i in range(50)],
+            )
+        self.assertEqual(posted_sizes[:4], [20, 10, 5, 5])
+
+    def test_async_try_aggregate_chunks_bisect(self):
+        async_ethereum_client = AsyncEthereumClient(UNREACHABLE_NODE_URL)
+        async_multicall = AsyncMulticall(
+            async_ethereum_client,
+            AsyncMulticall.ADDRESSES[EthereumNetwork.MAINNET],
+            gas_per_call=1,
+            max_gas_per_aggregate=4,
+            max_concurrency=2,
+        )
+        targets_with_data = [
+            (Account.create().address, HexBytes(bytes([i]))) for i in range(1, 11)
+        ]
+        batch_params = []
+
+        async def async_batch_call_custom(payloads, **kwargs):
+            batch_params.append(kwargs)
+            chunk_results = []
+            for payload in payloads:
+                calls = eth_abi.decode(
+                    ["bool", "(address,bytes)[]"], HexBytes(payload["data"])[4:]
+                )[1]
+                # Call with data `0x05` makes the whole `tryAggregate` fail
+                chunk_results.append(
+                    None
+                    if any(data == b"\x05" for _, data in calls)
+                    else [(True, data) for _, data in calls]
+                )
+            return chunk_results
+
+        with mock.patch.object(
+            async_ethereum_client.batch_call_manager,
+            "async_batch_call_custom",
+            side_effect=async_batch_call_custom,
+        ):
+            results = asyncio.run(
+                async_multicall._async_try_aggregate(targets_with_data)
+            )
+        expected = [MulticallResult(True, bytes([i])) for i in range(1, 11)]
+        expected[4] = MulticallResult(False, None)
+        self.assertEqual(results, expected)
+        self.assertEqual(
+            batch_params[0],
+            {
+                "raise_exception": False,
+                "block_identifier": "latest",
+                "batch_size": 1,
+                "max_concurrency": 2,
+            },
+        )
+
+    def test_async_iter_total_transfer_history(self):
+        async def get_logs(filter_params):
+            return get_logs_one_transfer_per_block(filter_params)
+
+        async def iter_windows():
+            return [
+                window
+                async for window in async_ethereum_client.erc20.async_iter_total_transfer_history(
+                    from_block=100, to_block=150, block_window=16, max_concurrency=2
+                )
+            ]
+
+        async_ethereum_client = AsyncEthereumClient(UNREACHABLE_NODE_URL)
+        with mock.patch.object(AsyncEth, "get_logs", side_effect=get_logs):
+            windows = asyncio.run(iter_windows())
+        self.assertEqual(windows[-1].next_block, 151)
+        self.assertEqual(windows[2].to_block - windows[2].from_block + 1, 4)
+        self.assertEqual(
+            [event["blockNumber"] for window in windows for event in window.events],
+            list(range(100, 151)),
+        )
+
+    def test_async_iter_trace_filter(self):
+        async def async_trace_filter(*args, **kwargs):
+            return trace_filter_two_traces_per_block(*args, **kwargs)
+
+        async def iter_traces(page_size):
+            return [
+                trace
+                async for trace in async_ethereum_client.tracing.async_iter_trace_filter(
+                    1, 20, to_address=to_address, page_size=page_size
+                )
+            ]
+
+        async_ethereum_client = AsyncEthereumClient(UNREACHABLE_NODE_URL)
+        to_address = [Account.create().address]
+        expected = [
+            {"blockNumber": block_number, "transactionPosition": position}
+            for block_number in range(1, 21)
+            for position in range(2)
+        ]
+        with mock.patch.object(
+            async_ethereum_client.tracing,
+            "async_trace_filter",
+            side_effect=async_trace_filter,
+        ):
+            self.assertEqual(asyncio.run(iter_traces(3)), expected)
+            self.assertEqual(asyncio.run(iter_traces(10)), expected)
+
+        async def async_trace_filter_capped_count(
+            from_block: int, to_block: int, count: Optional[int] = None, **kwargs
+        ):
+            # Node returns at most 2 traces per page, whatever ``count`` is requested
+            return trace_filter_two_traces_per_block(
+                from_block, to_block, count=min(count or 2, 2), **kwargs
+            )
+
+        with mock.patch.object(
+            async_ethereum_client.tracing,
+            "async_trace_filter",
+            side_effect=async_trace_filter_capped_count,
+        ):
+            self.assertEqual(asyncio.run(iter_traces(4)), expected)
@@ -0,0 +1,176 @@
+import gc
+import os
+import weakref
+from unittest import TestCase, mock
+
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3.contract import AsyncContract, Contract
+
+from .. import contracts
+from ..contracts import (
+    get_contract_factory,
+    get_contract_interface,
+    get_erc20_contract,
+    get_erc721_contract,
+    get_erc1155_contract,
+    get_safe_contract,
+)
+from ..contracts.call_builders import (
+    ERC20_CALLS,
+    ERC721_CALLS,
+    ERC1155_CALLS,
+    SAFE_CALLS,
+    ContractCall,
+    get_contract_call,
+)
+from ..ethereum_client import BatchCallManager
+from ..multicall import Multicall
+
+
+class TestContracts(TestCase):
+    def test_get_contract_interface(self):
+        contract_interface = get_contract_interface("erc20")
+        self.assertIn("abi", contract_interface)
+        self.assertIs(get_contract_interface("erc20"), contract_interface)
+
+        with self.assertRaisesRegex(ValueError, "not a known contract"):
+            get_contract_interface("not_existing")
+
+    def test_contract_json_is_loaded_lazily(self):
+        contract_name = "uniswap_v2_router"
+        get_contract_interface.cache_clear()
+        with mock.patch.object(
+            contracts,
+            "load_contract_interface",
+            wraps=contracts.load_contract_interface,
+        ) as load_contract_interface_mock:
+            w3 = Web3()
+            contracts.get_uniswap_v2_router_contract(w3)
+            contracts.get_uniswap_v2_router_contract(Web3())
+            load_contract_interface_mock.assert_called_once_with(
+                contracts.contracts[contract_name]
+            )
+
+    def test_get_contract_factory(self):
+        w3 = Web3()
+        address = to_checksum_address(os.urandom(20))
+        contract_factory = get_contract_factory(w3, "erc20")
+        self.assertIs(get_contract_factory(w3, "erc20"), contract_factory)
+        self.assertIsNot(get_contract_factory(Web3(), "erc20"), contract_factory)
+        self.assertIsNot(get_contract_factory(w3, "erc721"), contract_factory)
+
+        # A new factory is returned if no address is provided, so the shared one is not modified
+        erc20_contract_factory = get_erc20_contract(w3)
+        self.assertIsNot(erc20_contract_factory, contract_factory)
+        self.assertTrue(issubclass(erc20_contract_factory, contract_factory))
+        erc20_contract_factory.address = address
+        self.assertIsNone(get_erc20_contract(w3).address)
+        erc20_contract = get_erc20_contract(w3, address)
+        self.assertIsInstance(erc20_contract, Contract)
+        self.assertEqual(erc20_contract.address, address)
+        self.assertIsNone(contract_factory.address)
+        self.assertEqual(
+            erc20_contract.functions.transfer(address, 1)._encode_transaction_data()[
+                :10
+            ],
+            "0xa9059cbb",
+        )
+
+        async_safe_contract = get_safe_contract(AsyncWeb3(), address)
+        self.assertIsInstance(async_safe_contract, AsyncContract)
+        self.assertEqual(async_safe_contract.address, address)
+
+        # Factories are released with their `w3`
+        w3_ref = weakref.ref(w3)
+        del w3, contract_factory, erc20_contract_factory, erc20_contract
+        gc.collect()
+        self.assertIsNone(w3_ref())
+
+
+class TestContractCallBuilders(TestCase):
+    def test_build_data(self):
+        w3 = Web3()
+        owner = to_checksum_address(os.urandom(20))
+        token_id = 2**255
+        for call_builder, contract_function in (
+            (ERC20_CALLS["name"], get_erc20_contract(w3).functions.name()),
+            (
+                ERC20_CALLS["balanceOf"],
+                get_erc20_contract(w3).functions.balanceOf(owner),
+            ),
+            (
+                ERC20_CALLS["allowance"],
+                get_erc20_contract(w3).functions.allowance(owner, owner),
+            ),
+            (
+                ERC721_CALLS["ownerOf"],
+                get_erc721_contract(w3).functions.ownerOf(token_id),
+            ),
+            (
+                ERC1155_CALLS["balanceOfBatch"],
+                get_erc1155_contract(w3).functions.balanceOfBatch(
+                    [owner, owner], [1, token_id]
+                ),
+            ),
+            (
+                SAFE_CALLS["getModulesPaginated"],
+                get_safe_contract(w3).functions.getModulesPaginated(owner, 10),
+            ),
+        ):
+            with self.subTest(call_builder=call_builder):
+                contract_call = get_contract_call(contract_function)
+                self.assertEqual(
+                    call_builder.build(*contract_function.args), contract_call
+                )
+                self.assertEqual(
+                    call_builder.build_data(*contract_function.args),
+                    contract_function._encode_transaction_data(),
+                )
+
+        for not_valid_args in ((), (-1,), (2**256,), ("0x1234",)):
+            with self.subTest(not_valid_args=not_valid_args):
+                with self.assertRaises(ValueError):
+                    ERC721_CALLS["ownerOf"].build_data(*not_valid_args)
+
+        # Not checksummed addresses are encoded by `eth_abi`
+        self.assertEqual(
+            ERC20_CALLS["balanceOf"].build_data(owner.lower()),
+            ERC20_CALLS["balanceOf"].build_data(owner),
+        )
+        for not_valid_address in ("0x" + "Z" * 40, owner[:-1] + "G"):
+            with self.subTest(not_valid_address=not_valid_address):
+                with self.assertRaises(ValueError):
+                    ERC20_CALLS["balanceOf"].build_data(not_valid_address)
+
+    def test_build(self):
+        token_address = to_checksum_address(os.urandom(20))
+        self.assertEqual(
+            ERC20_CALLS["decimals"].build(address=token_address),
+            ContractCall(token_address, "0x313ce567", ("uint8",), "decimals"),
+        )
+        contract_call = ContractCall(None, "0x313ce567", ("uint8",), "decimals")
+        self.assertIs(get_contract_call(contract_call), contract_call)
+
+        self.assertEqual(
+            BatchCallManager._build_same_function_payloads(
+                contract_call, [token_address]
+            ),
+            [
+                {
+                    "to": token_address,
+                    "data": "0x313ce567",
+                    "output_type": ["uint8"],
+                    "fn_name": "decimals",
+                }
+            ],
+        )
+        with self.assertRaisesRegex(ValueError, "Missing address"):
+            BatchCallManager._build_call_payloads([contract_call])
+        self.assertEqual(
+            Multicall._build_payload(
+                [ERC20_CALLS["decimals"].build(address=token_address)]
+            ),
+            ([(token_address, HexBytes("0x313ce567"))], [["uint8"]]),
+        )
@@ -0,0 +1,124 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+from eth_utils import to_checksum_address
+from web3 import Web3
+
+import safe_eth.eth.contracts
+from safe_eth.eth.contracts import (
+    get_contract_interface,
+    get_erc20_contract,
+    get_erc721_contract,
+    get_safe_V1_4_1_contract,
+)
+from safe_eth.eth.contracts.call_builders import ERC721_CALLS
+from safe_eth.eth.ethereum_client import BatchCallManager
+
+CONTRACTS = {
+    "erc20": get_erc20_contract,
+    "safe_V1_4_1": get_safe_V1_4_1_contract,
+}
+
+
+def _load_contracts_module():
+    """
+    Executes ``safe_eth.eth.contracts`` module again in a new module object, so import time can be
+    measured without touching the already imported module
+    """
+    module_name = safe_eth.eth.contracts.__name__
+    spec = importlib.util.spec_from_file_location(
+        module_name,
+        safe_eth.eth.contracts.__file__,
+        submodule_search_locations=list(safe_eth.eth.contracts.__path__),
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.modules[module_name] = safe_eth.eth.contracts
+    return module
+
+
+@pytest.fixture(scope="module")
+def w3():
+    return Web3()
+
+
+@pytest.fixture(scope="function", params=list(CONTRACTS))
+def contract_name(request):
+    return request.param
+
+
+# --- 1. Import Benchmark ---
+#
+def test_contracts_module_import(benchmark):
+    benchmark(_load_contracts_module)
+
+
+# --- 2. Contract Building Benchmarks ---
+#
+def test_contract_web3_py(benchmark, w3, contract_name):
+    benchmark.group = f"Contract-{contract_name}"
+    contract_interface = get_contract_interface(contract_name)
+    address = to_checksum_address(os.urandom(20))
+
+    def build_contract():
+        return w3.eth.contract(
+            address=address,
+            abi=contract_interface["abi"],
+            bytecode=contract_interface.get("bytecode"),
+        )
+
+    benchmark(build_contract)
+
+
+def test_contract_safe_eth(benchmark, w3, contract_name):
+    benchmark.group = f"Contract-{contract_name}"
+    address = to_checksum_address(os.urandom(20))
+    benchmark(CONTRACTS[contract_name], w3, address)
+
+
+# --- 3. Call Payloads Benchmarks ---
+#
+# Number of ``ownerOf`` calls built on every round
+NUMBER_CALLS = 1_000
+
+
+@pytest.fixture(scope="module")
+def token_addresses_with_token_ids():
+    return [
+        (to_checksum_address(os.urandom(20)), token_id)
+        for token_id in range(NUMBER_CALLS)
+    ]
+
+
+def test_call_payloads_web3_py(benchmark, w3, token_addresses_with_token_ids):
+    benchmark.group = "Call-payloads"
+
+    def build_payloads():
+        return BatchCallManager._build_call_payloads(
+            [
+                get_erc721_contract(w3, token_address).functions.ownerOf(token_id)
+                for token_address, token_id in token_addresses_with_token_ids
+            ]
+        )
+
+    benchmark(build_payloads)
+
+
+def test_call_payloads_safe_eth(benchmark, token_addresses_with_token_ids):
+    benchmark.group = "Call-payloads"
+    call_builder = ERC721_CALLS["ownerOf"]
+
+    def build_payloads():
+        return BatchCallManager._build_call_payloads(
+            [
+                call_builder.build(token_id, address=token_address)
+                for token_address, token_id in token_addresses_with_token_ids
+            ]
+        )
+
+    benchmark(build_payloads)
@@ -1,5 +1,7 @@
+import threading
+import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -20,14 +22,23 @@ from ...util.util import to_0x_hex_str
 from ..constants import GAS_CALL_DATA_BYTE, NULL_ADDRESS
 from ..contracts import get_erc20_contract
 from ..ethereum_client import (
+    AdaptiveBatchSize,
+    BatchCallStrategy,
     EthereumClient,
     EthereumNetwork,
+    EthereumNetworkNotSupported,
     FromAddressNotFound,
     InsufficientFunds,
     InvalidNonce,
     SenderAccountNotFoundInNode,
+    TraceFilterRequest,
+    TraceTree,
     TracingManager,
     get_auto_ethereum_client,
+    is_batch_too_large_error,
+    is_too_many_results_error,
+    plan_block_windows,
+    resolve_batch_call_strategy,
 )
 from ..exceptions import BatchCallException, InvalidERC20Info
 from .ethereum_test_case import EthereumTestCaseMixin
@@ -159,6 +170,41 @@ class TestERC20Module(EthereumTestCaseMixin, TestCase):
         self.assertEqual(decoded_logs[3], expected_log_3)
         self.assertEqual(decoded_logs[5], expected_log_5)
 
+    def test_decode_transfer_logs_columns(self):
+        logs = log_receipts + [invalid_log_receipt]
+        columns = self.ethereum_client.erc20.decode_transfer_logs_columns(logs)
+        self.assertEqual(columns.positions, [0, 1, 3, 4, 6, 9])
+        self.assertEqual(
+            columns.value_names,
+            ["value", "value", "value", "tokenId", "tokenId", "unknown"],
+        )
+        self.assertEqual(
+            columns.from_addresses[:2],
+            [
+                "0x94E01661eBaef430fE862f958c03200b0F483f27",
+                "0x94E01661eBaef430fE862f958c03200b0F483f27",
+            ],
+        )
+        self.assertEqual(
+            columns.to_addresses[1], "0x64DA772DD84965f0Ee58174941d78a9DfBccca2e"
+        )
+        self.assertEqual(columns.values[1], 30000000000000000000)
+        self.assertEqual(columns.block_numbers[1], 4357126)
+        self.assertEqual(columns.log_indexes[1], 14)
+        self.assertEqual(
+            columns.token_addresses[1], "0x39C4BFa00b6edecCDd00fA9589E1BE76DE63e862"
+        )
+        self.assertEqual(
+            [columns.get_args(i) for i in range(len(columns.positions))],
+            [
+                decoded_log["args"]
+                for decoded_log in self.ethereum_client.erc20.decode_logs(logs)
+            ],
+        )
+        self.assertEqual(
+            self.ethereum_client.erc20.decode_transfer_logs_columns([]).positions, []
+        )
+
     def test_decode_invalid_transfer_log(self):
         invalid_transfer_logs = [invalid_log_receipt]
         self.assertEqual(
@@ -1238,6 +1284,19 @@ class TestEthereumClient(EthereumTestCaseMixin, TestCase):
         erc20 = self.deploy_example_erc20(2, self.ethereum_test_account.address)
         self.assertTrue(self.ethereum_client.is_contract(erc20.address))
 
+    def test_get_codes(self):
+        self.assertEqual(self.ethereum_client.get_codes([]), [])
+        erc20 = self.deploy_example_erc20(2, self.ethereum_test_account.address)
+        codes = self.ethereum_client.get_codes(
+            [self.ethereum_test_account.address, erc20.address]
+        )
+        self.assertEqual(codes, [b"", self.w3.eth.get_code(erc20.address)])
+        self.assertTrue(codes[1])
+        self.assertEqual(
+            self.ethereum_client.get_codes([erc20.address], block_identifier=0),
+            [b""],
+        )
+
     def test_is_eip1559_supported(self):
         self.assertTrue(self.ethereum_client.is_eip1559_supported())
 
@@ -1287,6 +1346,784 @@ class TestEthereumClientConstruction(TestCase):
             self.assertIn(ExtraDataToPOAMiddleware, w3.middleware_onion)
 
 
+class TestEthereumClientBatchDispatch(TestCase):
+    """Chunk dispatch of JSON RPC Batch requests, no node needed for these tests."""
+
+    def build_payload(self, size: int) -> List[Dict[str, Any]]:
+        return [
+            {"id": i, "jsonrpc": "2.0", "method": "eth_blockNumber", "params": []}
+            for i in range(size)
+        ]
+
+    def build_response(self, payload_chunk: Sequence[Dict[str, Any]]) -> MagicMock:
+        response = MagicMock(ok=True)
+        # Answer out of order, results must be sorted by `id`
+        response.json.return_value = [
+            {"jsonrpc": "2.0", "id": query["id"], "result": hex(query["id"])}
+            for query in reversed(payload_chunk)
+        ]
+        return response
+
+    def test_raw_batch_request_concurrency(self):
+        lock = threading.Lock()
+        in_flight = {"current": 0, "max": 0}
+
+        def post(url, json, timeout):
+            with lock:
+                in_flight["current"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["current"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["current"] -= 1
+            return self.build_response(json)
+
+        payload = self.build_payload(50)
+        expected = [hex(i) for i in range(50)]
+        for max_concurrency, expected_max_in_flight in ((1, 1), (4, 4)):
+            with self.subTest(max_concurrency=max_concurrency):
+                in_flight["max"] = 0
+                ethereum_client = EthereumClient(
+                    UNREACHABLE_NODE_URL,
+                    batch_request_max_size=5,
+                    batch_request_max_concurrency=max_concurrency,
+                )
+                with mock.patch.object(
+                    ethereum_client.http_session, "post", side_effect=post
+                ) as post_mock:
+                    self.assertEqual(
+                        list(ethereum_client.raw_batch_request(payload)), expected
+                    )
+                    self.assertEqual(post_mock.call_count, 10)
+                    self.assertEqual(in_flight["max"], expected_max_in_flight)
+
+        # Concurrency can be set per call
+        with mock.patch.object(ethereum_client.http_session, "post", side_effect=post):
+            in_flight["max"] = 0
+            self.assertEqual(
+                list(ethereum_client.raw_batch_request(payload, max_concurrency=2)),
+                expected,
+            )
+            self.assertEqual(in_flight["max"], 2)
+
+    def test_raw_batch_request_concurrency_error(self):
+        def post(url, json, timeout):
+            if json[0]["id"] == 10:
+                return MagicMock(ok=False, status_code=413, content=b"Too large")
+            return self.build_response(json)
+
+        ethereum_client = EthereumClient(
+            UNREACHABLE_NODE_URL,
+            batch_request_max_size=5,
+            batch_request_max_concurrency=4,
+        )
+        with mock.patch.object(ethereum_client.http_session, "post", side_effect=post):
+            results = []
+            with self.assertRaisesMessage(
+                ValueError, "Batch request error: b'Too large'"
+            ):
+                for result in ethereum_client.raw_batch_request(self.build_payload(50)):
+                    results.append(result)
+            # Chunks before the failing one are returned, same as serial dispatch
+            self.assertEqual(results, [hex(i) for i in range(10)])
+
+    def test_batch_call_custom_concurrency(self):
+        def post(url, json, timeout):
+            response = MagicMock(ok=True)
+            response.json.return_value = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": query["id"],
+                    "result": "0x" + query["id"].to_bytes(32, "big").hex(),
+                }
+                for query in json
+            ]
+            return response
+
+        ethereum_client = EthereumClient(
+            UNREACHABLE_NODE_URL,
+            batch_request_max_size=3,
+            batch_request_max_concurrency=3,
+        )
+        payloads = [
+            {"to": NULL_ADDRESS, "data": "0x", "output_type": ["uint256"]}
+            for _ in range(20)
+        ]
+        with mock.patch.object(ethereum_client.http_session, "post", side_effect=post):
+            self.assertEqual(
+                ethereum_client.batch_call_manager.batch_call_custom(payloads),
+                list(range(20)),
+            )
+
+    def test_adaptive_batch_size(self):
+        adaptive_batch_size = AdaptiveBatchSize(100, target_latency=1)
+        self.assertEqual(adaptive_batch_size.size, 100)
+        self.assertEqual(adaptive_batch_size.decrease(100), 50)
+        # Size of a failed chunk smaller than the current size
+        self.assertEqual(adaptive_batch_size.decrease(40), 20)
+        self.assertEqual(adaptive_batch_size.increase(0.1), 30)
+        # Too slow, don't increase
+        self.assertEqual(adaptive_batch_size.increase(2), 30)
+        for _ in range(10):
+            adaptive_batch_size.increase(0.1)
+        self.assertEqual(adaptive_batch_size.size, 100)
+        for _ in range(10):
+            adaptive_batch_size.decrease(adaptive_batch_size.size)
+        self.assertEqual(adaptive_batch_size.size, 1)
+
+        # Shared for the same node url
+        self.assertIs(
+            AdaptiveBatchSize.for_node("http://node-a.invalid", 10),
+            AdaptiveBatchSize.for_node("http://node-a.invalid", 10),
+        )
+        self.assertIsNot(
+            AdaptiveBatchSize.for_node("http://node-a.invalid", 10),
+            AdaptiveBatchSize.for_node("http://node-b.invalid", 10),
+        )
+
+        # Learned size is kept if another client uses a different max size
+        adaptive_batch_size = AdaptiveBatchSize.for_node("http://node-c.invalid", 10)
+        adaptive_batch_size.decrease(10)
+        self.assertIs(
+            AdaptiveBatchSize.for_node("http://node-c.invalid", 20),
+            adaptive_batch_size,
+        )
+        self.assertEqual(adaptive_batch_size.size, 5)
+        self.assertEqual(adaptive_batch_size.max_size, 20)
+        AdaptiveBatchSize.for_node("http://node-c.invalid", 2)
+        self.assertEqual(adaptive_batch_size.size, 2)
+
+    def test_raw_batch_request_adaptive_batch_size(self):
+        node_max_batch_size = 8
+        posted_sizes = []
+
+        def post(url, json, timeout):
+            posted_sizes.append(len(json))
+            if len(json) > node_max_batch_size:
+                if len(posted_sizes) == 1:
+                    return MagicMock(ok=False, status_code=413, content=b"")
+                response = MagicMock(ok=True)
+                response.json.return_value = {
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {"code": -32000, "message": "Batch size is too large"},
+                }
+                return response
+            return self.build_response(json)
+
+        ethereum_client = EthereumClient(
+            URI("http://adaptive-node.invalid:8545"),
+            batch_request_max_size=20,
+            adaptive_batch_size=True,
+        )
+        payload = self.build_payload(50)
+        with mock.patch.object(ethereum_client.http_session, "post", side_effect=post):
+            self.assertEqual(
+                list(ethereum_client.raw_batch_request(payload)),
+                [hex(i) for i in range(50)],
+            )
+            # 20 (fails) -> 10 + 10 (fail) -> 5 + 5 + ...
+            self.assertEqual(posted_sizes[:4], [20, 10, 5, 5])
+            # Only failed chunks are retried
+            self.assertEqual(
+                sum(size for size in posted_sizes if size <= node_max_batch_size), 50
+            )
+
+            # Learned size is reused by other clients for the same node
+            ethereum_client_2 = EthereumClient(
+                URI("http://adaptive-node.invalid:8545"),
+                batch_request_max_size=20,
+                adaptive_batch_size=True,
+            )
+            self.assertIs(
+                ethereum_client_2.batch_size_controller,
+                ethereum_client.batch_size_controller,
+            )
+            self.assertLess(ethereum_client_2.batch_size_controller.size, 20)
+
+            # If a single element fails, error is raised
+            node_max_batch_size = 0
+            with self.assertRaisesMessage(ValueError, "Batch size is too large"):
+                list(ethereum_client.raw_batch_request(payload))
+
+    def test_batch_call_custom_adaptive_batch_size(self):
+        posted_sizes = []
+
+        def post(url, json, timeout):
+            posted_sizes.append(len(json))
+            if len(json) > 4:
+                raise requests.exceptions.ReadTimeout("Read timed out")
+            response = MagicMock(ok=True)
+            response.json.return_value = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": query["id"],
+                    "result": "0x" + query["id"].to_bytes(32, "big").hex(),
+                }
+                for query in json
+            ]
+            return response
+
+        ethereum_client = EthereumClient(
+            URI("http://adaptive-node-timeout.invalid:8545"),
+            batch_request_max_size=16,
+            adaptive_batch_size=True,
+        )
+        payloads = [
+            {"to": NULL_ADDRESS, "data": "0x", "output_type": ["uint256"]}
+            for _ in range(20)
+        ]
+        with mock.patch.object(ethereum_client.http_session, "post", side_effect=post):
+            self.assertEqual(
+                ethereum_client.batch_call_manager.batch_call_custom(payloads),
+                list(range(20)),
+            )
+        self.assertEqual(posted_sizes[:3], [16, 8, 4])
+
+    def test_batch_call_custom_batch_too_large(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        payloads = [{"to": NULL_ADDRESS, "data": "0x", "output_type": ["uint256"]}]
+        with mock.patch.object(
+            ethereum_client.http_session,
+            "post",
+            return_value=MagicMock(ok=False, status_code=413, text="Too large"),
+        ):
+            # Still a ``ConnectionError`` when adaptive batch size is disabled
+            with self.assertRaises(ConnectionError):
+                ethereum_client.batch_call_manager.batch_call_custom(payloads)
+
+        self.assertTrue(
+            is_batch_too_large_error(
+                "you can't send more than 1000 requests in a batch"
+            )
+        )
+        self.assertTrue(
+            is_batch_too_large_error("batch length does not support more than 500")
+        )
+        self.assertFalse(
+            is_batch_too_large_error("query returned more than 10000 results")
+        )
+
+    def test_resolve_batch_call_strategy(self):
+        from_address = Account.create().address
+        for strategy, force_batch_call, from_address_, expected in (
+            ("auto", False, None, BatchCallStrategy.AUTO),
+            ("auto", True, None, BatchCallStrategy.JSONRPC),
+            ("auto", False, from_address, BatchCallStrategy.JSONRPC),
+            ("multicall", False, None, BatchCallStrategy.MULTICALL),
+            ("multicall", True, from_address, BatchCallStrategy.JSONRPC),
+            (BatchCallStrategy.JSONRPC, False, None, BatchCallStrategy.JSONRPC),
+        ):
+            with self.subTest(strategy=strategy, from_address=from_address_):
+                self.assertEqual(
+                    resolve_batch_call_strategy(
+                        strategy, force_batch_call, from_address_
+                    ),
+                    expected,
+                )
+
+        with self.assertRaisesMessage(ValueError, "cannot be used with Multicall"):
+            resolve_batch_call_strategy("multicall", from_address=from_address)
+        with self.assertRaises(ValueError):
+            resolve_batch_call_strategy("not-valid")
+
+    def test_batch_call_strategy(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        contract_functions = [
+            get_erc20_contract(ethereum_client.w3, NULL_ADDRESS).functions.decimals()
+        ]
+        multicall_mock = MagicMock()
+        multicall_mock.try_aggregate.return_value = []
+        ethereum_client.multicall = multicall_mock
+        with mock.patch.object(
+            ethereum_client.batch_call_manager, "batch_call", return_value=[]
+        ) as batch_call_mock:
+            ethereum_client.batch_call(contract_functions)
+            multicall_mock.try_aggregate.assert_called_once()
+            batch_call_mock.assert_not_called()
+
+            # `from` cannot be overridden using Multicall
+            ethereum_client.batch_call(
+                contract_functions, from_address=Account.create().address
+            )
+            ethereum_client.batch_call(contract_functions, strategy="jsonrpc")
+            multicall_mock.try_aggregate.assert_called_once()
+            self.assertEqual(batch_call_mock.call_count, 2)
+
+            ethereum_client.multicall = None
+            ethereum_client.batch_call(contract_functions)
+            self.assertEqual(batch_call_mock.call_count, 3)
+            with self.assertRaisesMessage(
+                EthereumNetworkNotSupported, "Multicall contract not available"
+            ):
+                ethereum_client.batch_call(contract_functions, strategy="multicall")
+
+
+def get_logs_one_transfer_per_block(
+    filter_params: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    ``eth_getLogs`` mock returning one transfer per block, ranges of more than 4 blocks are rejected
+    """
+    from_block, to_block = filter_params["fromBlock"], filter_params["toBlock"]
+    if to_block - from_block + 1 > 4:
+        raise Web3RPCError("query returned more than 10000 results")
+    return [
+        {
+            **log_receipts[1],
+            "blockNumber": block_number,
+            "transactionHash": HexBytes(block_number.to_bytes(32, "big")),
+        }
+        for block_number in range(from_block, to_block + 1)
+    ]
+
+
+class TestErc20TransferHistoryWindows(TestCase):
+    """Block range sharding of the transfer history, no node needed for these tests."""
+
+    def test_plan_block_windows(self):
+        self.assertEqual(
+            plan_block_windows(10, 30, 5, 3), [(10, 14), (15, 19), (20, 24)]
+        )
+        self.assertEqual(plan_block_windows(10, 12, 5, 3), [(10, 12)])
+        self.assertEqual(plan_block_windows(10, 9, 5, 3), [])
+
+    def test_is_too_many_results_error(self):
+        for message in (
+            "query returned more than 10000 results",
+            "Log response size exceeded. You can make eth_getLogs requests with up to a 2K block range",
+            "block range is too wide",
+            "query timeout exceeded",
+            "query returned more than 14290 results",
+            "Response is too large",
+        ):
+            self.assertTrue(is_too_many_results_error(message))
+        for message in (
+            "invalid argument 0",
+            "Your app has exceeded its compute units per second capacity",
+            "request rate exceeded",
+            "{'code': 429, 'message': 'Too many requests'}",
+            "429 Client Error: Too Many Requests for url: https://localhost",
+            "Too many requests, rate limit exceeded for block range queries",
+        ):
+            self.assertFalse(is_too_many_results_error(message))
+
+    def test_iter_total_transfer_history(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        with mock.patch.object(
+            Eth, "get_logs", side_effect=get_logs_one_transfer_per_block
+        ) as get_logs_mock:
+            windows = list(
+                ethereum_client.erc20.iter_total_transfer_history(
+                    from_block=100, to_block=150, block_window=16, max_concurrency=2
+                )
+            )
+        self.assertEqual(windows[0].from_block, 100)
+        self.assertEqual(windows[0].to_block, 115)
+        self.assertEqual(windows[-1].next_block, 151)
+        for previous_window, window in zip(windows, windows[1:]):
+            self.assertEqual(previous_window.next_block, window.from_block)
+        # After the first windows are split, size is reduced to 4 blocks
+        self.assertEqual(windows[2].to_block - windows[2].from_block + 1, 4)
+        events = [event for window in windows for event in window.events]
+        self.assertEqual(
+            [event["blockNumber"] for event in events], list(range(100, 151))
+        )
+        self.assertEqual(
+            events[0]["args"]["to"], "0x64DA772DD84965f0Ee58174941d78a9DfBccca2e"
+        )
+
+        # Resume from a cursor
+        with mock.patch.object(
+            Eth, "get_logs", side_effect=get_logs_one_transfer_per_block
+        ):
+            self.assertEqual(
+                [
+                    event["blockNumber"]
+                    for event in ethereum_client.erc20.get_total_transfer_history(
+                        from_block=windows[-2].next_block,
+                        to_block=150,
+                        block_window=4,
+                    )
+                ],
+                list(range(windows[-2].next_block, 151)),
+            )
+
+        with mock.patch.object(
+            Eth, "get_logs", side_effect=Web3RPCError("invalid argument")
+        ):
+            with self.assertRaises(Web3RPCError):
+                list(
+                    ethereum_client.erc20.iter_total_transfer_history(
+                        from_block=100, to_block=150
+                    )
+                )
+
+    def test_get_total_transfer_history_block_window_block_identifiers(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        with (
+            mock.patch.object(
+                Eth, "get_logs", side_effect=get_logs_one_transfer_per_block
+            ),
+            mock.patch.object(
+                EthereumClient, "get_block", return_value={"number": 110}
+            ) as get_block_mock,
+        ):
+            self.assertEqual(
+                [
+                    event["blockNumber"]
+                    for event in ethereum_client.erc20.get_total_transfer_history(
+                        from_block=100, to_block="latest", block_window=4
+                    )
+                ],
+                list(range(100, 111)),
+            )
+            get_block_mock.assert_called_once_with("latest")
+
+            get_block_mock.return_value = None
+            with self.assertRaisesMessage(
+                ValueError, "Cannot get block number for 'finalized'"
+            ):
+                ethereum_client.erc20.get_total_transfer_history(
+                    from_block=100, to_block="finalized", block_window=4
+                )
+
+
+def trace_filter_two_traces_per_block(
+    from_block: int,
+    to_block: int,
+    from_address: Optional[Sequence[str]] = None,
+    to_address: Optional[Sequence[str]] = None,
+    after: Optional[int] = None,
+    count: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    ``trace_filter`` mock returning two traces per block, ranges of more than 8 blocks
+    and pages of more than 4 traces are rejected
+    """
+    if to_block - from_block + 1 > 8:
+        raise Web3RPCError("block range is too wide")
+    if count is None or count > 4:
+        raise ValueError("Response is too large")
+    traces = [
+        {"blockNumber": block_number, "transactionPosition": position}
+        for block_number in range(from_block, to_block + 1)
+        for position in range(2)
+    ]
+    after = after or 0
+    return traces[after : after + count]
+
+
+class TestTracingManagerIterTraceFilter(TestCase):
+    """Pagination of ``trace_filter``, no node needed for these tests."""
+
+    def test_trace_filter_request_split(self):
+        self.assertEqual(
+            TraceFilterRequest(10, 20, 0, 100).split(),
+            [TraceFilterRequest(16, 20, 0, 100), TraceFilterRequest(10, 15, 0, 100)],
+        )
+        self.assertEqual(
+            TraceFilterRequest(10, 20, 100, 100).split(),
+            [TraceFilterRequest(10, 20, 100, 50)],
+        )
+        self.assertEqual(
+            TraceFilterRequest(10, 10, 0, 3).split(), [TraceFilterRequest(10, 10, 0, 1)]
+        )
+        self.assertIsNone(TraceFilterRequest(10, 10, 0, 1).split())
+
+    def test_iter_trace_filter(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        to_address = [Account.create().address]
+        expected = [
+            {"blockNumber": block_number, "transactionPosition": position}
+            for block_number in range(1, 21)
+            for position in range(2)
+        ]
+        with mock.patch.object(
+            ethereum_client.tracing,
+            "trace_filter",
+            side_effect=trace_filter_two_traces_per_block,
+        ) as trace_filter_mock:
+            traces = ethereum_client.tracing.iter_trace_filter(
+                1, 20, to_address=to_address, page_size=3
+            )
+            self.assertEqual(next(traces), expected[0])
+            self.assertEqual(list(traces), expected[1:])
+            # Pages are requested with the same filter
+            for call in trace_filter_mock.call_args_list:
+                self.assertEqual(call.kwargs["to_address"], to_address)
+                self.assertIsNone(call.kwargs["from_address"])
+
+            # Block range is split and page size is halved until the node accepts it
+            self.assertEqual(
+                list(
+                    ethereum_client.tracing.iter_trace_filter(
+                        1, 20, to_address=to_address, page_size=10
+                    )
+                ),
+                expected,
+            )
+
+        with mock.patch.object(
+            ethereum_client.tracing,
+            "trace_filter",
+            side_effect=Web3RPCError("invalid argument"),
+        ):
+            with self.assertRaises(Web3RPCError):
+                list(
+                    ethereum_client.tracing.iter_trace_filter(
+                        1, 20, to_address=to_address
+                    )
+                )
+
+    def test_iter_trace_filter_capped_count(self):
+        def trace_filter_capped_count(
+            from_block: int, to_block: int, count: Optional[int] = None, **kwargs
+        ):
+            # Node returns at most 2 traces per page, whatever ``count`` is requested
+            return trace_filter_two_traces_per_block(
+                from_block, to_block, count=min(count or 2, 2), **kwargs
+            )
+
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        with mock.patch.object(
+            ethereum_client.tracing,
+            "trace_filter",
+            side_effect=trace_filter_capped_count,
+        ):
+            self.assertEqual(
+                list(
+                    ethereum_client.tracing.iter_trace_filter(
+                        1, 8, to_address=[Account.create().address], page_size=4
+                    )
+                ),
+                [
+                    {"blockNumber": block_number, "transactionPosition": position}
+                    for block_number in range(1, 9)
+                    for position in range(2)
+                ],
+            )
+
+
+def get_not_errored_traces(traces: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reference implementation of ``TracingManager.filter_out_errored_traces``
+    """
+    errored_trace_addresses = [
+        trace["traceAddress"] for trace in traces if trace.get("error") is not None
+    ]
+    return sorted(
+        (
+            trace
+            for trace in traces
+            if not any(
+                trace["traceAddress"][: len(errored_trace_address)]
+                == errored_trace_address
+                for errored_trace_address in errored_trace_addresses
+            )
+        ),
+        key=lambda trace: trace["traceAddress"],
+    )
+
+
+class TestTracingManagerBlockTraces(TestCase):
+    """Grouping and filtering of block traces, no node needed for these tests."""
+
+    block_mocks = [
+        trace_block_13191781_mock,
+        trace_block_2191709_mock,
+        trace_block_15630274_mock,
+    ]
+
+    def test_filter_out_errored_traces_unsorted(self):
+        tracing = EthereumClient(UNREACHABLE_NODE_URL).tracing
+        expected = get_not_errored_traces(internal_txs_errored)
+        self.assertEqual(len(expected), 2)
+        self.assertEqual(
+            tracing.filter_out_errored_traces(internal_txs_errored), expected
+        )
+        self.assertEqual(
+            tracing.filter_out_errored_traces(list(reversed(internal_txs_errored))),
+            expected,
+        )
+        # Errored subtree inside a transaction
+        traces = [
+            {"traceAddress": [1, 0, 0]},
+            {"traceAddress": [0]},
+            {"traceAddress": [1], "error": "Reverted"},
+            {"traceAddress": []},
+            {"traceAddress": [1, 0]},
+            {"traceAddress": [2, 0]},
+            {"traceAddress": [0, 1]},
+            {"traceAddress": [10]},
+            {"traceAddress": [2]},
+        ]
+        self.assertEqual(
+            [
+                trace["traceAddress"]
+                for trace in tracing.filter_out_errored_traces(traces)
+            ],
+            [[], [0], [0, 1], [2], [2, 0], [10]],
+        )
+
+    def test_iter_blocks_transaction_traces(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        with mock.patch.object(
+            ethereum_client, "raw_batch_request", return_value=self.block_mocks
+        ) as raw_batch_request_mock:
+            tx_traces_list = list(
+                ethereum_client.tracing.iter_blocks_transaction_traces(
+                    [13191781, 2191709, 15630274], max_concurrency=2
+                )
+            )
+            self.assertEqual(
+                raw_batch_request_mock.call_args.kwargs,
+                {"batch_size": None, "max_concurrency": 2},
+            )
+            self.assertEqual(
+                [
+                    payload["params"]
+                    for payload in raw_batch_request_mock.call_args.args[0]
+                ],
+                [["0xc94a65"], ["0x21715d"], ["0xee7fc2"]],
+            )
+
+            not_filtered_tx_traces_list = list(
+                ethereum_client.tracing.iter_blocks_transaction_traces(
+                    [13191781, 2191709, 15630274], filter_errored=False
+                )
+            )
+
+        expected_tx_hashes = [
+            trace.get("transactionHash")
+            for block_traces in self.block_mocks
+            for i, trace in enumerate(block_traces)
+            if trace.get("transactionHash") is not None
+            and trace.get("transactionHash")
+            not in [
+                previous_trace.get("transactionHash")
+                for previous_trace in block_traces[:i]
+            ]
+        ]
+        self.assertEqual(
+            [
+                tx_traces[0]["transactionHash"]
+                for tx_traces in not_filtered_tx_traces_list
+            ],
+            expected_tx_hashes,
+        )
+        self.assertEqual(
+            sum(len(tx_traces) for tx_traces in not_filtered_tx_traces_list),
+            sum(
+                trace.get("transactionHash") is not None
+                for block_traces in self.block_mocks
+                for trace in block_traces
+            ),
+        )
+        self.assertEqual(
+            [
+                tx_traces
+                for tx_traces in map(
+                    get_not_errored_traces, not_filtered_tx_traces_list
+                )
+                if tx_traces
+            ],
+            [tx_traces for tx_traces in tx_traces_list if tx_traces],
+        )
+        self.assertLess(
+            sum(len(tx_traces) for tx_traces in tx_traces_list),
+            sum(len(tx_traces) for tx_traces in not_filtered_tx_traces_list),
+        )
+
+
+class TestTraceTree(TestCase):
+    """Trace lookups by `traceAddress`, no node needed for these tests."""
+
+    def test_trace_tree(self):
+        trace_tree = TraceTree(internal_txs_errored)
+        self.assertEqual(len(trace_tree), len(internal_txs_errored))
+        self.assertEqual(trace_tree.get_trace([0, 0]), internal_txs_errored[2])
+        self.assertIsNone(trace_tree.get_trace([1]))
+        # `[0]` is a delegatecall
+        self.assertEqual(trace_tree.get_previous_trace([0, 0]), internal_txs_errored[1])
+        self.assertEqual(
+            trace_tree.get_previous_trace([0, 0], skip_delegate_calls=True),
+            internal_txs_errored[0],
+        )
+        self.assertEqual(
+            trace_tree.get_previous_trace([0, 0, 0, 0], number_traces=2),
+            internal_txs_errored[2],
+        )
+        self.assertIsNone(trace_tree.get_previous_trace([0, 0], number_traces=3))
+        self.assertIsNone(trace_tree.get_previous_trace([1, 0]))
+        self.assertEqual(
+            trace_tree.get_ancestors([0, 0, 0]), internal_txs_errored[2::-1]
+        )
+        self.assertEqual(
+            trace_tree.get_ancestors([0, 0, 0], skip_delegate_calls=True),
+            [internal_txs_errored[2], internal_txs_errored[0]],
+        )
+        self.assertEqual(trace_tree.get_ancestors([]), [])
+
+        trace_tree = TraceTree(creation_internal_txs)
+        self.assertEqual(
+            trace_tree.get_next_traces([]),
+            [creation_internal_txs[1], creation_internal_txs[2]],
+        )
+        self.assertEqual(
+            trace_tree.get_next_traces([], remove_delegate_calls=True),
+            [creation_internal_txs[2]],
+        )
+        self.assertEqual(
+            trace_tree.get_next_traces(
+                [], remove_delegate_calls=True, remove_calls=True
+            ),
+            [],
+        )
+        self.assertEqual(trace_tree.get_next_traces([5]), [])
+
+    def test_get_trace_tree_cache(self):
+        tracing = EthereumClient(UNREACHABLE_NODE_URL).tracing
+        with (
+            mock.patch.object(TracingManager, "TRACE_TREE_CACHE_SIZE", 2),
+            mock.patch.object(
+                tracing, "trace_transaction", return_value=internal_txs_errored
+            ) as trace_transaction_mock,
+        ):
+            for trace_address in ([0], [0, 0], [0, 0, 0]):
+                tracing.get_previous_trace(HexStr("0x12"), trace_address)
+                tracing.get_next_traces(HexBytes("0x12"), trace_address)
+            self.assertEqual(trace_transaction_mock.call_count, 1)
+
+            tracing.get_trace_tree(HexStr("0x13"))
+            tracing.get_trace_tree(HexStr("0x14"))
+            # Least recently used tree was evicted
+            tracing.get_trace_tree(HexStr("0x12"))
+            self.assertEqual(trace_transaction_mock.call_count, 4)
+            tracing.get_trace_tree(HexStr("0x14"))
+            self.assertEqual(trace_transaction_mock.call_count, 4)
+
+            tracing.clear_trace_tree_cache()
+            tracing.get_trace_tree(HexStr("0x14"))
+            self.assertEqual(trace_transaction_mock.call_count, 5)
+
+            # Transactions not traced yet are not cached
+            trace_transaction_mock.return_value = []
+            tracing.get_trace_tree(HexStr("0x15"))
+            tracing.get_trace_tree(HexStr("0x15"))
+            self.assertEqual(trace_transaction_mock.call_count, 7)
+
+        # Cache is disabled with size 0 (default)
+        with (
+            mock.patch.object(TracingManager, "TRACE_TREE_CACHE_SIZE", 0),
+            mock.patch.object(
+                tracing, "trace_transaction", return_value=internal_txs_errored
+            ) as trace_transaction_mock,
+        ):
+            tracing.get_trace_tree(HexStr("0x16"))
+            tracing.get_trace_tree(HexStr("0x16"))
+            self.assertEqual(trace_transaction_mock.call_count, 2)
+
+
 class TestEthereumClientWithMainnetNode(EthereumTestCaseMixin, TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -4,10 +4,12 @@ import pytest
 from eth_utils import keccak
 from web3 import Web3
 
-from safe_eth.eth.utils import fast_keccak
+from safe_eth.eth.utils import fast_keccak, fast_keccak_buffer, fast_keccak_many
 
 # Define the message sizes (parameters)
-TEST_SIZES = [16, 1024, 64 * 1024, 1024 * 1024]
+TEST_SIZES = [16, 32, 64, 256, 1024, 64 * 1024, 1024 * 1024]
+# Number of messages hashed on every bulk test
+BULK_SIZE = 100
 
 
 # --- 1. Data Fixture (Forces Cache Miss) ---
@@ -47,3 +49,54 @@ def test_keccak_safe_eth(benchmark, random_data):
     benchmark.group = f"Keccak-{name}"
     # The benchmark fixture runs the function multiple times
     benchmark(fast_keccak, data)
+
+
+def test_keccak_safe_eth_buffer(benchmark, random_data):
+    name, data = random_data
+    benchmark.group = f"Keccak-{name}"
+    # Hash a slice of a bigger payload without copying it
+    benchmark(fast_keccak_buffer, memoryview(b"\x00" + data)[1:])
+
+
+# --- 3. Cache Miss Benchmarks ---
+#
+# Benchmarks above hash the same data on every round, so small inputs are cached after the first
+# one. These ones hash new data on every round
+def _new_data_setup(size):
+    return lambda: ((os.urandom(size),), {})
+
+
+def test_keccak_eth_utils_miss(benchmark, random_data):
+    name, data = random_data
+    benchmark.group = f"Keccak-miss-{name}"
+    benchmark.pedantic(keccak, setup=_new_data_setup(len(data)), rounds=200)
+
+
+def test_keccak_safe_eth_miss(benchmark, random_data):
+    name, data = random_data
+    benchmark.group = f"Keccak-miss-{name}"
+    benchmark.pedantic(fast_keccak, setup=_new_data_setup(len(data)), rounds=200)
+
+
+# --- 4. Bulk Benchmarks ---
+#
+@pytest.fixture(scope="function", params=TEST_SIZES[:5])
+def random_data_many(request):
+    """
+    Fixture that yields ``BULK_SIZE`` new random byte strings for each test parameter.
+    """
+    size = request.param
+    name = f"{size // 1024}KB" if size >= 1024 else f"{size}B"
+    return name, [os.urandom(size) for _ in range(BULK_SIZE)]
+
+
+def test_keccak_many_eth_utils(benchmark, random_data_many):
+    name, values = random_data_many
+    benchmark.group = f"Keccak-many-{name}"
+    benchmark(lambda: [keccak(value) for value in values])
+
+
+def test_keccak_many_safe_eth(benchmark, random_data_many):
+    name, values = random_data_many
+    benchmark.group = f"Keccak-many-{name}"
+    benchmark(fast_keccak_many, values)
@@ -1,17 +1,22 @@
+from typing import Any, Dict, List, Sequence
 from unittest import mock
 from unittest.mock import MagicMock
 
 from django.test import TestCase
 
+import eth_abi
+from eth_account import Account
 from eth_typing import URI, ChecksumAddress, HexAddress, HexStr
+from hexbytes import HexBytes
 
 from .. import EthereumClient, EthereumNetwork, EthereumNetworkNotSupported
 from ..constants import NULL_ADDRESS
 from ..contracts import get_erc20_contract
 from ..exceptions import BatchCallFunctionFailed
-from ..multicall import Multicall, MulticallDecodedResult
+from ..multicall import Multicall, MulticallDecodedResult, MulticallResult
 from ..utils import fast_is_checksum_address
 from .ethereum_test_case import EthereumTestCaseMixin
+from .test_ethereum_client import UNREACHABLE_NODE_URL
 from .utils import just_test_if_mainnet_node
 
 
@@ -22,6 +27,192 @@ class TestMulticallAddresses(TestCase):
             self.assertTrue(fast_is_checksum_address(address))
 
 
+class TestMulticallChunks(TestCase):
+    """
+    ``tryAggregate`` chunking, no node needed for these tests
+    """
+
+    def setUp(self):
+        self.ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        self.multicall = Multicall(
+            self.ethereum_client, Multicall.ADDRESSES[EthereumNetwork.MAINNET]
+        )
+
+    def build_response(self, queries: Sequence[Dict[str, Any]]) -> MagicMock:
+        """
+        Emulate ``tryAggregate``: every call succeeds returning the length of its calldata,
+        except calls with empty calldata that fail. ``0xff`` calldata makes the whole
+        ``tryAggregate`` fail (e.g. it consumes all the gas)
+        """
+        results = []
+        for query in queries:
+            data = HexBytes(query["params"][0]["data"])
+            self.assertEqual(data[:4], Multicall.TRY_AGGREGATE_SELECTOR)
+            _, calls = eth_abi.decode(["bool", "(address,bytes)[]"], data[4:])
+            if any(call_data == b"\xff" for _, call_data in calls):
+                results.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": query["id"],
+                        "error": {"code": -32000, "message": "out of gas"},
+                    }
+                )
+                continue
+            return_data = [
+                (
+                    (True, eth_abi.encode(["uint256"], [len(call_data)]))
+                    if call_data
+                    else (False, b"")
+                )
+                for _, call_data in calls
+            ]
+            results.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": query["id"],
+                    "result": HexBytes(
+                        eth_abi.encode(["(bool,bytes)[]"], [return_data])
+                    ).hex(),
+                }
+            )
+        response = MagicMock(ok=True)
+        response.json.return_value = results
+        return response
+
+    def test_chunk_targets_with_data_by_gas(self):
+        targets_with_data = [
+            (Account.create().address, HexBytes("0x12345678")) for _ in range(7)
+        ]
+        self.multicall.max_gas_per_aggregate = 3 * self.multicall.gas_per_call
+        chunks = self.multicall._chunk_targets_with_data(targets_with_data)
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(
+            [call for chunk in chunks for call in chunk], targets_with_data
+        )
+
+        # Every chunk contains one call at least
+        self.multicall.max_gas_per_aggregate = 1
+        chunks = self.multicall._chunk_targets_with_data(targets_with_data)
+        self.assertEqual(len(chunks), 7)
+
+    def test_chunk_targets_with_data_by_calldata_bytes(self):
+        # Every call takes 4 words + 2 words for the data
+        self.assertEqual(Multicall._get_call_encoded_size(b""), 128)
+        self.assertEqual(Multicall._get_call_encoded_size(b"1" * 32), 160)
+        self.assertEqual(Multicall._get_call_encoded_size(b"1" * 33), 192)
+        targets_with_data = [
+            (Account.create().address, HexBytes(b"1" * 64)) for _ in range(5)
+        ]
+        self.multicall.max_calldata_bytes = 2 * 192
+        chunks = self.multicall._chunk_targets_with_data(targets_with_data)
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(self.multicall._chunk_targets_with_data([]), [])
+
+    def test_try_aggregate_chunks(self):
+        targets_with_data = [
+            (Account.create().address, HexBytes(b"1" * i)) for i in range(10)
+        ]
+        self.multicall.max_gas_per_aggregate = 4 * self.multicall.gas_per_call
+        with mock.patch.object(
+            self.ethereum_client.http_session,
+            "post",
+            side_effect=lambda url, json, timeout: self.build_response(json),
+        ) as post_mock:
+            results = self.multicall._try_aggregate(targets_with_data)
+            # All the chunks are sent in the same JSON RPC batch request
+            post_mock.assert_called_once()
+            self.assertEqual(len(post_mock.call_args.kwargs["json"]), 3)
+
+        expected: List[MulticallResult] = [MulticallResult(False, None)] + [
+            MulticallResult(True, eth_abi.encode(["uint256"], [i]))
+            for i in range(1, 10)
+        ]
+        self.assertEqual(results, expected)
+
+        with mock.patch.object(
+            self.ethereum_client.http_session,
+            "post",
+            side_effect=lambda url, json, timeout: self.build_response(json),
+        ):
+            with self.assertRaises(BatchCallFunctionFailed):
+                self.multicall._try_aggregate(targets_with_data, require_success=True)
+            self.assertEqual(
+                self.multicall._try_aggregate(
+                    targets_with_data[1:], require_success=True
+                ),
+                expected[1:],
+            )
+
+        self.assertEqual(self.multicall._try_aggregate([]), [])
+
+    def test_try_aggregate_chunks_concurrency(self):
+        targets_with_data = [
+            (Account.create().address, HexBytes(b"1" * i)) for i in range(1, 11)
+        ]
+        multicall = Multicall(
+            self.ethereum_client,
+            Multicall.ADDRESSES[EthereumNetwork.MAINNET],
+            gas_per_call=1_000_000,
+            max_gas_per_aggregate=3_000_000,
+            max_concurrency=4,
+        )
+        with mock.patch.object(
+            self.ethereum_client.http_session,
+            "post",
+            side_effect=lambda url, json, timeout: self.build_response(json),
+        ) as post_mock:
+            results = multicall._try_aggregate(targets_with_data)
+            # Every chunk is sent in its own request
+            self.assertEqual(post_mock.call_count, 4)
+        self.assertEqual(
+            results,
+            [
+                MulticallResult(True, eth_abi.encode(["uint256"], [i]))
+                for i in range(1, 11)
+            ],
+        )
+
+    def test_try_aggregate_chunks_bisect(self):
+        targets_with_data = [
+            (Account.create().address, HexBytes(b"1" * i)) for i in range(1, 11)
+        ]
+        targets_with_data[6] = (Account.create().address, HexBytes(b"\xff"))
+        self.multicall.max_gas_per_aggregate = 8 * self.multicall.gas_per_call
+        with mock.patch.object(
+            self.ethereum_client.http_session,
+            "post",
+            side_effect=lambda url, json, timeout: self.build_response(json),
+        ) as post_mock:
+            results = self.multicall._try_aggregate(targets_with_data)
+            # 8 calls chunk is bisected 3 times until the failing call is isolated
+            self.assertEqual(post_mock.call_count, 4)
+
+            with self.assertRaises(BatchCallFunctionFailed):
+                self.multicall._try_aggregate(targets_with_data, require_success=True)
+
+        expected = [
+            MulticallResult(True, eth_abi.encode(["uint256"], [i]))
+            for i in range(1, 11)
+        ]
+        expected[6] = MulticallResult(False, None)
+        self.assertEqual(results, expected)
+
+    def test_try_aggregate_chunks_error(self):
+        response = MagicMock(ok=True)
+        response.json.return_value = {
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32000, "message": "execution aborted"},
+        }
+        with mock.patch.object(
+            self.ethereum_client.http_session, "post", return_value=response
+        ):
+            with self.assertRaises(BatchCallFunctionFailed):
+                self.multicall._try_aggregate(
+                    [(Account.create().address, HexBytes("0x12345678"))]
+                )
+
+
 class TestMulticallGanache(EthereumTestCaseMixin, TestCase):
     """
     Test Multicall using ganache
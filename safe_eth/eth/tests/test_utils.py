@@ -2,20 +2,35 @@ import os
 
 from django.test import TestCase
 
+import eth_abi
+from eth_abi.exceptions import DecodingError
 from eth_abi.packed import encode_packed
-from eth_utils import to_checksum_address
+from eth_utils import keccak, to_checksum_address
 from hexbytes import HexBytes
 
-from ..contracts import get_proxy_1_0_0_deployed_bytecode, get_proxy_factory_contract
+from ..contracts import (
+    get_proxy_1_0_0_deployed_bytecode,
+    get_proxy_1_3_0_deployed_bytecode,
+    get_proxy_factory_contract,
+)
 from ..utils import (
     compare_byte_code,
     decode_string_or_bytes32,
     fast_bytes_to_checksum_address,
+    fast_bytes_to_checksum_addresses,
     fast_is_checksum_address,
     fast_keccak,
+    fast_keccak_buffer,
+    fast_keccak_hex,
+    fast_keccak_many,
     fast_to_checksum_address,
+    fast_to_checksum_addresses,
+    get_abi_decoder,
+    get_checksum_address_cache_info,
+    get_code_hash_without_metadata,
     mk_contract_address,
     mk_contract_address_2,
+    remove_swarm_metadata,
 )
 from .ethereum_test_case import EthereumTestCaseMixin
 
@@ -105,6 +120,44 @@ class TestUtils(EthereumTestCaseMixin, TestCase):
         self.assertEqual(decode_string_or_bytes32(gnosis_hex), "Gnosis Token")
         self.assertEqual(decode_string_or_bytes32(dai_hex), "Dai Stablecoin v1.0")
 
+    def test_get_abi_decoder(self):
+        address = "0x8942595A2dC5181Df0465AF0D7be08c8f23C93af"
+        for output_types, values, expected in (
+            (("uint256",), [2**256 - 1], 2**256 - 1),
+            (("uint8",), [18], 18),
+            (("address",), [address], address),
+            (("bool",), [True], True),
+            (("bool",), [False], False),
+            (("string",), ["Gnosis Token"], "Gnosis Token"),
+            (("string",), ["ñ" * 40], "ñ" * 40),
+            (("string",), [""], ""),
+            (("bytes32",), [b"a" * 32], b"a" * 32),
+            (("uint112", "uint112", "uint32"), [1, 2, 3], [1, 2, 3]),
+            (("address[]",), [[address.lower()]], [address]),
+            (("(bool,bytes)[]",), [[(True, b"a")]], [(True, b"a")]),
+        ):
+            with self.subTest(output_types=output_types):
+                decoder = get_abi_decoder(output_types)
+                self.assertIs(decoder, get_abi_decoder(output_types))
+                self.assertEqual(
+                    decoder(eth_abi.encode(output_types, values)), expected
+                )
+
+        # Non canonical data is decoded by the generic decoder
+        string_data = eth_abi.encode(["uint256", "string"], [64, "Gnosis"])
+        self.assertEqual(get_abi_decoder(("string",))(string_data), "Gnosis")
+
+        for output_type, data in (
+            ("uint256", b"1" * 31),
+            ("uint8", eth_abi.encode(["uint256"], [256])),
+            ("address", b"1" * 32),
+            ("bool", eth_abi.encode(["uint256"], [2])),
+            ("string", b""),
+        ):
+            with self.subTest(output_type=output_type, data=data):
+                with self.assertRaises(DecodingError):
+                    get_abi_decoder((output_type,))(data)
+
     def test_compare_byte_code(self):
         proxy_with_metadata = get_proxy_1_0_0_deployed_bytecode()
         proxy_with_different_metadata = HexBytes(
@@ -117,6 +170,33 @@ class TestUtils(EthereumTestCaseMixin, TestCase):
             compare_byte_code(proxy_with_metadata, proxy_with_different_metadata)
         )
 
+    def test_get_code_hash_without_metadata(self):
+        proxy_with_metadata = get_proxy_1_0_0_deployed_bytecode()
+        proxy_with_different_metadata = HexBytes(
+            "0x608060405273ffffffffffffffffffffffffffffffffffffffff60005416366000"
+            "8037600080366000845af43d6000803e6000811415603d573d6000fd5b3d6000f3fe"
+            "a165627a7a72305820b7f4e514a2bdfeb2e729e84f7101233a43b51d677007041e70"
+            "8067e4b88bec480029"
+        )
+        proxy_without_metadata = remove_swarm_metadata(proxy_with_metadata)
+        self.assertEqual(
+            get_code_hash_without_metadata(proxy_with_metadata),
+            fast_keccak(proxy_without_metadata),
+        )
+        self.assertEqual(
+            get_code_hash_without_metadata(proxy_with_metadata),
+            get_code_hash_without_metadata(proxy_with_different_metadata),
+        )
+        self.assertEqual(
+            get_code_hash_without_metadata(proxy_with_metadata),
+            get_code_hash_without_metadata(proxy_without_metadata),
+        )
+        self.assertNotEqual(
+            get_code_hash_without_metadata(proxy_with_metadata),
+            get_code_hash_without_metadata(get_proxy_1_3_0_deployed_bytecode()),
+        )
+        self.assertEqual(get_code_hash_without_metadata(b""), fast_keccak(b""))
+
     def test_fast_keccak(self):
         text = "chidori"
         self.assertEqual(
@@ -142,6 +222,30 @@ class TestUtils(EthereumTestCaseMixin, TestCase):
             ),
         )
 
+        # Big inputs are not cached
+        binary = b"1234" * 1024
+        self.assertEqual(fast_keccak(binary), keccak(binary))
+        self.assertEqual(fast_keccak_hex(binary), keccak(binary).hex())
+
+    def test_fast_keccak_buffer(self):
+        payload = os.urandom(2048)
+        for value in (payload, bytearray(payload), memoryview(payload)):
+            with self.subTest(value=type(value)):
+                self.assertEqual(fast_keccak_buffer(value), keccak(payload))
+        self.assertEqual(
+            fast_keccak_buffer(memoryview(payload)[100:120]), keccak(payload[100:120])
+        )
+
+    def test_fast_keccak_many(self):
+        self.assertEqual(fast_keccak_many([]), [])
+        values = [b"", b"1234", os.urandom(32), os.urandom(4096)]
+        buffer = memoryview(b"".join(values))
+        self.assertEqual(fast_keccak_many(values), [keccak(value) for value in values])
+        self.assertEqual(
+            fast_keccak_many([buffer[0:4], bytearray(b"1234")]),
+            [keccak(b"1234"), keccak(b"1234")],
+        )
+
     def test_fast_to_checksum_address(self):
         for _ in range(10):
             address = os.urandom(20).hex()
@@ -162,6 +266,50 @@ class TestUtils(EthereumTestCaseMixin, TestCase):
                 fast_bytes_to_checksum_address(address), to_checksum_address(address)
             )
 
+    def test_fast_to_checksum_addresses(self):
+        self.assertEqual(fast_to_checksum_addresses([]), [])
+        addresses = [os.urandom(20) for _ in range(10)]
+        values = [
+            (
+                address
+                if i % 3 == 0
+                else address.hex() if i % 3 == 1 else "0x" + address.hex().upper()
+            )
+            for i, address in enumerate(addresses)
+        ]
+        self.assertEqual(
+            fast_to_checksum_addresses(values),
+            [to_checksum_address(address) for address in addresses],
+        )
+
+        with self.assertRaises(ValueError):
+            fast_to_checksum_addresses([addresses[0], os.urandom(19)])
+
+        with self.assertRaises(ValueError):
+            fast_to_checksum_addresses(["0x" + "z" * 40])
+
+    def test_fast_bytes_to_checksum_addresses(self):
+        self.assertEqual(fast_bytes_to_checksum_addresses(b""), [])
+        with self.assertRaises(ValueError):
+            fast_bytes_to_checksum_addresses(os.urandom(41))
+
+        addresses = [os.urandom(20) for _ in range(10)]
+        expected = [to_checksum_address(address) for address in addresses]
+        packed = b"".join(addresses)
+        for value in (packed, bytearray(packed), memoryview(packed)):
+            with self.subTest(value=type(value)):
+                self.assertEqual(fast_bytes_to_checksum_addresses(value), expected)
+
+    def test_get_checksum_address_cache_info(self):
+        address = os.urandom(20)
+        cache_info = get_checksum_address_cache_info()
+        fast_bytes_to_checksum_address(address)
+        fast_to_checksum_addresses([address, address.hex()])
+        fast_bytes_to_checksum_addresses(address)
+        new_cache_info = get_checksum_address_cache_info()
+        self.assertEqual(new_cache_info.misses, cache_info.misses + 1)
+        self.assertEqual(new_cache_info.hits, cache_info.hits + 3)
+
     def test_fast_is_checksum_address(self):
         self.assertFalse(fast_is_checksum_address(None))
         self.assertFalse(fast_is_checksum_address(""))
@@ -1,14 +1,19 @@
 import os
+import re
 from functools import lru_cache
-from typing import Any, Union
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
 
 import eth_abi
 from eth._utils.address import generate_contract_address
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.registry import registry as eth_abi_registry
 from eth_account import Account
 from eth_typing import Address, AnyAddress, ChecksumAddress, Hash32, HexAddress, HexStr
 from eth_utils import to_normalized_address
 from hexbytes import HexBytes
 from sha3 import keccak_256
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.types import TxParams, Wei
 
 from safe_eth.util.util import to_0x_hex_str
@@ -24,9 +29,28 @@ def get_empty_tx_params() -> TxParams:
     }
 
 
+# Only small inputs (addresses, hashes, function signatures...) are cached, as they are the ones
+# usually hashed repeatedly. For bigger inputs hashing the cache key costs more than the keccak itself
+_KECCAK_CACHE_MAX_INPUT_SIZE = int(os.getenv("CACHE_KECCAK_MAX_INPUT_SIZE", 64))
+# Copying an empty hasher skips the constructor arguments parsing
+_new_keccak_256 = keccak_256().copy
+
+
+def _keccak_256_digest(value: Union[bytes, bytearray, memoryview]) -> bytes:
+    hasher = _new_keccak_256()
+    hasher.update(value)
+    return hasher.digest()
+
+
 @lru_cache(maxsize=int(os.getenv("CACHE_KECCAK", 1024)))
-def _keccak_256(value: bytes) -> keccak_256:
-    return keccak_256(value)
+def _keccak_256_digest_cached(value: bytes) -> bytes:
+    return _keccak_256_digest(value)
+
+
+def _fast_keccak_digest(value: bytes) -> bytes:
+    if len(value) <= _KECCAK_CACHE_MAX_INPUT_SIZE and isinstance(value, bytes):
+        return _keccak_256_digest_cached(value)
+    return _keccak_256_digest(value)
 
 
 def fast_keccak(value: bytes) -> Hash32:
@@ -36,7 +60,37 @@ def fast_keccak(value: bytes) -> Hash32:
     :param value:
     :return: Keccak256 used by ethereum as `HexBytes`
     """
-    return Hash32(HexBytes(_keccak_256(value).digest()))
+    return Hash32(HexBytes(_fast_keccak_digest(value)))
+
+
+def fast_keccak_buffer(value: Union[bytes, bytearray, memoryview]) -> Hash32:
+    """
+    Same as `fast_keccak`, but accepting any buffer (e.g. a `memoryview` slice of a bigger payload)
+    so no copy is required. Result is never cached
+
+    :param value:
+    :return: Keccak256 used by ethereum as `HexBytes`
+    """
+    return Hash32(HexBytes(_keccak_256_digest(value)))
+
+
+def fast_keccak_many(
+    values: Iterable[Union[bytes, bytearray, memoryview]],
+) -> List[Hash32]:
+    """
+    Calculates keccak256 for many values, reusing the same empty hasher as template for all of them.
+    Results are not cached, so it's useful to hash many different values (e.g. transactions or logs)
+
+    :param values:
+    :return: List of Keccak256 as `HexBytes`, in the same order as `values`
+    """
+    new_keccak_256 = _new_keccak_256
+    hashes: List[Hash32] = []
+    for value in values:
+        hasher = new_keccak_256()
+        hasher.update(value)
+        hashes.append(Hash32(HexBytes(hasher.digest())))
+    return hashes
 
 
 def fast_keccak_text(value: str) -> Hash32:
@@ -51,13 +105,24 @@ def fast_keccak_text(value: str) -> Hash32:
 
 def fast_keccak_hex(value: bytes) -> HexStr:
     """
-    Same as `fast_keccak`, but it's a little more optimal calling `hexdigest()`
-    than calling `digest()` and then `hex()`
+    Same as `fast_keccak`, but returning a hex string
 
     :param value:
     :return: Keccak256 used by ethereum as a hex string (not 0x prefixed)
     """
-    return HexStr(_keccak_256(value).hexdigest())
+    return HexStr(_fast_keccak_digest(value).hex())
+
+
+_HEX_ADDRESS_REGEX = re.compile(r"0x[0-9a-fA-F]{40}")
+# Maps every hex character of the address hash to the bit (0x20) that switches an ascii letter to
+# uppercase if the nibble is greater than 7, as defined in EIP-55
+_CHECKSUM_HASH_MASK_TABLE = bytes.maketrans(
+    b"0123456789abcdef", b"\x00" * 8 + b"\x20" * 8
+)
+# Only letters of the address can be uppercased
+_CHECKSUM_LETTER_MASK_TABLE = bytes.maketrans(
+    b"0123456789abcdef", b"\x00" * 10 + b"\xff" * 6
+)
 
 
 def _build_checksum_address(
@@ -66,24 +131,22 @@ def _build_checksum_address(
     """
     https://github.com/ethereum/EIPs/blob/master/EIPS/eip-55.md
 
+    Instead of checking every nibble of the hash, a mask with the case bit for every character is
+    built using translation tables and applied to the whole address at once
+
     :param norm_address: address in lowercase (not 0x prefixed)
     :param address_hash: keccak256 of `norm_address` (not 0x prefixed)
     :return:
     """
+    address = norm_address.encode()
+    mask = int.from_bytes(
+        address_hash[:40].encode().translate(_CHECKSUM_HASH_MASK_TABLE), "big"
+    ) & int.from_bytes(address.translate(_CHECKSUM_LETTER_MASK_TABLE), "big")
     return ChecksumAddress(
         HexAddress(
             HexStr(
                 "0x"
-                + (
-                    "".join(
-                        (
-                            norm_address[i].upper()
-                            if int(address_hash[i], 16) > 7
-                            else norm_address[i]
-                        )
-                        for i in range(0, 40)
-                    )
-                )
+                + (int.from_bytes(address, "big") ^ mask).to_bytes(40, "big").decode()
             )
         )
     )
@@ -95,13 +158,15 @@ def _fast_to_checksum_address(address: HexAddress):
     return _build_checksum_address(address, address_hash)
 
 
-def fast_to_checksum_address(value: Union[AnyAddress, str, bytes]) -> ChecksumAddress:
+def _normalize_address(value: Union[AnyAddress, str, bytes]) -> HexAddress:
     """
-    Converts to checksum_address. Uses more optimal `pysha3` instead of `eth_utils` for keccak256 calculation
-
     :param value:
-    :return:
+    :return: address in lowercase (not 0x prefixed)
+    :raises: ValueError if `value` is not a valid address
     """
+    if isinstance(value, str) and _HEX_ADDRESS_REGEX.fullmatch(value):
+        # Fast path for the most common input, a 0x prefixed hex address
+        return HexAddress(HexStr(value[2:].lower()))
     if isinstance(value, bytes):
         if len(value) != 20:
             raise ValueError(
@@ -109,11 +174,22 @@ def fast_to_checksum_address(value: Union[AnyAddress, str, bytes]) -> ChecksumAd
                 % value.hex()
             )
 
-    norm_address = HexAddress(HexStr(to_normalized_address(value)[2:]))
-    return _fast_to_checksum_address(norm_address)
+    return HexAddress(HexStr(to_normalized_address(value)[2:]))
 
 
-def fast_bytes_to_checksum_address(value: bytes) -> ChecksumAddress:
+def fast_to_checksum_address(value: Union[AnyAddress, str, bytes]) -> ChecksumAddress:
+    """
+    Converts to checksum_address. Uses more optimal `pysha3` instead of `eth_utils` for keccak256 calculation
+
+    :param value:
+    :return:
+    """
+    return _fast_to_checksum_address(_normalize_address(value))
+
+
+def fast_bytes_to_checksum_address(
+    value: Union[bytes, bytearray, memoryview],
+) -> ChecksumAddress:
     """
     Converts to checksum_address. Uses more optimal `pysha3` instead of `eth_utils` for keccak256 calculation.
     As input is already in bytes, some checks and conversions can be skipped, providing a speedup of ~50%
@@ -126,10 +202,55 @@ def fast_bytes_to_checksum_address(value: bytes) -> ChecksumAddress:
             "Cannot convert %s to a checksum address, 20 bytes were expected"
             % bytes(value).hex()
         )
-    norm_address = HexAddress(HexStr(bytes(value).hex()))
+    norm_address = HexAddress(HexStr(value.hex()))
     return _fast_to_checksum_address(norm_address)
 
 
+def fast_to_checksum_addresses(
+    values: Iterable[Union[AnyAddress, str, bytes]],
+) -> List[ChecksumAddress]:
+    """
+    Same as `fast_to_checksum_address`, but for many addresses. Results are shared with
+    `fast_to_checksum_address` cache, so repeated addresses are only hashed once
+
+    :param values:
+    :return: List with the checksummed addresses, in the same order as `values`
+    :raises: ValueError if any of the `values` is not a valid address
+    """
+    return [_fast_to_checksum_address(_normalize_address(value)) for value in values]
+
+
+def fast_bytes_to_checksum_addresses(
+    value: Union[bytes, bytearray, memoryview],
+) -> List[ChecksumAddress]:
+    """
+    Same as `fast_bytes_to_checksum_address`, but for a buffer of packed 20 bytes addresses (e.g. logs
+    topics or database rows concatenated). The buffer is converted to hex only once
+
+    :param value: Packed addresses, length must be multiple of 20
+    :return: List with the checksummed addresses, in the same order as in `value`
+    :raises: ValueError if `value` length is not multiple of 20
+    """
+    if len(value) % 20:
+        raise ValueError(
+            "Cannot convert %s to checksum addresses, a multiple of 20 bytes was expected"
+            % bytes(value).hex()
+        )
+    hex_value = value.hex()
+    return [
+        _fast_to_checksum_address(HexAddress(HexStr(hex_value[i : i + 40])))
+        for i in range(0, len(hex_value), 40)
+    ]
+
+
+def get_checksum_address_cache_info():
+    """
+    :return: Cache statistics (`hits`, `misses`, `maxsize` and `currsize`) for the checksum address
+        cache shared by all the `fast_*checksum_address*` functions
+    """
+    return _fast_to_checksum_address.cache_info()
+
+
 def fast_is_checksum_address(value: Union[AnyAddress, str, bytes]) -> bool:
     """
     Fast version to check if an address is a checksum_address
@@ -154,7 +275,7 @@ def get_eth_address_with_invalid_checksum() -> str:
 
 def decode_string_or_bytes32(data: bytes) -> str:
     try:
-        return eth_abi.decode(["string"], data)[0]
+        return get_abi_decoder(("string",))(data)
     except (OverflowError, eth_abi.exceptions.DecodingError):
         name = eth_abi.decode(["bytes32"], data)[0]
         end_position = name.find(b"\x00")
@@ -164,17 +285,118 @@ def decode_string_or_bytes32(data: bytes) -> str:
             return name[:end_position].decode()
 
 
-def remove_swarm_metadata(code: bytes) -> bytes:
+# Types whose decoded value is not modified by the web3 return normalizers
+_NOT_NORMALIZED_TYPE_REGEX = re.compile(r"^(u?int\d*|bool|bytes\d*|string)$")
+_UINT_TYPE_REGEX = re.compile(r"^uint(\d*)$")
+
+
+def _fast_decode_uint(bits: int) -> Callable[[bytes], Optional[int]]:
+    max_value = 2**bits
+
+    def decode(data: bytes) -> Optional[int]:
+        if len(data) < 32:
+            return None
+        value = int.from_bytes(data[:32], "big")
+        return value if value < max_value else None
+
+    return decode
+
+
+def _fast_decode_address(data: bytes) -> Optional[ChecksumAddress]:
+    if len(data) < 32 or any(data[:12]):
+        return None
+    return fast_bytes_to_checksum_address(bytes(data[12:32]))
+
+
+def _fast_decode_bool(data: bytes) -> Optional[bool]:
+    if len(data) < 32 or any(data[:31]) or data[31] > 1:
+        return None
+    return data[31] == 1
+
+
+def _fast_decode_string(data: bytes) -> Optional[str]:
+    if len(data) < 64 or int.from_bytes(data[:32], "big") != 32:
+        return None
+    length = int.from_bytes(data[32:64], "big")
+    end = 64 + length
+    padded_end = 64 + (length + 31) // 32 * 32
+    if len(data) < padded_end or any(data[end:padded_end]):
+        return None
+    try:
+        return bytes(data[64:end]).decode()
+    except UnicodeDecodeError:
+        return None
+
+
+def _get_fast_path_decoder(output_type: str) -> Optional[Callable[[bytes], Any]]:
     """
-    Remove CBOR-encoded metadata (Swarm `bzzr0`/`bzzr1` or IPFS) appended by
-    the Solidity compiler to the end of the bytecode.
+    :param output_type:
+    :return: Decoder for the most common single output types, skipping the generic ``eth_abi``
+        and normalization machinery. It returns ``None`` if ``data`` is not in the canonical
+        encoding, so the generic decoder can deal with it (and raise the proper exception)
+    """
+    if output_type == "address":
+        return _fast_decode_address
+    if output_type == "bool":
+        return _fast_decode_bool
+    if output_type == "string":
+        return _fast_decode_string
+    if match := _UINT_TYPE_REGEX.match(output_type):
+        return _fast_decode_uint(int(match.group(1) or 256))
+    return None
+
+
+@lru_cache(maxsize=int(os.getenv("CACHE_ABI_DECODER", 1024)))
+def get_abi_decoder(output_types: Tuple[str, ...]) -> Callable[[bytes], Any]:
+    """
+    Build a function to decode contract calls results for ``output_types``, bundling the ``eth_abi``
+    decoder and the web3 return normalizers (e.g. checksum addresses) so they are only built once
+    for every ``output_types``.
+
+    :param output_types: Tuple with the output types, e.g. ``("uint256",)``
+    :return: Function to decode ABI encoded data. As in web3 contract calls, a single value is
+        returned if there is only one output type, a list otherwise.
+        It raises ``DecodingError`` if data cannot be decoded
+    """
+    tuple_decoder = TupleDecoder(
+        decoders=[
+            eth_abi_registry.get_decoder(output_type) for output_type in output_types
+        ]
+    )
+    types = list(output_types)
+    normalize = not all(
+        _NOT_NORMALIZED_TYPE_REGEX.match(output_type) for output_type in output_types
+    )
+
+    def decode(data: bytes) -> Any:
+        decoded_values = tuple_decoder(ContextFramesBytesIO(data))
+        normalized_data: Sequence[Any] = (
+            map_abi_data(BASE_RETURN_NORMALIZERS, types, decoded_values)
+            if normalize
+            else list(decoded_values)
+        )
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
+
+    fast_path_decoder = (
+        _get_fast_path_decoder(output_types[0]) if len(output_types) == 1 else None
+    )
+    if not fast_path_decoder:
+        return decode
+
+    def decode_with_fast_path(data: bytes) -> Any:
+        value = fast_path_decoder(data)
+        return decode(data) if value is None else value
+
+    return decode_with_fast_path
 
-    Solidity appends a CBOR map followed by its 2-byte big-endian length, e.g.
-    ``0xa2 0x64 'ipfs' ... 0x64 'solc' ... <2-byte length>``. The trailing
-    length lets us strip the metadata regardless of the encoding version.
 
+def _get_metadata_start(code: bytes) -> Optional[int]:
+    """
     :param code:
-    :return: Code without metadata
+    :return: Position of the CBOR-encoded metadata appended by the Solidity compiler,
+        ``None`` if not found
     """
     if len(code) >= 2:
         metadata_length = int.from_bytes(code[-2:], "big")
@@ -185,8 +407,26 @@ def remove_swarm_metadata(code: bytes) -> bytes:
             0xA2,
             0xA3,
         ):
-            return code[:metadata_start]
-    raise ValueError("Metadata not found in code %s" % code.hex())
+            return metadata_start
+    return None
+
+
+def remove_swarm_metadata(code: bytes) -> bytes:
+    """
+    Remove CBOR-encoded metadata (Swarm `bzzr0`/`bzzr1` or IPFS) appended by
+    the Solidity compiler to the end of the bytecode.
+
+    Solidity appends a CBOR map followed by its 2-byte big-endian length, e.g.
+    ``0xa2 0x64 'ipfs' ... 0x64 'solc' ... <2-byte length>``. The trailing
+    length lets us strip the metadata regardless of the encoding version.
+
+    :param code:
+    :return: Code without metadata
+    """
+    metadata_start = _get_metadata_start(code)
+    if metadata_start is None:
+        raise ValueError("Metadata not found in code %s" % code.hex())
+    return code[:metadata_start]
 
 
 def compare_byte_code(code_1: bytes, code_2: bytes) -> bool:
@@ -210,6 +450,20 @@ def compare_byte_code(code_1: bytes, code_2: bytes) -> bool:
         return codes[0] == codes[1]
 
 
+def get_code_hash_without_metadata(code: bytes) -> Hash32:
+    """
+    Keccak256 of the code without the metadata appended by the Solidity compiler, so two codes
+    are equal for ``compare_byte_code`` if and only if they have the same hash
+
+    :param code:
+    :return: Keccak256 of the code, removing swarm metadata if found
+    """
+    metadata_start = _get_metadata_start(code)
+    if metadata_start is None:
+        return fast_keccak_buffer(code)
+    return fast_keccak_buffer(memoryview(code)[:metadata_start])
+
+
 def mk_contract_address(address: Union[str, bytes], nonce: int) -> ChecksumAddress:
     """
     Generate expected contract address when using EVM CREATE
@@ -1,6 +1,6 @@
 from enum import Enum
 from logging import getLogger
-from typing import List, Optional, Union
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
 
 from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress, HexAddress, HexStr
@@ -14,18 +14,131 @@ from safe_eth.eth.typing import EthereumData
 from safe_eth.eth.utils import (
     fast_bytes_to_checksum_address,
     fast_is_checksum_address,
-    get_empty_tx_params,
+    fast_keccak_text,
 )
 from safe_eth.util.util import to_0x_hex_str
 
 logger = getLogger(__name__)
 
 
+# Size of operation (1 byte), to (20 bytes), value (32 bytes) and data length (32 bytes)
+_MULTISEND_TX_HEADER_SIZE = 1 + 20 + 32 * 2
+# Old multisend encoding pads every field to 32 bytes, and has an extra 32 bytes for the data offset
+_OLD_MULTISEND_TX_HEADER_SIZE = 32 * 5
+_MULTI_SEND_SELECTOR = bytes(fast_keccak_text("multiSend(bytes)")[:4])
+
+
 class MultiSendOperation(Enum):
     CALL = 0
     DELEGATE_CALL = 1
 
 
+class MultiSendTxView(NamedTuple):
+    """
+    Lightweight decoded MultiSend transaction. ``data`` is a ``memoryview`` over the encoded
+    transactions, so inner data is not copied
+    """
+
+    operation: MultiSendOperation
+    to: ChecksumAddress
+    value: int
+    data: memoryview
+    old_encoding: bool = False
+
+    def to_multisend_tx(self) -> "MultiSendTx":
+        return MultiSendTx(
+            self.operation,
+            self.to,
+            self.value,
+            bytes(self.data),
+            old_encoding=self.old_encoding,
+        )
+
+
+def _decode_multisend_tx_view(
+    buffer: memoryview, offset: int
+) -> Tuple[MultiSendTxView, int]:
+    """
+    Decodes one MultiSend transaction starting at ``offset``. Fallbacks to the old multisend
+    structure if the transaction cannot be decoded
+
+    :param buffer: Encoded multisend transactions
+    :param offset: Position of the transaction in ``buffer``
+    :return: Tuple with the decoded transaction and the position of the next transaction
+    :raises: ValueError if the transaction cannot be decoded
+    """
+    try:
+        return _decode_multisend_data_view(buffer, offset)
+    except ValueError:
+        # Try using the old decoding method
+        return _decode_multisend_old_transaction_view(buffer, offset)
+
+
+def _decode_multisend_data_view(
+    buffer: memoryview, offset: int
+) -> Tuple[MultiSendTxView, int]:
+    """
+    Structure:
+        - operation   -> MultiSendOperation 1 byte
+        - to          -> ethereum address 20 bytes
+        - value       -> tx value 32 bytes
+        - data_length -> 32 bytes
+        - data        -> `data_length` bytes
+
+    :return: Tuple with the decoded transaction and the position of the next transaction
+    :raises: ValueError if the transaction cannot be decoded
+    """
+    operation = MultiSendOperation(buffer[offset])
+    to = fast_bytes_to_checksum_address(buffer[offset + 1 : offset + 21])
+    value = int.from_bytes(buffer[offset + 21 : offset + 53], byteorder="big")
+    data_length = int.from_bytes(buffer[offset + 53 : offset + 85], byteorder="big")
+    data_start = offset + _MULTISEND_TX_HEADER_SIZE
+    data = buffer[data_start : data_start + data_length]
+    len_data = len(data)
+    if len_data != data_length:
+        raise ValueError(
+            f"Data length {data_length} is different from len(data) {len_data}"
+        )
+    return (
+        MultiSendTxView(operation, to, value, data, False),
+        data_start + data_length,
+    )
+
+
+def _decode_multisend_old_transaction_view(
+    buffer: memoryview, offset: int
+) -> Tuple[MultiSendTxView, int]:
+    """
+    Structure:
+        - operation   -> MultiSendOperation 32 byte
+        - to          -> ethereum address 32 bytes
+        - value       -> tx value 32 bytes
+        - data_offset -> 32 bytes
+        - data_length -> 32 bytes
+        - data        -> `data_length` bytes, padded to 32 bytes
+
+    :return: Tuple with the decoded transaction and the position of the next transaction
+    :raises: ValueError if the transaction cannot be decoded
+    """
+    operation = MultiSendOperation(
+        int.from_bytes(buffer[offset : offset + 32], byteorder="big")
+    )
+    to = fast_bytes_to_checksum_address(buffer[offset + 44 : offset + 64])
+    value = int.from_bytes(buffer[offset + 64 : offset + 96], byteorder="big")
+    data_length = int.from_bytes(buffer[offset + 128 : offset + 160], byteorder="big")
+    data_start = offset + _OLD_MULTISEND_TX_HEADER_SIZE
+    data = buffer[data_start : data_start + data_length]
+    len_data = len(data)
+    if len_data != data_length:
+        raise ValueError(
+            f"Data length {data_length} is different from len(data) {len_data}"
+        )
+    return (
+        MultiSendTxView(operation, to, value, data, True),
+        data_start + (data_length + 0x1F) // 0x20 * 0x20,
+    )
+
+
 class MultiSendTx:
     """
     Wrapper for a single MultiSendTx
@@ -81,14 +194,33 @@ class MultiSendTx:
         return len(self.data)
 
     @property
-    def encoded_data(self):
-        operation = HexBytes("{:0>2x}".format(self.operation.value))  # Operation 1 byte
-        to = HexBytes("{:0>40x}".format(int(self.to, 16)))  # Address 20 bytes
-        value = HexBytes("{:0>64x}".format(self.value))  # Value 32 bytes
-        data_length = HexBytes(
-            "{:0>64x}".format(self.data_length)
+    def encoded_data(self) -> bytes:
+        encoded_data = bytearray(len(self))
+        self._write_encoded_data(encoded_data, 0)
+        return bytes(encoded_data)
+
+    def _write_encoded_data(self, buffer: bytearray, offset: int) -> int:
+        """
+        Writes the encoded transaction into ``buffer``, that must be already allocated
+
+        :param buffer:
+        :param offset: Position to write the transaction in ``buffer``
+        :return: Position after the encoded transaction
+        """
+        data_length = self.data_length
+        buffer[offset] = self.operation.value  # Operation 1 byte
+        buffer[offset + 1 : offset + 21] = int(self.to, 16).to_bytes(
+            20, byteorder="big"
+        )  # Address 20 bytes
+        buffer[offset + 21 : offset + 53] = self.value.to_bytes(
+            32, byteorder="big"
+        )  # Value 32 bytes
+        buffer[offset + 53 : offset + 85] = data_length.to_bytes(
+            32, byteorder="big"
         )  # Data length 32 bytes
-        return operation + to + value + data_length + self.data
+        data_start = offset + _MULTISEND_TX_HEADER_SIZE
+        buffer[data_start : data_start + data_length] = self.data
+        return data_start + data_length
 
     @classmethod
     def from_bytes(cls, encoded_multisend_tx: Union[str, bytes]) -> "MultiSendTx":
@@ -98,12 +230,10 @@ class MultiSendTx:
         :param encoded_multisend_tx:
         :return:
         """
-        encoded_multisend_tx = HexBytes(encoded_multisend_tx)
-        try:
-            return cls._decode_multisend_data(encoded_multisend_tx)
-        except ValueError:
-            # Try using the old decoding method
-            return cls._decode_multisend_old_transaction(encoded_multisend_tx)
+        multisend_tx_view, _ = _decode_multisend_tx_view(
+            memoryview(HexBytes(encoded_multisend_tx)), 0
+        )
+        return multisend_tx_view.to_multisend_tx()
 
     @classmethod
     def _decode_multisend_data(cls, encoded_multisend_tx: Union[str, bytes]):
@@ -120,20 +250,10 @@ class MultiSendTx:
         :param encoded_multisend_tx: 1 multisend transaction encoded
         :return: Tx as a MultisendTx
         """
-        encoded_multisend_tx = HexBytes(encoded_multisend_tx)
-        operation = MultiSendOperation(encoded_multisend_tx[0])
-        to = fast_bytes_to_checksum_address(encoded_multisend_tx[1 : 1 + 20])
-        value = int.from_bytes(encoded_multisend_tx[21 : 21 + 32], byteorder="big")
-        data_length = int.from_bytes(
-            encoded_multisend_tx[21 + 32 : 21 + 32 * 2], byteorder="big"
+        multisend_tx_view, _ = _decode_multisend_data_view(
+            memoryview(HexBytes(encoded_multisend_tx)), 0
         )
-        data = encoded_multisend_tx[21 + 32 * 2 : 21 + 32 * 2 + data_length]
-        len_data = len(data)
-        if len_data != data_length:
-            raise ValueError(
-                f"Data length {data_length} is different from len(data) {len_data}"
-            )
-        return cls(operation, to, value, data, old_encoding=False)
+        return multisend_tx_view.to_multisend_tx()
 
     @classmethod
     def _decode_multisend_old_transaction(
@@ -152,20 +272,10 @@ class MultiSendTx:
         :param encoded_multisend_tx: 1 multisend transaction encoded
         :return: Tx as a MultisendTx
         """
-        encoded_multisend_tx = HexBytes(encoded_multisend_tx)
-        operation = MultiSendOperation(
-            int.from_bytes(encoded_multisend_tx[:32], byteorder="big")
+        multisend_tx_view, _ = _decode_multisend_old_transaction_view(
+            memoryview(HexBytes(encoded_multisend_tx)), 0
         )
-        to = fast_bytes_to_checksum_address(encoded_multisend_tx[32:64][-20:])
-        value = int.from_bytes(encoded_multisend_tx[64:96], byteorder="big")
-        data_length = int.from_bytes(encoded_multisend_tx[128:160], byteorder="big")
-        data = encoded_multisend_tx[160 : 160 + data_length]
-        len_data = len(data)
-        if len_data != data_length:
-            raise ValueError(
-                f"Data length {data_length} is different from len(data) {len_data}"
-            )
-        return cls(operation, to, value, data, old_encoding=True)
+        return multisend_tx_view.to_multisend_tx()
 
 
 class MultiSend:
@@ -239,28 +349,35 @@ class MultiSend:
         :param encoded_multisend_txs:
         :return: List of MultiSendTxs
         """
-        if not encoded_multisend_txs:
-            return []
+        return [
+            multisend_tx_view.to_multisend_tx()
+            for multisend_tx_view in cls.iter_from_bytes(encoded_multisend_txs)
+        ]
 
-        remaining_data = HexBytes(encoded_multisend_txs)
-        multisend_txs: List[MultiSendTx] = []
-        while remaining_data:
-            multisend_tx = MultiSendTx.from_bytes(remaining_data)
-            multisend_tx_size = len(multisend_tx)
-
-            assert (
-                multisend_tx_size > 0
-            ), "Multisend tx cannot be empty"  # This should never happen, just in case
-            if multisend_tx.old_encoding:
-                next_data_position = (
-                    (multisend_tx.data_length + 0x1F) // 0x20 * 0x20
-                ) + 0xA0
-            else:
-                next_data_position = multisend_tx_size
-            multisend_txs.append(multisend_tx)
-            remaining_data = remaining_data[next_data_position:]
-
-        return multisend_txs
+    @classmethod
+    def iter_from_bytes(
+        cls, encoded_multisend_txs: Union[str, bytes, bytearray, memoryview]
+    ) -> Iterator[MultiSendTxView]:
+        """
+        Same as ``from_bytes``, but transactions are decoded lazily and ``data`` of the transactions
+        is not copied. Useful for MultiSend transactions with a lot of transactions or big data
+
+        :param encoded_multisend_txs:
+        :return: Iterator of ``MultiSendTxView``
+        :raises: ValueError if a transaction cannot be decoded
+        """
+        if not encoded_multisend_txs:
+            return
+
+        buffer = memoryview(
+            HexBytes(encoded_multisend_txs)
+            if isinstance(encoded_multisend_txs, str)
+            else encoded_multisend_txs
+        ).cast("B")
+        offset = 0
+        while offset < len(buffer):
+            multisend_tx_view, offset = _decode_multisend_tx_view(buffer, offset)
+            yield multisend_tx_view
 
     @classmethod
     def from_transaction_data(
@@ -323,18 +440,48 @@ class MultiSend:
         :return:
         """
         multisend_contract = self.get_contract()
-        encoded_multisend_data = b"".join([x.encoded_data for x in multi_send_txs])
         return multisend_contract.functions.multiSend(
-            encoded_multisend_data
+            self.encode_txs(multi_send_txs)
         ).build_transaction(tx_params or {})
 
+    @staticmethod
+    def _encode_txs(
+        multi_send_txs: List[MultiSendTx], offset: int
+    ) -> Tuple[bytearray, int]:
+        """
+        :param multi_send_txs:
+        :param offset: Bytes reserved before the encoded transactions
+        :return: Tuple with a ``bytearray`` with the encoded transactions starting at ``offset``
+            (preallocated with padding, so it can be ABI encoded without copying) and the size of
+            the encoded transactions
+        """
+        size = sum(len(multi_send_tx) for multi_send_tx in multi_send_txs)
+        buffer = bytearray(offset + (size + 0x1F) // 0x20 * 0x20)
+        for multi_send_tx in multi_send_txs:
+            offset = multi_send_tx._write_encoded_data(buffer, offset)
+        return buffer, size
+
+    @classmethod
+    def encode_txs(cls, multi_send_txs: List[MultiSendTx]) -> bytes:
+        """
+        :param multi_send_txs:
+        :return: Packed encoded transactions, the ``transactions`` parameter for ``multiSend``
+        """
+        buffer, size = cls._encode_txs(multi_send_txs, 0)
+        del buffer[size:]
+        return bytes(buffer)
+
     def build_tx_data(self, multi_send_txs: List[MultiSendTx]) -> HexBytes:
         """
-        Txs don't need to be valid to get through
+        Txs don't need to be valid to get through. Data is encoded in a single preallocated buffer,
+        no contract or node is required
 
         :param multi_send_txs:
         :return:
         """
-        return HexBytes(
-            self.build_tx(multi_send_txs, tx_params=get_empty_tx_params())["data"]
-        )
+        # Selector (4 bytes) + offset of `transactions` (32 bytes) + length (32 bytes)
+        buffer, size = self._encode_txs(multi_send_txs, 4 + 32 * 2)
+        buffer[:4] = _MULTI_SEND_SELECTOR
+        buffer[4:36] = (0x20).to_bytes(32, byteorder="big")
+        buffer[36:68] = size.to_bytes(32, byteorder="big")
+        return HexBytes(buffer)
@@ -1,11 +1,11 @@
 import secrets
 from abc import ABC, ABCMeta
-from functools import cache
-from typing import Callable, Optional
+from functools import cache, cached_property
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from eth_abi.packed import encode_packed
 from eth_account.signers.local import LocalAccount
-from eth_typing import ChecksumAddress
+from eth_typing import ChecksumAddress, Hash32
 from web3 import Web3
 from web3.contract.contract import Contract, ContractFunction
 
@@ -26,12 +26,47 @@ from safe_eth.eth.contracts import (
     get_proxy_factory_V1_5_0_contract,
 )
 from safe_eth.eth.utils import (
-    compare_byte_code,
     fast_keccak,
+    get_code_hash_without_metadata,
     get_empty_tx_params,
     mk_contract_address_2,
 )
-from safe_eth.safe.safe_deployments import default_safe_deployments
+from safe_eth.safe.safe_deployments_index import get_proxy_factory_deployment
+
+
+@cache
+def get_proxy_code_hashes() -> Dict[Hash32, Tuple[str, ...]]:
+    """
+    :return: Keccak256 of the runtime code (without metadata, check ``get_code_hash_without_metadata``)
+        of every known Safe Proxy, mapped to the names of the Proxies with that code, e.g.
+        ``("Proxy 1.4.1", "Proxy 1.3.0", ...)``, as runtime code is the same for some versions
+    """
+    proxy_code_hashes: Dict[Hash32, Tuple[str, ...]] = {}
+    for proxy_name, proxy_code_fn in (
+        ("Proxy 1.5.0", get_proxy_1_5_0_deployed_bytecode),
+        ("Proxy 1.4.1", get_proxy_1_4_1_deployed_bytecode),
+        ("Proxy 1.3.0", get_proxy_1_3_0_deployed_bytecode),
+        ("Proxy 1.1.1", get_proxy_1_1_1_deployed_bytecode),
+        ("Proxy 1.1.1 mainnet", get_proxy_1_1_1_mainnet_deployed_bytecode),
+        ("Proxy 1.0.0", get_proxy_1_0_0_deployed_bytecode),
+        ("PayingProxy", get_paying_proxy_deployed_bytecode),
+    ):
+        code_hash = get_code_hash_without_metadata(proxy_code_fn())
+        proxy_code_hashes[code_hash] = proxy_code_hashes.get(code_hash, ()) + (
+            proxy_name,
+        )
+    return proxy_code_hashes
+
+
+def classify_proxy_code(code: bytes) -> Tuple[str, ...]:
+    """
+    :param code: Runtime code of a contract
+    :return: Names of the known Safe Proxies (e.g. ``Proxy 1.5.0``) with the same code, ignoring
+        metadata. Empty if there's no match
+    """
+    if not code:
+        return ()
+    return get_proxy_code_hashes().get(get_code_hash_without_metadata(code), ())
 
 
 class ProxyFactory(ContractBase, metaclass=ABCMeta):
@@ -75,17 +110,9 @@ class ProxyFactory(ContractBase, metaclass=ABCMeta):
         :return: Version string (e.g., "1.5.0")
         :raises ValueError: If factory address is not found in safe_deployments
         """
-        for version, deployment_data in default_safe_deployments.items():
-            # Check all possible factory key names
-            for proxy_factory_contract_name in (
-                "SafeProxyFactory",
-                "ProxyFactory",
-                "GnosisSafeProxyFactory",
-            ):
-                if factory_address in deployment_data.get(
-                    proxy_factory_contract_name, []
-                ):
-                    return version
+        deployment = get_proxy_factory_deployment(factory_address)
+        if deployment:
+            return deployment.version
 
         raise ValueError(
             f"Unknown ProxyFactory address: {factory_address}. "
@@ -142,6 +169,38 @@ class ProxyFactory(ContractBase, metaclass=ABCMeta):
             )
         return self.contract.functions.createProxyWithNonce
 
+    def get_proxy_runtime_code_hash(self) -> Optional[Hash32]:
+        """
+        :return: Keccak256 of ``get_proxy_runtime_code`` without metadata, ``None`` if runtime code
+            is not available for the Proxy Factory version
+        """
+        return self._proxy_runtime_code_hash
+
+    @cached_property
+    def _proxy_runtime_code_hash(self) -> Optional[Hash32]:
+        try:
+            proxy_runtime_code = self.get_proxy_runtime_code()
+        except NotImplementedError:
+            return None
+        return (
+            get_code_hash_without_metadata(proxy_runtime_code)
+            if proxy_runtime_code
+            else None
+        )
+
+    def is_proxy_code(self, code: bytes) -> bool:
+        """
+        :param code: Runtime code of a contract
+        :return: ``True`` if code matches any of the Proxies deployed by the supported Proxy Factories
+        """
+        if not code:
+            return False
+        code_hash = get_code_hash_without_metadata(code)
+        return (
+            code_hash in get_proxy_code_hashes()
+            or code_hash == self.get_proxy_runtime_code_hash()
+        )
+
     def check_proxy_code(self, address: ChecksumAddress) -> bool:
         """
         Check if proxy bytecode matches any of the deployed by the supported Proxy Factories
@@ -149,29 +208,20 @@ class ProxyFactory(ContractBase, metaclass=ABCMeta):
         :param address: Ethereum address to check
         :return: ``True`` if proxy is valid, ``False`` otherwise
         """
+        return self.is_proxy_code(self.w3.eth.get_code(address))
 
-        def get_proxy_runtime_code() -> Optional[bytes]:
-            try:
-                return self.get_proxy_runtime_code()
-            except NotImplementedError:
-                return None
-
-        deployed_proxy_code = self.w3.eth.get_code(address)
-        proxy_code_fns = (
-            get_proxy_1_5_0_deployed_bytecode,
-            get_proxy_1_4_1_deployed_bytecode,
-            get_proxy_1_3_0_deployed_bytecode,
-            get_proxy_1_1_1_deployed_bytecode,
-            get_proxy_1_1_1_mainnet_deployed_bytecode,
-            get_proxy_1_0_0_deployed_bytecode,
-            get_paying_proxy_deployed_bytecode,
-            get_proxy_runtime_code,
-        )
-        for proxy_code_fn in proxy_code_fns:
-            proxy_code = proxy_code_fn()
-            if proxy_code and compare_byte_code(deployed_proxy_code, proxy_code):
-                return True
-        return False
+    def check_proxy_codes(self, addresses: Sequence[ChecksumAddress]) -> List[bool]:
+        """
+        Same as ``check_proxy_code``, but code for all the addresses is retrieved using a batch
+        ``eth_getCode`` request
+
+        :param addresses: Ethereum addresses to check
+        :return: ``True`` for every valid proxy, ``False`` otherwise. Same order as ``addresses``
+        """
+        return [
+            self.is_proxy_code(code)
+            for code in self.ethereum_client.get_codes(addresses)
+        ]
 
     def _deploy_proxy_contract(
         self,
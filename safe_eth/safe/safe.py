@@ -4,7 +4,7 @@ import os
 from abc import ABC, ABCMeta, abstractmethod
 from functools import cached_property
 from logging import getLogger
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import eth_abi
 from eth_abi.exceptions import DecodingError
@@ -39,12 +39,15 @@ from safe_eth.eth.contracts import (
     get_simulate_tx_accessor_V1_4_1_contract,
     get_simulate_tx_accessor_V1_5_0_contract,
 )
+from safe_eth.eth.contracts.call_builders import SAFE_CALLS
+from safe_eth.eth.ethereum_client import build_jsonrpc_batch_payload
 from safe_eth.eth.proxies import MinimalProxy, SafeProxy, StandardProxy
 from safe_eth.eth.typing import EthereumData
 from safe_eth.eth.utils import (
     fast_bytes_to_checksum_address,
     fast_is_checksum_address,
     fast_keccak,
+    get_abi_decoder,
     get_empty_tx_params,
 )
 
@@ -53,10 +56,41 @@ from .addresses import SAFE_SIMULATE_TX_ACCESSOR_ADDRESS
 from .enums import SafeOperationEnum, SafeOperationLike
 from .exceptions import CannotEstimateGas, CannotRetrieveSafeInfoException
 from .safe_creator import SafeCreator
+from .safe_deployments_index import get_singleton_deployment
 from .safe_tx import SafeTx
 
 logger = getLogger(__name__)
 
+# Storage slots read by `Safe.retrieve_all_info`, master copy slots first (`SafeProxy` and EIP-1967)
+_SAFE_INFO_MASTER_COPY_STORAGE_SLOTS = (
+    0,
+    StandardProxy.LOGIC_CONTRACT_SLOT,
+    StandardProxy.BEACON_CONTRACT_SLOT,
+)
+# First page of modules, as requested by `Safe.retrieve_all_info`
+_GET_MODULES_PAGINATED_DATA = HexBytes(
+    SAFE_CALLS["getModulesPaginated"].build_data(SENTINEL_ADDRESS, 20)
+)
+_GET_MODULES_DATA = HexBytes(SAFE_CALLS["getModules"].build_data())
+# Calls done by `Safe.retrieve_all_info` after the modules call (in order), with their output types
+_SAFE_INFO_CALLS: Dict[str, Tuple[HexBytes, Tuple[str, ...]]] = {
+    fn_name: (
+        HexBytes(SAFE_CALLS[fn_name].build_data()),
+        SAFE_CALLS[fn_name].output_types,
+    )
+    for fn_name in ("nonce", "getOwners", "getThreshold", "VERSION")
+}
+
+# Costs to route through the proxy and nested calls
+_PROXY_GAS = 1000
+# https://github.com/ethereum/solidity/blob/dfe3193c7382c80f1814247a162663a97c3f5e67/libsolidity/codegen/ExpressionCompiler.cpp#L1764
+# This was `false` before solc 0.4.21 -> `m_context.evmVersion().canOverchargeGasForCall()`
+# So gas needed by caller will be around 35k
+_OLD_CALL_GAS = 35000
+# Web3 `estimate_gas` estimates less gas
+_WEB3_ESTIMATION_OFFSET = 23000
+_ESTIMATE_TX_GAS_ADDITIONAL_GAS = _PROXY_GAS + _OLD_CALL_GAS
+
 
 @dataclasses.dataclass
 class SafeInfo:
@@ -72,6 +106,13 @@ class SafeInfo:
     module_guard: ChecksumAddress
 
 
+@dataclasses.dataclass
+class SafeTxGasEstimation:
+    safe_tx_gas: Optional[int]
+    base_gas: Optional[int]
+    error: Optional[CannotEstimateGas] = None
+
+
 class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
     """
     Collection of methods and utilities to handle a Safe
@@ -94,6 +135,9 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
     SAFE_MESSAGE_TYPEHASH = bytes.fromhex(
         "60b3cbf8b4a223d68d641b3b6ddf9a298e7f33710cf3d3a9d1146b5a6150fbca"
     )
+    # `estimate_tx_gas_by_trying`: gas limits tried in the same batch request and relative precision
+    ESTIMATE_TX_GAS_REFINE_PROBES = 16
+    ESTIMATE_TX_GAS_PRECISION = 0.01
     _DEFAULT_VERSION = "1.5.0"
 
     def __new__(
@@ -214,6 +258,7 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         address: ChecksumAddress,
         ethereum_client: EthereumClient,
         block_identifier: Optional[BlockIdentifier] = "latest",
+        master_copy: Optional[ChecksumAddress] = None,
     ) -> Optional[str]:
         """
         Return the Safe semantic version reported by the contract. None is returned if the read fails.
@@ -221,8 +266,14 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         :param address: Safe proxy address
         :param ethereum_client: Client wrapper used to interact with the node
         :param block_identifier: Optional block identifier for the call
+        :param master_copy: Optional master copy (singleton) of the Safe, e.g. taken from the
+            ``ProxyCreation`` event. If it's a known singleton the version is taken from the Safe
+            deployments index and no RPC call is done
         :return: Semantic version string or ``None`` if it cannot be detected
         """
+        if master_copy and (deployment := get_singleton_deployment(master_copy)):
+            # Remove build metadata, e.g. `1.1.1+Circles`
+            return deployment.version.split("+")[0]
         try:
             contract = get_safe_contract(ethereum_client.w3, address=address)
             return contract.functions.VERSION().call(
@@ -380,10 +431,30 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         :param estimated_tx_gas: gas calculated with `estimate_tx_gas`
         :return:
         """
-        data = data or b""
-        safe_contract = self.contract
         threshold = self.retrieve_threshold()
         nonce = self.retrieve_nonce()
+        return self._calculate_tx_base_gas(
+            to, value, data, operation, gas_token, estimated_tx_gas, threshold, nonce
+        )
+
+    def _calculate_tx_base_gas(
+        self,
+        to: ChecksumAddress,
+        value: int,
+        data: bytes,
+        operation: SafeOperationLike,
+        gas_token: ChecksumAddress,
+        estimated_tx_gas: int,
+        threshold: int,
+        nonce: int,
+    ) -> int:
+        """
+        :param threshold: Safe threshold
+        :param nonce: Safe nonce
+        :return: Base gas, as described in ``estimate_tx_base_gas``
+        """
+        data = data or b""
+        safe_contract = self.contract
 
         # Every byte == 0 -> 4  Gas
         # Every byte != 0 -> 16 Gas (68 before Istanbul)
@@ -416,7 +487,7 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
                 gas_token,
                 refund_receiver,
                 signatures,
-            ).build_transaction(get_empty_tx_params())["data"]
+            )._encode_transaction_data()
         )
 
         # If nonce == 0, nonce storage has to be initialized
@@ -460,52 +531,7 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         :raises: CannotEstimateGas: If gas cannot be estimated
         :raises: ValueError: Cannot decode received data
         """
-
-        safe_address = self.address
-        data = data or b""
-
-        def parse_revert_data(result: bytes) -> int:
-            # 4 bytes - error method id
-            # 32 bytes - position
-            # 32 bytes - length
-            # Last 32 bytes - value of revert (if everything went right)
-            gas_estimation_offset = 4 + 32 + 32
-            gas_estimation = result[gas_estimation_offset:]
-
-            # Estimated gas must be 32 bytes
-            if len(gas_estimation) != 32:
-                gas_limit_text = (
-                    f"with gas limit={gas_limit} "
-                    if gas_limit is not None
-                    else "without gas limit set "
-                )
-                logger.warning(
-                    "Safe=%s Problem estimating gas, returned value %sis %s for tx=%s",
-                    safe_address,
-                    gas_limit_text,
-                    result.hex(),
-                    tx,
-                )
-                raise CannotEstimateGas("Received %s for tx=%s" % (result.hex(), tx))
-
-            return int(gas_estimation.hex(), 16)
-
-        tx = self.contract.functions.requiredTxGas(
-            to, value, data, operation
-        ).build_transaction(
-            {
-                "from": safe_address,
-                "gas": 0,  # Don't call estimate
-                "gasPrice": Wei(0),  # Don't get gas price
-            }
-        )
-
-        tx_params = {
-            "from": safe_address,
-            "to": safe_address,
-            "data": tx["data"],
-        }
-
+        tx_params = self._build_estimate_tx_gas_call(to, value, data, operation)
         if gas_limit:
             tx_params["gas"] = HexStr(hex(gas_limit))
 
@@ -519,24 +545,80 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         response = self.ethereum_client.http_session.post(
             self.ethereum_client.ethereum_node_url, json=query, timeout=30
         )
-        if response.ok:
-            response_data = response.json()
-            error_data: Optional[str] = None
-            if "error" in response_data and "data" in response_data["error"]:
-                error_data = response_data["error"]["data"]
-            elif "result" in response_data:  # Ganache-cli
-                error_data = response_data["result"]
-
-            if error_data:
-                if "0x" in error_data:
-                    return parse_revert_data(
-                        HexBytes(error_data[error_data.find("0x") :])
-                    )
-
-        raise CannotEstimateGas(
-            f"Received {response.status_code} - {response.content!r} from ethereum node"
+        if not response.ok:
+            raise CannotEstimateGas(
+                f"Received {response.status_code} - {response.content!r} from ethereum node"
+            )
+        return self._decode_estimate_tx_gas_response(
+            response.json(), tx_params, gas_limit
         )
 
+    def _build_estimate_tx_gas_call(
+        self,
+        to: ChecksumAddress,
+        value: int,
+        data: bytes,
+        operation: SafeOperationLike,
+    ) -> Dict[str, Any]:
+        """
+        :return: ``eth_call`` params (without gas limit) to estimate the tx gas
+        """
+        return {
+            "from": self.address,
+            "to": self.address,
+            "data": self.contract.functions.requiredTxGas(
+                to, value, data or b"", operation
+            )._encode_transaction_data(),
+        }
+
+    def _decode_estimate_tx_gas_response(
+        self,
+        response_data: Dict[str, Any],
+        tx_params: Dict[str, Any],
+        gas_limit: Optional[int] = None,
+    ) -> int:
+        """
+        :param response_data: JSON RPC response for the ``_build_estimate_tx_gas_call`` ``eth_call``
+        :param tx_params: ``eth_call`` params, for debugging purposes
+        :param gas_limit: Gas limit set for the ``eth_call``, for debugging purposes
+        :return: Estimated gas
+        :raises: CannotEstimateGas
+        """
+        error_data: Optional[str] = None
+        if "error" in response_data and "data" in response_data["error"]:
+            error_data = response_data["error"]["data"]
+        elif "result" in response_data:  # Ganache-cli
+            error_data = response_data["result"]
+
+        if not error_data or "0x" not in error_data:
+            raise CannotEstimateGas(f"Received {response_data} from ethereum node")
+
+        # 4 bytes - error method id
+        # 32 bytes - position
+        # 32 bytes - length
+        # Last 32 bytes - value of revert (if everything went right)
+        result = HexBytes(error_data[error_data.find("0x") :])
+        gas_estimation_offset = 4 + 32 + 32
+        gas_estimation = result[gas_estimation_offset:]
+
+        # Estimated gas must be 32 bytes
+        if len(gas_estimation) != 32:
+            gas_limit_text = (
+                f"with gas limit={gas_limit} "
+                if gas_limit is not None
+                else "without gas limit set "
+            )
+            logger.warning(
+                "Safe=%s Problem estimating gas, returned value %sis %s for tx=%s",
+                self.address,
+                gas_limit_text,
+                result.hex(),
+                tx_params,
+            )
+            raise CannotEstimateGas("Received %s for tx=%s" % (result.hex(), tx_params))
+
+        return int(gas_estimation.hex(), 16)
+
     def estimate_tx_gas_with_web3(
         self, to: ChecksumAddress, value: int, data: EthereumData
     ) -> int:
@@ -563,9 +645,12 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         operation: SafeOperationLike,
     ) -> int:
         """
-        Try to get an estimation with Safe's `requiredTxGas`. If estimation is successful, try to set a gas limit and
-        estimate again. If gas estimation is ok, same gas estimation should be returned, if it's less than required
-        estimation will not be completed, so estimation was not accurate and gas limit needs to be increased.
+        Try to get an estimation with Safe's `requiredTxGas`. Estimation can be less than required
+        (e.g. 63/64th problem), so increasing gas limits are tried with `eth_call` until the tx can be executed.
+        The estimation is tried first. If it fails, all the increasing gas limits are tried in the same JSON RPC
+        batch request, and then the minimal gas limit between
+        the last failing one and the first successful one is searched with batches of
+        ``ESTIMATE_TX_GAS_REFINE_PROBES`` gas limits, until the precision is ``ESTIMATE_TX_GAS_PRECISION``.
 
         :param to:
         :param value:
@@ -574,45 +659,131 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         :return: Estimated gas calling `requiredTxGas` setting a gas limit and checking if `eth_call` is successful
         :raises: CannotEstimateGas
         """
-        if not data:
-            data = HexBytes(b"")
+        data = HexBytes(data or b"")
+        tx_params = self._build_estimate_tx_gas_call(to, value, data, operation)
+        base_gas = self.ethereum_client.estimate_data_gas(data)
+
+        estimation_response, block_response = self._estimate_tx_gas_batch_request(
+            [
+                ("eth_call", [tx_params, "latest"]),
+                ("eth_getBlockByNumber", ["latest", False]),
+            ]
+        )
+        gas_estimated = self._decode_estimate_tx_gas_response(
+            estimation_response, tx_params
+        )
+        block_gas_limit: Optional[int] = (
+            int(block_response["result"]["gasLimit"], 16)
+            if block_response.get("result")
+            else None
+        )
+
+        # Gas limits to try, increasing the estimation in steps
+        gas_limits = [gas_estimated]
+        for i in range(1, 30):
+            next_gas_limit = math.floor((1 + i * 0.03) * gas_limits[-1])
+            if block_gas_limit and next_gas_limit >= block_gas_limit:
+                next_gas_limit = block_gas_limit
+                break
+            gas_limits.append(next_gas_limit)
         else:
-            data = HexBytes(data)
+            next_gas_limit = gas_limits.pop()
+
+        # Estimation is usually enough, only try the increasing gas limits if it fails
+        if self._try_estimate_tx_gas_limits(tx_params, gas_limits[:1], base_gas)[0]:
+            return gas_estimated
+        results = [False] + self._try_estimate_tx_gas_limits(
+            tx_params, gas_limits[1:], base_gas
+        )
 
-        gas_estimated = self.estimate_tx_gas_with_safe(to, value, data, operation)
-        block_gas_limit: Optional[int] = None
-        base_gas: Optional[int] = self.ethereum_client.estimate_data_gas(data)
+        logger.warning(
+            "Safe=%s - Found 63/64 problem gas-estimated=%d to=%s data=%s",
+            self.address,
+            gas_estimated,
+            to,
+            to_0x_hex_str(data),
+        )
+        if True not in results:
+            return next_gas_limit
+
+        # Search minimal gas limit between the last failing and the first successful one
+        position = results.index(True)
+        lower_gas_limit, gas_limit = gas_limits[position - 1], gas_limits[position]
+        while gas_limit - lower_gas_limit > gas_limit * self.ESTIMATE_TX_GAS_PRECISION:
+            step = (gas_limit - lower_gas_limit) / (
+                self.ESTIMATE_TX_GAS_REFINE_PROBES + 1
+            )
+            probes = sorted(
+                {
+                    lower_gas_limit + math.ceil(step * i)
+                    for i in range(1, self.ESTIMATE_TX_GAS_REFINE_PROBES + 1)
+                }
+                - {gas_limit}
+            )
+            if not probes:
+                break
+            for probe, result in zip(
+                probes, self._try_estimate_tx_gas_limits(tx_params, probes, base_gas)
+            ):
+                if result:
+                    gas_limit = probe
+                    break
+                lower_gas_limit = probe
+        return gas_limit
 
-        for i in range(
-            1, 30
-        ):  # Make sure tx can be executed, fixing for example 63/64th problem
-            try:
-                self.estimate_tx_gas_with_safe(
-                    to,
-                    value,
-                    data,
-                    operation,
-                    gas_limit=gas_estimated + (base_gas or 0) + 32000,
+    def _estimate_tx_gas_batch_request(
+        self,
+        queries: Sequence[Tuple[str, List[Any]]],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        :param queries: JSON RPC ``(method, params)``
+        :param batch_size:
+        :param max_concurrency:
+        :return: JSON RPC responses for the ``queries``
+        :raises: CannotEstimateGas if the batch request fails
+        """
+        try:
+            return self.ethereum_client.batch_call_manager.batch_request_responses(
+                build_jsonrpc_batch_payload(queries),
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+            )
+        except (OSError, ValueError) as exc:
+            raise CannotEstimateGas(f"Batch request failed: {exc}") from exc
+
+    def _try_estimate_tx_gas_limits(
+        self, tx_params: Dict[str, Any], gas_limits: Sequence[int], base_gas: int
+    ) -> List[bool]:
+        """
+        :param tx_params: ``_build_estimate_tx_gas_call`` params
+        :param gas_limits: Safe tx gas to try
+        :param base_gas: Gas costs for the data
+        :return: For every ``gas_limit``, ``True`` if the estimation can be completed with that gas limit
+        """
+        if not gas_limits:
+            return []
+        responses = self._estimate_tx_gas_batch_request(
+            [
+                (
+                    "eth_call",
+                    [
+                        {**tx_params, "gas": hex(gas_limit + base_gas + 32000)},
+                        "latest",
+                    ],
                 )
-                return gas_estimated
+                for gas_limit in gas_limits
+            ]
+        )
+        results = []
+        for gas_limit, response in zip(gas_limits, responses):
+            try:
+                self._decode_estimate_tx_gas_response(response, tx_params, gas_limit)
+                results.append(True)
             except CannotEstimateGas:
-                logger.warning(
-                    "Safe=%s - Found 63/64 problem gas-estimated=%d to=%s data=%s",
-                    self.address,
-                    gas_estimated,
-                    to,
-                    to_0x_hex_str(data),
-                )
-                block_gas_limit = (
-                    block_gas_limit
-                    or self.w3.eth.get_block("latest", full_transactions=False)[
-                        "gasLimit"
-                    ]
-                )
-                gas_estimated = math.floor((1 + i * 0.03) * gas_estimated)
-                if gas_estimated >= block_gas_limit:
-                    return block_gas_limit
-        return gas_estimated
+                results.append(False)
+        return results
 
     def estimate_tx_gas(
         self,
@@ -632,28 +803,175 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         :return: Estimated gas for Safe inner tx
         :raises: CannotEstimateGas
         """
-        # Costs to route through the proxy and nested calls
-        PROXY_GAS = 1000
-        # https://github.com/ethereum/solidity/blob/dfe3193c7382c80f1814247a162663a97c3f5e67/libsolidity/codegen/ExpressionCompiler.cpp#L1764
-        # This was `false` before solc 0.4.21 -> `m_context.evmVersion().canOverchargeGasForCall()`
-        # So gas needed by caller will be around 35k
-        OLD_CALL_GAS = 35000
-        # Web3 `estimate_gas` estimates less gas
-        WEB3_ESTIMATION_OFFSET = 23000
-        ADDITIONAL_GAS = PROXY_GAS + OLD_CALL_GAS
-
         try:
             return (
                 self.estimate_tx_gas_by_trying(to, value, data, operation)
-                + ADDITIONAL_GAS
+                + _ESTIMATE_TX_GAS_ADDITIONAL_GAS
             )
         except CannotEstimateGas:
             return (
                 self.estimate_tx_gas_with_web3(to, value, data)
-                + ADDITIONAL_GAS
-                + WEB3_ESTIMATION_OFFSET
+                + _ESTIMATE_TX_GAS_ADDITIONAL_GAS
+                + _WEB3_ESTIMATION_OFFSET
             )
 
+    @classmethod
+    def estimate_many(
+        cls,
+        txs: Sequence[
+            Tuple["Safe", ChecksumAddress, int, Union[bytes, str], SafeOperationLike]
+        ],
+        gas_token: ChecksumAddress = NULL_ADDRESS,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[SafeTxGasEstimation]:
+        """
+        Estimate `safeTxGas` and `baseGas` for multiple Safe transactions, as ``estimate_tx_gas``
+        and ``estimate_tx_base_gas`` do. Threshold and nonce are only retrieved once per Safe, and they
+        are requested in the same JSON RPC batch request as the estimations. Then estimations are checked
+        setting a gas limit on a second batch request, together with ``eth_estimateGas`` for the
+        transactions that cannot be estimated using the Safe. ``estimate_tx_gas`` (with its
+        ``estimate_tx_gas_by_trying`` and ``eth_estimateGas`` fallbacks) is only used for the
+        transactions that fail the check (63/64 problem).
+
+        :param txs: ``(safe, to, value, data, operation)`` for every transaction. All the Safes
+            must be using the same ``EthereumClient``
+        :param gas_token: Gas token used to calculate `baseGas`
+        :param batch_size: Number of JSON RPC requests per batch request. If not provided,
+            ``EthereumClient`` batch size will be used
+        :param max_concurrency: Max number of batch requests in flight at the same time. If not provided,
+            ``EthereumClient.batch_request_max_concurrency`` will be used
+        :return: ``SafeTxGasEstimation`` for every transaction (in the same order as the ``txs`` were
+            provided). If a transaction cannot be estimated, ``error`` is set and gas values are ``None``
+        :raises: CannotEstimateGas if a batch request fails
+        """
+        if not txs:
+            return []
+        first_safe = txs[0][0]
+        safes: Dict[ChecksumAddress, Safe] = {}
+        for safe, *_ in txs:
+            safes.setdefault(safe.address, safe)
+        nonce_data, nonce_types = _SAFE_INFO_CALLS["nonce"]
+        threshold_data, threshold_types = _SAFE_INFO_CALLS["getThreshold"]
+
+        txs_data = [HexBytes(data or b"") for _, _, _, data, _ in txs]
+        txs_params = [
+            safe._build_estimate_tx_gas_call(to, value, data, operation)
+            for (safe, to, value, _, operation), data in zip(txs, txs_data)
+        ]
+        responses = first_safe._estimate_tx_gas_batch_request(
+            [
+                (
+                    "eth_call",
+                    [
+                        {"from": address, "to": address, "data": to_0x_hex_str(data)},
+                        "latest",
+                    ],
+                )
+                for address in safes
+                for data in (threshold_data, nonce_data)
+            ]
+            + [("eth_call", [tx_params, "latest"]) for tx_params in txs_params],
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+        )
+        thresholds_and_nonces = {
+            address: (
+                cls._decode_eth_call_response(responses[i * 2], threshold_types),
+                cls._decode_eth_call_response(responses[i * 2 + 1], nonce_types),
+            )
+            for i, address in enumerate(safes)
+        }
+        gas_estimations: List[Optional[int]] = []
+        for (safe, *_), tx_params, response in zip(
+            txs, txs_params, responses[len(safes) * 2 :]
+        ):
+            try:
+                gas_estimations.append(
+                    safe._decode_estimate_tx_gas_response(response, tx_params)
+                )
+            except CannotEstimateGas:
+                gas_estimations.append(None)
+
+        # Check estimations with a gas limit, use `eth_estimateGas` if Safe cannot estimate
+        check_queries: List[Tuple[str, List[Any]]] = []
+        for (safe, to, value, _, _), data, tx_params, gas_estimated in zip(
+            txs, txs_data, txs_params, gas_estimations
+        ):
+            if gas_estimated is None:
+                tx: Dict[str, Any] = {"from": safe.address, "to": to}
+                if value:
+                    tx["value"] = hex(value)
+                if data:
+                    tx["data"] = to_0x_hex_str(data)
+                check_queries.append(("eth_estimateGas", [tx]))
+            else:
+                gas_limit = (
+                    gas_estimated
+                    + first_safe.ethereum_client.estimate_data_gas(data)
+                    + 32000
+                )
+                check_queries.append(
+                    ("eth_call", [{**tx_params, "gas": hex(gas_limit)}, "latest"])
+                )
+        check_responses = first_safe._estimate_tx_gas_batch_request(
+            check_queries, batch_size=batch_size, max_concurrency=max_concurrency
+        )
+
+        estimations: List[SafeTxGasEstimation] = []
+        for (
+            (safe, to, value, _, operation),
+            data,
+            tx_params,
+            gas_estimated,
+            check_response,
+        ) in zip(txs, txs_data, txs_params, gas_estimations, check_responses):
+            try:
+                threshold, nonce = thresholds_and_nonces[safe.address]
+                if threshold is None or nonce is None:
+                    raise CannotEstimateGas(
+                        f"Cannot retrieve threshold and nonce for Safe={safe.address}"
+                    )
+                if gas_estimated is None:
+                    if not check_response.get("result"):
+                        raise CannotEstimateGas(
+                            f"Cannot estimate gas with `eth_estimateGas`: {check_response.get('error')}"
+                        )
+                    safe_tx_gas = (
+                        int(check_response["result"], 16)
+                        + _ESTIMATE_TX_GAS_ADDITIONAL_GAS
+                        + _WEB3_ESTIMATION_OFFSET
+                    )
+                else:
+                    try:
+                        safe._decode_estimate_tx_gas_response(
+                            check_response, tx_params, gas_estimated
+                        )
+                        safe_tx_gas = gas_estimated + _ESTIMATE_TX_GAS_ADDITIONAL_GAS
+                    except CannotEstimateGas:
+                        # Same fallbacks as `estimate_tx_gas`, including `eth_estimateGas`
+                        safe_tx_gas = safe.estimate_tx_gas(to, value, data, operation)
+                base_gas = safe._calculate_tx_base_gas(
+                    to,
+                    value,
+                    data,
+                    operation,
+                    gas_token,
+                    safe_tx_gas,
+                    threshold,
+                    nonce,
+                )
+                estimations.append(SafeTxGasEstimation(safe_tx_gas, base_gas))
+            except CannotEstimateGas as exc:
+                logger.debug(
+                    "Safe=%s Cannot estimate gas for tx to=%s: %s",
+                    safe.address,
+                    to,
+                    exc,
+                )
+                estimations.append(SafeTxGasEstimation(None, None, exc))
+        return estimations
+
     def get_message_preimage(self, message: Union[str, bytes]) -> bytes:
         """
         Return preimage for a message that can be signed by owners.
@@ -709,7 +1027,8 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         self, block_identifier: Optional[BlockIdentifier] = "latest"
     ) -> SafeInfo:
         """
-        Get all Safe info in the same batch call.
+        Get all Safe info in the same batch call. Storage slots (master copy, fallback handler
+        and guards) and contract calls are requested in the same JSON RPC batch request.
 
         :param block_identifier:
         :return:
@@ -717,72 +1036,266 @@ class Safe(SafeCreator, ContractBase, metaclass=ABCMeta):
         """
 
         # FIXME for not initialized Safes `getModules` get into an infinite loop on the RPC
+        # From v1.1.1:
+        # - `getModulesPaginated` is available
+        # - `getModules` returns only 10 modules
+        modules_paginated = hasattr(self.contract.functions, "getModulesPaginated")
         try:
-            contract = self.contract
-            master_copy = self.retrieve_master_copy_address()
-            if master_copy == NULL_ADDRESS:
-                raise CannotRetrieveSafeInfoException(self.address)
-
-            fallback_handler = self.retrieve_fallback_handler()
-            guard = (
-                self.retrieve_transaction_guard()
-            )  # Transaction guard was implemented in v1.1.1
-            module_guard = (
-                self.retrieve_module_guard()
-            )  # Module guard was implemented in v1.5.0
-
-            # From v1.1.1:
-            # - `getModulesPaginated` is available
-            # - `getModules` returns only 10 modules
-            modules_fn = (
-                contract.functions.getModulesPaginated(SENTINEL_ADDRESS, 20)
-                if hasattr(contract.functions, "getModulesPaginated")
-                else contract.functions.getModules()
-            )
-
-            results = self.ethereum_client.batch_call(
-                [
-                    modules_fn,
-                    contract.functions.nonce(),
-                    contract.functions.getOwners(),
-                    contract.functions.getThreshold(),
-                    contract.functions.VERSION(),
-                ],
-                from_address=self.address,
-                block_identifier=block_identifier,
-                raise_exception=False,
+            responses = self.ethereum_client.batch_call_manager.batch_request_responses(
+                build_jsonrpc_batch_payload(
+                    self._build_retrieve_all_info_queries(
+                        self.address, block_identifier, modules_paginated
+                    )
+                )
             )
-            modules_response, nonce, owners, threshold, version = results
-            if (
-                modules_response
-                and len(modules_response) == 2
-                and isinstance(modules_response[0], (tuple, list))
-            ):
-                # Must be a Tuple[List[ChecksumAddress], ChecksumAddress]
-                # >= v1.1.1
-                modules, next_module = modules_response
-                if modules and next_module != SENTINEL_ADDRESS:
-                    # Still more elements in the list
-                    modules = self.retrieve_modules()
-            else:
-                # < v1.1.1
-                modules = modules_response
-
-            return SafeInfo(
+            return self._decode_retrieve_all_info_responses(
                 self.address,
-                fallback_handler,
-                guard,
-                master_copy,
-                modules if modules else [],
-                nonce,
-                owners,
-                threshold,
-                version,
-                module_guard,
+                self.ethereum_client,
+                responses,
+                block_identifier,
+                modules_paginated,
             )
         except (Web3Exception, ValueError) as e:
             raise CannotRetrieveSafeInfoException(self.address) from e
 
+    @classmethod
+    def retrieve_all_info_many(
+        cls,
+        addresses: Sequence[ChecksumAddress],
+        ethereum_client: EthereumClient,
+        block_identifier: Optional[BlockIdentifier] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Optional[SafeInfo]]:
+        """
+        Get all Safe info for multiple Safes, using as few JSON RPC batch requests as possible.
+        Version of the Safes is not required, Safes < v1.1.1 (no ``getModulesPaginated``) require
+        an extra batch request to get their modules.
+
+        :param addresses: Safe addresses
+        :param ethereum_client:
+        :param block_identifier: Block to take the snapshot at. If not provided, current block number
+            is used, so the snapshot is consistent across all the batch requests
+        :param batch_size: Number of JSON RPC requests per batch request. If not provided,
+            ``EthereumClient`` batch size will be used
+        :param max_concurrency: Max number of batch requests in flight at the same time. If not provided,
+            ``EthereumClient.batch_request_max_concurrency`` will be used
+        :return: ``SafeInfo`` for every address (in the same order as the `addresses` were provided),
+            ``None`` if info for a Safe cannot be retrieved
+        """
+        if not addresses:
+            return []
+        if block_identifier is None:
+            block_identifier = ethereum_client.current_block_number
+
+        payload = build_jsonrpc_batch_payload(
+            [
+                query
+                for address in addresses
+                for query in cls._build_retrieve_all_info_queries(
+                    address, block_identifier, True
+                )
+            ]
+        )
+        responses = ethereum_client.batch_call_manager.batch_request_responses(
+            payload, batch_size=batch_size, max_concurrency=max_concurrency
+        )
+        queries_per_safe = len(payload) // len(addresses)
+        responses_per_safe = [
+            responses[i : i + queries_per_safe]
+            for i in range(0, len(responses), queries_per_safe)
+        ]
+
+        # Safes < v1.1.1 don't support `getModulesPaginated`, use `getModules` for them if initialized
+        modules_index = len(_SAFE_INFO_MASTER_COPY_STORAGE_SLOTS) + 3
+        threshold_index = modules_index + 3
+        legacy_safe_positions = [
+            position
+            for position, safe_responses in enumerate(responses_per_safe)
+            if cls._decode_eth_call_response(
+                safe_responses[modules_index], ("address[]", "address")
+            )
+            is None
+            and cls._decode_eth_call_response(
+                safe_responses[threshold_index], ("uint256",)
+            )
+        ]
+        legacy_modules = dict(
+            zip(
+                legacy_safe_positions,
+                ethereum_client.batch_call_manager.batch_call_custom(
+                    [
+                        {
+                            "from": addresses[position],
+                            "to": addresses[position],
+                            "data": to_0x_hex_str(_GET_MODULES_DATA),
+                            "output_type": ["address[]"],
+                            "fn_name": "getModules",
+                        }
+                        for position in legacy_safe_positions
+                    ],
+                    raise_exception=False,
+                    block_identifier=block_identifier,
+                    batch_size=batch_size,
+                    max_concurrency=max_concurrency,
+                ),
+            )
+        )
+
+        safe_infos: List[Optional[SafeInfo]] = []
+        for position, (address, safe_responses) in enumerate(
+            zip(addresses, responses_per_safe)
+        ):
+            try:
+                safe_info = cls._decode_retrieve_all_info_responses(
+                    address,
+                    ethereum_client,
+                    safe_responses,
+                    block_identifier,
+                    True,
+                )
+                if position in legacy_modules:
+                    safe_info.modules = legacy_modules[position] or []
+                safe_infos.append(safe_info)
+            except (CannotRetrieveSafeInfoException, Web3Exception, ValueError):
+                logger.debug("Cannot retrieve info for Safe %s", address)
+                safe_infos.append(None)
+        return safe_infos
+
+    @classmethod
+    def _build_retrieve_all_info_queries(
+        cls,
+        address: ChecksumAddress,
+        block_identifier: Optional[BlockIdentifier],
+        modules_paginated: bool,
+    ) -> List[Tuple[str, List[Any]]]:
+        """
+        :param address:
+        :param block_identifier:
+        :param modules_paginated: Use ``getModulesPaginated`` (>= v1.1.1) instead of ``getModules``
+        :return: JSON RPC ``(method, params)`` for every storage slot and call required by ``retrieve_all_info``
+        """
+        block = (
+            hex(block_identifier)
+            if isinstance(block_identifier, int)
+            else block_identifier or "latest"
+        )
+        modules_data = (
+            _GET_MODULES_PAGINATED_DATA if modules_paginated else _GET_MODULES_DATA
+        )
+        storage_slots = _SAFE_INFO_MASTER_COPY_STORAGE_SLOTS + (
+            cls.FALLBACK_HANDLER_STORAGE_SLOT,
+            cls.TRANSACTION_GUARD_STORAGE_SLOT,
+            cls.MODULE_GUARD_STORAGE_SLOT,
+        )
+        return [
+            ("eth_getStorageAt", [address, hex(storage_slot), block])
+            for storage_slot in storage_slots
+        ] + [
+            (
+                "eth_call",
+                [{"from": address, "to": address, "data": to_0x_hex_str(data)}, block],
+            )
+            for data in [modules_data] + [data for data, _ in _SAFE_INFO_CALLS.values()]
+        ]
+
+    @staticmethod
+    def _decode_eth_call_response(
+        response: Dict[str, Any], output_types: Tuple[str, ...]
+    ) -> Any:
+        """
+        :return: Decoded ``eth_call`` result, ``None`` if the call failed or it cannot be decoded
+        """
+        if "error" in response:
+            return None
+        try:
+            return get_abi_decoder(output_types)(HexBytes(response["result"]))
+        except (DecodingError, OverflowError, UnicodeDecodeError):
+            return None
+
+    @classmethod
+    def _decode_retrieve_all_info_responses(
+        cls,
+        address: ChecksumAddress,
+        ethereum_client: EthereumClient,
+        responses: Sequence[Dict[str, Any]],
+        block_identifier: Optional[BlockIdentifier],
+        modules_paginated: bool,
+    ) -> SafeInfo:
+        """
+        :param address:
+        :param ethereum_client: Used if more requests are required (minimal proxies
+            or more modules than the first page)
+        :param responses: JSON RPC responses for the ``_build_retrieve_all_info_queries`` requests
+        :param block_identifier:
+        :param modules_paginated:
+        :return: SafeInfo
+        :raises: CannotRetrieveSafeInfoException
+        """
+        storage_addresses = []
+        for response in responses[: -len(_SAFE_INFO_CALLS) - 1]:
+            if "error" in response:
+                raise CannotRetrieveSafeInfoException(address)
+            storage_addresses.append(
+                fast_bytes_to_checksum_address(
+                    HexBytes(response["result"])[-20:].rjust(20, b"\0")
+                )
+            )
+        master_copy_addresses = storage_addresses[
+            : len(_SAFE_INFO_MASTER_COPY_STORAGE_SLOTS)
+        ]
+        fallback_handler, guard, module_guard = storage_addresses[
+            len(_SAFE_INFO_MASTER_COPY_STORAGE_SLOTS) :
+        ]
+        master_copy = next(
+            (
+                master_copy_address
+                for master_copy_address in master_copy_addresses
+                if master_copy_address != NULL_ADDRESS
+            ),
+            NULL_ADDRESS,
+        )
+        if master_copy == NULL_ADDRESS:
+            master_copy = MinimalProxy(
+                address, ethereum_client
+            ).get_implementation_address(block_identifier=block_identifier)
+            if master_copy == NULL_ADDRESS:
+                raise CannotRetrieveSafeInfoException(address)
+
+        modules_response, *call_responses = responses[-len(_SAFE_INFO_CALLS) - 1 :]
+        calls_results = {
+            fn_name: cls._decode_eth_call_response(response, output_types)
+            for response, (fn_name, (_, output_types)) in zip(
+                call_responses, _SAFE_INFO_CALLS.items()
+            )
+        }
+        version = calls_results["VERSION"]
+        if modules_paginated:
+            modules_response = cls._decode_eth_call_response(
+                modules_response, ("address[]", "address")
+            )
+            modules, next_module = modules_response or ([], None)
+            if modules and next_module != SENTINEL_ADDRESS:
+                # Still more elements in the list
+                modules = cls(
+                    address, ethereum_client, version=version
+                ).retrieve_modules(block_identifier=block_identifier)
+        else:
+            modules = cls._decode_eth_call_response(modules_response, ("address[]",))
+
+        return SafeInfo(
+            address,
+            fallback_handler,
+            guard,
+            master_copy,
+            modules if modules else [],
+            calls_results["nonce"],
+            calls_results["getOwners"],
+            calls_results["getThreshold"],
+            version,
+            module_guard,
+        )
+
     def retrieve_domain_separator(
         self, block_identifier: Optional[BlockIdentifier] = "latest"
     ) -> Optional[bytes]:
@@ -1255,6 +1768,54 @@ class SafeCompatibilityAdapter(Safe, ABC):
             ).call(params)
         except (Web3ValueError, Web3RPCError, ContractLogicError) as e:
             raise CannotEstimateGas(f"Reverted call using SimulateTxAccessor {e}")
+        return self._decode_simulate_tx_accessor_data(accessible_data)
+
+    def _build_estimate_tx_gas_call(
+        self,
+        to: ChecksumAddress,
+        value: int,
+        data: bytes,
+        operation: SafeOperationLike,
+    ) -> Dict[str, Any]:
+        accessor = self._get_simulate_tx_accessor()
+        simulator = self._get_simulator()
+        simulation_data = accessor.functions.simulate(
+            to, value, data, operation
+        )._encode_transaction_data()
+        return {
+            "to": self.address,
+            "data": simulator.functions.simulate(
+                accessor.address, simulation_data
+            )._encode_transaction_data(),
+        }
+
+    def _decode_estimate_tx_gas_response(
+        self,
+        response_data: Dict[str, Any],
+        tx_params: Dict[str, Any],
+        gas_limit: Optional[int] = None,
+    ) -> int:
+        if "error" in response_data or "result" not in response_data:
+            raise CannotEstimateGas(
+                f"Reverted call using SimulateTxAccessor {response_data.get('error')}"
+            )
+        try:
+            (accessible_data,) = eth_abi.decode(
+                ["bytes"], HexBytes(response_data["result"])
+            )
+        except DecodingError as e:
+            raise CannotEstimateGas(
+                f"Cannot decode SimulateTxAccessor simulation {e}"
+            ) from e
+        return self._decode_simulate_tx_accessor_data(accessible_data)
+
+    @staticmethod
+    def _decode_simulate_tx_accessor_data(accessible_data: bytes) -> int:
+        """
+        :param accessible_data: Data returned by `simulate` on the `CompatibilityFallHandler`
+        :return: Estimated gas
+        :raises: CannotEstimateGas
+        """
         try:
             # Simulate returns (uint256 estimate, bool success, bytes memory returnData)
             estimate, success, return_data = eth_abi.decode(
@@ -1,15446 +1,122 @@
-safe_deployments = {
-    "1.0.0": {
-        "GnosisSafe": {
-            "1": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-            "4": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-            "5": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-            "42": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-            "100": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-            "369": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-        },
-        "ProxyFactory": {
-            "1": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-            "4": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-            "5": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-            "42": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-            "100": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-            "369": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-        },
-    },
-    "1.1.1": {
-        "CreateAndAddModules": {
-            "1": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "4": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "5": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "42": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "88": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "100": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "246": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "369": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-            "73799": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-        },
-        "CreateCall": {
-            "1": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "4": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "5": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "42": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "88": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "100": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "246": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "369": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-            "73799": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-        },
-        "DefaultCallbackHandler": {
-            "1": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "4": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "5": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "42": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "88": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "100": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "246": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "369": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-            "73799": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-        },
-        "GnosisSafe": {
-            "1": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "4": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "5": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "42": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "88": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "100": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "246": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "369": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-            "73799": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-        },
-        "MultiSend": {
-            "1": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "4": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "5": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "42": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "88": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "100": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "246": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "369": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-            "73799": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-        },
-        "ProxyFactory": {
-            "1": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "4": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "5": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "42": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "88": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "100": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "246": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "369": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-            "73799": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-        },
-    },
-    "1.2.0": {
-        "GnosisSafe": {
-            "1": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "4": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "5": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "42": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "88": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "100": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "246": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "369": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
-            "73799": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"],
+"""
+Safe contracts deployed addresses, from https://github.com/safe-global/safe-deployments/
+
+Deployments are stored in ``safe_deployments.json`` (generated by
+``scripts/generators/generate_safe_deployments.py``) with every address already checksummed.
+For every version and contract name it contains the default ``addresses`` and, for every chain id,
+the indexes of the addresses deployed on that chain. The file is only loaded the first time
+a deployment is requested.
+
+``safe_deployments`` (Version -> Contract name -> Chain id -> Addresses) and
+``default_safe_deployments`` (Version -> Contract name -> Addresses) dictionaries are
+still available, but they are built on first access.
+"""
+
+import json
+import os
+from functools import cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from eth_typing import ChecksumAddress
+
+SAFE_DEPLOYMENTS_FILE = os.path.join(os.path.dirname(__file__), "safe_deployments.json")
+
+
+@cache
+def _load_safe_deployments() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    with open(SAFE_DEPLOYMENTS_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@cache
+def _get_chain_deployment_addresses(
+    contract_name: str, version: str, chain_id: int
+) -> Tuple[ChecksumAddress, ...]:
+    deployment = _load_safe_deployments().get(version, {}).get(contract_name)
+    if not deployment:
+        return ()
+    addresses = deployment["addresses"]
+    return tuple(
+        addresses[index] for index in deployment["chains"].get(str(chain_id), ())
+    )
+
+
+def get_safe_deployment_versions() -> List[str]:
+    """
+    :return: Versions with deployments, from oldest to newest
+    """
+    return list(_load_safe_deployments())
+
+
+def get_safe_deployment_contract_names(version: str) -> List[str]:
+    """
+    :param version: Safe contracts version, e.g. ``1.3.0``
+    :return: Names of the contracts deployed for ``version``
+    """
+    return list(_load_safe_deployments().get(version, {}))
+
+
+def get_safe_deployment_chain_ids(contract_name: str, version: str) -> List[int]:
+    """
+    :param contract_name:
+    :param version: Safe contracts version, e.g. ``1.3.0``
+    :return: Chain ids where the contract is deployed
+    """
+    deployment = _load_safe_deployments().get(version, {}).get(contract_name)
+    return [int(chain_id) for chain_id in deployment["chains"]] if deployment else []
+
+
+def get_safe_deployment_addresses(
+    contract_name: str, version: str, chain_id: Optional[int] = None
+) -> Tuple[ChecksumAddress, ...]:
+    """
+    Get the addresses for a contract deployment, e.g. ``("GnosisSafeL2", "1.3.0")``
+
+    :param contract_name:
+    :param version: Safe contracts version, e.g. ``1.3.0``
+    :param chain_id: If provided, only the addresses deployed on that chain are returned.
+        Otherwise, default addresses (canonical, eip155 and zksync) are returned
+    :return: Checksummed addresses. Empty if there's no deployment for the provided parameters
+    """
+    if chain_id is not None:
+        return _get_chain_deployment_addresses(contract_name, version, chain_id)
+    deployment = _load_safe_deployments().get(version, {}).get(contract_name)
+    return tuple(deployment["addresses"]) if deployment else ()
+
+
+@cache
+def _build_safe_deployments() -> Dict[str, Dict[str, Dict[str, List[str]]]]:
+    return {
+        version: {
+            contract_name: {
+                chain_id: [deployment["addresses"][index] for index in indexes]
+                for chain_id, indexes in deployment["chains"].items()
+            }
+            for contract_name, deployment in contracts.items()
         }
-    },
-    "1.3.0": {
-        "CompatibilityFallbackHandler": {
-            "1": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "3": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "5": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "10": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "11": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "14": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "16": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "18": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "19": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "25": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "28": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "30": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "31": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "39": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "40": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "41": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "42": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "43": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "44": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "46": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "50": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "51": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "56": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "57": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "61": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "63": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "69": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "71": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "81": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "82": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "83": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "96": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "97": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "100": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "106": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "108": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "109": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "111": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "114": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "122": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "123": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "130": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "133": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "137": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "143": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "146": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "148": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "155": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "169": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "177": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "179": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "185": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "195": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "196": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "204": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "232": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "239": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "240": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "246": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "250": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "252": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "255": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "274": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "280": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "282": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "288": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "291": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "295": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "296": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "300": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "314": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "321": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "322": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "324": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "336": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "338": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "360": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "369": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "388": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "418": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "420": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "424": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "466": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "478": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "480": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "545": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "570": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "588": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "592": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "595": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "599": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "648": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "677": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "686": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "690": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "698": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "747": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "787": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "870": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "919": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "943": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "988": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "999": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1001": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1008": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1030": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1088": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1101": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1111": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1112": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1114": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1115": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1116": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1135": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1230": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1231": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1284": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1285": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1287": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1294": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1315": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1328": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1329": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1337": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1424": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1439": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1442": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1480": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1513": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1514": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1516": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1559": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1625": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1663": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1672": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1729": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1740": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1750": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1776": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1807": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1868": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1874": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "1890": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1891": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1923": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1924": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1946": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1984": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1998": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2001": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2002": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2008": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2019": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2020": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2021": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2039": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2187": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2192": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2201": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2221": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2222": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2331": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2345": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2358": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "2390": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "2391": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "2741": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2787": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "2810": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "2818": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "2910": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "3338": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "3636": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "3637": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "3737": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "3776": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "3946": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4002": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4078": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4153": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4157": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "4158": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "4202": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4217": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "4326": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "4337": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4441": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "4460": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4509": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4653": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "4661": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4663": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "4689": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "4918": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4919": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "5000": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5001": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "5003": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5042": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5115": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5124": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "5165": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "5330": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5464": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5700": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5887": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5888": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "6001": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "6102": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "6398": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "6497": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "6880": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "6900": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "6911": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "7000": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "7001": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "7070": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "7332": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "7341": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "7560": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "7700": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "7897": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "8008": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "8150": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "8192": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "8194": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "8217": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "8329": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "8333": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "8453": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "8700": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "8822": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "9000": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "9001": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "9069": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "9070": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "9369": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "9728": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "9745": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "9746": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "10000": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "10001": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "10081": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "10143": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "10200": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "10242": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "10243": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "10849": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11011": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "11111": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11124": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "11235": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11417": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11437": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11820": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11891": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12324": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12325": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12357": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12553": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "13337": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "13371": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "13473": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "13505": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "13746": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "14800": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "16661": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "17000": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "17069": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "17172": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "18231": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "18233": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "22776": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "23294": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "23295": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "24101": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "25327": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "25363": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "28802": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "28882": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "28979": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "30303": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "31611": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "31612": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "32323": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "32769": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "32770": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "33101": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "33139": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "33401": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "34443": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "35441": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "35443": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "36900": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "37111": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "41455": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "41923": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "42161": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "42170": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "42220": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "42431": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "42793": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "43111": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "43113": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "43114": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "43288": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "44787": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "45000": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "46630": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "47763": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "47805": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "48898": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "48899": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "48900": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "50104": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "52924": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "53456": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "53457": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "54211": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "56288": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "57000": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "57054": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "57073": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "58008": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "59140": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "59141": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "59144": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "60808": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "61166": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "71401": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "71402": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "73799": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "80001": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "80002": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "80069": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "80084": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "80085": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "80094": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "81224": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "81457": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "83291": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "84531": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "84532": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "88882": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "88888": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "97435": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "98875": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "102030": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "103454": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "111188": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "127001": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "127823": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "128123": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "167000": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "167008": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "167009": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "167013": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "175188": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "200101": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "200202": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "200810": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "200901": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "222888": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "278701": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "314159": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "328527": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "333999": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "421611": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "421613": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "421614": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "490000": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "534351": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "534352": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "534353": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "543210": [
-                "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "555666": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "560048": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "622277": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "656476": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "657468": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "660279": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "668668": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "688688": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "688689": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "695569": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "713715": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "747474": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "763373": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "764984": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "808813": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "810180": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "853211": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "978657": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1000101": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "4457845": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "5042002": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "5064014": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "6038361": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "6281971": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "6985385": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "7080969": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "7225878": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "7777777": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "11142220": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "11155111": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "11155420": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "11155931": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "12227332": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "13374202": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "21000000": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "94204209": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "111557560": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "123420111": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "161221135": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "168587773": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "222000222": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "245022926": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "245022934": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "328527624": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "333000333": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "476462898": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "531050104": ["0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"],
-            "531050204": [
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            ],
-            "666666666": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "888888888": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "999999999": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1313161554": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "1313161555": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1511670449": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "1666600000": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "1666700000": ["0x017062a1dE2FE6b99BE3d9d37841FeD19F573804"],
-            "3735928814": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11297108099": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "11297108109": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "37714555429": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-            "88153591557": [
-                "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-                "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            ],
-            "920637907288165": ["0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4"],
-        },
-        "CreateCall": {
-            "1": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "3": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "5": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "10": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "11": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "14": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "16": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "18": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "19": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "25": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "28": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "30": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "31": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "39": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "40": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "41": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "42": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "43": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "44": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "46": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "50": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "51": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "56": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "57": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "61": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "63": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "69": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "71": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "81": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "82": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "83": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "96": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "97": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "100": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "106": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "108": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "109": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "111": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "114": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "122": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "123": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "130": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "133": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "137": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "143": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "146": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "148": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "155": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "169": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "177": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "179": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "185": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "195": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "196": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "204": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "232": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "239": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "240": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "246": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "250": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "252": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "255": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "274": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "280": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "282": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "288": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "291": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "295": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "296": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "300": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "314": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "321": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "322": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "324": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "336": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "338": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "360": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "369": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "388": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "418": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "420": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "424": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "466": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "478": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "480": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "545": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "570": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "588": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "592": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "595": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "599": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "648": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "677": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "686": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "690": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "698": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "747": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "787": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "870": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "919": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "943": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "988": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "999": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1001": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1008": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1030": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1088": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1101": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1111": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1112": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1114": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1115": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1116": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1135": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1230": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1231": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1284": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1285": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1287": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1294": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1315": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1328": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1329": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1337": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1424": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1439": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1442": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1480": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1513": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1514": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1516": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1559": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1625": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1663": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1672": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1729": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1740": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1750": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1776": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1807": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1868": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1874": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "1890": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1891": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1923": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1924": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1946": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1984": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1998": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2001": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2002": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2008": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2019": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2020": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2021": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2039": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2187": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2192": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2201": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2221": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2222": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2331": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2345": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2358": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "2390": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "2391": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "2741": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2787": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "2810": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "2818": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "2910": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "3338": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "3636": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "3637": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "3737": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "3776": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "3946": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4002": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4078": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4153": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4157": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "4158": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "4202": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4217": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "4326": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "4337": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4441": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "4460": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4509": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4653": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "4661": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4663": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "4689": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "4918": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4919": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "5000": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5001": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "5003": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5042": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5115": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5124": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "5165": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "5330": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5464": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5700": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5887": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5888": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "6001": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "6102": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "6398": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "6497": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "6880": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "6900": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "6911": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "7000": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "7001": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "7070": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "7332": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "7341": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "7560": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "7700": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "7897": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "8008": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "8150": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "8192": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "8194": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "8217": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "8329": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "8333": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "8453": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "8700": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "8822": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "9000": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "9001": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "9069": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "9070": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "9369": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "9728": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "9745": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "9746": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "10000": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "10001": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "10081": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "10143": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "10200": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "10242": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "10243": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "10849": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11011": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "11111": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11124": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "11235": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11417": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11437": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11820": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11891": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12324": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12325": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12357": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12553": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "13337": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "13371": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "13473": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "13505": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "13746": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "14800": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "16661": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "17000": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "17069": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "17172": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "18231": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "18233": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "22776": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "23294": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "23295": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "24101": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "25327": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "25363": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "28802": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "28882": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "28979": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "30303": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "31611": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "31612": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "32323": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "32769": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "32770": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "33101": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "33139": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "33401": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "34443": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "35441": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "35443": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "36900": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "37111": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "41455": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "41923": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "42161": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "42170": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "42220": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "42431": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "42793": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "43111": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "43113": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "43114": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "43288": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "44787": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "45000": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "46630": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "47763": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "47805": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "48898": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "48899": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "48900": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "50104": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "52924": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "53456": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "53457": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "54211": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "56288": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "57000": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "57054": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "57073": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "58008": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "59140": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "59141": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "59144": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "60808": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "61166": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "71401": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "71402": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "73799": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "80001": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "80002": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "80069": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "80084": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "80085": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "80094": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "81224": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "81457": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "83291": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "84531": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "84532": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "88882": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "88888": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "97435": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "98875": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "102030": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "103454": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "111188": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "127001": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "127823": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "128123": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "167000": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "167008": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "167009": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "167013": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "175188": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "200101": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "200202": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "200810": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "200901": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "222888": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "278701": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "314159": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "328527": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "333999": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "421611": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "421613": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "421614": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "490000": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "534351": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "534352": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "534353": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "543210": [
-                "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "555666": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "560048": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "622277": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "656476": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "657468": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "660279": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "668668": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "688688": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "688689": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "695569": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "713715": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "747474": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "763373": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "764984": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "808813": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "810180": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "853211": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "978657": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1000101": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "4457845": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "5042002": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "5064014": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "6038361": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "6281971": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "6985385": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "7080969": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "7225878": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "7777777": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "11142220": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "11155111": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "11155420": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "11155931": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "12227332": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "13374202": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "21000000": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "94204209": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "111557560": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "123420111": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "161221135": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "168587773": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "222000222": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "245022926": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "245022934": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "328527624": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "333000333": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "476462898": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "531050104": ["0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56"],
-            "531050204": [
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            ],
-            "666666666": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "888888888": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "999999999": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1313161554": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "1313161555": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1511670449": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "1666600000": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "1666700000": ["0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d"],
-            "3735928814": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11297108099": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "11297108109": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "37714555429": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-            "88153591557": [
-                "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-                "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            ],
-            "920637907288165": ["0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4"],
-        },
-        "GnosisSafe": {
-            "1": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "3": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "5": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "10": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "11": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "14": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "16": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "18": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "19": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "25": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "28": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "30": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "31": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "39": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "40": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "41": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "42": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "43": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "44": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "46": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "50": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "51": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "56": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "57": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "61": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "63": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "69": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "71": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "81": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "82": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "83": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "96": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "97": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "100": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "106": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "108": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "109": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "111": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "114": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "122": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "123": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "130": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "133": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "137": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "143": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "146": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "148": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "155": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "169": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "177": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "179": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "185": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "195": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "196": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "204": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "232": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "239": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "240": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "246": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "250": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "252": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "255": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "274": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "280": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "282": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "288": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "291": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "295": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "296": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "300": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "314": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "321": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "322": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "324": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "336": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "338": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "360": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "369": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "388": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "418": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "420": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "424": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "466": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "478": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "480": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "545": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "570": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "588": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "592": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "595": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "599": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "648": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "677": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "686": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "690": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "698": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "747": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "787": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "870": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "919": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "943": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "988": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "999": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1001": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1008": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1030": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1088": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1101": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1111": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1112": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1114": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1115": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1116": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1135": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1230": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1231": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1284": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1285": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1287": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1294": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1315": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1328": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1329": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1337": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1424": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1439": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1442": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1480": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1513": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1514": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1516": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1559": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1625": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1663": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1672": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1729": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1740": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1750": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1776": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1807": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1868": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1874": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "1890": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1891": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1923": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1924": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1946": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1984": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1998": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2001": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2002": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2008": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2019": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2020": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2021": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2039": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2187": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2192": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2201": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2221": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2222": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2331": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2345": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2358": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "2390": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "2391": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "2741": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2787": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "2810": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "2818": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "2910": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "3338": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "3636": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "3637": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "3737": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "3776": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "3946": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4002": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4078": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4153": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4157": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "4158": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "4202": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4217": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "4326": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "4337": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4441": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "4460": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4509": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4653": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "4661": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4663": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "4689": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "4918": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4919": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "5000": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5001": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "5003": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5042": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5115": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5124": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "5165": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "5330": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5464": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5700": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5887": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5888": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "6001": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "6102": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "6398": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "6497": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "6880": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "6900": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "6911": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "7000": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "7001": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "7070": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "7332": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "7341": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "7560": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "7700": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "7897": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "8008": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "8150": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "8192": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "8194": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "8217": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "8329": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "8333": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "8453": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "8700": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "8822": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "9000": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "9001": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "9069": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "9070": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "9369": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "9728": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "9745": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "9746": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "10000": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "10001": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "10081": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "10143": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "10200": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "10242": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "10243": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "10849": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11011": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "11111": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11124": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "11235": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11417": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11437": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11820": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11891": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12324": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12325": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12357": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12553": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "13337": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "13371": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "13473": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "13505": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "13746": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "14800": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "16661": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "17000": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "17069": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "17172": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "18231": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "18233": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "22776": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "23294": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "23295": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "24101": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "25327": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "25363": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "28802": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "28882": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "28979": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "30303": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "31611": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "31612": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "32323": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "32769": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "32770": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "33101": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "33139": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "33401": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "34443": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "35441": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "35443": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "36900": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "37111": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "41455": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "41923": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "42161": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "42170": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "42220": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "42431": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "42793": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "43111": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "43113": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "43114": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "43288": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "44787": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "45000": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "46630": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "47763": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "47805": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "48898": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "48899": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "48900": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "50104": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "52924": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "53456": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "53457": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "54211": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "56288": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "57000": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "57054": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "57073": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "58008": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "59140": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "59141": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "59144": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "60808": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "61166": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "71401": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "71402": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "73799": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "80001": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "80002": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "80069": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "80084": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "80085": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "80094": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "81224": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "81457": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "83291": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "84531": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "84532": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "88882": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "88888": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "97435": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "98875": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "102030": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "103454": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "111188": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "127001": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "127823": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "128123": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "167000": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "167008": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "167009": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "167013": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "175188": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "200101": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "200202": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "200810": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "200901": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "222888": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "278701": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "314159": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "328527": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "333999": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "421611": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "421613": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "421614": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "490000": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "534351": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "534352": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "534353": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "543210": [
-                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "555666": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "560048": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "622277": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "656476": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "657468": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "660279": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "668668": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "688688": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "688689": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "695569": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "713715": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "747474": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "763373": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "764984": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "808813": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "810180": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "853211": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "978657": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1000101": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "4457845": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "5042002": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "5064014": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "6038361": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "6281971": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "6985385": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "7080969": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "7225878": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "7777777": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "11142220": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "11155111": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "11155420": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "11155931": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "12227332": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "13374202": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "21000000": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "94204209": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "111557560": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "123420111": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "161221135": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "168587773": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "222000222": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "245022926": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "245022934": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "328527624": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "333000333": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "476462898": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "531050104": ["0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910"],
-            "531050204": [
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            ],
-            "666666666": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "888888888": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "999999999": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1313161554": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "1313161555": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1511670449": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "1666600000": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "1666700000": ["0x69f4D1788e39c87893C980c06EdF4b7f686e2938"],
-            "3735928814": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11297108099": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "11297108109": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "37714555429": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-            "88153591557": [
-                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-                "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            ],
-            "920637907288165": ["0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"],
-        },
-        "GnosisSafeL2": {
-            "1": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "3": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "5": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "10": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "11": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "14": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "16": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "18": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "19": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "25": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "28": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "30": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "31": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "39": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "40": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "41": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "42": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "43": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "44": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "46": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "50": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "51": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "56": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "57": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "61": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "63": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "69": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "71": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "81": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "82": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "83": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "96": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "97": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "100": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "106": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "108": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "109": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "111": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "114": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "122": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "123": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "130": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "133": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "137": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "143": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "146": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "148": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "155": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "169": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "177": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "179": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "185": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "195": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "196": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "204": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "232": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "239": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "240": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "246": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "250": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "252": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "255": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "274": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "280": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "282": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "288": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "291": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "295": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "296": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "300": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "314": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "321": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "322": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "324": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "336": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "338": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "360": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "369": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "388": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "418": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "420": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "424": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "466": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "478": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "480": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "545": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "570": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "588": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "592": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "595": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "599": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "648": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "677": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "686": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "690": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "698": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "747": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "787": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "870": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "919": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "943": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "988": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "999": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1001": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1008": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1030": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1088": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1101": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1111": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1112": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1114": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1115": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1116": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1135": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1230": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1231": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1284": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1285": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1287": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1294": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1315": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1328": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1329": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1337": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1424": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1439": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1442": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1480": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1513": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1514": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1516": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1559": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1625": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1663": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1672": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1729": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1740": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1750": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1776": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1807": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1868": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1874": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "1890": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1891": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1923": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1924": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1946": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1984": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1998": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2001": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2002": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2008": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2019": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2020": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2021": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2039": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2187": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2192": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2201": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2221": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2222": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2331": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2345": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2358": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "2390": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "2391": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "2741": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2787": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "2810": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "2818": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "2910": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "3338": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "3636": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "3637": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "3737": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "3776": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "3946": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4002": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4078": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4153": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4157": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "4158": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "4202": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4217": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "4326": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "4337": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4441": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "4460": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4509": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4653": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "4661": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4663": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "4689": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "4918": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4919": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "5000": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5001": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "5003": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5042": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5115": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5124": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "5165": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "5330": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5464": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5700": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5887": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5888": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "6001": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "6102": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "6398": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "6497": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "6880": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "6900": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "6911": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "7000": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "7001": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "7070": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "7332": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "7341": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "7560": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "7700": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "7897": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "8008": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "8150": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "8192": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "8194": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "8217": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "8329": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "8333": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "8453": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "8700": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "8822": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "9000": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "9001": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "9069": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "9070": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "9369": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "9728": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "9745": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "9746": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "10000": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "10001": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "10081": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "10143": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "10200": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "10242": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "10243": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "10849": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11011": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "11111": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11124": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "11235": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11417": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11437": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11820": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11891": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12324": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12325": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12357": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12553": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "13337": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "13371": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "13473": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "13505": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "13746": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "14800": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "16661": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "17000": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "17069": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "17172": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "18231": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "18233": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "22776": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "23294": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "23295": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "24101": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "25327": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "25363": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "28802": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "28882": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "28979": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "30303": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "31611": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "31612": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "32323": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "32769": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "32770": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "33101": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "33139": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "33401": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "34443": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "35441": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "35443": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "36900": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "37111": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "41455": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "41923": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "42161": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "42170": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "42220": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "42431": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "42793": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "43111": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "43113": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "43114": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "43288": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "44787": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "45000": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "46630": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "47763": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "47805": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "48898": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "48899": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "48900": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "50104": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "52924": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "53456": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "53457": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "54211": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "56288": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "57000": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "57054": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "57073": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "58008": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "59140": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "59141": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "59144": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "60808": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "61166": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "71401": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "71402": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "73799": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "80001": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "80002": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "80069": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "80084": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "80085": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "80094": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "81224": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "81457": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "83291": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "84531": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "84532": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "88882": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "88888": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "97435": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "98875": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "102030": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "103454": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "111188": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "127001": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "127823": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "128123": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "167000": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "167008": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "167009": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "167013": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "175188": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "200101": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "200202": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "200810": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "200901": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "222888": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "278701": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "314159": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "328527": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "333999": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "421611": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "421613": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "421614": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "490000": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "534351": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "534352": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "534353": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "543210": [
-                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "555666": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "560048": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "622277": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "656476": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "657468": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "660279": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "668668": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "688688": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "688689": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "695569": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "713715": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "747474": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "763373": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "764984": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "808813": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "810180": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "853211": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "978657": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1000101": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "4457845": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "5042002": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "5064014": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "6038361": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "6281971": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "6985385": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "7080969": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "7225878": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "7777777": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "11142220": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "11155111": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "11155420": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "11155931": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "12227332": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "13374202": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "21000000": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "94204209": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "111557560": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "123420111": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "161221135": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "168587773": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "222000222": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "245022926": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "245022934": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "328527624": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "333000333": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "476462898": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "531050104": ["0x1727c2c531cf966f902E5927b98490fDFb3b2b70"],
-            "531050204": [
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            ],
-            "666666666": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "888888888": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "999999999": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1313161554": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "1313161555": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1511670449": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "1666600000": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "1666700000": ["0xfb1bffC9d739B8D520DaF37dF666da4C687191EA"],
-            "3735928814": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11297108099": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "11297108109": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "37714555429": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-            "88153591557": [
-                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            ],
-            "920637907288165": ["0x3E5c63644E683549055b9Be8653de26E0B4CD36E"],
-        },
-        "MultiSend": {
-            "1": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "3": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "5": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "10": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "11": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "14": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "16": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "18": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "19": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "25": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "28": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "30": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "31": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "39": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "40": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "41": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "42": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "43": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "44": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "46": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "50": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "51": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "56": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "57": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "61": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "63": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "69": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "71": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "81": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "82": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "83": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "96": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "97": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "100": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "106": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "108": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "109": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "111": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "114": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "122": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "123": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "130": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "133": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "137": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "143": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "146": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "148": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "155": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "169": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "177": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "179": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "185": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "195": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "196": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "204": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "232": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "239": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "240": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "246": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "250": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "252": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "255": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "274": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "280": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "282": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "288": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "291": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "295": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "296": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "300": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "314": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "321": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "322": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "324": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "336": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "338": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "360": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "369": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "388": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "418": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "420": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "424": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "466": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "478": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "480": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "545": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "570": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "588": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "592": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "595": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "599": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "648": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "677": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "686": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "690": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "698": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "747": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "787": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "870": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "919": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "943": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "988": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "999": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1001": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1008": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1030": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1088": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1101": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1111": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1112": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1114": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1115": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1116": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1135": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1230": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1231": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1284": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1285": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1287": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1294": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1315": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1328": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1329": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1337": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1424": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1439": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1442": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1480": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1513": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1514": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1516": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1559": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1625": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1663": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1672": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1729": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1740": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1750": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1776": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1807": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1868": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1874": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "1890": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1891": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1923": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1924": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1946": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1984": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1998": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2001": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2002": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2008": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2019": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2020": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2021": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2039": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2187": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2192": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2201": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2221": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2222": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2331": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2345": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2358": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "2390": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "2391": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "2741": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2787": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "2810": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "2818": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "2910": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "3338": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "3636": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "3637": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "3737": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "3776": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "3946": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4002": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4078": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4153": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4157": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "4158": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "4202": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4217": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "4326": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "4337": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4441": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "4460": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4509": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4653": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "4661": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4663": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "4689": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "4918": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4919": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "5000": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5001": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "5003": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5042": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5115": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5124": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "5165": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "5330": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5464": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5700": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5887": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5888": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "6001": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "6102": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "6398": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "6497": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "6880": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "6900": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "6911": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "7000": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "7001": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "7070": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "7332": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "7341": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "7560": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "7700": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "7897": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "8008": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "8150": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "8192": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "8194": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "8217": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "8329": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "8333": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "8453": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "8700": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "8822": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "9000": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "9001": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "9069": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "9070": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "9369": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "9728": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "9745": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "9746": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "10000": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "10001": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "10081": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "10143": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "10200": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "10242": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "10243": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "10849": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11011": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "11111": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11124": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "11235": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11417": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11437": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11820": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11891": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12324": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12325": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12357": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12553": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "13337": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "13371": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "13473": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "13505": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "13746": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "14800": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "16661": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "17000": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "17069": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "17172": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "18231": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "18233": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "22776": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "23294": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "23295": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "24101": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "25327": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "25363": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "28802": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "28882": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "28979": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "30303": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "31611": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "31612": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "32323": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "32769": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "32770": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "33101": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "33139": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "33401": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "34443": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "35441": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "35443": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "36900": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "37111": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "41455": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "41923": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "42161": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "42170": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "42220": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "42431": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "42793": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "43111": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "43113": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "43114": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "43288": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "44787": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "45000": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "46630": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "47763": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "47805": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "48898": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "48899": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "48900": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "50104": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "52924": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "53456": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "53457": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "54211": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "56288": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "57000": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "57054": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "57073": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "58008": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "59140": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "59141": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "59144": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "60808": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "61166": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "71401": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "71402": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "73799": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "80001": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "80002": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "80069": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "80084": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "80085": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "80094": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "81224": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "81457": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "83291": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "84531": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "84532": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "88882": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "88888": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "97435": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "98875": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "102030": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "103454": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "111188": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "127001": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "127823": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "128123": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "167000": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "167008": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "167009": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "167013": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "175188": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "200101": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "200202": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "200810": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "200901": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "222888": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "278701": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "314159": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "328527": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "333999": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "421611": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "421613": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "421614": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "490000": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "534351": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "534352": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "534353": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "543210": [
-                "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "555666": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "560048": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "622277": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "656476": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "657468": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "660279": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "668668": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "688688": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "688689": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "695569": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "713715": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "747474": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "763373": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "764984": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "808813": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "810180": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "853211": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "978657": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1000101": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "4457845": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "5042002": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "5064014": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "6038361": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "6281971": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "6985385": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "7080969": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "7225878": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "7777777": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "11142220": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "11155111": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "11155420": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "11155931": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "12227332": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "13374202": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "21000000": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "94204209": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "111557560": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "123420111": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "161221135": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "168587773": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "222000222": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "245022926": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "245022934": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "328527624": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "333000333": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "476462898": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "531050104": ["0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912"],
-            "531050204": [
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            ],
-            "666666666": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "888888888": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "999999999": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1313161554": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "1313161555": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1511670449": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "1666600000": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "1666700000": ["0x998739BFdAAdde7C933B942a68053933098f9EDa"],
-            "3735928814": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11297108099": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "11297108109": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "37714555429": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-            "88153591557": [
-                "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-                "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            ],
-            "920637907288165": ["0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761"],
-        },
-        "MultiSendCallOnly": {
-            "1": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "3": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "5": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "10": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "11": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "14": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "16": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "18": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "19": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "25": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "28": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "30": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "31": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "39": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "40": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "41": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "42": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "43": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "44": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "46": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "50": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "51": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "56": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "57": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "61": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "63": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "69": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "71": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "81": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "82": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "83": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "96": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "97": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "100": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "106": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "108": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "109": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "111": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "114": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "122": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "123": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "130": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "133": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "137": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "143": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "146": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "148": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "155": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "169": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "177": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "179": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "185": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "195": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "196": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "204": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "232": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "239": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "240": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "246": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "250": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "252": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "255": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "274": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "280": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "282": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "288": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "291": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "295": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "296": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "300": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "314": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "321": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "322": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "324": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "336": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "338": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "360": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "369": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "388": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "418": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "420": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "424": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "466": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "478": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "480": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "545": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "570": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "588": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "592": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "595": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "599": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "648": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "677": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "686": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "690": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "698": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "747": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "787": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "870": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "919": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "943": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "988": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "999": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1001": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1008": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1030": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1088": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1101": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1111": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1112": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1114": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1115": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1116": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1135": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1230": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1231": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1284": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1285": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1287": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1294": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1315": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1328": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1329": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1337": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1424": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1439": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1442": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1480": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1513": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1514": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1516": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1559": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1625": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1663": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1672": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1729": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1740": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1750": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1776": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1807": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1868": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1874": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "1890": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1891": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1923": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1924": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1946": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1984": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1998": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2001": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2002": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2008": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2019": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2020": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2021": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2039": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2187": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2192": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2201": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2221": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2222": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2331": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2345": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2358": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "2390": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "2391": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "2741": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2787": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "2810": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "2818": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "2910": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "3338": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "3636": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "3637": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "3737": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "3776": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "3946": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4002": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4078": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4153": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4157": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "4158": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "4202": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4217": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "4326": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "4337": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4441": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "4460": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4509": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4653": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "4661": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4663": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "4689": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "4918": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4919": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "5000": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5001": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "5003": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5042": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5115": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5124": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "5165": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "5330": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5464": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5700": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5887": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5888": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "6001": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "6102": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "6398": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "6497": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "6880": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "6900": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "6911": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "7000": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "7001": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "7070": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "7332": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "7341": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "7560": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "7700": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "7897": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "8008": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "8150": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "8192": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "8194": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "8217": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "8329": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "8333": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "8453": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "8700": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "8822": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "9000": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "9001": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "9069": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "9070": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "9369": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "9728": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "9745": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "9746": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "10000": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "10001": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "10081": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "10143": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "10200": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "10242": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "10243": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "10849": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11011": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "11111": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11124": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "11235": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11417": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11437": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11820": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11891": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12324": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12325": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12357": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12553": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "13337": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "13371": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "13473": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "13505": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "13746": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "14800": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "16661": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "17000": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "17069": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "17172": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "18231": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "18233": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "22776": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "23294": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "23295": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "24101": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "25327": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "25363": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "28802": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "28882": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "28979": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "30303": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "31611": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "31612": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "32323": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "32769": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "32770": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "33101": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "33139": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "33401": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "34443": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "35441": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "35443": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "36900": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "37111": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "41455": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "41923": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "42161": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "42170": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "42220": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "42431": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "42793": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "43111": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "43113": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "43114": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "43288": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "44787": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "45000": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "46630": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "47763": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "47805": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "48898": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "48899": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "48900": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "50104": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "52924": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "53456": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "53457": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "54211": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "56288": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "57000": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "57054": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "57073": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "58008": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "59140": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "59141": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "59144": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "60808": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "61166": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "71401": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "71402": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "73799": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "80001": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "80002": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "80069": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "80084": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "80085": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "80094": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "81224": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "81457": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "83291": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "84531": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "84532": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "88882": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "88888": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "97435": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "98875": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "102030": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "103454": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "111188": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "127001": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "127823": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "128123": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "167000": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "167008": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "167009": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "167013": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "175188": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "200101": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "200202": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "200810": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "200901": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "222888": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "278701": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "314159": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "328527": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "333999": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "421611": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "421613": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "421614": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "490000": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "534351": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "534352": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "534353": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "543210": [
-                "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "555666": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "560048": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "622277": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "656476": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "657468": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "660279": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "668668": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "688688": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "688689": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "695569": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "713715": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "747474": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "763373": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "764984": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "808813": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "810180": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "853211": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "978657": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1000101": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "4457845": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "5042002": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "5064014": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "6038361": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "6281971": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "6985385": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "7080969": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "7225878": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "7777777": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "11142220": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "11155111": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "11155420": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "11155931": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "12227332": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "13374202": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "21000000": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "94204209": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "111557560": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "123420111": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "161221135": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "168587773": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "222000222": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "245022926": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "245022934": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "328527624": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "333000333": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "476462898": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "531050104": ["0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F"],
-            "531050204": [
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            ],
-            "666666666": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "888888888": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "999999999": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1313161554": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "1313161555": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1511670449": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "1666600000": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "1666700000": ["0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B"],
-            "3735928814": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11297108099": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "11297108109": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "37714555429": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-            "88153591557": [
-                "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-                "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            ],
-            "920637907288165": ["0x40A2aCCbd92BCA938b02010E17A5b8929b49130D"],
-        },
-        "GnosisSafeProxyFactory": {
-            "1": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "3": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "5": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "10": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "11": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "14": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "16": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "18": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "19": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "25": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "28": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "30": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "31": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "39": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "40": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "41": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "42": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "43": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "44": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "46": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "50": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "51": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "56": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "57": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "61": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "63": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "69": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "71": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "81": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "82": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "83": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "96": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "97": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "100": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "106": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "108": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "109": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "111": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "114": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "122": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "123": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "130": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "133": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "137": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "143": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "146": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "148": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "155": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "169": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "177": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "179": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "185": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "195": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "196": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "204": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "232": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "239": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "240": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "246": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "250": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "252": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "255": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "274": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "280": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "282": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "288": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "291": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "295": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "296": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "300": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "314": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "321": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "322": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "324": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "336": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "338": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "360": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "369": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "388": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "418": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "420": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "424": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "466": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "478": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "480": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "545": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "570": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "588": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "592": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "595": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "599": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "648": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "677": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "686": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "690": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "698": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "747": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "787": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "870": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "919": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "943": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "988": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "999": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1001": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1008": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1030": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1088": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1101": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1111": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1112": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1114": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1115": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1116": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1135": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1230": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1231": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1284": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1285": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1287": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1294": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1315": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1328": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1329": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1337": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1424": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1439": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1442": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1480": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1513": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1514": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1516": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1559": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1625": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1663": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1672": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1729": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1740": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1750": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1776": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1807": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1868": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1874": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "1890": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1891": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1923": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1924": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1946": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1984": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1998": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2001": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2002": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2008": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2019": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2020": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2021": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2039": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2187": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2192": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2201": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2221": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2222": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2331": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2345": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2358": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "2390": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "2391": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "2741": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2787": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "2810": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "2818": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "2910": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "3338": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "3636": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "3637": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "3737": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "3776": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "3946": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4002": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4078": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4153": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4157": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "4158": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "4202": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4217": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "4326": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "4337": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4441": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "4460": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4509": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4653": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "4661": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4663": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "4689": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "4918": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4919": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "5000": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5001": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "5003": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5042": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5115": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5124": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "5165": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "5330": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5464": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5700": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5887": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5888": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "6001": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "6102": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "6398": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "6497": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "6880": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "6900": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "6911": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "7000": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "7001": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "7070": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "7332": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "7341": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "7560": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "7700": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "7897": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "8008": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "8150": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "8192": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "8194": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "8217": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "8329": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "8333": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "8453": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "8700": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "8822": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "9000": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "9001": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "9069": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "9070": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "9369": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "9728": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "9745": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "9746": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "10000": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "10001": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "10081": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "10143": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "10200": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "10242": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "10243": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "10849": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11011": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "11111": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11124": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "11235": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11417": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11437": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11820": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11891": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12324": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12325": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12357": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12553": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "13337": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "13371": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "13473": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "13505": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "13746": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "14800": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "16661": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "17000": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "17069": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "17172": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "18231": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "18233": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "22776": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "23294": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "23295": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "24101": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "25327": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "25363": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "28802": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "28882": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "28979": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "30303": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "31611": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "31612": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "32323": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "32769": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "32770": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "33101": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "33139": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "33401": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "34443": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "35441": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "35443": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "36900": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "37111": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "41455": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "41923": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "42161": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "42170": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "42220": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "42431": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "42793": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "43111": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "43113": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "43114": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "43288": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "44787": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "45000": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "46630": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "47763": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "47805": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "48898": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "48899": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "48900": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "50104": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "52924": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "53456": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "53457": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "54211": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "56288": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "57000": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "57054": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "57073": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "58008": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "59140": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "59141": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "59144": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "60808": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "61166": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "71401": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "71402": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "73799": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "80001": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "80002": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "80069": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "80084": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "80085": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "80094": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "81224": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "81457": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "83291": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "84531": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "84532": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "88882": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "88888": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "97435": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "98875": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "102030": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "103454": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "111188": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "127001": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "127823": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "128123": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "167000": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "167008": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "167009": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "167013": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "175188": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "200101": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "200202": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "200810": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "200901": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "222888": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "278701": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "314159": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "328527": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "333999": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "421611": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "421613": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "421614": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "490000": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "534351": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "534352": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "534353": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "543210": [
-                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "555666": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "560048": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "622277": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "656476": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "657468": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "660279": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "668668": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "688688": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "688689": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "695569": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "713715": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "747474": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "763373": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "764984": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "808813": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "810180": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "853211": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "978657": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1000101": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "4457845": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "5042002": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "5064014": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "6038361": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "6281971": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "6985385": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "7080969": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "7225878": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "7777777": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "11142220": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "11155111": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "11155420": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "11155931": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "12227332": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "13374202": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "21000000": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "94204209": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "111557560": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "123420111": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "161221135": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "168587773": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "222000222": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "245022926": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "245022934": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "328527624": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "333000333": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "476462898": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "531050104": ["0xDAec33641865E4651fB43181C6DB6f7232Ee91c2"],
-            "531050204": [
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            ],
-            "666666666": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "888888888": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "999999999": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1313161554": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "1313161555": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1511670449": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "1666600000": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "1666700000": ["0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"],
-            "3735928814": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11297108099": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "11297108109": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "37714555429": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-            "88153591557": [
-                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            ],
-            "920637907288165": ["0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"],
-        },
-        "SignMessageLib": {
-            "1": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "3": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "5": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "10": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "11": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "14": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "16": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "18": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "19": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "25": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "28": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "30": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "31": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "39": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "40": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "41": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "42": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "43": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "44": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "46": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "50": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "51": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "56": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "57": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "61": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "63": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "69": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "71": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "81": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "82": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "83": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "96": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "97": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "100": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "106": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "108": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "109": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "111": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "114": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "122": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "123": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "130": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "133": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "137": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "143": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "146": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "148": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "155": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "169": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "177": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "179": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "185": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "195": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "196": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "204": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "232": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "239": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "240": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "246": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "250": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "252": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "255": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "274": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "280": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "282": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "288": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "291": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "295": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "296": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "300": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "314": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "321": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "322": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "324": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "336": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "338": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "360": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "369": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "388": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "418": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "420": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "424": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "466": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "478": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "480": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "545": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "570": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "588": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "592": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "595": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "599": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "648": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "677": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "686": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "690": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "698": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "747": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "787": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "870": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "919": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "943": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "988": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "999": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1001": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1008": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1030": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1088": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1101": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1111": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1112": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1114": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1115": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1116": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1135": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1230": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1231": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1284": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1285": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1287": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1294": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1315": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1328": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1329": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1337": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1424": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1439": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1442": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1480": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1513": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1514": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1516": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1559": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1625": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1663": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1672": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1729": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1740": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1750": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1776": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1807": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1868": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1874": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "1890": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1891": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1923": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1924": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1946": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1984": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1998": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2001": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2002": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2008": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2019": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2020": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2021": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2039": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2187": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2192": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2201": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2221": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2222": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2331": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2345": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2358": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "2390": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "2391": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "2741": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2787": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "2810": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "2818": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "2910": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "3338": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "3636": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "3637": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "3737": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "3776": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "3946": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4002": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4078": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4153": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4157": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "4158": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "4202": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4217": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "4326": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "4337": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4441": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "4460": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4509": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4653": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "4661": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4663": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "4689": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "4918": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4919": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "5000": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5001": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "5003": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5042": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5115": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5124": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "5165": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "5330": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5464": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5700": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5887": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5888": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "6001": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "6102": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "6398": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "6497": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "6880": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "6900": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "6911": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "7000": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "7001": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "7070": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "7332": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "7341": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "7560": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "7700": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "7897": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "8008": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "8150": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "8192": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "8194": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "8217": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "8329": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "8333": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "8453": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "8700": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "8822": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "9000": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "9001": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "9069": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "9070": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "9369": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "9728": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "9745": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "9746": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "10000": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "10001": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "10081": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "10143": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "10200": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "10242": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "10243": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "10849": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11011": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "11111": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11124": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "11235": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11417": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11437": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11820": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11891": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12324": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12325": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12357": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12553": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "13337": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "13371": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "13473": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "13505": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "13746": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "14800": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "16661": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "17000": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "17069": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "17172": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "18231": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "18233": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "22776": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "23294": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "23295": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "24101": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "25327": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "25363": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "28802": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "28882": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "28979": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "30303": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "31611": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "31612": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "32323": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "32769": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "32770": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "33101": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "33139": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "33401": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "34443": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "35441": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "35443": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "36900": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "37111": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "41455": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "41923": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "42161": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "42170": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "42220": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "42431": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "42793": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "43111": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "43113": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "43114": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "43288": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "44787": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "45000": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "46630": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "47763": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "47805": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "48898": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "48899": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "48900": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "50104": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "52924": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "53456": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "53457": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "54211": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "56288": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "57000": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "57054": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "57073": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "58008": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "59140": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "59141": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "59144": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "60808": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "61166": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "71401": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "71402": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "73799": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "80001": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "80002": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "80069": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "80084": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "80085": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "80094": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "81224": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "81457": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "83291": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "84531": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "84532": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "88882": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "88888": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "97435": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "98875": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "102030": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "103454": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "111188": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "127001": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "127823": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "128123": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "167000": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "167008": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "167009": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "167013": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "175188": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "200101": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "200202": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "200810": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "200901": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "222888": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "278701": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "314159": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "328527": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "333999": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "421611": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "421613": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "421614": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "490000": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "534351": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "534352": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "534353": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "543210": [
-                "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "555666": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "560048": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "622277": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "656476": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "657468": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "660279": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "668668": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "688688": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "688689": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "695569": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "713715": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "747474": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "763373": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "764984": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "808813": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "810180": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "853211": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "978657": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1000101": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "4457845": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "5042002": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "5064014": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "6038361": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "6281971": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "6985385": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "7080969": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "7225878": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "7777777": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "11142220": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "11155111": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "11155420": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "11155931": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "12227332": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "13374202": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "21000000": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "94204209": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "111557560": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "123420111": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "161221135": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "168587773": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "222000222": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "245022926": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "245022934": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "328527624": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "333000333": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "476462898": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "531050104": ["0x357147caf9C0cCa67DfA0CF5369318d8193c8407"],
-            "531050204": [
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            ],
-            "666666666": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "888888888": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "999999999": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1313161554": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "1313161555": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1511670449": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "1666600000": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "1666700000": ["0x98FFBBF51bb33A056B08ddf711f289936AafF717"],
-            "3735928814": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11297108099": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "11297108109": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "37714555429": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-            "88153591557": [
-                "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-                "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            ],
-            "920637907288165": ["0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2"],
-        },
-        "SimulateTxAccessor": {
-            "1": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "3": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "5": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "10": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "11": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "14": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "16": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "18": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "19": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "25": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "28": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "30": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "31": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "39": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "40": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "41": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "42": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "43": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "44": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "46": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "50": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "51": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "56": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "57": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "61": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "63": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "69": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "71": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "81": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "82": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "83": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "96": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "97": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "100": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "106": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "108": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "109": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "111": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "114": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "122": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "123": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "130": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "133": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "137": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "143": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "146": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "148": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "155": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "169": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "177": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "179": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "185": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "195": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "196": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "204": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "232": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "239": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "240": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "246": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "250": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "252": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "255": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "274": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "280": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "282": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "288": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "291": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "295": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "296": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "300": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "314": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "321": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "322": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "324": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "336": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "338": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "360": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "369": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "388": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "418": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "420": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "424": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "466": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "478": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "480": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "545": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "570": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "588": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "592": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "595": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "599": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "648": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "677": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "686": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "690": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "698": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "747": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "787": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "870": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "919": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "943": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "988": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "999": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1001": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1008": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1030": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1088": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1101": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1111": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1112": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1114": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1115": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1116": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1135": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1230": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1231": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1284": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1285": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1287": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1294": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1315": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1328": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1329": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1337": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1424": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1439": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1442": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1480": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1513": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1514": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1516": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1559": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1625": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1663": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1672": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1729": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1740": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1750": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1776": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1807": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1868": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1874": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "1890": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1891": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1923": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1924": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1946": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1984": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1998": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2001": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2002": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2008": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2019": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2020": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2021": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2039": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2187": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2192": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2201": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2221": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2222": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2331": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2345": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2358": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "2390": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "2391": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "2741": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2787": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "2810": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "2818": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "2910": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "3338": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "3636": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "3637": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "3737": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "3776": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "3946": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4002": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4078": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4153": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4157": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "4158": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "4202": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4217": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "4326": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "4337": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4441": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "4460": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4509": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4653": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "4661": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4663": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "4689": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "4918": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4919": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "5000": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5001": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "5003": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5042": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5115": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5124": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "5165": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "5330": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5464": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5700": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5887": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5888": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "6001": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "6102": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "6398": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "6497": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "6880": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "6900": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "6911": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "7000": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "7001": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "7070": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "7332": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "7341": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "7560": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "7700": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "7897": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "8008": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "8150": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "8192": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "8194": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "8217": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "8329": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "8333": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "8453": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "8700": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "8822": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "9000": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "9001": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "9069": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "9070": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "9369": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "9728": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "9745": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "9746": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "10000": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "10001": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "10081": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "10143": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "10200": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "10242": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "10243": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "10849": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11011": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "11111": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11124": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "11235": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11417": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11437": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11820": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11891": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12324": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12325": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12357": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12553": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "13337": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "13371": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "13473": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "13505": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "13746": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "14800": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "16661": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "17000": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "17069": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "17172": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "18231": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "18233": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "22776": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "23294": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "23295": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "24101": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "25327": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "25363": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "28802": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "28882": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "28979": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "30303": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "31611": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "31612": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "32323": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "32769": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "32770": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "33101": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "33139": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "33401": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "34443": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "35441": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "35443": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "36900": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "37111": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "41455": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "41923": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "42161": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "42170": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "42220": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "42431": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "42793": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "43111": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "43113": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "43114": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "43288": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "44787": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "45000": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "46630": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "47763": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "47805": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "48898": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "48899": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "48900": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "50104": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "52924": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "53456": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "53457": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "54211": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "56288": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "57000": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "57054": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "57073": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "58008": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "59140": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "59141": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "59144": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "60808": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "61166": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "71401": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "71402": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "73799": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "80001": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "80002": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "80069": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "80084": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "80085": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "80094": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "81224": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "81457": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "83291": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "84531": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "84532": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "88882": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "88888": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "97435": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "98875": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "102030": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "103454": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "111188": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "127001": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "127823": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "128123": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "167000": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "167008": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "167009": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "167013": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "175188": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "200101": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "200202": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "200810": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "200901": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "222888": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "278701": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "314159": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "328527": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "333999": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "421611": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "421613": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "421614": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "490000": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "534351": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "534352": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "534353": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "543210": [
-                "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "555666": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "560048": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "622277": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "656476": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "657468": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "660279": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "668668": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "688688": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "688689": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "695569": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "713715": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "747474": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "763373": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "764984": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "808813": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "810180": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "853211": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "978657": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1000101": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "4457845": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "5042002": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "5064014": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "6038361": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "6281971": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "6985385": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "7080969": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "7225878": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "7777777": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "11142220": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "11155111": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "11155420": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "11155931": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "12227332": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "13374202": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "21000000": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "94204209": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "111557560": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "123420111": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "161221135": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "168587773": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "222000222": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "245022926": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "245022934": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "328527624": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "333000333": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "476462898": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "531050104": ["0x4191E2e12E8BC5002424CE0c51f9947b02675a44"],
-            "531050204": [
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            ],
-            "666666666": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "888888888": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "999999999": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1313161554": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "1313161555": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1511670449": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "1666600000": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "1666700000": ["0x727a77a074D1E6c4530e814F89E618a3298FC044"],
-            "3735928814": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11297108099": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "11297108109": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "37714555429": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-            "88153591557": [
-                "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-                "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            ],
-            "920637907288165": ["0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da"],
-        },
-    },
-    "1.4.1": {
-        "CompatibilityFallbackHandler": {
-            "1": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "14": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "16": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "19": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "25": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "30": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "31": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "39": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "40": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "41": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "44": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "46": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "50": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "51": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "56": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "61": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "63": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "71": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "81": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "97": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "100": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "106": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "114": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "122": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "130": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "133": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "137": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "143": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "146": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "150": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "151": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "153": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "155": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "169": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "173": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "177": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "181": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "185": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "196": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "204": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "228": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "232": [
-                "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-                "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            ],
-            "239": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "240": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "250": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "252": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "255": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "288": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "300": [
-                "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-                "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            ],
-            "314": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "324": [
-                "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-                "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            ],
-            "336": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "338": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "360": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "369": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "466": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "478": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "480": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "530": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "545": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "592": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "677": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "690": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "747": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "756": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "757": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "841": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "842": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "870": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "919": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "938": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "964": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "970": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "988": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "995": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "999": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1030": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1101": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1112": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1114": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1125": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1135": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1284": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1285": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1287": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1301": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1315": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1328": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1329": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1337": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1424": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1439": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1442": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1480": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1514": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1516": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1625": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1663": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1672": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1729": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1740": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1750": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1776": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1811": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1868": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1874": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1923": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1924": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1946": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1995": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2039": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2187": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2192": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2201": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2221": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2222": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2345": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2358": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2390": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2391": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2424": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2442": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2522": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2741": [
-                "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-                "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            ],
-            "2787": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2810": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2818": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2910": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3068": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3338": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3501": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3636": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3637": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3776": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3946": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4002": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4061": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4062": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4153": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4157": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4158": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4162": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4202": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4217": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4326": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4337": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4441": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4488": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4653": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4661": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4663": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "4801": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5003": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5031": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5042": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5115": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5124": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5330": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5464": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5611": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5851": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5887": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6321": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6322": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6342": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6398": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6497": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6688": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6900": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6911": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6942": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7171": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7200": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7208": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7336": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7337": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7560": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7771": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7897": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7979": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8008": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8150": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8192": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8194": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8217": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8408": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8453": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8700": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8765": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8801": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "8844": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9369": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9700": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9728": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9745": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9746": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10081": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10143": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10242": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10243": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "10888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11011": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11124": [
-                "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-                "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            ],
-            "11235": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11501": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11503": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13337": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13371": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13441": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13473": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13505": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13746": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "14601": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "14800": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "16661": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "17000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "17069": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "18233": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "18880": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "20994": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "23294": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "23295": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "24101": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "25363": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "26888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "28802": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "28882": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "31611": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "32380": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "32769": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "32770": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "33101": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "33111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "33139": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "34443": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "35441": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "35443": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "36888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "36900": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "41455": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "41923": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "42161": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "42220": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "42421": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "42431": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "42793": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "43111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "43113": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "43114": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "43419": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "44787": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "46630": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "47763": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "48898": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "48899": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "48900": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "49088": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "49321": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "50104": ["0x9301E98DD367135f21bdF66f342A249c9D5F9069"],
-            "50312": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "53302": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "54211": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "55244": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "56288": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "57000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "57054": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "57073": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "59140": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "59141": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "59144": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "59902": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "60808": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "66665": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "72080": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "80001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "80002": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "80069": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "80085": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "80094": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "81224": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "81457": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "84531": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "84532": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88811": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88817": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88882": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "90001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "91342": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "97476": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "97477": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98864": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98865": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98866": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98867": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "98985": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "102030": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "105105": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "111188": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "127001": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "127823": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "128123": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "167000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "167009": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "167013": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "175188": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "181228": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "190415": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "200810": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "200901": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "205205": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "210425": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "222888": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "278701": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "314159": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "325000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "369369": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "381931": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "421614": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "444444": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "490000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "511111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "534351": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "534352": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "543210": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "555666": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "560048": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "656476": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "657468": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "688688": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "688689": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "695569": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "713715": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "743111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "747474": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "763373": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "763375": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "808813": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "839999": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "984122": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1440000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1449000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1501869": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2206132": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2632500": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3441006": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5042002": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "5064014": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6038361": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6281971": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "6985385": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7080969": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7225878": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "7777777": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "9999999": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11142220": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11155111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11155420": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "11155931": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "12227332": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13374202": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "13863860": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "20250407": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "21000000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "52164803": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "65100004": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "94204209": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "111557560": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "123420111": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "168587773": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "245022934": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "253368190": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "476462898": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "531050104": ["0x9301E98DD367135f21bdF66f342A249c9D5F9069"],
-            "531050204": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "666666666": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "994873017": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "999999999": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1313161554": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1313161555": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1417429182": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1511670449": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1570754601": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1660990954": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1666600000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1666700000": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "1952959480": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "2030232745": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "3735928814": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "30143370385": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "88153591557": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-            "123420000220": ["0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99"],
-        },
-        "CreateCall": {
-            "1": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "14": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "16": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "19": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "25": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "30": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "31": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "39": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "40": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "41": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "44": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "46": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "50": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "51": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "56": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "61": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "63": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "71": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "81": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "97": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "100": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "106": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "114": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "122": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "130": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "133": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "137": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "143": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "146": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "150": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "151": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "153": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "155": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "169": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "173": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "177": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "181": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "185": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "196": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "204": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "228": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "232": [
-                "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-                "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            ],
-            "239": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "240": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "250": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "252": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "255": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "288": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "300": [
-                "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-                "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            ],
-            "314": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "324": [
-                "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-                "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            ],
-            "336": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "338": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "360": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "369": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "466": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "478": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "480": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "530": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "545": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "592": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "677": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "690": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "747": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "756": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "757": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "841": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "842": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "870": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "919": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "938": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "964": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "970": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "988": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "995": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "999": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1030": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1101": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1112": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1114": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1125": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1135": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1284": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1285": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1287": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1301": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1315": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1328": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1329": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1337": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1424": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1439": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1442": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1480": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1514": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1516": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1625": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1663": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1672": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1729": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1740": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1750": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1776": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1811": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1868": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1874": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1923": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1924": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1946": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1995": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2039": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2187": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2192": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2201": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2221": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2222": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2345": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2358": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2390": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2391": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2424": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2442": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2522": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2741": [
-                "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-                "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            ],
-            "2787": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2810": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2818": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2910": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3068": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3338": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3501": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3636": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3637": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3776": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3946": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4002": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4061": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4062": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4153": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4157": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4158": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4162": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4202": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4217": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4326": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4337": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4441": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4488": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4653": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4661": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4663": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "4801": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5003": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5031": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5042": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5115": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5124": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5330": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5464": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5611": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5851": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5887": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6321": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6322": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6342": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6398": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6497": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6688": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6900": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6911": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6942": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7171": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7200": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7208": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7336": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7337": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7560": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7771": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7897": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7979": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8008": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8150": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8192": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8194": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8217": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8408": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8453": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8700": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8765": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8801": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "8844": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9369": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9700": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9728": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9745": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9746": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10081": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10143": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10242": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10243": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "10888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11011": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11124": [
-                "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-                "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            ],
-            "11235": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11501": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11503": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13337": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13371": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13441": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13473": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13505": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13746": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "14601": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "14800": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "16661": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "17000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "17069": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "18233": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "18880": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "20994": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "23294": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "23295": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "24101": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "25363": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "26888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "28802": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "28882": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "31611": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "32380": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "32769": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "32770": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "33101": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "33111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "33139": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "34443": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "35441": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "35443": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "36888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "36900": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "41455": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "41923": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "42161": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "42220": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "42421": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "42431": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "42793": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "43111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "43113": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "43114": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "43419": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "44787": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "46630": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "47763": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "48898": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "48899": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "48900": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "49088": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "49321": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "50104": ["0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f"],
-            "50312": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "53302": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "54211": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "55244": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "56288": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "57000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "57054": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "57073": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "59140": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "59141": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "59144": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "59902": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "60808": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "66665": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "72080": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "80001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "80002": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "80069": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "80085": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "80094": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "81224": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "81457": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "84531": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "84532": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88811": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88817": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88882": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "90001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "91342": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "97476": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "97477": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98864": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98865": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98866": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98867": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "98985": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "102030": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "105105": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "111188": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "127001": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "127823": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "128123": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "167000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "167009": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "167013": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "175188": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "181228": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "190415": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "200810": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "200901": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "205205": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "210425": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "222888": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "278701": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "314159": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "325000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "369369": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "381931": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "421614": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "444444": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "490000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "511111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "534351": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "534352": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "543210": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "555666": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "560048": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "656476": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "657468": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "688688": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "688689": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "695569": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "713715": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "743111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "747474": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "763373": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "763375": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "808813": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "839999": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "984122": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1440000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1449000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1501869": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2206132": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2632500": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3441006": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5042002": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "5064014": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6038361": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6281971": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "6985385": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7080969": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7225878": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "7777777": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "9999999": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11142220": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11155111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11155420": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "11155931": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "12227332": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13374202": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "13863860": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "20250407": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "21000000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "52164803": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "65100004": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "94204209": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "111557560": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "123420111": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "168587773": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "245022934": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "253368190": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "476462898": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "531050104": ["0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f"],
-            "531050204": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "666666666": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "994873017": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "999999999": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1313161554": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1313161555": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1417429182": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1511670449": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1570754601": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1660990954": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1666600000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1666700000": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "1952959480": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "2030232745": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "3735928814": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "30143370385": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "88153591557": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-            "123420000220": ["0x9b35Af71d77eaf8d7e40252370304687390A1A52"],
-        },
-        "MultiSend": {
-            "1": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "14": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "16": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "19": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "25": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "30": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "31": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "39": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "40": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "41": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "44": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "46": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "50": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "51": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "56": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "61": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "63": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "71": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "81": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "97": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "100": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "106": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "114": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "122": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "130": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "133": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "137": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "143": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "146": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "150": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "151": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "153": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "155": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "169": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "173": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "177": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "181": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "185": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "196": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "204": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "228": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "232": [
-                "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-                "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            ],
-            "239": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "240": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "250": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "252": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "255": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "288": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "300": [
-                "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-                "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            ],
-            "314": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "324": [
-                "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-                "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            ],
-            "336": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "338": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "360": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "369": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "466": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "478": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "480": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "530": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "545": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "592": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "677": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "690": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "747": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "756": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "757": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "841": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "842": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "870": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "919": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "938": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "964": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "970": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "988": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "995": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "999": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1030": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1101": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1112": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1114": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1125": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1135": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1284": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1285": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1287": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1301": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1315": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1328": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1329": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1337": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1424": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1439": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1442": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1480": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1514": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1516": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1625": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1663": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1672": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1729": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1740": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1750": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1776": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1811": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1868": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1874": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1923": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1924": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1946": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1995": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2039": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2187": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2192": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2201": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2221": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2222": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2345": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2358": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2390": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2391": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2424": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2442": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2522": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2741": [
-                "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-                "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            ],
-            "2787": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2810": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2818": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2910": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3068": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3338": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3501": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3636": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3637": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3776": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3946": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4002": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4061": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4062": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4153": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4157": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4158": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4162": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4202": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4217": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4326": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4337": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4441": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4488": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4653": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4661": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4663": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "4801": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5003": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5031": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5042": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5115": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5124": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5330": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5464": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5611": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5851": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5887": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6321": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6322": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6342": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6398": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6497": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6688": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6900": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6911": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6942": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7171": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7200": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7208": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7336": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7337": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7560": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7771": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7897": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7979": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8008": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8150": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8192": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8194": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8217": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8408": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8453": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8700": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8765": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8801": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "8844": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9369": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9700": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9728": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9745": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9746": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10081": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10143": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10242": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10243": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "10888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11011": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11124": [
-                "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-                "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            ],
-            "11235": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11501": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11503": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13337": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13371": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13441": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13473": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13505": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13746": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "14601": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "14800": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "16661": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "17000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "17069": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "18233": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "18880": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "20994": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "23294": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "23295": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "24101": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "25363": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "26888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "28802": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "28882": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "31611": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "32380": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "32769": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "32770": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "33101": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "33111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "33139": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "34443": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "35441": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "35443": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "36888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "36900": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "41455": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "41923": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "42161": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "42220": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "42421": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "42431": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "42793": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "43111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "43113": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "43114": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "43419": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "44787": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "46630": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "47763": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "48898": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "48899": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "48900": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "49088": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "49321": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "50104": ["0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885"],
-            "50312": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "53302": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "54211": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "55244": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "56288": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "57000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "57054": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "57073": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "59140": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "59141": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "59144": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "59902": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "60808": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "66665": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "72080": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "80001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "80002": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "80069": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "80085": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "80094": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "81224": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "81457": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "84531": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "84532": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88811": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88817": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88882": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "90001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "91342": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "97476": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "97477": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98864": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98865": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98866": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98867": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "98985": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "102030": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "105105": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "111188": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "127001": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "127823": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "128123": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "167000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "167009": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "167013": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "175188": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "181228": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "190415": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "200810": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "200901": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "205205": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "210425": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "222888": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "278701": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "314159": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "325000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "369369": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "381931": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "421614": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "444444": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "490000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "511111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "534351": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "534352": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "543210": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "555666": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "560048": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "656476": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "657468": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "688688": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "688689": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "695569": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "713715": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "743111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "747474": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "763373": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "763375": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "808813": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "839999": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "984122": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1440000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1449000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1501869": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2206132": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2632500": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3441006": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5042002": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "5064014": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6038361": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6281971": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "6985385": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7080969": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7225878": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "7777777": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "9999999": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11142220": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11155111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11155420": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "11155931": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "12227332": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13374202": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "13863860": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "20250407": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "21000000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "52164803": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "65100004": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "94204209": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "111557560": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "123420111": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "168587773": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "245022934": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "253368190": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "476462898": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "531050104": ["0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885"],
-            "531050204": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "666666666": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "994873017": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "999999999": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1313161554": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1313161555": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1417429182": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1511670449": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1570754601": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1660990954": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1666600000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1666700000": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "1952959480": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "2030232745": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "3735928814": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "30143370385": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "88153591557": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-            "123420000220": ["0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526"],
-        },
-        "MultiSendCallOnly": {
-            "1": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "14": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "16": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "19": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "25": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "30": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "31": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "39": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "40": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "41": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "44": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "46": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "50": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "51": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "56": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "61": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "63": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "71": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "81": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "97": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "100": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "106": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "114": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "122": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "130": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "133": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "137": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "143": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "146": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "150": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "151": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "153": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "155": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "169": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "173": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "177": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "181": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "185": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "196": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "204": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "228": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "232": [
-                "0x0408EF011960d02349d50286D20531229BCef773",
-                "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            ],
-            "239": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "240": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "250": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "252": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "255": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "288": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "300": [
-                "0x0408EF011960d02349d50286D20531229BCef773",
-                "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            ],
-            "314": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "324": [
-                "0x0408EF011960d02349d50286D20531229BCef773",
-                "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            ],
-            "336": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "338": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "360": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "369": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "466": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "478": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "480": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "530": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "545": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "592": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "677": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "690": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "747": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "756": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "757": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "841": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "842": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "870": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "919": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "938": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "964": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "970": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "988": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "995": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "999": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1030": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1101": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1112": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1114": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1125": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1135": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1284": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1285": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1287": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1301": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1315": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1328": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1329": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1337": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1424": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1439": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1442": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1480": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1514": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1516": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1625": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1663": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1672": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1729": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1740": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1750": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1776": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1811": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1868": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1874": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1923": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1924": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1946": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1995": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2039": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2187": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2192": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2201": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2221": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2222": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2345": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2358": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2390": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2391": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2424": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2442": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2522": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2741": [
-                "0x0408EF011960d02349d50286D20531229BCef773",
-                "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            ],
-            "2787": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2810": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2818": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2910": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3068": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3338": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3501": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3636": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3637": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3776": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3946": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4002": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4061": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4062": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4153": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4157": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4158": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4162": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4202": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4217": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4326": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4337": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4441": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4488": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4653": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4661": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4663": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "4801": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5003": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5031": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5042": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5115": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5124": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5330": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5464": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5611": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5851": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5887": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6321": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6322": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6342": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6398": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6497": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6688": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6900": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6911": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6942": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7171": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7200": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7208": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7336": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7337": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7560": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7771": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7897": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7979": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8008": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8150": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8192": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8194": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8217": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8408": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8453": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8700": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8765": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8801": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "8844": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9369": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9700": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9728": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9745": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9746": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10081": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10143": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10242": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10243": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "10888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11011": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11124": [
-                "0x0408EF011960d02349d50286D20531229BCef773",
-                "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            ],
-            "11235": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11501": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11503": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13337": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13371": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13441": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13473": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13505": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13746": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "14601": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "14800": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "16661": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "17000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "17069": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "18233": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "18880": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "20994": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "23294": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "23295": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "24101": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "25363": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "26888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "28802": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "28882": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "31611": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "32380": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "32769": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "32770": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "33101": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "33111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "33139": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "34443": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "35441": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "35443": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "36888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "36900": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "41455": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "41923": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "42161": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "42220": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "42421": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "42431": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "42793": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "43111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "43113": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "43114": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "43419": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "44787": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "46630": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "47763": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "48898": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "48899": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "48900": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "49088": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "49321": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "50104": ["0x0408EF011960d02349d50286D20531229BCef773"],
-            "50312": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "53302": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "54211": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "55244": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "56288": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "57000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "57054": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "57073": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "59140": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "59141": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "59144": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "59902": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "60808": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "66665": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "72080": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "80001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "80002": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "80069": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "80085": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "80094": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "81224": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "81457": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "84531": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "84532": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88811": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88817": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88882": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "90001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "91342": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "97476": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "97477": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98864": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98865": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98866": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98867": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "98985": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "102030": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "105105": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "111188": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "127001": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "127823": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "128123": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "167000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "167009": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "167013": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "175188": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "181228": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "190415": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "200810": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "200901": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "205205": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "210425": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "222888": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "278701": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "314159": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "325000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "369369": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "381931": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "421614": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "444444": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "490000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "511111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "534351": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "534352": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "543210": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "555666": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "560048": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "656476": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "657468": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "688688": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "688689": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "695569": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "713715": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "743111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "747474": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "763373": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "763375": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "808813": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "839999": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "984122": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1440000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1449000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1501869": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2206132": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2632500": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3441006": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5042002": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "5064014": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6038361": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6281971": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "6985385": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7080969": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7225878": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "7777777": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "9999999": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11142220": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11155111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11155420": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "11155931": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "12227332": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13374202": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "13863860": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "20250407": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "21000000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "52164803": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "65100004": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "94204209": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "111557560": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "123420111": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "168587773": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "245022934": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "253368190": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "476462898": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "531050104": ["0x0408EF011960d02349d50286D20531229BCef773"],
-            "531050204": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "666666666": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "994873017": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "999999999": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1313161554": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1313161555": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1417429182": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1511670449": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1570754601": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1660990954": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1666600000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1666700000": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "1952959480": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "2030232745": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "3735928814": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "30143370385": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "88153591557": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-            "123420000220": ["0x9641d764fc13c8B624c04430C7356C1C7C8102e2"],
-        },
-        "Safe": {
-            "1": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "14": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "16": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "19": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "25": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "30": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "31": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "39": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "40": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "41": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "44": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "46": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "50": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "51": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "56": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "61": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "63": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "71": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "81": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "97": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "100": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "106": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "114": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "122": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "130": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "133": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "137": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "143": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "146": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "150": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "151": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "153": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "155": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "169": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "173": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "177": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "181": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "185": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "196": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "204": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "228": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "232": [
-                "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            ],
-            "239": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "240": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "250": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "252": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "255": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "288": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "300": [
-                "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            ],
-            "314": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "324": [
-                "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            ],
-            "336": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "338": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "360": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "369": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "466": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "478": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "480": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "530": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "545": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "592": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "677": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "690": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "747": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "756": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "757": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "841": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "842": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "870": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "919": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "938": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "964": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "970": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "988": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "995": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "999": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1030": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1101": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1112": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1114": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1125": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1135": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1284": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1285": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1287": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1301": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1315": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1328": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1329": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1337": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1424": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1439": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1442": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1480": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1514": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1516": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1625": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1663": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1672": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1729": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1740": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1750": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1776": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1811": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1868": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1874": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1923": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1924": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1946": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1995": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2039": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2187": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2192": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2201": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2221": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2222": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2345": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2358": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2390": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2391": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2424": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2442": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2522": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2741": [
-                "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            ],
-            "2787": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2810": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2818": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2910": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3068": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3338": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3501": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3636": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3637": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3776": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3946": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4002": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4061": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4062": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4153": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4157": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4158": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4162": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4202": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4217": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4326": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4337": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4441": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4488": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4653": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4661": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4663": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "4801": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5003": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5031": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5042": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5115": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5124": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5330": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5464": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5611": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5851": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5887": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6321": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6322": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6342": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6398": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6497": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6688": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6900": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6911": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6942": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7171": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7200": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7208": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7336": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7337": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7560": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7771": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7897": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7979": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8008": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8150": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8192": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8194": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8217": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8408": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8453": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8700": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8765": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8801": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "8844": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9369": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9700": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9728": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9745": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9746": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10081": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10143": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10242": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10243": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "10888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11011": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11124": [
-                "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            ],
-            "11235": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11501": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11503": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13337": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13371": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13441": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13473": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13505": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13746": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "14601": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "14800": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "16661": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "17000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "17069": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "18233": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "18880": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "20994": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "23294": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "23295": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "24101": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "25363": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "26888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "28802": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "28882": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "31611": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "32380": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "32769": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "32770": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "33101": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "33111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "33139": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "34443": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "35441": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "35443": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "36888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "36900": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "41455": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "41923": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "42161": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "42220": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "42421": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "42431": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "42793": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "43111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "43113": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "43114": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "43419": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "44787": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "46630": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "47763": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "48898": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "48899": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "48900": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "49088": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "49321": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "50104": ["0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa"],
-            "50312": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "53302": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "54211": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "55244": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "56288": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "57000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "57054": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "57073": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "59140": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "59141": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "59144": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "59902": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "60808": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "66665": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "72080": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "80001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "80002": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "80069": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "80085": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "80094": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "81224": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "81457": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "84531": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "84532": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88811": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88817": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88882": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "90001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "91342": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "97476": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "97477": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98864": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98865": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98866": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98867": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "98985": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "102030": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "105105": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "111188": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "127001": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "127823": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "128123": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "167000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "167009": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "167013": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "175188": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "181228": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "190415": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "200810": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "200901": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "205205": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "210425": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "222888": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "278701": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "314159": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "325000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "369369": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "381931": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "421614": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "444444": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "490000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "511111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "534351": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "534352": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "543210": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "555666": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "560048": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "656476": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "657468": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "688688": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "688689": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "695569": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "713715": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "743111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "747474": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "763373": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "763375": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "808813": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "839999": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "984122": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1440000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1449000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1501869": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2206132": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2632500": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3441006": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5042002": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "5064014": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6038361": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6281971": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "6985385": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7080969": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7225878": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "7777777": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "9999999": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11142220": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11155111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11155420": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "11155931": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "12227332": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13374202": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "13863860": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "20250407": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "21000000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "52164803": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "65100004": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "94204209": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "111557560": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "123420111": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "168587773": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "245022934": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "253368190": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "476462898": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "531050104": ["0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa"],
-            "531050204": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "666666666": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "994873017": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "999999999": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1313161554": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1313161555": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1417429182": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1511670449": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1570754601": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1660990954": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1666600000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1666700000": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "1952959480": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "2030232745": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "3735928814": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "30143370385": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "88153591557": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-            "123420000220": ["0x41675C099F32341bf84BFc5382aF534df5C7461a"],
-        },
-        "SafeL2": {
-            "1": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "14": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "16": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "19": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "25": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "30": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "31": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "39": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "40": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "41": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "44": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "46": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "50": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "51": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "56": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "61": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "63": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "71": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "81": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "97": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "100": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "106": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "114": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "122": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "130": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "133": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "137": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "143": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "146": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "150": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "151": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "153": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "155": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "169": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "173": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "177": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "181": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "185": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "196": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "204": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "228": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "232": [
-                "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-                "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            ],
-            "239": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "240": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "250": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "252": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "255": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "288": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "300": [
-                "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-                "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            ],
-            "314": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "324": [
-                "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-                "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            ],
-            "336": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "338": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "360": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "369": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "466": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "478": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "480": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "530": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "545": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "592": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "677": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "690": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "747": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "756": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "757": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "841": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "842": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "870": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "919": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "938": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "964": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "970": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "988": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "995": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "999": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1030": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1101": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1112": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1114": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1125": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1135": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1284": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1285": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1287": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1301": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1315": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1328": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1329": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1337": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1424": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1439": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1442": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1480": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1514": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1516": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1625": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1663": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1672": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1729": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1740": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1750": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1776": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1811": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1868": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1874": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1923": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1924": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1946": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1995": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2039": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2187": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2192": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2201": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2221": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2222": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2345": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2358": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2390": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2391": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2424": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2442": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2522": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2741": [
-                "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-                "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            ],
-            "2787": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2810": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2818": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2910": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3068": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3338": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3501": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3636": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3637": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3776": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3946": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4002": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4061": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4062": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4153": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4157": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4158": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4162": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4202": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4217": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4326": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4337": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4441": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4488": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4653": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4661": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4663": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "4801": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5003": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5031": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5042": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5115": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5124": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5330": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5464": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5611": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5851": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5887": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6321": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6322": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6342": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6398": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6497": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6688": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6900": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6911": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6942": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7171": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7200": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7208": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7336": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7337": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7560": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7771": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7897": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7979": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8008": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8150": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8192": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8194": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8217": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8408": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8453": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8700": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8765": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8801": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "8844": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9369": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9700": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9728": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9745": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9746": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10081": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10143": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10242": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10243": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "10888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11011": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11124": [
-                "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-                "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            ],
-            "11235": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11501": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11503": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13337": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13371": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13441": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13473": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13505": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13746": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "14601": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "14800": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "16661": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "17000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "17069": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "18233": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "18880": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "20994": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "23294": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "23295": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "24101": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "25363": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "26888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "28802": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "28882": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "31611": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "32380": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "32769": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "32770": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "33101": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "33111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "33139": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "34443": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "35441": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "35443": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "36888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "36900": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "41455": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "41923": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "42161": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "42220": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "42421": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "42431": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "42793": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "43111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "43113": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "43114": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "43419": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "44787": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "46630": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "47763": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "48898": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "48899": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "48900": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "49088": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "49321": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "50104": ["0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380"],
-            "50312": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "53302": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "54211": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "55244": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "56288": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "57000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "57054": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "57073": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "59140": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "59141": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "59144": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "59902": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "60808": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "66665": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "72080": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "80001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "80002": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "80069": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "80085": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "80094": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "81224": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "81457": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "84531": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "84532": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88811": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88817": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88882": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "90001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "91342": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "97476": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "97477": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98864": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98865": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98866": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98867": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "98985": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "102030": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "105105": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "111188": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "127001": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "127823": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "128123": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "167000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "167009": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "167013": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "175188": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "181228": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "190415": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "200810": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "200901": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "205205": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "210425": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "222888": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "278701": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "314159": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "325000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "369369": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "381931": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "421614": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "444444": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "490000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "511111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "534351": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "534352": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "543210": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "555666": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "560048": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "656476": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "657468": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "688688": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "688689": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "695569": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "713715": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "743111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "747474": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "763373": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "763375": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "808813": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "839999": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "984122": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1440000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1449000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1501869": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2206132": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2632500": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3441006": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5042002": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "5064014": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6038361": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6281971": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "6985385": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7080969": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7225878": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "7777777": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "9999999": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11142220": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11155111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11155420": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "11155931": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "12227332": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13374202": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "13863860": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "20250407": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "21000000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "52164803": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "65100004": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "94204209": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "111557560": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "123420111": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "168587773": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "245022934": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "253368190": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "476462898": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "531050104": ["0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380"],
-            "531050204": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "666666666": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "994873017": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "999999999": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1313161554": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1313161555": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1417429182": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1511670449": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1570754601": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1660990954": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1666600000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1666700000": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "1952959480": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "2030232745": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "3735928814": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "30143370385": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "88153591557": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-            "123420000220": ["0x29fcB43b46531BcA003ddC8FCB67FFE91900C762"],
-        },
-        "SafeMigration": {
-            "1": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "10": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "14": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "25": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "30": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "31": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "39": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "44": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "46": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "50": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "51": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "56": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "61": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "63": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "81": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "88": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "100": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "106": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "122": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "130": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "133": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "137": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "143": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "146": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "150": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "151": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "153": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "173": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "177": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "181": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "185": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "196": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "204": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "228": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "232": [
-                "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-                "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            ],
-            "239": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "240": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "252": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "255": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "288": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "300": [
-                "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-                "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            ],
-            "314": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "324": [
-                "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-                "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            ],
-            "336": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "338": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "360": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "466": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "478": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "480": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "545": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "592": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "677": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "690": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "747": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "756": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "757": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "841": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "842": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "870": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "919": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "938": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "964": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "970": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "988": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "995": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "999": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1001": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1101": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1112": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1114": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1125": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1135": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1284": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1285": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1287": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1301": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1315": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1328": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1329": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1337": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1424": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1439": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1480": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1514": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1516": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1625": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1663": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1672": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1740": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1750": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1776": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1868": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1874": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1923": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1924": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1946": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1995": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2039": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2187": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2192": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2201": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2221": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2222": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2345": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2358": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2390": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2391": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2424": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2442": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2522": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2741": [
-                "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-                "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            ],
-            "2787": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2810": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2818": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2910": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3068": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3338": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3501": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3636": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3637": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3946": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4061": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4153": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4157": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4158": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4202": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4217": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4326": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4441": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4488": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4661": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4663": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "4801": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5003": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5031": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5042": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5115": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5124": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5330": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5464": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5611": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5851": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5887": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6342": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6398": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6497": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6900": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6911": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6942": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7001": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7200": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7208": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7336": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7337": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7560": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7897": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8008": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8150": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8217": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8408": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8453": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8700": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8765": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8801": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "8844": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9001": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9369": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9700": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9728": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9745": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "9746": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "10081": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "10143": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "10242": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "10888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11011": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11124": [
-                "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-                "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            ],
-            "13371": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13441": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13473": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13505": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13746": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "14601": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "14800": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "16661": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "17000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "18233": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "18880": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "20994": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "23294": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "23295": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "24101": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "25363": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "26888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "28802": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "28882": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "31611": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "32380": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "32769": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "32770": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "33101": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "33111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "33139": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "34443": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "36888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "36900": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "41923": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "42161": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "42220": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "42421": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "42431": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "42793": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "43111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "43113": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "43114": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "43419": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "44787": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "46630": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "47763": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "48898": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "48899": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "48900": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "49088": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "49321": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "50104": ["0x817756C6c555A94BCEE39eB5a102AbC1678b09A7"],
-            "50312": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "53302": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "55244": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "56288": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "57000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "57054": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "57073": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "59141": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "59144": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "59902": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "60808": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "66665": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "72080": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "80002": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "80069": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "80094": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "81224": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "81457": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "84532": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "88811": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "88817": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "88882": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "88888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "91342": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "97476": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "97477": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98864": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98865": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98866": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98867": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "98985": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "102030": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "111188": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "127001": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "127823": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "128123": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "167000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "167009": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "167013": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "175188": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "181228": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "190415": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "200810": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "200901": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "210425": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "222888": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "278701": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "314159": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "325000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "369369": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "381931": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "490000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "511111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "534352": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "543210": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "560048": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "656476": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "657468": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "688688": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "688689": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "695569": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "713715": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "743111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "747474": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "763373": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "763375": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "808813": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "839999": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "984122": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1440000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1449000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1501869": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2206132": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2632500": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3441006": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5042002": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "5064014": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6281971": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "6985385": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7080969": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "7777777": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11142220": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11155111": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11155420": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "11155931": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "12227332": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13374202": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "13863860": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "20250407": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "21000000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "65100004": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "111557560": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "168587773": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "245022934": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "253368190": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "531050104": ["0x817756C6c555A94BCEE39eB5a102AbC1678b09A7"],
-            "531050204": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "994873017": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "999999999": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1313161554": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1417429182": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1570754601": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1660990954": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1666600000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1666700000": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "1952959480": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "2030232745": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "3735928814": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-            "30143370385": ["0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6"],
-        },
-        "SafeProxyFactory": {
-            "1": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "14": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "16": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "19": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "25": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "30": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "31": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "39": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "40": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "41": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "44": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "46": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "50": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "51": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "56": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "61": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "63": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "71": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "81": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "97": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "100": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "106": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "114": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "122": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "130": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "133": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "137": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "143": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "146": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "150": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "151": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "153": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "155": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "169": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "173": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "177": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "181": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "185": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "196": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "204": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "228": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "232": [
-                "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-                "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            ],
-            "239": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "240": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "250": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "252": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "255": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "288": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "300": [
-                "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-                "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            ],
-            "314": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "324": [
-                "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-                "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            ],
-            "336": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "338": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "360": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "369": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "466": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "478": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "480": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "530": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "545": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "592": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "677": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "690": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "747": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "756": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "757": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "841": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "842": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "870": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "919": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "938": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "964": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "970": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "988": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "995": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "999": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1030": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1101": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1112": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1114": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1125": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1135": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1284": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1285": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1287": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1301": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1315": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1328": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1329": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1337": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1424": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1439": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1442": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1480": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1514": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1516": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1625": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1663": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1672": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1729": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1740": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1750": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1776": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1811": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1868": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1874": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1923": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1924": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1946": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1995": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2039": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2187": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2192": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2201": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2221": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2222": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2345": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2358": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2390": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2391": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2424": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2442": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2522": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2741": [
-                "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-                "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            ],
-            "2787": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2810": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2818": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2910": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3068": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3338": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3501": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3636": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3637": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3776": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3946": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4002": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4061": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4062": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4153": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4157": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4158": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4162": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4202": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4217": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4326": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4337": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4441": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4488": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4653": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4661": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4663": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "4801": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5003": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5031": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5042": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5115": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5124": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5330": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5464": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5611": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5851": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5887": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6321": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6322": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6342": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6398": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6497": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6688": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6900": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6911": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6942": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7171": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7200": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7208": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7336": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7337": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7560": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7771": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7897": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7979": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8008": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8150": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8192": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8194": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8217": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8408": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8453": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8700": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8765": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8801": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "8844": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9369": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9700": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9728": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9745": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9746": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10081": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10143": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10242": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10243": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "10888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11011": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11124": [
-                "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-                "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            ],
-            "11235": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11501": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11503": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13337": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13371": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13441": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13473": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13505": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13746": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "14601": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "14800": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "16661": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "17000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "17069": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "18233": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "18880": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "20994": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "23294": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "23295": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "24101": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "25363": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "26888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "28802": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "28882": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "31611": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "32380": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "32769": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "32770": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "33101": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "33111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "33139": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "34443": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "35441": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "35443": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "36888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "36900": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "41455": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "41923": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "42161": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "42220": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "42421": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "42431": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "42793": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "43111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "43113": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "43114": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "43419": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "44787": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "46630": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "47763": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "48898": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "48899": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "48900": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "49088": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "49321": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "50104": ["0xc329D02fd8CB2fc13aa919005aF46320794a8629"],
-            "50312": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "53302": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "54211": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "55244": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "56288": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "57000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "57054": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "57073": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "59140": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "59141": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "59144": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "59902": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "60808": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "66665": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "72080": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "80001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "80002": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "80069": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "80085": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "80094": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "81224": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "81457": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "84531": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "84532": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88811": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88817": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88882": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "90001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "91342": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "97476": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "97477": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98864": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98865": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98866": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98867": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "98985": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "102030": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "105105": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "111188": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "127001": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "127823": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "128123": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "167000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "167009": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "167013": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "175188": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "181228": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "190415": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "200810": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "200901": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "205205": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "210425": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "222888": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "278701": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "314159": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "325000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "369369": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "381931": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "421614": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "444444": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "490000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "511111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "534351": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "534352": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "543210": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "555666": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "560048": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "656476": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "657468": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "688688": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "688689": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "695569": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "713715": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "743111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "747474": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "763373": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "763375": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "808813": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "839999": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "984122": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1440000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1449000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1501869": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2206132": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2632500": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3441006": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5042002": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "5064014": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6038361": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6281971": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "6985385": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7080969": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7225878": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "7777777": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "9999999": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11142220": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11155111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11155420": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "11155931": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "12227332": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13374202": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "13863860": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "20250407": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "21000000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "52164803": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "65100004": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "94204209": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "111557560": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "123420111": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "168587773": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "245022934": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "253368190": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "476462898": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "531050104": ["0xc329D02fd8CB2fc13aa919005aF46320794a8629"],
-            "531050204": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "666666666": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "994873017": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "999999999": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1313161554": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1313161555": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1417429182": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1511670449": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1570754601": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1660990954": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1666600000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1666700000": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "1952959480": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "2030232745": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "3735928814": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "30143370385": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "88153591557": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-            "123420000220": ["0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67"],
-        },
-        "SafeToL2Migration": {
-            "1": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "10": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "14": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "25": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "30": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "31": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "39": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "44": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "46": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "50": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "51": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "56": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "61": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "63": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "81": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "88": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "100": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "106": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "122": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "130": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "133": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "137": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "143": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "146": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "150": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "151": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "153": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "173": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "177": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "181": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "185": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "196": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "204": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "228": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "232": [
-                "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-                "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            ],
-            "239": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "240": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "252": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "255": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "288": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "300": [
-                "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-                "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            ],
-            "314": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "324": [
-                "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-                "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            ],
-            "336": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "338": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "360": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "466": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "478": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "480": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "545": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "592": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "677": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "690": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "747": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "756": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "757": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "841": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "842": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "870": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "919": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "938": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "964": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "970": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "988": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "995": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "999": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1001": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1101": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1112": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1114": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1125": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1135": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1284": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1285": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1287": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1301": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1315": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1328": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1329": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1337": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1424": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1439": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1480": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1514": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1516": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1625": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1663": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1672": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1740": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1750": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1776": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1868": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1874": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1923": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1924": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1946": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1995": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2039": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2187": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2192": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2201": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2221": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2222": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2345": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2358": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2390": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2391": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2424": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2442": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2522": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2741": [
-                "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-                "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            ],
-            "2787": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2810": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2818": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2910": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3068": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3338": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3501": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3636": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3637": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3946": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4061": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4153": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4157": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4158": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4202": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4217": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4326": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4441": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4488": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4661": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4663": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "4801": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5003": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5031": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5042": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5115": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5124": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5330": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5464": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5611": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5851": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5887": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6342": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6398": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6497": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6900": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6911": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6942": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7001": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7200": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7208": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7336": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7337": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7560": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7897": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8008": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8150": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8217": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8408": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8453": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8700": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8765": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8801": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "8844": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9001": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9369": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9700": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9728": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9745": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "9746": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "10081": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "10143": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "10242": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "10888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11011": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11124": [
-                "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-                "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            ],
-            "13371": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13441": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13473": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13505": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13746": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "14601": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "14800": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "16661": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "17000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "18233": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "18880": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "20994": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "23294": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "23295": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "24101": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "25363": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "26888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "28802": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "28882": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "31611": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "32380": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "32769": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "32770": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "33101": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "33111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "33139": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "34443": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "36888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "36900": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "41923": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "42161": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "42220": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "42421": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "42431": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "42793": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "43111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "43113": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "43114": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "43419": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "44787": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "46630": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "47763": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "48898": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "48899": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "48900": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "49088": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "49321": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "50104": ["0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590"],
-            "50312": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "53302": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "55244": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "56288": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "57000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "57054": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "57073": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "59141": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "59144": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "59902": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "60808": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "66665": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "72080": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "80002": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "80069": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "80094": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "81224": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "81457": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "84532": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "88811": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "88817": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "88882": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "88888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "91342": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "97476": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "97477": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98864": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98865": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98866": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98867": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "98985": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "102030": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "111188": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "127001": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "127823": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "128123": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "167000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "167009": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "167013": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "175188": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "181228": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "190415": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "200810": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "200901": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "210425": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "222888": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "278701": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "314159": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "325000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "369369": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "381931": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "490000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "511111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "534352": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "543210": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "560048": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "656476": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "657468": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "688688": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "688689": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "695569": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "713715": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "743111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "747474": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "763373": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "763375": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "808813": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "839999": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "984122": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1440000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1449000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1501869": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2206132": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2632500": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3441006": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5042002": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "5064014": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6281971": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "6985385": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7080969": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "7777777": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11142220": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11155111": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11155420": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "11155931": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "12227332": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13374202": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "13863860": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "20250407": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "21000000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "65100004": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "111557560": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "168587773": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "245022934": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "253368190": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "531050104": ["0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590"],
-            "531050204": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "994873017": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "999999999": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1313161554": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1417429182": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1570754601": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1660990954": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1666600000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1666700000": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "1952959480": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "2030232745": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "3735928814": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-            "30143370385": ["0xfF83F6335d8930cBad1c0D439A841f01888D9f69"],
-        },
-        "SafeToL2Setup": {
-            "1": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "10": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "14": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "25": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "30": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "31": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "39": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "44": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "46": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "50": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "51": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "56": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "61": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "63": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "81": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "88": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "100": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "106": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "122": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "130": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "133": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "137": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "143": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "146": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "150": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "151": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "153": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "173": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "177": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "181": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "185": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "196": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "204": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "228": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "232": [
-                "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-                "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            ],
-            "239": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "240": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "252": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "255": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "288": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "300": [
-                "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-                "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            ],
-            "314": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "324": [
-                "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-                "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            ],
-            "336": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "338": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "360": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "466": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "478": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "480": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "545": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "592": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "677": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "690": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "747": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "756": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "757": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "841": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "842": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "870": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "919": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "938": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "964": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "970": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "988": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "995": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "999": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1001": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1101": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1112": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1114": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1125": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1135": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1284": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1285": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1287": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1301": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1315": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1328": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1329": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1337": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1424": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1439": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1480": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1514": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1516": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1625": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1663": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1672": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1740": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1750": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1776": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1868": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1874": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1923": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1924": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1946": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1995": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2039": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2187": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2192": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2201": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2221": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2222": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2345": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2358": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2390": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2391": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2424": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2442": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2522": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2741": [
-                "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-                "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            ],
-            "2787": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2810": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2818": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2910": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3068": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3338": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3501": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3636": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3637": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3946": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4061": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4153": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4157": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4158": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4202": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4217": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4326": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4441": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4488": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4661": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4663": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "4801": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5003": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5031": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5042": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5115": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5124": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5330": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5464": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5611": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5851": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5887": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6342": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6398": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6497": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6900": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6911": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6942": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7001": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7200": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7208": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7336": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7337": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7560": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7897": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8008": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8150": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8217": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8408": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8453": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8700": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8765": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8801": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "8844": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9001": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9369": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9700": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9728": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9745": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "9746": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "10081": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "10143": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "10242": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "10888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11011": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11124": [
-                "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-                "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            ],
-            "13371": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13441": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13473": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13505": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13746": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "14601": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "14800": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "16661": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "17000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "18233": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "18880": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "20994": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "23294": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "23295": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "24101": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "25363": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "26888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "28802": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "28882": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "31611": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "32380": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "32769": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "32770": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "33101": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "33111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "33139": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "34443": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "36888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "36900": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "41923": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "42161": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "42220": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "42421": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "42431": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "42793": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "43111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "43113": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "43114": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "43419": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "44787": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "46630": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "47763": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "48898": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "48899": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "48900": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "49088": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "49321": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "50104": ["0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39"],
-            "50312": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "53302": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "55244": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "56288": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "57000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "57054": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "57073": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "59141": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "59144": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "59902": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "60808": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "66665": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "72080": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "80002": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "80069": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "80094": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "81224": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "81457": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "84532": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "88811": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "88817": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "88882": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "88888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "91342": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "97476": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "97477": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98864": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98865": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98866": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98867": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "98985": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "102030": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "111188": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "127001": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "127823": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "128123": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "167000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "167009": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "167013": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "175188": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "181228": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "190415": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "200810": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "200901": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "210425": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "222888": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "278701": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "314159": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "325000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "369369": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "381931": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "490000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "511111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "534352": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "543210": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "560048": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "656476": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "657468": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "688688": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "688689": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "695569": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "713715": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "743111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "747474": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "763373": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "763375": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "808813": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "839999": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "984122": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1440000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1449000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1501869": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2206132": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2632500": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3441006": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5042002": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "5064014": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6281971": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "6985385": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7080969": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "7777777": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11142220": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11155111": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11155420": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "11155931": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "12227332": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13374202": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "13863860": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "20250407": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "21000000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "65100004": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "111557560": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "168587773": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "245022934": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "253368190": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "531050104": ["0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39"],
-            "531050204": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "994873017": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "999999999": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1313161554": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1417429182": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1570754601": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1660990954": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1666600000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1666700000": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "1952959480": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "2030232745": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "3735928814": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-            "30143370385": ["0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54"],
-        },
-        "SignMessageLib": {
-            "1": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "14": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "16": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "19": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "25": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "30": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "31": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "39": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "40": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "41": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "44": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "46": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "50": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "51": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "56": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "61": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "63": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "71": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "81": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "97": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "100": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "106": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "114": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "122": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "130": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "133": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "137": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "143": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "146": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "150": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "151": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "153": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "155": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "169": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "173": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "177": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "181": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "185": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "196": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "204": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "228": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "232": [
-                "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-                "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            ],
-            "239": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "240": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "250": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "252": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "255": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "288": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "300": [
-                "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-                "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            ],
-            "314": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "324": [
-                "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-                "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            ],
-            "336": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "338": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "360": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "369": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "466": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "478": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "480": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "530": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "545": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "592": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "677": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "690": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "747": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "756": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "757": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "841": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "842": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "870": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "919": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "938": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "964": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "970": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "988": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "995": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "999": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1030": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1101": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1112": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1114": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1125": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1135": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1284": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1285": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1287": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1301": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1315": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1328": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1329": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1337": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1424": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1439": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1442": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1480": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1514": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1516": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1625": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1663": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1672": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1729": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1740": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1750": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1776": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1811": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1868": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1874": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1923": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1924": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1946": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1995": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2039": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2187": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2192": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2201": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2221": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2222": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2345": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2358": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2390": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2391": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2424": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2442": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2522": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2741": [
-                "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-                "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            ],
-            "2787": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2810": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2818": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2910": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3068": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3338": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3501": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3636": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3637": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3776": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3946": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4002": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4061": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4062": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4153": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4157": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4158": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4162": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4202": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4217": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4326": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4337": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4441": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4488": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4653": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4661": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4663": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "4801": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5003": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5031": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5042": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5115": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5124": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5330": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5464": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5611": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5851": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5887": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6321": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6322": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6342": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6398": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6497": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6688": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6900": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6911": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6942": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7171": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7200": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7208": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7336": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7337": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7560": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7771": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7897": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7979": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8008": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8150": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8192": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8194": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8217": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8408": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8453": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8700": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8765": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8801": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "8844": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9369": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9700": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9728": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9745": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9746": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10081": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10143": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10242": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10243": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "10888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11011": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11124": [
-                "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-                "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            ],
-            "11235": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11501": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11503": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13337": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13371": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13441": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13473": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13505": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13746": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "14601": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "14800": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "16661": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "17000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "17069": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "18233": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "18880": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "20994": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "23294": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "23295": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "24101": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "25363": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "26888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "28802": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "28882": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "31611": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "32380": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "32769": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "32770": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "33101": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "33111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "33139": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "34443": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "35441": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "35443": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "36888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "36900": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "41455": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "41923": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "42161": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "42220": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "42421": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "42431": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "42793": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "43111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "43113": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "43114": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "43419": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "44787": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "46630": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "47763": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "48898": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "48899": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "48900": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "49088": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "49321": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "50104": ["0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888"],
-            "50312": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "53302": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "54211": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "55244": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "56288": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "57000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "57054": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "57073": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "59140": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "59141": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "59144": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "59902": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "60808": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "66665": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "72080": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "80001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "80002": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "80069": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "80085": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "80094": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "81224": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "81457": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "84531": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "84532": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88811": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88817": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88882": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "90001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "91342": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "97476": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "97477": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98864": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98865": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98866": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98867": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "98985": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "102030": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "105105": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "111188": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "127001": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "127823": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "128123": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "167000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "167009": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "167013": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "175188": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "181228": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "190415": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "200810": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "200901": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "205205": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "210425": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "222888": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "278701": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "314159": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "325000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "369369": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "381931": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "421614": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "444444": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "490000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "511111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "534351": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "534352": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "543210": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "555666": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "560048": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "656476": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "657468": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "688688": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "688689": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "695569": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "713715": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "743111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "747474": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "763373": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "763375": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "808813": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "839999": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "984122": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1440000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1449000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1501869": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2206132": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2632500": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3441006": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5042002": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "5064014": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6038361": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6281971": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "6985385": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7080969": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7225878": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "7777777": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "9999999": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11142220": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11155111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11155420": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "11155931": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "12227332": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13374202": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "13863860": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "20250407": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "21000000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "52164803": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "65100004": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "94204209": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "111557560": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "123420111": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "168587773": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "245022934": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "253368190": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "476462898": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "531050104": ["0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888"],
-            "531050204": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "666666666": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "994873017": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "999999999": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1313161554": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1313161555": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1417429182": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1511670449": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1570754601": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1660990954": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1666600000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1666700000": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "1952959480": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "2030232745": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "3735928814": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "30143370385": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "88153591557": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-            "123420000220": ["0xd53cd0aB83D845Ac265BE939c57F53AD838012c9"],
-        },
-        "SimulateTxAccessor": {
-            "1": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "14": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "16": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "19": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "25": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "30": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "31": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "39": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "40": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "41": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "44": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "46": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "50": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "51": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "56": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "61": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "63": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "71": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "81": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "97": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "100": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "106": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "114": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "122": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "130": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "133": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "137": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "143": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "146": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "150": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "151": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "153": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "155": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "169": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "173": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "177": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "181": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "185": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "196": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "204": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "228": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "232": [
-                "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-                "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            ],
-            "239": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "240": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "250": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "252": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "255": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "288": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "300": [
-                "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-                "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            ],
-            "314": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "324": [
-                "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-                "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            ],
-            "336": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "338": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "360": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "369": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "466": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "478": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "480": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "530": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "545": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "592": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "677": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "690": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "747": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "756": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "757": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "841": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "842": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "870": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "919": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "938": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "964": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "970": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "988": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "995": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "999": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1030": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1101": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1112": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1114": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1125": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1135": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1284": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1285": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1287": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1301": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1315": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1328": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1329": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1337": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1424": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1439": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1442": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1480": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1514": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1516": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1625": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1663": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1672": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1729": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1740": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1750": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1776": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1811": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1868": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1874": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1923": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1924": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1946": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1995": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2039": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2187": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2192": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2201": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2221": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2222": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2345": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2358": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2390": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2391": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2424": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2442": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2522": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2741": [
-                "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-                "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            ],
-            "2787": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2810": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2818": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2910": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3068": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3338": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3501": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3636": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3637": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3776": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3946": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4002": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4061": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4062": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4153": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4157": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4158": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4162": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4202": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4217": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4326": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4337": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4441": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4488": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4653": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4661": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4663": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "4801": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5003": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5031": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5042": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5115": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5124": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5330": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5464": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5611": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5851": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5887": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6321": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6322": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6342": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6398": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6497": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6688": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6900": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6911": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6942": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7171": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7200": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7208": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7336": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7337": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7560": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7771": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7897": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7979": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8008": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8150": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8192": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8194": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8217": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8408": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8453": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8700": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8765": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8801": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "8844": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9369": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9700": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9728": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9745": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9746": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10081": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10143": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10242": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10243": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "10888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11011": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11124": [
-                "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-                "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            ],
-            "11235": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11501": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11503": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13337": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13371": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13441": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13473": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13505": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13746": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "14601": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "14800": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "16661": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "17000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "17069": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "18233": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "18880": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "20994": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "23294": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "23295": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "24101": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "25363": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "26888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "28802": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "28882": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "31611": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "32380": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "32769": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "32770": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "33101": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "33111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "33139": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "34443": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "35441": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "35443": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "36888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "36900": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "41455": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "41923": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "42161": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "42220": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "42421": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "42431": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "42793": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "43111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "43113": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "43114": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "43419": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "44787": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "46630": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "47763": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "48898": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "48899": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "48900": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "49088": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "49321": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "50104": ["0xdd35026932273768A3e31F4efF7313B5B7A7199d"],
-            "50312": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "53302": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "54211": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "55244": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "56288": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "57000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "57054": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "57073": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "59140": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "59141": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "59144": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "59902": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "60808": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "66665": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "72080": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "80001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "80002": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "80069": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "80085": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "80094": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "81224": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "81457": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "84531": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "84532": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88811": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88817": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88882": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "90001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "91342": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "97476": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "97477": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98864": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98865": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98866": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98867": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "98985": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "102030": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "105105": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "111188": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "127001": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "127823": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "128123": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "167000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "167009": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "167013": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "175188": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "181228": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "190415": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "200810": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "200901": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "205205": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "210425": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "222888": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "278701": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "314159": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "325000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "369369": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "381931": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "421614": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "444444": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "490000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "511111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "534351": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "534352": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "543210": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "555666": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "560048": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "656476": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "657468": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "688688": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "688689": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "695569": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "713715": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "743111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "747474": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "763373": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "763375": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "808813": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "839999": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "984122": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1440000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1449000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1501869": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2206132": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2632500": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3441006": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5042002": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "5064014": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6038361": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6281971": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "6985385": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7080969": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7225878": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "7777777": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "9999999": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11142220": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11155111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11155420": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "11155931": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "12227332": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13374202": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "13863860": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "20250407": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "21000000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "52164803": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "65100004": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "94204209": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "111557560": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "123420111": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "168587773": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "245022934": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "253368190": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "476462898": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "531050104": ["0xdd35026932273768A3e31F4efF7313B5B7A7199d"],
-            "531050204": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "666666666": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "994873017": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "999999999": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1313161554": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1313161555": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1417429182": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1511670449": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1570754601": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1660990954": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1666600000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1666700000": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "1952959480": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "2030232745": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "3735928814": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "30143370385": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "88153591557": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-            "123420000220": ["0x3d4BA2E0884aa488718476ca2FB8Efc291A46199"],
-        },
-    },
-    "1.5.0": {
-        "CompatibilityFallbackHandler": {
-            "1": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "10": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "31": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "50": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "56": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "63": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "81": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "100": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "130": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "137": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "143": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "146": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "196": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "204": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "232": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "324": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "338": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "480": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "545": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "677": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "756": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "757": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "919": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "988": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "999": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1001": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1112": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1285": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1287": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1329": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1480": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1672": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1874": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1924": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1995": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "2201": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "2221": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "2222": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "2391": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "3338": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "4153": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "4202": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "4217": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "4326": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "4663": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5000": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5003": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5042": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5115": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5424": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5887": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "6497": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "7001": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "7979": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "8150": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "8217": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "8453": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "9302": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "9745": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "9746": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "10081": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "10143": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "11011": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "13441": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "13473": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "13505": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "14800": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "16661": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "20994": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "23294": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "23295": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "25363": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "28882": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "32380": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "36900": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "38833": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "42161": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "42220": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "42431": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "43111": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "43114": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "46630": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "48898": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "49088": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "57073": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "59141": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "59144": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "80069": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "80094": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "81224": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "84532": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "88811": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "88817": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "102030": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "127823": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "167013": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "181228": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "190415": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "222888": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "369369": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "534352": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "560048": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "613419": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "656476": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "747474": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "763373": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "808813": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "843843": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1440000": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1449000": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "5042002": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "6281971": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "11142220": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "11155111": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "11155931": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "999999999": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1313161554": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1666600000": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "1666700000": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-            "37714555429": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-        },
-        "CreateCall": {
-            "1": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "10": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "31": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "50": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "56": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "63": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "81": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "100": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "130": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "137": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "143": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "146": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "196": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "204": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "232": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "324": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "338": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "480": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "545": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "677": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "756": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "757": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "919": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "988": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "999": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1001": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1112": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1285": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1287": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1329": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1480": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1672": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1874": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1924": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1995": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "2201": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "2221": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "2222": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "2391": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "3338": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "4153": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "4202": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "4217": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "4326": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "4663": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5000": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5003": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5042": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5115": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5424": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5887": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "6497": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "7001": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "7979": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "8150": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "8217": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "8453": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "9302": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "9745": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "9746": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "10081": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "10143": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "11011": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "13441": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "13473": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "13505": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "14800": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "16661": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "20994": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "23294": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "23295": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "25363": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "28882": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "32380": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "36900": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "38833": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "42161": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "42220": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "42431": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "43111": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "43114": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "46630": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "48898": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "49088": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "57073": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "59141": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "59144": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "80069": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "80094": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "81224": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "84532": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "88811": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "88817": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "102030": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "127823": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "167013": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "181228": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "190415": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "222888": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "369369": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "534352": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "560048": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "613419": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "656476": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "747474": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "763373": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "808813": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "843843": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1440000": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1449000": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "5042002": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "6281971": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "11142220": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "11155111": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "11155931": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "999999999": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1313161554": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1666600000": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "1666700000": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-            "37714555429": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-        },
-        "ExtensibleFallbackHandler": {
-            "1": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "10": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "31": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "50": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "56": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "63": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "81": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "100": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "130": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "137": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "143": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "146": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "196": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "204": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "232": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "324": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "338": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "480": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "545": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "677": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "756": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "757": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "919": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "988": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "999": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1001": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1112": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1285": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1287": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1329": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1480": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1672": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1874": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1924": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1995": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "2201": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "2221": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "2222": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "2391": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "3338": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "4153": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "4202": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "4217": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "4326": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "4663": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5000": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5003": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5042": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5115": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5424": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5887": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "6497": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "7001": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "7979": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "8150": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "8217": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "8453": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "9302": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "9745": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "9746": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "10081": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "10143": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "11011": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "13441": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "13473": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "13505": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "14800": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "16661": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "20994": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "23294": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "23295": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "25363": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "28882": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "32380": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "36900": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "38833": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "42161": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "42220": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "42431": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "43111": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "43114": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "46630": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "48898": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "49088": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "57073": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "59141": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "59144": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "80069": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "80094": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "81224": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "84532": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "88811": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "88817": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "102030": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "127823": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "167013": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "181228": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "190415": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "222888": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "369369": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "534352": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "560048": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "613419": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "656476": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "747474": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "763373": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "808813": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "843843": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1440000": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1449000": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "5042002": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "6281971": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "11142220": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "11155111": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "11155931": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "999999999": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1313161554": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1666600000": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "1666700000": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-            "37714555429": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-        },
-        "MultiSend": {
-            "1": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "10": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "31": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "50": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "56": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "63": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "81": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "100": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "130": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "137": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "143": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "146": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "196": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "204": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "232": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "324": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "338": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "480": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "545": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "677": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "756": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "757": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "919": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "988": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "999": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1001": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1112": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1285": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1287": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1329": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1480": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1672": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1874": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1924": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1995": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "2201": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "2221": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "2222": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "2391": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "3338": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "4153": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "4202": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "4217": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "4326": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "4663": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5000": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5003": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5042": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5115": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5424": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5887": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "6497": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "7001": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "7979": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "8150": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "8217": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "8453": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "9302": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "9745": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "9746": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "10081": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "10143": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "11011": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "13441": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "13473": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "13505": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "14800": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "16661": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "20994": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "23294": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "23295": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "25363": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "28882": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "32380": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "36900": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "38833": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "42161": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "42220": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "42431": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "43111": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "43114": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "46630": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "48898": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "49088": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "57073": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "59141": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "59144": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "80069": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "80094": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "81224": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "84532": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "88811": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "88817": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "102030": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "127823": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "167013": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "181228": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "190415": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "222888": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "369369": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "534352": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "560048": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "613419": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "656476": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "747474": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "763373": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "808813": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "843843": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1440000": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1449000": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "5042002": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "6281971": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "11142220": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "11155111": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "11155931": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "999999999": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1313161554": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1666600000": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "1666700000": ["0x218543288004CD07832472D464648173c77D7eB7"],
-            "37714555429": ["0x218543288004CD07832472D464648173c77D7eB7"],
-        },
-        "MultiSendCallOnly": {
-            "1": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "10": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "31": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "50": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "56": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "63": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "81": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "100": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "130": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "137": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "143": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "146": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "196": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "204": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "232": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "324": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "338": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "480": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "545": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "677": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "756": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "757": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "919": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "988": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "999": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1001": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1112": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1285": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1287": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1329": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1480": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1672": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1874": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1924": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1995": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "2201": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "2221": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "2222": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "2391": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "3338": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "4153": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "4202": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "4217": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "4326": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "4663": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5000": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5003": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5042": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5115": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5424": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5887": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "6497": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "7001": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "7979": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "8150": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "8217": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "8453": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "9302": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "9745": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "9746": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "10081": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "10143": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "11011": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "13441": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "13473": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "13505": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "14800": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "16661": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "20994": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "23294": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "23295": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "25363": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "28882": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "32380": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "36900": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "38833": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "42161": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "42220": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "42431": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "43111": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "43114": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "46630": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "48898": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "49088": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "57073": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "59141": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "59144": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "80069": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "80094": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "81224": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "84532": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "88811": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "88817": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "102030": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "127823": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "167013": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "181228": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "190415": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "222888": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "369369": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "534352": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "560048": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "613419": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "656476": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "747474": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "763373": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "808813": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "843843": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1440000": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1449000": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "5042002": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "6281971": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "11142220": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "11155111": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "11155931": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "999999999": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1313161554": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1666600000": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "1666700000": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-            "37714555429": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-        },
-        "Safe": {
-            "1": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "10": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "31": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "50": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "56": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "63": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "81": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "100": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "130": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "137": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "143": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "146": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "196": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "204": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "232": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "324": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "338": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "480": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "545": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "677": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "756": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "757": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "919": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "988": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "999": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1001": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1112": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1285": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1287": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1329": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1480": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1672": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1874": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1924": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1995": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "2201": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "2221": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "2222": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "2391": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "3338": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "4153": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "4202": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "4217": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "4326": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "4663": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5000": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5003": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5042": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5115": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5424": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5887": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "6497": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "7001": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "7979": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "8150": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "8217": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "8453": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "9302": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "9745": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "9746": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "10081": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "10143": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "11011": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "13441": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "13473": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "13505": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "14800": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "16661": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "20994": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "23294": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "23295": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "25363": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "28882": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "32380": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "36900": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "38833": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "42161": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "42220": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "42431": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "43111": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "43114": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "46630": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "48898": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "49088": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "57073": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "59141": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "59144": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "80069": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "80094": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "81224": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "84532": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "88811": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "88817": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "102030": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "127823": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "167013": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "181228": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "190415": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "222888": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "369369": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "534352": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "560048": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "613419": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "656476": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "747474": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "763373": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "808813": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "843843": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1440000": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1449000": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "5042002": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "6281971": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "11142220": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "11155111": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "11155931": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "999999999": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1313161554": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1666600000": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "1666700000": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-            "37714555429": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-        },
-        "SafeL2": {
-            "1": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "10": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "31": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "50": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "56": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "63": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "81": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "100": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "130": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "137": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "143": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "146": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "196": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "204": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "232": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "324": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "338": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "480": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "545": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "677": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "756": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "757": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "919": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "988": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "999": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1001": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1112": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1285": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1287": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1329": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1480": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1672": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1874": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1924": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1995": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "2201": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "2221": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "2222": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "2391": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "3338": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "4153": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "4202": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "4217": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "4326": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "4663": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5000": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5003": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5042": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5115": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5424": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5887": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "6497": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "7001": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "7979": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "8150": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "8217": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "8453": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "9302": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "9745": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "9746": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "10081": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "10143": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "11011": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "13441": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "13473": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "13505": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "14800": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "16661": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "20994": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "23294": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "23295": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "25363": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "28882": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "32380": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "36900": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "38833": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "42161": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "42220": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "42431": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "43111": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "43114": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "46630": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "48898": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "49088": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "57073": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "59141": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "59144": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "80069": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "80094": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "81224": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "84532": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "88811": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "88817": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "102030": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "127823": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "167013": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "181228": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "190415": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "222888": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "369369": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "534352": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "560048": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "613419": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "656476": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "747474": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "763373": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "808813": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "843843": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1440000": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1449000": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "5042002": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "6281971": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "11142220": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "11155111": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "11155931": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "999999999": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1313161554": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1666600000": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "1666700000": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-            "37714555429": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-        },
-        "SafeMigration": {
-            "1": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "10": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "31": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "50": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "56": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "63": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "81": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "100": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "130": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "137": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "143": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "146": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "196": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "204": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "232": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "324": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "338": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "480": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "545": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "677": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "756": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "757": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "919": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "988": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "999": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1001": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1112": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1285": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1287": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1329": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1480": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1672": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1874": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1924": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1995": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "2201": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "2221": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "2222": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "2391": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "3338": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "4153": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "4202": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "4217": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "4326": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "4663": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5000": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5003": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5042": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5115": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5424": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5887": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "6497": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "7001": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "7979": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "8150": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "8217": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "8453": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "9302": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "9745": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "9746": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "10081": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "10143": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "11011": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "13441": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "13473": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "13505": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "14800": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "16661": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "20994": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "23294": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "23295": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "25363": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "28882": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "32380": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "36900": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "38833": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "42161": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "42220": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "42431": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "43111": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "43114": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "46630": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "48898": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "49088": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "57073": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "59141": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "59144": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "80069": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "80094": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "81224": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "84532": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "88811": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "88817": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "102030": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "127823": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "167013": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "181228": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "190415": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "222888": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "369369": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "534352": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "560048": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "613419": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "656476": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "747474": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "763373": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "808813": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "843843": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1440000": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1449000": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "5042002": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "6281971": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "11142220": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "11155111": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "11155931": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "999999999": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1313161554": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1666600000": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "1666700000": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-            "37714555429": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-        },
-        "SafeProxyFactory": {
-            "1": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "10": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "31": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "50": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "56": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "63": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "81": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "100": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "130": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "137": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "143": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "146": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "196": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "204": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "232": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "324": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "338": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "480": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "545": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "677": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "756": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "757": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "919": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "988": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "999": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1001": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1112": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1285": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1287": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1329": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1480": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1672": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1874": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1924": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1995": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "2201": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "2221": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "2222": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "2391": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "3338": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "4153": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "4202": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "4217": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "4326": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "4663": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5000": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5003": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5042": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5115": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5424": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5887": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "6497": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "7001": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "7979": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "8150": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "8217": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "8453": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "9302": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "9745": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "9746": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "10081": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "10143": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "11011": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "13441": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "13473": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "13505": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "14800": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "16661": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "20994": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "23294": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "23295": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "25363": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "28882": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "32380": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "36900": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "38833": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "42161": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "42220": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "42431": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "43111": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "43114": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "46630": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "48898": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "49088": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "57073": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "59141": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "59144": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "80069": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "80094": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "81224": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "84532": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "88811": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "88817": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "102030": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "127823": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "167013": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "181228": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "190415": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "222888": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "369369": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "534352": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "560048": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "613419": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "656476": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "747474": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "763373": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "808813": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "843843": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1440000": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1449000": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "5042002": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "6281971": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "11142220": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "11155111": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "11155931": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "999999999": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1313161554": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1666600000": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "1666700000": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-            "37714555429": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-        },
-        "SafeToL2Setup": {
-            "1": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "10": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "31": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "50": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "56": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "63": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "81": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "100": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "130": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "137": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "143": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "146": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "196": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "204": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "232": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "324": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "338": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "480": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "545": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "677": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "756": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "757": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "919": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "988": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "999": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1001": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1112": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1285": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1287": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1329": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1480": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1672": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1874": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1924": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1995": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "2201": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "2221": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "2222": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "2391": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "3338": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "4153": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "4202": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "4217": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "4326": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "4663": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5000": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5003": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5042": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5115": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5424": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5887": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "6497": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "7001": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "7979": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "8150": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "8217": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "8453": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "9302": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "9745": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "9746": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "10081": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "10143": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "11011": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "13441": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "13473": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "13505": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "14800": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "16661": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "20994": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "23294": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "23295": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "25363": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "28882": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "32380": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "36900": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "38833": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "42161": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "42220": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "42431": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "43111": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "43114": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "46630": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "48898": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "49088": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "57073": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "59141": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "59144": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "80069": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "80094": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "81224": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "84532": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "88811": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "88817": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "102030": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "127823": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "167013": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "181228": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "190415": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "222888": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "369369": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "534352": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "560048": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "613419": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "656476": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "747474": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "763373": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "808813": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "843843": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1440000": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1449000": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "5042002": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "6281971": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "11142220": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "11155111": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "11155931": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "999999999": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1313161554": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1666600000": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "1666700000": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-            "37714555429": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-        },
-        "SignMessageLib": {
-            "1": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "10": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "31": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "50": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "56": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "63": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "81": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "100": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "130": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "137": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "143": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "146": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "196": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "204": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "232": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "324": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "338": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "480": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "545": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "677": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "756": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "757": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "919": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "988": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "999": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1001": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1112": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1285": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1287": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1329": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1480": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1672": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1874": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1924": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1995": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "2201": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "2221": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "2222": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "2391": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "3338": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "4153": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "4202": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "4217": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "4326": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "4663": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5000": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5003": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5042": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5115": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5424": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5887": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "6497": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "7001": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "7979": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "8150": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "8217": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "8453": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "9302": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "9745": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "9746": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "10081": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "10143": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "11011": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "13441": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "13473": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "13505": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "14800": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "16661": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "20994": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "23294": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "23295": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "25363": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "28882": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "32380": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "36900": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "38833": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "42161": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "42220": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "42431": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "43111": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "43114": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "46630": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "48898": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "49088": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "57073": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "59141": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "59144": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "80069": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "80094": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "81224": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "84532": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "88811": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "88817": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "102030": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "127823": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "167013": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "181228": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "190415": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "222888": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "369369": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "534352": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "560048": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "613419": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "656476": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "747474": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "763373": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "808813": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "843843": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1440000": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1449000": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "5042002": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "6281971": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "11142220": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "11155111": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "11155931": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "999999999": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1313161554": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1666600000": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "1666700000": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-            "37714555429": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-        },
-        "SimulateTxAccessor": {
-            "1": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "10": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "31": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "50": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "56": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "63": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "81": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "100": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "130": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "137": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "143": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "146": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "196": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "204": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "232": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "324": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "338": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "480": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "545": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "677": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "756": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "757": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "919": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "988": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "999": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1001": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1112": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1285": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1287": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1329": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1480": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1672": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1874": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1924": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1995": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "2201": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "2221": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "2222": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "2391": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "3338": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "4153": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "4202": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "4217": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "4326": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "4663": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5000": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5003": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5042": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5115": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5424": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5887": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "6497": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "7001": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "7979": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "8150": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "8217": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "8453": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "9302": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "9745": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "9746": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "10081": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "10143": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "11011": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "13441": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "13473": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "13505": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "14800": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "16661": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "20994": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "23294": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "23295": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "25363": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "28882": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "32380": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "36900": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "38833": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "42161": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "42220": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "42431": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "43111": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "43114": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "46630": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "48898": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "49088": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "57073": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "59141": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "59144": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "80069": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "80094": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "81224": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "84532": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "88811": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "88817": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "102030": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "127823": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "167013": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "181228": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "190415": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "222888": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "369369": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "534352": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "560048": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "613419": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "656476": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "747474": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "763373": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "808813": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "843843": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1440000": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1449000": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "5042002": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "6281971": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "11142220": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "11155111": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "11155931": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "999999999": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1313161554": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1666600000": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "1666700000": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-            "37714555429": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-        },
-        "TokenCallbackHandler": {
-            "1": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "10": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "31": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "50": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "56": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "63": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "81": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "100": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "130": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "137": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "143": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "146": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "196": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "204": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "232": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "324": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "338": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "480": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "545": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "677": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "756": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "757": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "919": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "988": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "999": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1001": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1112": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1285": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1287": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1329": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1480": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1672": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1874": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1924": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1995": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "2201": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "2221": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "2222": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "2391": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "3338": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "4153": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "4202": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "4217": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "4326": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "4663": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5000": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5003": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5042": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5115": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5424": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5887": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "6497": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "7001": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "7979": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "8150": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "8217": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "8453": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "9302": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "9745": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "9746": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "10081": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "10143": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "11011": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "13441": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "13473": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "13505": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "14800": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "16661": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "20994": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "23294": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "23295": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "25363": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "28882": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "32380": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "36900": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "38833": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "42161": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "42220": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "42431": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "43111": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "43114": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "46630": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "48898": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "49088": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "57073": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "59141": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "59144": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "80069": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "80094": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "81224": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "84532": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "88811": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "88817": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "102030": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "127823": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "167013": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "181228": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "190415": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "222888": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "369369": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "534352": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "560048": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "613419": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "656476": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "747474": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "763373": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "808813": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "843843": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1440000": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1449000": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "5042002": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "6281971": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "11142220": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "11155111": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "11155931": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "999999999": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1313161554": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1666600000": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "1666700000": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-            "37714555429": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-        },
-    },
-}
-default_safe_deployments = {
-    "1.0.0": {
-        "GnosisSafe": ["0xb6029EA3B2c51D09a50B53CA8012FeEB05bDa35A"],
-        "ProxyFactory": ["0x12302fE9c02ff50939BaAaaf415fc226C078613C"],
-    },
-    "1.1.1": {
-        "CreateAndAddModules": ["0xF61A721642B0c0C8b334bA3763BA1326F53798C0"],
-        "CreateCall": ["0x8538FcBccba7f5303d2C679Fa5d7A629A8c9bf4A"],
-        "DefaultCallbackHandler": ["0xd5D82B6aDDc9027B22dCA772Aa68D5d74cdBdF44"],
-        "GnosisSafe": ["0x34CfAC646f301356fAa8B21e94227e3583Fe3F5F"],
-        "MultiSend": ["0x8D29bE29923b68abfDD21e541b9374737B49cdAD"],
-        "ProxyFactory": ["0x76E2cFc1F5Fa8F6a5b3fC4c8F4788F0116861F9B"],
-    },
-    "1.2.0": {"GnosisSafe": ["0x6851D6fDFAfD08c0295C392436245E5bc78B0185"]},
-    "1.3.0": {
-        "CompatibilityFallbackHandler": [
-            "0xf48f2B2d2a534e402487b3ee7C18c33Aec0Fe5e4",
-            "0x017062a1dE2FE6b99BE3d9d37841FeD19F573804",
-            "0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A",
-        ],
-        "CreateCall": [
-            "0x7cbB62EaA69F79e6873cD1ecB2392971036cFAa4",
-            "0xB19D6FFc2182150F8Eb585b79D4ABcd7C5640A9d",
-            "0xcB8e5E438c5c2b45FbE17B02Ca9aF91509a8ad56",
-        ],
-        "GnosisSafe": [
-            "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
-            "0x69f4D1788e39c87893C980c06EdF4b7f686e2938",
-            "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
-        ],
-        "GnosisSafeL2": [
-            "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
-            "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
-            "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
-        ],
-        "MultiSend": [
-            "0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761",
-            "0x998739BFdAAdde7C933B942a68053933098f9EDa",
-            "0x0dFcccB95225ffB03c6FBB2559B530C2B7C8A912",
-        ],
-        "MultiSendCallOnly": [
-            "0x40A2aCCbd92BCA938b02010E17A5b8929b49130D",
-            "0xA1dabEF33b3B82c7814B6D82A79e50F4AC44102B",
-            "0xf220D3b4DFb23C4ade8C88E526C1353AbAcbC38F",
-        ],
-        "GnosisSafeProxyFactory": [
-            "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
-            "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC",
-            "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
-        ],
-        "SignMessageLib": [
-            "0xA65387F16B013cf2Af4605Ad8aA5ec25a2cbA3a2",
-            "0x98FFBBF51bb33A056B08ddf711f289936AafF717",
-            "0x357147caf9C0cCa67DfA0CF5369318d8193c8407",
-        ],
-        "SimulateTxAccessor": [
-            "0x59AD6735bCd8152B84860Cb256dD9e96b85F69Da",
-            "0x727a77a074D1E6c4530e814F89E618a3298FC044",
-            "0x4191E2e12E8BC5002424CE0c51f9947b02675a44",
-        ],
-    },
-    "1.4.1": {
-        "CompatibilityFallbackHandler": [
-            "0xfd0732Dc9E303f09fCEf3a7388Ad10A83459Ec99",
-            "0x9301E98DD367135f21bdF66f342A249c9D5F9069",
-        ],
-        "CreateCall": [
-            "0x9b35Af71d77eaf8d7e40252370304687390A1A52",
-            "0xAAA566Fe7978bB0fb0B5362B7ba23038f4428D8f",
-        ],
-        "MultiSend": [
-            "0x38869bf66a61cF6bDB996A6aE40D5853Fd43B526",
-            "0x309D0B190FeCCa8e1D5D8309a16F7e3CB133E885",
-        ],
-        "MultiSendCallOnly": [
-            "0x9641d764fc13c8B624c04430C7356C1C7C8102e2",
-            "0x0408EF011960d02349d50286D20531229BCef773",
-        ],
-        "Safe": [
-            "0x41675C099F32341bf84BFc5382aF534df5C7461a",
-            "0xC35F063962328aC65cED5D4c3fC5dEf8dec68dFa",
-        ],
-        "SafeL2": [
-            "0x29fcB43b46531BcA003ddC8FCB67FFE91900C762",
-            "0x610fcA2e0279Fa1F8C00c8c2F71dF522AD469380",
-        ],
-        "SafeMigration": [
-            "0x526643F69b81B008F46d95CD5ced5eC0edFFDaC6",
-            "0x817756C6c555A94BCEE39eB5a102AbC1678b09A7",
-        ],
-        "SafeProxyFactory": [
-            "0x4e1DCf7AD4e460CfD30791CCC4F9c8a4f820ec67",
-            "0xc329D02fd8CB2fc13aa919005aF46320794a8629",
-        ],
-        "SafeToL2Migration": [
-            "0xfF83F6335d8930cBad1c0D439A841f01888D9f69",
-            "0xa26620d1f8f1a2433F0D25027F141aaCAFB3E590",
-        ],
-        "SafeToL2Setup": [
-            "0xBD89A1CE4DDe368FFAB0eC35506eEcE0b1fFdc54",
-            "0x199A9df0224031c20Cc27083A4164c9c8F1Bcb39",
-        ],
-        "SignMessageLib": [
-            "0xd53cd0aB83D845Ac265BE939c57F53AD838012c9",
-            "0xAca1ec0a1A575CDCCF1DC3d5d296202Eb6061888",
-        ],
-        "SimulateTxAccessor": [
-            "0x3d4BA2E0884aa488718476ca2FB8Efc291A46199",
-            "0xdd35026932273768A3e31F4efF7313B5B7A7199d",
-        ],
-    },
-    "1.5.0": {
-        "CompatibilityFallbackHandler": ["0x3EfCBb83A4A7AfcB4F68D501E2c2203a38be77f4"],
-        "CreateCall": ["0x2Ef5ECfbea521449E4De05EDB1ce63B75eDA90B4"],
-        "ExtensibleFallbackHandler": ["0x85a8ca358D388530ad0fB95D0cb89Dd44Fc242c3"],
-        "MultiSend": ["0x218543288004CD07832472D464648173c77D7eB7"],
-        "MultiSendCallOnly": ["0xA83c336B20401Af773B6219BA5027174338D1836"],
-        "Safe": ["0xFf51A5898e281Db6DfC7855790607438dF2ca44b"],
-        "SafeL2": ["0xEdd160fEBBD92E350D4D398fb636302fccd67C7e"],
-        "SafeMigration": ["0x6439e7ABD8Bb915A5263094784C5CF561c4172AC"],
-        "SafeProxyFactory": ["0x14F2982D601c9458F93bd70B218933A6f8165e7b"],
-        "SafeToL2Setup": ["0x900C7589200010D6C6eCaaE5B06EBe653bc2D82a"],
-        "SignMessageLib": ["0x4FfeF8222648872B3dE295Ba1e49110E61f5b5aa"],
-        "SimulateTxAccessor": ["0x07EfA797c55B5DdE3698d876b277aBb6B893654C"],
-        "TokenCallbackHandler": ["0x54e86d004d71a8D2112ec75FaCE57D730b0433F3"],
-    },
+        for version, contracts in _load_safe_deployments().items()
+    }
+
+
+@cache
+def _build_default_safe_deployments() -> Dict[str, Dict[str, List[str]]]:
+    return {
+        version: {
+            contract_name: list(deployment["addresses"])
+            for contract_name, deployment in contracts.items()
+        }
+        for version, contracts in _load_safe_deployments().items()
+    }
+
+
+_LAZY_ATTRIBUTES = {
+    "safe_deployments": _build_safe_deployments,
+    "default_safe_deployments": _build_default_safe_deployments,
 }
+
+
+def __getattr__(name: str):
+    try:
+        return _LAZY_ATTRIBUTES[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,224 @@
+"""
+Reverse index of Safe contracts deployments: address -> contract name, version and chains.
+
+The index is built once, the first time it's used, from ``safe_deployments`` (every contract in
+https://github.com/safe-global/safe-deployments/) and the ``MASTER_COPIES`` and ``PROXY_FACTORIES``
+tables in ``addresses``, that provide the deployment blocks and singletons not included in
+safe-deployments. Proxy factories not included in safe-deployments are not indexed, as their version
+is unknown.
+"""
+
+from functools import cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from eth_typing import ChecksumAddress, HexAddress, HexStr
+from packaging.version import Version
+
+from .addresses import (
+    MASTER_COPIES,
+    PROXY_FACTORIES,
+    safe_proxy_factory_contract_names,
+    safe_singleton_contract_names,
+)
+from .safe_deployments import (
+    get_safe_deployment_addresses,
+    get_safe_deployment_chain_ids,
+    get_safe_deployment_contract_names,
+    get_safe_deployment_versions,
+)
+
+
+class SafeContractDeployment(NamedTuple):
+    address: ChecksumAddress
+    contract_name: str  # e.g. `GnosisSafeL2`
+    version: str  # e.g. `1.3.0`. Can contain build metadata, e.g. `1.1.1+Circles`
+    is_l2: bool
+    chains: FrozenSet[int]
+    deployment_blocks: Mapping[int, int]  # Chain id -> Earliest block number
+
+    @property
+    def extended_version(self) -> str:
+        """
+        :return: Version with ``+L2`` for L2 contracts, as used in ``MASTER_COPIES``
+        """
+        return self.version + "+L2" if self.is_l2 else self.version
+
+    @property
+    def is_singleton(self) -> bool:
+        return self.contract_name in safe_singleton_contract_names
+
+    @property
+    def is_proxy_factory(self) -> bool:
+        return self.contract_name in safe_proxy_factory_contract_names
+
+    def get_deployment_block(self, chain_id: int) -> Optional[int]:
+        """
+        :param chain_id:
+        :return: Deployment block number on ``chain_id``, ``None`` if not known
+        """
+        return self.deployment_blocks.get(chain_id)
+
+
+class _SafeDeploymentsIndex(NamedTuple):
+    by_address: Mapping[ChecksumAddress, Tuple[SafeContractDeployment, ...]]
+    singletons_by_chain: Mapping[int, Tuple[SafeContractDeployment, ...]]
+    proxy_factories_by_chain: Mapping[int, Tuple[SafeContractDeployment, ...]]
+
+
+def _get_singleton_contract_name(version: str, is_l2: bool) -> str:
+    """
+    :return: Singleton contract name for a ``MASTER_COPIES`` entry not included in safe-deployments.
+        Contract was renamed from ``GnosisSafe`` to ``Safe`` in ``v1.4.0``
+    """
+    contract_name = "Safe" if Version(version).release >= (1, 4, 0) else "GnosisSafe"
+    return contract_name + "L2" if is_l2 else contract_name
+
+
+@cache
+def _get_safe_deployments_index() -> _SafeDeploymentsIndex:
+    # (Address, contract name, version) -> chains and deployment blocks
+    entries: Dict[Tuple[ChecksumAddress, str, str], Tuple[Set[int], Dict[int, int]]] = (
+        {}
+    )
+    deployments_by_address: Dict[ChecksumAddress, List[Tuple[str, str]]] = {}
+    for version in get_safe_deployment_versions():
+        for contract_name in get_safe_deployment_contract_names(version):
+            for address in get_safe_deployment_addresses(contract_name, version):
+                deployments_by_address.setdefault(address, []).append(
+                    (contract_name, version)
+                )
+                entries[(address, contract_name, version)] = (set(), {})
+            for chain_id in get_safe_deployment_chain_ids(contract_name, version):
+                for address in get_safe_deployment_addresses(
+                    contract_name, version, chain_id
+                ):
+                    entries[(address, contract_name, version)][0].add(chain_id)
+
+    for ethereum_network, master_copies in MASTER_COPIES.items():
+        chain_id = ethereum_network.value
+        for master_copy_address, block_number, extended_version in master_copies:
+            address = ChecksumAddress(HexAddress(HexStr(master_copy_address)))
+            version, is_l2 = (
+                (extended_version[:-3], True)
+                if extended_version.endswith("+L2")
+                else (extended_version, False)
+            )
+            keys = [
+                (address, contract_name, deployment_version)
+                for contract_name, deployment_version in deployments_by_address.get(
+                    address, []
+                )
+                if contract_name in safe_singleton_contract_names
+            ] or [(address, _get_singleton_contract_name(version, is_l2), version)]
+            for key in keys:
+                chains, deployment_blocks = entries.setdefault(key, (set(), {}))
+                chains.add(chain_id)
+                deployment_blocks[chain_id] = min(
+                    deployment_blocks.get(chain_id, block_number), block_number
+                )
+
+    for ethereum_network, proxy_factories in PROXY_FACTORIES.items():
+        chain_id = ethereum_network.value
+        for proxy_factory_address, block_number in proxy_factories:
+            address = ChecksumAddress(HexAddress(HexStr(proxy_factory_address)))
+            for contract_name, version in deployments_by_address.get(address, []):
+                if contract_name in safe_proxy_factory_contract_names:
+                    chains, deployment_blocks = entries[
+                        (address, contract_name, version)
+                    ]
+                    chains.add(chain_id)
+                    deployment_blocks[chain_id] = min(
+                        deployment_blocks.get(chain_id, block_number), block_number
+                    )
+
+    by_address: Dict[ChecksumAddress, List[SafeContractDeployment]] = {}
+    singletons_by_chain: Dict[int, List[SafeContractDeployment]] = {}
+    proxy_factories_by_chain: Dict[int, List[SafeContractDeployment]] = {}
+    for (address, contract_name, version), (
+        chains,
+        deployment_blocks,
+    ) in entries.items():
+        deployment = SafeContractDeployment(
+            address,
+            contract_name,
+            version,
+            contract_name.endswith("L2"),
+            frozenset(chains),
+            MappingProxyType(deployment_blocks),
+        )
+        by_address.setdefault(address, []).append(deployment)
+        if deployment.is_singleton:
+            for chain_id in chains:
+                singletons_by_chain.setdefault(chain_id, []).append(deployment)
+        elif deployment.is_proxy_factory:
+            for chain_id in chains:
+                proxy_factories_by_chain.setdefault(chain_id, []).append(deployment)
+
+    return _SafeDeploymentsIndex(
+        MappingProxyType(
+            {address: tuple(values) for address, values in by_address.items()}
+        ),
+        MappingProxyType(
+            {
+                chain_id: tuple(values)
+                for chain_id, values in singletons_by_chain.items()
+            }
+        ),
+        MappingProxyType(
+            {
+                chain_id: tuple(values)
+                for chain_id, values in proxy_factories_by_chain.items()
+            }
+        ),
+    )
+
+
+def lookup(address: ChecksumAddress) -> Tuple[SafeContractDeployment, ...]:
+    """
+    :param address: Checksummed address
+    :return: Safe contracts deployed at ``address``, empty if it's not a known Safe contract
+    """
+    return _get_safe_deployments_index().by_address.get(address, ())
+
+
+def get_singletons(chain_id: int) -> Tuple[SafeContractDeployment, ...]:
+    """
+    :param chain_id:
+    :return: Known Safe singletons (master copies) for ``chain_id``
+    """
+    return _get_safe_deployments_index().singletons_by_chain.get(chain_id, ())
+
+
+def get_proxy_factories(chain_id: int) -> Tuple[SafeContractDeployment, ...]:
+    """
+    :param chain_id:
+    :return: Known Safe proxy factories for ``chain_id``
+    """
+    return _get_safe_deployments_index().proxy_factories_by_chain.get(chain_id, ())
+
+
+def get_singleton_deployment(
+    address: ChecksumAddress,
+) -> Optional[SafeContractDeployment]:
+    """
+    :param address: Checksummed address
+    :return: Safe singleton deployed at ``address``, ``None`` if it's not a known singleton
+    """
+    for deployment in lookup(address):
+        if deployment.is_singleton:
+            return deployment
+    return None
+
+
+def get_proxy_factory_deployment(
+    address: ChecksumAddress,
+) -> Optional[SafeContractDeployment]:
+    """
+    :param address: Checksummed address
+    :return: Safe proxy factory deployed at ``address``, ``None`` if it's not a known proxy factory
+    """
+    for deployment in lookup(address):
+        if deployment.is_proxy_factory:
+            return deployment
+    return None
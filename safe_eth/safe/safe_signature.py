@@ -1,14 +1,20 @@
+import asyncio
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from enum import IntEnum
+from functools import lru_cache
 from logging import getLogger
 from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     List,
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -26,6 +32,7 @@ from typing_extensions import Self
 from web3 import AsyncWeb3, Web3
 from web3.contract import Contract
 from web3.exceptions import Web3Exception, Web3RPCError, Web3ValueError
+from web3.types import RPCEndpoint
 
 from safe_eth.eth import EthereumClient
 from safe_eth.eth.contracts import (
@@ -33,6 +40,7 @@ from safe_eth.eth.contracts import (
     get_compatibility_fallback_handler_V1_4_1_contract,
     get_safe_contract,
 )
+from safe_eth.eth.ethereum_client import build_jsonrpc_batch_payload
 from safe_eth.eth.utils import (
     fast_bytes_to_checksum_address,
     fast_keccak,
@@ -41,12 +49,18 @@ from safe_eth.eth.utils import (
 from safe_eth.safe import p256
 from safe_eth.safe.signatures import (
     get_signing_address,
-    signature_split,
     signature_to_bytes,
 )
+from safe_eth.util.util import to_0x_hex_str
 
 logger = getLogger(__name__)
 
+# EIP1271 `isValidSignature` selector and data type, updated `(bytes32,bytes)` first and legacy `(bytes,bytes)`
+_IS_VALID_SIGNATURE_SELECTORS = (
+    (fast_keccak(b"isValidSignature(bytes32,bytes)")[:4], "bytes32"),
+    (fast_keccak(b"isValidSignature(bytes,bytes)")[:4], "bytes"),
+)
+
 
 EthereumBytes = Union[bytes, str]
 
@@ -95,6 +109,16 @@ def uint_to_address(value: int) -> ChecksumAddress:
     )
 
 
+@lru_cache(maxsize=int(os.getenv("CACHE_SIGNATURE_OWNER", 100_000)))
+def _recover_owner(signed_hash: bytes, v: int, r: int, s: int) -> ChecksumAddress:
+    """
+    Memoized ``get_signing_address``, so owners for the same ``(hash, signature)`` are only recovered once
+
+    :return: Owner of the signature, ``NULL_ADDRESS`` if signature is not valid
+    """
+    return cast(ChecksumAddress, get_signing_address(signed_hash, v, r, s))
+
+
 TSafeSignature = TypeVar("TSafeSignature", bound="SafeSignatureBase")
 
 
@@ -104,6 +128,9 @@ class SupportsContractSignature(Protocol):
 
 
 class SafeSignatureBase(ABC):
+    # Millions of signatures can be kept in memory when indexing, so no `__dict__` is used
+    __slots__ = ("signature", "safe_hash", "v", "r", "s", "_owner")
+
     contract_signature_cls: ClassVar[Optional[Type["SafeSignatureBase"]]] = None
     approved_hash_cls: ClassVar[Optional[Type["SafeSignatureBase"]]] = None
     eoa_cls: ClassVar[Optional[Type["SafeSignatureBase"]]] = None
@@ -117,10 +144,15 @@ class SafeSignatureBase(ABC):
         """
         self.signature = HexBytes(signature)
         self.safe_hash = HexBytes(safe_hash)
-        v, r, s = signature_split(self.signature)
-        self.v: int = v
-        self.r: int = r
-        self.s: int = s
+        if len(self.signature) < 65:
+            raise ValueError(
+                f"Signature must be at least 65 bytes {self.signature.hex()}"
+            )
+        self.r: int = int.from_bytes(self.signature[:32], "big")
+        self.s: int = int.from_bytes(self.signature[32:64], "big")
+        self.v: int = self.signature[64]
+        # Recovered owner, for signatures that require `ecrecover`
+        self._owner: Optional[ChecksumAddress] = None
 
     def __str__(self):
         return f"SafeSignature type={self.signature_type.name} owner={self.owner}"
@@ -128,13 +160,14 @@ class SafeSignatureBase(ABC):
     @classmethod
     def parse_signature(
         cls: Type[TSafeSignature],
-        signatures: EthereumBytes,
+        signatures: Union[EthereumBytes, memoryview],
         safe_hash: EthereumBytes,
         safe_hash_preimage: Optional[EthereumBytes] = None,
         ignore_trailing: bool = True,
     ) -> List[TSafeSignature]:
         """
         :param signatures: One or more signatures appended. EIP1271 data at the end is supported.
+            A ``memoryview`` can be provided, signatures are parsed without copying the buffer
         :param safe_hash: Signed hash for the Safe (message or transaction)
         :param safe_hash_preimage: ``safe_hash`` preimage for EIP1271 validation
         :param ignore_trailing: Ignore trailing data on the signature. Some libraries pad it and add some zeroes at
@@ -145,34 +178,42 @@ class SafeSignatureBase(ABC):
             return []
         elif isinstance(signatures, str):
             signatures = HexBytes(signatures)
+        signatures_view = memoryview(signatures)
+        safe_hash = HexBytes(safe_hash)
 
         signature_size = 65  # For contract signatures there'll be some data at the end
         data_position = len(
-            signatures
+            signatures_view
         )  # For contract signatures, to stop parsing at data position
 
         safe_signatures: List[TSafeSignature] = []
-        for i in range(0, len(signatures), signature_size):
+        for i in range(0, len(signatures_view), signature_size):
             if (
                 i >= data_position
             ):  # If contract signature data position is reached, stop
                 break
 
-            signature = signatures[i : i + signature_size]
-            if ignore_trailing and len(signature) < 65:
-                # Trailing stuff
-                break
-            v, r, s = signature_split(signature)
+            signature_view = signatures_view[i : i + signature_size]
+            if len(signature_view) < 65:
+                if ignore_trailing:
+                    # Trailing stuff
+                    break
+                raise ValueError(
+                    f"Signature must be at least 65 bytes {signature_view.hex()}"
+                )
+            signature = bytes(signature_view)
+            s = int.from_bytes(signature_view[32:64], "big")
+            v = signature_view[64]
             signature_type = SafeSignatureType.from_v(v)
             if signature_type == SafeSignatureType.CONTRACT_SIGNATURE:
                 if s < data_position:
                     data_position = s
                 contract_signature_len = int.from_bytes(
-                    signatures[s : s + 32], "big"
+                    signatures_view[s : s + 32], "big"
                 )  # Len size is 32 bytes
-                contract_signature = signatures[
-                    s + 32 : s + 32 + contract_signature_len
-                ]  # Skip array size (32 bytes)
+                contract_signature = bytes(
+                    signatures_view[s + 32 : s + 32 + contract_signature_len]
+                )  # Skip array size (32 bytes)
                 safe_signature_cls = cls._get_contract_signature_cls()
                 safe_signature = cast(
                     TSafeSignature,
@@ -189,9 +230,11 @@ class SafeSignatureBase(ABC):
                 # Unlike contract signatures, there's no length prefix as the size is fixed
                 if s < data_position:
                     data_position = s
-                passkey_signature = signatures[
-                    s : s + SafeSignatureP256Mixin.PASSKEY_SIGNATURE_LENGTH
-                ]
+                passkey_signature = bytes(
+                    signatures_view[
+                        s : s + SafeSignatureP256Mixin.PASSKEY_SIGNATURE_LENGTH
+                    ]
+                )
                 safe_signature_cls = cls._get_p256_cls()
                 safe_signature = cast(
                     TSafeSignature,
@@ -226,6 +269,61 @@ class SafeSignatureBase(ABC):
             safe_signatures.append(safe_signature)
         return safe_signatures
 
+    @staticmethod
+    def recover_owners(
+        safe_signatures: Sequence["SafeSignatureBase"],
+        executor: Optional[Executor] = None,
+        chunksize: int = 1_000,
+    ) -> List[ChecksumAddress]:
+        """
+        Get the owners for multiple signatures in one pass. ``ecrecover`` is only done for EOA and
+        ``eth_sign`` signatures which owner was not recovered before, and the ``eth_sign`` message hash
+        is calculated only once for every signed hash. Recovered owners are memoized on the signatures.
+
+        :param safe_signatures:
+        :param executor: If provided (e.g. a ``ProcessPoolExecutor``), ``ecrecover`` is distributed
+            using ``executor.map``. Useful for recovering a huge number of owners
+        :param chunksize: Number of signatures sent to every ``ProcessPoolExecutor`` worker at once
+        :return: Owner for every signature (``NULL_ADDRESS`` for EOA and ``eth_sign`` not valid signatures)
+        """
+        pending_signatures: List[SafeSignatureBase] = []
+        recover_arguments: List[Tuple[bytes, int, int, int]] = []
+        eth_sign_hashes: Dict[bytes, bytes] = {}
+        for safe_signature in safe_signatures:
+            if safe_signature._owner is not None:
+                continue
+            safe_hash = bytes(safe_signature.safe_hash)
+            if isinstance(safe_signature, SafeSignatureEthSignMixin):
+                if safe_hash not in eth_sign_hashes:
+                    # defunct_hash_message prepends `\x19Ethereum Signed Message:\n32`
+                    eth_sign_hashes[safe_hash] = bytes(
+                        defunct_hash_message(primitive=safe_hash)
+                    )
+                signed_hash, v = eth_sign_hashes[safe_hash], safe_signature.v - 4
+            elif isinstance(safe_signature, SafeSignatureEOAMixin):
+                signed_hash, v = safe_hash, safe_signature.v
+            else:
+                continue
+            pending_signatures.append(safe_signature)
+            recover_arguments.append(
+                (signed_hash, v, safe_signature.r, safe_signature.s)
+            )
+
+        if executor is None or not recover_arguments:
+            owners: List[ChecksumAddress] = [
+                _recover_owner(*arguments) for arguments in recover_arguments
+            ]
+        else:
+            owners = [
+                cast(ChecksumAddress, owner)
+                for owner in executor.map(
+                    get_signing_address, *zip(*recover_arguments), chunksize=chunksize
+                )
+            ]
+        for safe_signature, owner in zip(pending_signatures, owners):
+            safe_signature._owner = owner
+        return [safe_signature.owner for safe_signature in safe_signatures]
+
     @classmethod
     def export_signatures(
         cls, safe_signatures: Sequence["SafeSignatureBase"]
@@ -332,6 +430,8 @@ class SafeSignatureBase(ABC):
 
 
 class SafeSignature(SafeSignatureBase):
+    __slots__ = ()
+
     @abstractmethod
     def is_valid(
         self,
@@ -345,8 +445,55 @@ class SafeSignature(SafeSignatureBase):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def is_valid_many(
+        signatures: Sequence["SafeSignature"],
+        ethereum_client: EthereumClient,
+        safe_address: Optional[str] = None,
+    ) -> List[bool]:
+        """
+        Validate multiple signatures. EIP1271 ``isValidSignature`` calls for all the contract
+        signatures (both ``(bytes32,bytes)`` and ``(bytes,bytes)`` methods) are done
+        in the same JSON RPC batch request. Other signatures are validated using ``is_valid``
+
+        :param signatures:
+        :param ethereum_client:
+        :param safe_address: Required for Approved Hash check
+        :return: ``True`` for every valid signature, ``False`` otherwise
+        :raises: ConnectionError, ValueError if the batch request fails
+        """
+        contract_signatures = [
+            signature
+            for signature in signatures
+            if isinstance(signature, SafeSignatureContractMixin)
+        ]
+        responses = (
+            ethereum_client.batch_call_manager.batch_request_responses(
+                build_jsonrpc_batch_payload(
+                    [
+                        query
+                        for signature in contract_signatures
+                        for query in signature.build_eip1271_queries()
+                    ]
+                )
+            )
+            if contract_signatures
+            else []
+        )
+        contract_results = iter(_get_eip1271_results(contract_signatures, responses))
+        return [
+            (
+                next(contract_results)
+                if isinstance(signature, SafeSignatureContractMixin)
+                else signature.is_valid(ethereum_client, safe_address)
+            )
+            for signature in signatures
+        ]
+
 
 class SafeSignatureAsync(SafeSignatureBase):
+    __slots__ = ()
+
     @abstractmethod
     async def is_valid(
         self,
@@ -355,8 +502,94 @@ class SafeSignatureAsync(SafeSignatureBase):
     ) -> bool:
         raise NotImplementedError
 
+    @staticmethod
+    async def is_valid_many(
+        signatures: Sequence["SafeSignatureAsync"],
+        web3: AsyncWeb3,
+        safe_address: Optional[str] = None,
+    ) -> List[bool]:
+        """
+        Async version of :meth:`SafeSignature.is_valid_many`. If the provider does not support
+        batch requests, contract signatures are validated using ``is_valid``
+
+        :param signatures:
+        :param web3:
+        :param safe_address: Required for Approved Hash check
+        :return: ``True`` for every valid signature, ``False`` otherwise
+        """
+        contract_positions = [
+            position
+            for position, signature in enumerate(signatures)
+            if isinstance(signature, SafeSignatureContractMixin)
+        ]
+        results: Dict[int, bool] = {}
+        if contract_positions:
+            contract_signatures = [
+                cast(SafeSignatureContractMixin, signatures[position])
+                for position in contract_positions
+            ]
+            try:
+                responses = await web3.provider.make_batch_request(
+                    [
+                        (RPCEndpoint(method), params)
+                        for signature in contract_signatures
+                        for method, params in signature.build_eip1271_queries()
+                    ]
+                )
+            except NotImplementedError:
+                responses = None
+            if isinstance(responses, list):
+                results = dict(
+                    zip(
+                        contract_positions,
+                        _get_eip1271_results(
+                            contract_signatures, cast(List[Dict[str, Any]], responses)
+                        ),
+                    )
+                )
+            else:
+                logger.warning(
+                    "Cannot check EIP1271 signatures using a batch request: %s",
+                    responses,
+                )
+
+        pending_positions = [
+            position for position in range(len(signatures)) if position not in results
+        ]
+        for position, result in zip(
+            pending_positions,
+            await asyncio.gather(
+                *[
+                    signatures[position].is_valid(web3, safe_address)
+                    for position in pending_positions
+                ]
+            ),
+        ):
+            results[position] = result
+        return [results[position] for position in range(len(signatures))]
+
+
+def _get_eip1271_results(
+    signatures: Sequence["SafeSignatureContractMixin"],
+    responses: Sequence[Dict[str, Any]],
+) -> List[bool]:
+    """
+    :param signatures: Contract signatures
+    :param responses: JSON RPC responses for the ``build_eip1271_queries`` of every signature
+    :return: ``True`` for every valid signature, ``False`` otherwise
+    """
+    queries_per_signature = len(_IS_VALID_SIGNATURE_SELECTORS)
+    return [
+        signature.is_valid_eip1271_responses(
+            responses[i * queries_per_signature : (i + 1) * queries_per_signature]
+        )
+        for i, signature in enumerate(signatures)
+    ]
+
 
 class SafeSignatureContractMixin(SafeSignatureBase):
+    __slots__ = ("safe_hash_preimage", "contract_signature")
+
     EIP1271_MAGIC_VALUE = HexBytes(0x20C13B0B)
     EIP1271_MAGIC_VALUE_UPDATED = HexBytes(0x1626BA7E)
 
@@ -413,8 +646,71 @@ class SafeSignatureContractMixin(SafeSignatureBase):
             signature_to_bytes(self.v, self.r, dynamic_offset) + contract_signature
         )
 
+    @classmethod
+    def is_eip1271_magic_value(cls, value: bytes) -> bool:
+        """
+        :param value: Value returned by ``isValidSignature``
+        :return: ``True`` if it's one of the EIP1271 magic values, ``False`` otherwise
+        """
+        return value in (cls.EIP1271_MAGIC_VALUE, cls.EIP1271_MAGIC_VALUE_UPDATED)
+
+    def build_eip1271_queries(self) -> List[Tuple[str, List[Any]]]:
+        """
+        :return: JSON RPC ``(method, params)`` for the ``isValidSignature`` ``eth_call`` to the
+            owner, using the updated ``(bytes32,bytes)`` and the legacy ``(bytes,bytes)`` methods
+        """
+        return [
+            (
+                "eth_call",
+                [
+                    {
+                        "to": self.owner,
+                        "data": to_0x_hex_str(
+                            selector
+                            + encode_abi(
+                                [data_type, "bytes"],
+                                [bytes(data), bytes(self.contract_signature)],
+                            )
+                        ),
+                    },
+                    "latest",
+                ],
+            )
+            for (selector, data_type), data in zip(
+                _IS_VALID_SIGNATURE_SELECTORS,
+                (self.safe_hash, self.safe_hash_preimage),
+            )
+        ]
+
+    def is_valid_eip1271_responses(self, responses: Sequence[Dict[str, Any]]) -> bool:
+        """
+        :param responses: JSON RPC responses for the ``build_eip1271_queries``
+        :return: ``True`` if any of the ``isValidSignature`` calls returned the magic value,
+            ``False`` otherwise
+        """
+        for response in responses:
+            if "error" in response:
+                logger.warning(
+                    "Cannot check EIP1271 on contract %s: %s",
+                    self.owner,
+                    response["error"],
+                )
+                continue
+            try:
+                (value,) = decode_abi(["bytes4"], HexBytes(response["result"]))
+            except DecodingError as exc:
+                logger.warning(
+                    "Cannot check EIP1271 on contract %s: %s", self.owner, exc
+                )
+                continue
+            if self.is_eip1271_magic_value(value):
+                return True
+        return False
+
 
 class SafeSignatureApprovedHashMixin(SafeSignatureBase):
+    __slots__ = ()
+
     @property
     def owner(self) -> ChecksumAddress:
         return uint_to_address(self.r)
@@ -432,14 +728,17 @@ class SafeSignatureApprovedHashMixin(SafeSignatureBase):
 
 
 class SafeSignatureEthSignMixin(SafeSignatureBase):
+    __slots__ = ()
+
     @property
     def owner(self) -> ChecksumAddress:
-        # defunct_hash_message prepends `\x19Ethereum Signed Message:\n32`
-        message_hash = defunct_hash_message(primitive=self.safe_hash)
-        return cast(
-            ChecksumAddress,
-            get_signing_address(message_hash, self.v - 4, self.r, self.s),
-        )
+        if self._owner is None:
+            # defunct_hash_message prepends `\x19Ethereum Signed Message:\n32`
+            message_hash = defunct_hash_message(primitive=self.safe_hash)
+            self._owner = _recover_owner(
+                bytes(message_hash), self.v - 4, self.r, self.s
+            )
+        return self._owner
 
     @property
     def signature_type(self) -> SafeSignatureType:
@@ -447,12 +746,13 @@ class SafeSignatureEthSignMixin(SafeSignatureBase):
 
 
 class SafeSignatureEOAMixin(SafeSignatureBase):
+    __slots__ = ()
+
     @property
     def owner(self) -> ChecksumAddress:
-        return cast(
-            ChecksumAddress,
-            get_signing_address(self.safe_hash, self.v, self.r, self.s),
-        )
+        if self._owner is None:
+            self._owner = _recover_owner(bytes(self.safe_hash), self.v, self.r, self.s)
+        return self._owner
 
     @property
     def signature_type(self) -> SafeSignatureType:
@@ -475,6 +775,8 @@ class SafeSignatureP256Mixin(SafeSignatureBase):
     the signature is verified off-chain against the ``safe_hash`` over the P-256 curve.
     """
 
+    __slots__ = ("passkey_signature",)
+
     PASSKEY_SIGNATURE_LENGTH = 128
 
     def __init__(
@@ -571,6 +873,8 @@ class SafeSignatureP256Mixin(SafeSignatureBase):
 
 
 class SafeSignatureContract(SafeSignatureContractMixin, SafeSignature):
+    __slots__ = ()
+
     def _check_eip1271(
         self,
         ethereum_client: EthereumClient,
@@ -605,10 +909,7 @@ class SafeSignatureContract(SafeSignatureContractMixin, SafeSignature):
             )
             return False
 
-        return result in (
-            self.EIP1271_MAGIC_VALUE,
-            self.EIP1271_MAGIC_VALUE_UPDATED,
-        )
+        return self.is_eip1271_magic_value(result)
 
     def is_valid(
         self,
@@ -653,6 +954,8 @@ class SafeSignatureContract(SafeSignatureContractMixin, SafeSignature):
 
 
 class SafeSignatureApprovedHash(SafeSignatureApprovedHashMixin, SafeSignature):
+    __slots__ = ()
+
     def is_valid(
         self,
         ethereum_client: Optional[EthereumClient] = None,
@@ -685,6 +988,8 @@ class SafeSignatureApprovedHash(SafeSignatureApprovedHashMixin, SafeSignature):
 
 
 class SafeSignatureEthSign(SafeSignatureEthSignMixin, SafeSignature):
+    __slots__ = ()
+
     def is_valid(
         self,
         ethereum_client: Optional[EthereumClient] = None,
@@ -694,6 +999,8 @@ class SafeSignatureEthSign(SafeSignatureEthSignMixin, SafeSignature):
 
 
 class SafeSignatureEOA(SafeSignatureEOAMixin, SafeSignature):
+    __slots__ = ()
+
     def is_valid(
         self,
         ethereum_client: Optional[EthereumClient] = None,
@@ -703,6 +1010,8 @@ class SafeSignatureEOA(SafeSignatureEOAMixin, SafeSignature):
 
 
 class SafeSignatureP256(SafeSignatureP256Mixin, SafeSignature):
+    __slots__ = ()
+
     def is_valid(
         self,
         ethereum_client: Optional[EthereumClient] = None,
@@ -712,6 +1021,8 @@ class SafeSignatureP256(SafeSignatureP256Mixin, SafeSignature):
 
 
 class SafeSignatureContractAsync(SafeSignatureContractMixin, SafeSignatureAsync):
+    __slots__ = ()
+
     async def _check_eip1271(
         self,
         web3: AsyncWeb3,
@@ -748,10 +1059,7 @@ class SafeSignatureContractAsync(SafeSignatureContractMixin, SafeSignatureAsync)
             )
             return False
 
-        return result in (
-            self.EIP1271_MAGIC_VALUE,
-            self.EIP1271_MAGIC_VALUE_UPDATED,
-        )
+        return self.is_eip1271_magic_value(result)
 
     async def is_valid(
         self,
@@ -796,6 +1104,8 @@ class SafeSignatureContractAsync(SafeSignatureContractMixin, SafeSignatureAsync)
 class SafeSignatureApprovedHashAsync(
     SafeSignatureApprovedHashMixin, SafeSignatureAsync
 ):
+    __slots__ = ()
+
     async def is_valid(
         self,
         web3: Optional[AsyncWeb3] = None,
@@ -826,6 +1136,8 @@ class SafeSignatureApprovedHashAsync(
 
 
 class SafeSignatureEthSignAsync(SafeSignatureEthSignMixin, SafeSignatureAsync):
+    __slots__ = ()
+
     async def is_valid(
         self,
         web3: Optional[AsyncWeb3] = None,
@@ -835,6 +1147,8 @@ class SafeSignatureEthSignAsync(SafeSignatureEthSignMixin, SafeSignatureAsync):
 
 
 class SafeSignatureEOAAsync(SafeSignatureEOAMixin, SafeSignatureAsync):
+    __slots__ = ()
+
     async def is_valid(
         self,
         web3: Optional[AsyncWeb3] = None,
@@ -844,6 +1158,8 @@ class SafeSignatureEOAAsync(SafeSignatureEOAMixin, SafeSignatureAsync):
 
 
 class SafeSignatureP256Async(SafeSignatureP256Mixin, SafeSignatureAsync):
+    __slots__ = ()
+
     async def is_valid(
         self,
         web3: Optional[AsyncWeb3] = None,
@@ -1,5 +1,5 @@
-from functools import cached_property
-from typing import Any, Dict, List, NoReturn, Optional, Tuple, Type
+from functools import cached_property, lru_cache
+from typing import Any, Dict, List, NoReturn, Optional, Sequence, Tuple, Type
 
 from eth_account import Account
 from eth_typing import ChecksumAddress
@@ -12,7 +12,6 @@ from web3.types import BlockIdentifier, Nonce, TxParams, Wei
 from safe_eth.eth import EthereumClient
 from safe_eth.eth.constants import NULL_ADDRESS
 from safe_eth.eth.contracts import get_safe_contract
-from safe_eth.eth.eip712 import eip712_encode
 from safe_eth.eth.ethereum_client import TxSpeed
 
 from ..eth.utils import fast_keccak
@@ -41,6 +40,102 @@ from .exceptions import (
 from .safe_signature import SafeSignature
 from .signatures import signature_to_bytes
 
+_DOMAIN_TYPE_HASH = fast_keccak(b"EIP712Domain(address verifyingContract)")
+_DOMAIN_WITH_CHAIN_ID_TYPE_HASH = fast_keccak(
+    b"EIP712Domain(uint256 chainId,address verifyingContract)"
+)
+_SAFE_TX_TYPE = (
+    "SafeTx(address to,uint256 value,bytes data,uint8 operation,uint256 safeTxGas,"
+    "uint256 {base_gas_key},uint256 gasPrice,address gasToken,address refundReceiver,uint256 nonce)"
+)
+_SAFE_TX_TYPE_HASH = fast_keccak(_SAFE_TX_TYPE.format(base_gas_key="baseGas").encode())
+_SAFE_TX_DATA_GAS_TYPE_HASH = fast_keccak(
+    _SAFE_TX_TYPE.format(base_gas_key="dataGas").encode()
+)
+# Changing any of these attributes changes the `safe_tx_hash`
+_SAFE_TX_HASH_ATTRIBUTES = frozenset(
+    (
+        "safe_address",
+        "to",
+        "value",
+        "data",
+        "operation",
+        "safe_tx_gas",
+        "base_gas",
+        "gas_price",
+        "gas_token",
+        "refund_receiver",
+        "safe_nonce",
+        "safe_version",
+        "chain_id",
+        "_safe_nonce",
+        "_safe_version",
+        "_chain_id",
+    )
+)
+
+
+@lru_cache(maxsize=64)
+def _get_safe_tx_type_hashes(safe_version: str) -> Tuple[bytes, bytes, bool]:
+    """
+    :param safe_version:
+    :return: Tuple with the ``EIP712Domain`` type hash, ``SafeTx`` type hash and ``True`` if
+        ``chainId`` is part of the domain for the provided Safe version
+    """
+    version = Version(safe_version)
+    # Enable chainId from v1.3.0 onwards
+    with_chain_id = version >= Version("1.3.0")
+    return (
+        _DOMAIN_WITH_CHAIN_ID_TYPE_HASH if with_chain_id else _DOMAIN_TYPE_HASH,
+        # Safes >= 1.0.0 Renamed `baseGas` to `dataGas`
+        (
+            _SAFE_TX_TYPE_HASH
+            if version >= Version("1.0.0")
+            else _SAFE_TX_DATA_GAS_TYPE_HASH
+        ),
+        with_chain_id,
+    )
+
+
+def _encode_address(address: str) -> bytes:
+    return HexBytes(address).rjust(32, b"\0")
+
+
+@lru_cache(maxsize=1024)
+def _get_domain_separator(
+    domain_type_hash: bytes, chain_id: Optional[int], safe_address: str
+) -> bytes:
+    """
+    :return: EIP712 domain separator for the Safe, ``chain_id`` is only used if not ``None``
+    """
+    chain_id_encoded = b"" if chain_id is None else chain_id.to_bytes(32, "big")
+    return fast_keccak(
+        domain_type_hash + chain_id_encoded + _encode_address(safe_address)
+    )
+
+
+def compute_safe_tx_hashes(safe_txs: Sequence["SafeTx"]) -> List[HexBytes]:
+    """
+    Calculate the ``safe_tx_hash`` for multiple transactions. Domain separators are only calculated
+    once for every Safe, and the ``chainId`` is only retrieved once for every ``EthereumClient``
+    if not provided
+
+    :param safe_txs:
+    :return: ``safe_tx_hash`` for every transaction
+    """
+    chain_ids: Dict[int, int] = {}
+    for safe_tx in safe_txs:
+        if (
+            "chain_id" not in safe_tx.__dict__
+            and safe_tx._chain_id is None
+            and _get_safe_tx_type_hashes(safe_tx.safe_version)[2]
+        ):
+            client_id = id(safe_tx.ethereum_client)
+            if client_id not in chain_ids:
+                chain_ids[client_id] = safe_tx.ethereum_client.get_chain_id()
+            safe_tx._chain_id = chain_ids[client_id]
+    return [safe_tx.safe_tx_hash for safe_tx in safe_txs]
+
 
 class SafeTx:
     def __init__(
@@ -100,6 +195,13 @@ class SafeTx:
         self.tx: Optional[TxParams] = None  # If executed, `tx` is set
         self.tx_hash: Optional[bytes] = None  # If executed, `tx_hash` is set
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SAFE_TX_HASH_ATTRIBUTES:
+            # Invalidate memoized hash
+            self.__dict__.pop("_safe_tx_hash_preimage", None)
+            self.__dict__.pop("_safe_tx_hash", None)
+
     def __str__(self):
         return (
             f"SafeTx - safe={self.safe_address} - to={self.to} - value={self.value} - data={to_0x_hex_str(self.data)} - "
@@ -189,11 +291,53 @@ class SafeTx:
 
     @property
     def safe_tx_hash_preimage(self) -> HexBytes:
-        return HexBytes(b"".join(eip712_encode(self.eip712_structured_data)))
+        """
+        :return: EIP712 encoded data for the transaction, same as ``eip712_encode`` for
+            ``eip712_structured_data`` but using precomputed type hashes. It's memoized until
+            any of the transaction fields changes
+        """
+        if "_safe_tx_hash_preimage" not in self.__dict__:
+            domain_type_hash, safe_tx_type_hash, with_chain_id = (
+                _get_safe_tx_type_hashes(self.safe_version)
+            )
+            domain_separator = _get_domain_separator(
+                domain_type_hash,
+                self.chain_id if with_chain_id else None,
+                self.safe_address,
+            )
+            # Fields are public and can be reassigned with not normalized values
+            struct_hash = fast_keccak(
+                b"".join(
+                    (
+                        safe_tx_type_hash,
+                        _encode_address(self.to),
+                        int(self.value).to_bytes(32, "big"),
+                        fast_keccak(HexBytes(self.data)),
+                        int(self.operation).to_bytes(32, "big"),
+                        int(self.safe_tx_gas).to_bytes(32, "big"),
+                        int(self.base_gas).to_bytes(32, "big"),
+                        int(self.gas_price).to_bytes(32, "big"),
+                        _encode_address(self.gas_token),
+                        _encode_address(self.refund_receiver),
+                        int(self.safe_nonce).to_bytes(32, "big"),
+                    )
+                )
+            )
+            self.__dict__["_safe_tx_hash_preimage"] = HexBytes(
+                b"\x19\x01" + domain_separator + struct_hash
+            )
+        return self.__dict__["_safe_tx_hash_preimage"]
 
     @property
     def safe_tx_hash(self) -> HexBytes:
-        return HexBytes(fast_keccak(self.safe_tx_hash_preimage))
+        """
+        :return: Hash of the transaction, memoized until any of the transaction fields changes
+        """
+        if "_safe_tx_hash" not in self.__dict__:
+            self.__dict__["_safe_tx_hash"] = HexBytes(
+                fast_keccak(self.safe_tx_hash_preimage)
+            )
+        return self.__dict__["_safe_tx_hash"]
 
     @property
     def signers(self) -> List[str]:
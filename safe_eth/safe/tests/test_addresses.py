@@ -1,3 +1,4 @@
+import json
 from unittest import TestCase
 
 from packaging.version import Version
@@ -5,12 +6,23 @@ from packaging.version import Version
 from safe_eth.eth import EthereumNetwork
 from safe_eth.eth.utils import fast_is_checksum_address
 from safe_eth.safe.addresses import (
+    ADDRESSES_FILE,
     MASTER_COPIES,
     PROXY_FACTORIES,
+    dump_addresses_json,
     get_default_addresses_with_version,
+    get_master_copy,
+    get_proxy_factory,
     safe_proxy_factory_contract_names,
     safe_singleton_contract_names,
 )
+from safe_eth.safe.safe_deployments import (
+    default_safe_deployments,
+    get_safe_deployment_addresses,
+    get_safe_deployment_contract_names,
+    get_safe_deployment_versions,
+    safe_deployments,
+)
 
 
 class TestAddresses(TestCase):
@@ -35,6 +47,111 @@ class TestAddresses(TestCase):
                 self.assertTrue(fast_is_checksum_address(proxy_factory[0]))
                 self.assertGreaterEqual(proxy_factory[1], 0)
 
+    def test_addresses_json(self):
+        """
+        ``addresses.json`` is edited by hand and by the add-address automation, so check every address
+        is stored checksummed and the file keeps the format of ``dump_addresses_json``
+        """
+        with open(ADDRESSES_FILE, encoding="utf-8") as f:
+            content = f.read()
+        addresses = json.loads(content)
+        self.assertEqual(list(addresses), ["master_copies", "proxy_factories"])
+        for table_name, networks in addresses.items():
+            for network_name, entries in networks.items():
+                self.assertIsInstance(EthereumNetwork[network_name], EthereumNetwork)
+                for entry in entries:
+                    with self.subTest(table_name=table_name, entry=entry):
+                        self.assertTrue(fast_is_checksum_address(entry[0]))
+        self.assertEqual(dump_addresses_json(addresses), content)
+
+    def test_network_addresses(self):
+        self.assertIn(EthereumNetwork.MAINNET, MASTER_COPIES)
+        self.assertNotIn(1, MASTER_COPIES)
+        self.assertIsNone(MASTER_COPIES.get(1))
+        self.assertEqual(len(MASTER_COPIES), len(list(MASTER_COPIES)))
+        # Entries are only built once
+        self.assertIs(
+            MASTER_COPIES[EthereumNetwork.MAINNET],
+            MASTER_COPIES[EthereumNetwork.MAINNET],
+        )
+
+    def test_get_master_copy(self):
+        self.assertEqual(
+            get_master_copy(
+                EthereumNetwork.MAINNET, "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"
+            ),
+            ("0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552", 12504268, "1.3.0"),
+        )
+        self.assertIsNone(
+            get_master_copy(
+                EthereumNetwork.MAINNET, "0x0000000000000000000000000000000000000000"
+            )
+        )
+        self.assertIsNone(
+            get_master_copy(
+                EthereumNetwork.UNKNOWN, "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"
+            )
+        )
+        for ethereum_network, master_copies in MASTER_COPIES.items():
+            for master_copy in master_copies:
+                self.assertEqual(
+                    get_master_copy(ethereum_network, master_copy[0])[0],
+                    master_copy[0],
+                )
+
+    def test_get_proxy_factory(self):
+        self.assertEqual(
+            get_proxy_factory(
+                EthereumNetwork.MAINNET, "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2"
+            ),
+            ("0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2", 12504126),
+        )
+        self.assertIsNone(
+            get_proxy_factory(
+                EthereumNetwork.MAINNET, "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552"
+            )
+        )
+
+    def test_safe_deployments(self):
+        versions = get_safe_deployment_versions()
+        self.assertEqual(versions[:3], ["1.0.0", "1.1.1", "1.2.0"])
+        self.assertIn("GnosisSafeL2", get_safe_deployment_contract_names("1.3.0"))
+        self.assertEqual(get_safe_deployment_contract_names("0.0.1"), [])
+        self.assertEqual(
+            get_safe_deployment_addresses("GnosisSafeL2", "1.3.0"),
+            (
+                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
+                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
+                "0x1727c2c531cf966f902E5927b98490fDFb3b2b70",
+            ),
+        )
+        self.assertEqual(
+            get_safe_deployment_addresses("GnosisSafeL2", "1.3.0", 1),
+            (
+                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E",
+                "0xfb1bffC9d739B8D520DaF37dF666da4C687191EA",
+            ),
+        )
+        self.assertEqual(get_safe_deployment_addresses("GnosisSafeL2", "1.0.0"), ())
+        self.assertEqual(
+            get_safe_deployment_addresses("GnosisSafeL2", "1.3.0", 123456789), ()
+        )
+
+        # Legacy dictionaries
+        self.assertEqual(list(default_safe_deployments), versions)
+        self.assertEqual(
+            safe_deployments["1.3.0"]["GnosisSafeL2"]["1"],
+            list(get_safe_deployment_addresses("GnosisSafeL2", "1.3.0", 1)),
+        )
+        for version, contracts in default_safe_deployments.items():
+            for contract_name, addresses in contracts.items():
+                for address in addresses:
+                    self.assertTrue(fast_is_checksum_address(address))
+                for chain_addresses in safe_deployments[version][
+                    contract_name
+                ].values():
+                    self.assertTrue(set(chain_addresses).issubset(addresses))
+
     def test_get_default_addresses_with_version(self):
         all_defaults_with_version = get_default_addresses_with_version()
         self.assertEqual(len(all_defaults_with_version), 73)
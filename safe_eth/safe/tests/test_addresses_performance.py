@@ -0,0 +1,119 @@
+import importlib.util
+import sys
+
+import pytest
+
+import safe_eth.safe.addresses
+import safe_eth.safe.safe_deployments
+from safe_eth.eth import EthereumNetwork
+from safe_eth.safe.addresses import (
+    MASTER_COPIES,
+    get_default_addresses_with_version,
+    get_master_copy,
+    safe_singleton_contract_names,
+)
+from safe_eth.safe.safe_deployments_index import get_singleton_deployment
+
+# Last master copy for mainnet, so linear search needs to go through all of them
+MAINNET_MASTER_COPY = MASTER_COPIES[EthereumNetwork.MAINNET][-1][0]
+
+
+def _load_module(module):
+    """
+    Executes ``module`` again in a new module object, so import time can be measured without
+    touching the already imported module. Data caches of the new module are empty
+    """
+    spec = importlib.util.spec_from_file_location(module.__name__, module.__file__)
+    new_module = importlib.util.module_from_spec(spec)
+    sys.modules[module.__name__] = new_module
+    try:
+        spec.loader.exec_module(new_module)
+    finally:
+        sys.modules[module.__name__] = module
+    return new_module
+
+
+# --- 1. Import Benchmarks ---
+#
+def test_addresses_module_import(benchmark):
+    benchmark.group = "Import"
+    benchmark(_load_module, safe_eth.safe.addresses)
+
+
+def test_safe_deployments_module_import(benchmark):
+    benchmark.group = "Import"
+    benchmark(_load_module, safe_eth.safe.safe_deployments)
+
+
+def test_addresses_module_import_and_lookup(benchmark):
+    """
+    Import and first lookup. Lookups use the Safe deployments index, that is shared with the
+    already imported module, so it's not built again
+    """
+    benchmark.group = "Import"
+
+    def import_and_lookup():
+        module = _load_module(safe_eth.safe.addresses)
+        return module.get_master_copy(EthereumNetwork.MAINNET, MAINNET_MASTER_COPY)
+
+    assert benchmark(import_and_lookup)
+
+
+def test_safe_deployments_module_import_and_lookup(benchmark):
+    benchmark.group = "Import"
+
+    def import_and_lookup():
+        module = _load_module(safe_eth.safe.safe_deployments)
+        return module.get_safe_deployment_addresses("SafeL2", "1.4.1", 1)
+
+    assert benchmark(import_and_lookup)
+
+
+# --- 2. Lookup Benchmarks ---
+#
+@pytest.mark.parametrize("network", [EthereumNetwork.MAINNET])
+def test_master_copy_linear_search(benchmark, network):
+    benchmark.group = "Master-copy-lookup"
+
+    def linear_search():
+        for master_copy in MASTER_COPIES[network]:
+            if master_copy[0] == MAINNET_MASTER_COPY:
+                return master_copy
+
+    assert benchmark(linear_search)
+
+
+@pytest.mark.parametrize("network", [EthereumNetwork.MAINNET])
+def test_master_copy_indexed(benchmark, network):
+    benchmark.group = "Master-copy-lookup"
+    assert benchmark(get_master_copy, network, MAINNET_MASTER_COPY)
+
+
+# --- 3. Singleton Classification Benchmarks ---
+#
+# Last default singleton, so linear search needs to go through all of them
+DEFAULT_SINGLETON = get_default_addresses_with_version(safe_singleton_contract_names)[
+    -1
+][0]
+
+
+def test_classify_singleton_default_addresses(benchmark):
+    benchmark.group = "Classify-singleton"
+
+    def classify():
+        for address, version in get_default_addresses_with_version(
+            safe_singleton_contract_names
+        ):
+            if address == DEFAULT_SINGLETON:
+                return version
+
+    assert benchmark(classify)
+
+
+def test_classify_singleton_index(benchmark):
+    benchmark.group = "Classify-singleton"
+
+    def classify():
+        return get_singleton_deployment(DEFAULT_SINGLETON).extended_version
+
+    assert benchmark(classify)
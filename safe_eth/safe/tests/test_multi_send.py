@@ -7,6 +7,7 @@ from eth_account import Account
 from hexbytes import HexBytes
 
 from safe_eth.eth import EthereumClient
+from safe_eth.util.util import to_0x_hex_str
 
 from ..multi_send import MultiSend, MultiSendOperation, MultiSendTx
 from .safe_test_case import SafeTestCaseMixin
@@ -80,6 +81,54 @@ class TestMultiSend(SafeTestCaseMixin, TestCase):
             self.assertEqual(multi_send_tx.value, value)
             self.assertEqual(multi_send_tx.data, data)
 
+    def test_multi_send_iter_from_bytes(self):
+        self.assertEqual(list(MultiSend.iter_from_bytes(b"")), [])
+        multi_send_txs = [
+            MultiSendTx(
+                MultiSendOperation(i % 2),
+                Account.create().address,
+                876 * i,
+                HexBytes("0x123456789a") * i,
+            )
+            for i in range(3)
+        ]
+        encoded_multisend_txs = MultiSend.encode_txs(multi_send_txs)
+        self.assertEqual(
+            encoded_multisend_txs,
+            b"".join(multi_send_tx.encoded_data for multi_send_tx in multi_send_txs),
+        )
+
+        buffer = memoryview(encoded_multisend_txs)
+        multisend_tx_views = MultiSend.iter_from_bytes(buffer)
+        self.assertNotIsInstance(multisend_tx_views, list)
+        multisend_tx_views = list(multisend_tx_views)
+        self.assertEqual(len(multisend_tx_views), 3)
+        for multisend_tx_view, multi_send_tx in zip(multisend_tx_views, multi_send_txs):
+            self.assertEqual(multisend_tx_view.operation, multi_send_tx.operation)
+            self.assertEqual(multisend_tx_view.to, multi_send_tx.to)
+            self.assertEqual(multisend_tx_view.value, multi_send_tx.value)
+            self.assertFalse(multisend_tx_view.old_encoding)
+            # Data is not copied
+            self.assertIsInstance(multisend_tx_view.data, memoryview)
+            self.assertIs(multisend_tx_view.data.obj, encoded_multisend_txs)
+            self.assertEqual(multisend_tx_view.data, multi_send_tx.data)
+            self.assertEqual(multisend_tx_view.to_multisend_tx(), multi_send_tx)
+
+        # Hex strings are supported
+        self.assertEqual(
+            [
+                multisend_tx_view.to_multisend_tx()
+                for multisend_tx_view in MultiSend.iter_from_bytes(
+                    to_0x_hex_str(encoded_multisend_txs)
+                )
+            ],
+            multi_send_txs,
+        )
+
+        # Truncated data
+        with self.assertRaises(ValueError):
+            list(MultiSend.iter_from_bytes(buffer[:-1]))
+
     def test_multisend_parse_real_transaction(self):
         # Change Safe contract master copy and set fallback manager multisend transaction
         safe_contract_address = "0x5B9ea52Aaa931D4EEf74C8aEaf0Fe759434FeD74"
@@ -184,3 +233,12 @@ class TestMultiSend(SafeTestCaseMixin, TestCase):
                 self.assertEqual(
                     MultiSend.from_transaction_data(safe_multisend_data), multisend_txs
                 )
+                self.assertEqual(
+                    safe_multisend_data,
+                    HexBytes(
+                        multi_send.get_contract().encode_abi(
+                            "multiSend",
+                            [MultiSend.encode_txs(multisend_txs)],
+                        )
+                    ),
+                )
@@ -7,6 +7,7 @@ from eth_account import Account
 
 from safe_eth.eth import EthereumClient
 from safe_eth.eth.contracts import (
+    get_paying_proxy_deployed_bytecode,
     get_proxy_1_0_0_deployed_bytecode,
     get_proxy_1_1_1_deployed_bytecode,
     get_proxy_1_3_0_deployed_bytecode,
@@ -24,6 +25,7 @@ from safe_eth.safe.proxy_factory import (
     ProxyFactoryV130,
     ProxyFactoryV141,
     ProxyFactoryV150,
+    classify_proxy_code,
 )
 from safe_eth.safe.tests.safe_test_case import SafeTestCaseMixin
 from safe_eth.safe.tests.utils import generate_salt_nonce
@@ -95,6 +97,49 @@ class TestProxyFactory(SafeTestCaseMixin, TestCase):
                     )
                 )
 
+    def test_check_proxy_codes(self):
+        self.assertEqual(self.proxy_factory.check_proxy_codes([]), [])
+        proxy_contract_address = self.deploy_test_safe().address
+        self.assertEqual(
+            self.proxy_factory.check_proxy_codes(
+                [
+                    proxy_contract_address,
+                    self.safe_contract.address,
+                    Account.create().address,
+                    proxy_contract_address,
+                ]
+            ),
+            [True, False, False, True],
+        )
+
+    def test_classify_proxy_code(self):
+        self.assertEqual(classify_proxy_code(b""), ())
+        self.assertEqual(classify_proxy_code(b"\x60\x80"), ())
+        # Runtime code is the same from v1.1.1 to v1.4.1
+        same_proxies = (
+            "Proxy 1.4.1",
+            "Proxy 1.3.0",
+            "Proxy 1.1.1",
+            "Proxy 1.1.1 mainnet",
+        )
+        for get_proxy_deployed_bytecode_fn, proxy_names in (
+            (get_proxy_1_0_0_deployed_bytecode, ("Proxy 1.0.0",)),
+            (get_proxy_1_1_1_deployed_bytecode, same_proxies),
+            (get_proxy_1_3_0_deployed_bytecode, same_proxies),
+            (get_proxy_1_4_1_deployed_bytecode, same_proxies),
+            (get_proxy_1_5_0_deployed_bytecode, ("Proxy 1.5.0",)),
+            (get_paying_proxy_deployed_bytecode, ("PayingProxy",)),
+        ):
+            with self.subTest(proxy_names=proxy_names):
+                proxy_code = get_proxy_deployed_bytecode_fn()
+                self.assertEqual(classify_proxy_code(proxy_code), proxy_names)
+                self.assertTrue(self.proxy_factory.is_proxy_code(proxy_code))
+                # Metadata is ignored
+                self.assertEqual(
+                    classify_proxy_code(proxy_code[:-10] + bytes(8) + proxy_code[-2:]),
+                    proxy_names,
+                )
+
     def test_check_proxy_code_mainnet(self):
         mainnet_node = just_test_if_mainnet_node()
         ethereum_client = EthereumClient(mainnet_node)
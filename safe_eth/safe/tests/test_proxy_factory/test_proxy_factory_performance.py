@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from safe_eth.eth.contracts import (
+    get_paying_proxy_deployed_bytecode,
+    get_proxy_1_0_0_deployed_bytecode,
+    get_proxy_1_1_1_deployed_bytecode,
+    get_proxy_1_1_1_mainnet_deployed_bytecode,
+    get_proxy_1_3_0_deployed_bytecode,
+    get_proxy_1_4_1_deployed_bytecode,
+    get_proxy_1_5_0_deployed_bytecode,
+)
+from safe_eth.eth.utils import compare_byte_code
+from safe_eth.safe.proxy_factory import classify_proxy_code
+
+PROXY_CODE_FNS = (
+    get_proxy_1_5_0_deployed_bytecode,
+    get_proxy_1_4_1_deployed_bytecode,
+    get_proxy_1_3_0_deployed_bytecode,
+    get_proxy_1_1_1_deployed_bytecode,
+    get_proxy_1_1_1_mainnet_deployed_bytecode,
+    get_proxy_1_0_0_deployed_bytecode,
+    get_paying_proxy_deployed_bytecode,
+)
+
+# Number of codes checked on every round
+NUMBER_CODES = 1_000
+
+
+@pytest.fixture(scope="module")
+def codes():
+    """
+    Codes to check: known proxies, with the oldest ones (worst case for the linear search)
+    more frequent, and not proxy contracts
+    """
+    proxy_codes = [proxy_code_fn() for proxy_code_fn in PROXY_CODE_FNS]
+    return [
+        (
+            proxy_codes[-(i % len(proxy_codes)) - 1]
+            if i % 4
+            else os.urandom(1_000) + b"\xa1\x00\x03"
+        )
+        for i in range(NUMBER_CODES)
+    ]
+
+
+def test_check_proxy_codes_compare_byte_code(benchmark, codes):
+    benchmark.group = "Check-proxy-codes"
+
+    def check_proxy_codes():
+        return [
+            any(
+                compare_byte_code(code, proxy_code_fn())
+                for proxy_code_fn in PROXY_CODE_FNS
+            )
+            for code in codes
+        ]
+
+    benchmark(check_proxy_codes)
+
+
+def test_check_proxy_codes_hash_index(benchmark, codes):
+    benchmark.group = "Check-proxy-codes"
+
+    def check_proxy_codes():
+        return [bool(classify_proxy_code(code)) for code in codes]
+
+    benchmark(check_proxy_codes)
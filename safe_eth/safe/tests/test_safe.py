@@ -1,14 +1,21 @@
 import logging
+from typing import Any, Dict, List, Sequence, Set
+from unittest import mock
 
 from django.test import TestCase
 
+import eth_abi
 from eth_account import Account
 from hexbytes import HexBytes
 from web3.exceptions import Web3RPCError
 
-from safe_eth.eth.constants import GAS_CALL_DATA_BYTE, NULL_ADDRESS
+from safe_eth.eth import EthereumClient
+from safe_eth.eth.constants import GAS_CALL_DATA_BYTE, NULL_ADDRESS, SENTINEL_ADDRESS
 from safe_eth.eth.contracts import get_safe_contract, get_sign_message_lib_contract
-from safe_eth.eth.utils import fast_keccak_text, get_empty_tx_params
+from safe_eth.eth.ethereum_client import BatchCallManager
+from safe_eth.eth.proxies import MinimalProxy
+from safe_eth.eth.tests.test_ethereum_client import UNREACHABLE_NODE_URL
+from safe_eth.eth.utils import fast_keccak, fast_keccak_text, get_empty_tx_params
 
 from ..enums import SafeOperationEnum
 from ..exceptions import (
@@ -887,3 +894,464 @@ class TestSafe(SafeTestCaseMixin, TestCase):
 
         balance = self.w3.eth.get_balance(to)
         self.assertEqual(value, balance)
+
+
+class TestSafeRetrieveAllInfoBatch(TestCase):
+    """Safe info retrieved with JSON RPC batch requests, no node needed for these tests."""
+
+    master_copy = Account.create().address
+    fallback_handler = Account.create().address
+    owners = [Account.create().address for _ in range(2)]
+    module = Account.create().address
+    safe_v1_3_0_address = Account.create().address
+    safe_v1_0_0_address = Account.create().address
+
+    @classmethod
+    def _get_node_state(cls) -> Dict[str, Dict[Any, bytes]]:
+        """
+        :return: Storage slots and call return data for every address
+        """
+
+        def encode_address(address: str) -> bytes:
+            return eth_abi.encode(["address"], [address])
+
+        def selector(fn_signature: bytes) -> str:
+            return "0x" + fast_keccak(fn_signature)[:4].hex()
+
+        calls = {
+            selector(b"nonce()"): eth_abi.encode(["uint256"], [5]),
+            selector(b"getOwners()"): eth_abi.encode(["address[]"], [cls.owners]),
+            selector(b"getThreshold()"): eth_abi.encode(["uint256"], [2]),
+        }
+        return {
+            cls.safe_v1_3_0_address: {
+                hex(0): encode_address(cls.master_copy),
+                hex(Safe.FALLBACK_HANDLER_STORAGE_SLOT): encode_address(
+                    cls.fallback_handler
+                ),
+                selector(b"getModulesPaginated(address,uint256)"): eth_abi.encode(
+                    ["address[]", "address"], [[cls.module], SENTINEL_ADDRESS]
+                ),
+                selector(b"VERSION()"): eth_abi.encode(["string"], ["1.3.0"]),
+                **calls,
+            },
+            cls.safe_v1_0_0_address: {
+                hex(0): encode_address(cls.master_copy),
+                # Fallback function accepts any data
+                selector(b"getModulesPaginated(address,uint256)"): b"",
+                selector(b"getModules()"): eth_abi.encode(
+                    ["address[]"], [[cls.module]]
+                ),
+                selector(b"VERSION()"): eth_abi.encode(["string"], ["1.0.0"]),
+                **calls,
+            },
+        }
+
+    @classmethod
+    def batch_call_chunk(cls, chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Answer ``eth_getStorageAt`` and ``eth_call`` requests using ``_get_node_state``
+        """
+        node_state = cls._get_node_state()
+        responses = []
+        for query in reversed(chunk):  # Some nodes answer out of order
+            if query["method"] == "eth_getStorageAt":
+                address, slot, _ = query["params"]
+                result = node_state.get(address, {}).get(slot, bytes(32))
+            else:
+                call_params, _ = query["params"]
+                result = node_state.get(call_params["to"], {}).get(
+                    call_params["data"][:10], b""
+                )
+            responses.append(
+                {
+                    "jsonrpc": "2.0",
+                    "id": query["id"],
+                    "result": HexBytes(result).to_0x_hex(),
+                }
+            )
+        return responses
+
+    def test_retrieve_all_info(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        safe = Safe.from_version("1.3.0", self.safe_v1_3_0_address, ethereum_client)
+        with mock.patch.object(
+            BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+        ) as batch_call_chunk_mock:
+            safe_info = safe.retrieve_all_info(block_identifier=15)
+        # Only 1 request to the node
+        self.assertEqual(batch_call_chunk_mock.call_count, 1)
+        self.assertEqual(
+            {query["params"][-1] for query in batch_call_chunk_mock.call_args.args[0]},
+            {"0xf"},
+        )
+        self.assertEqual(safe_info.address, self.safe_v1_3_0_address)
+        self.assertEqual(safe_info.master_copy, self.master_copy)
+        self.assertEqual(safe_info.fallback_handler, self.fallback_handler)
+        self.assertEqual(safe_info.guard, NULL_ADDRESS)
+        self.assertEqual(safe_info.module_guard, NULL_ADDRESS)
+        self.assertEqual(safe_info.modules, [self.module])
+        self.assertEqual(safe_info.nonce, 5)
+        self.assertEqual(safe_info.owners, self.owners)
+        self.assertEqual(safe_info.threshold, 2)
+        self.assertEqual(safe_info.version, "1.3.0")
+
+        invalid_safe = Safe.from_version(
+            "1.3.0", Account.create().address, ethereum_client
+        )
+        with (
+            mock.patch.object(
+                BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+            ),
+            mock.patch.object(
+                MinimalProxy, "get_implementation_address", return_value=NULL_ADDRESS
+            ),
+        ):
+            with self.assertRaisesMessage(
+                CannotRetrieveSafeInfoException, invalid_safe.address
+            ):
+                invalid_safe.retrieve_all_info()
+
+    def test_retrieve_all_info_many(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        invalid_address = Account.create().address
+        addresses = [
+            self.safe_v1_3_0_address,
+            invalid_address,
+            self.safe_v1_0_0_address,
+        ]
+        self.assertEqual(Safe.retrieve_all_info_many([], ethereum_client), [])
+        with (
+            mock.patch.object(
+                BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+            ) as batch_call_chunk_mock,
+            mock.patch.object(
+                MinimalProxy, "get_implementation_address", return_value=NULL_ADDRESS
+            ),
+            mock.patch.object(
+                EthereumClient,
+                "current_block_number",
+                new_callable=mock.PropertyMock,
+                return_value=20,
+            ),
+        ):
+            safe_infos = Safe.retrieve_all_info_many(
+                addresses, ethereum_client, batch_size=10
+            )
+        # 3 Safes with 11 queries each in batches of 10 + `getModules` for the v1.0.0 Safe
+        self.assertEqual(batch_call_chunk_mock.call_count, 5)
+        self.assertEqual(
+            {
+                query["params"][-1]
+                for call in batch_call_chunk_mock.call_args_list
+                for query in call.args[0]
+            },
+            {"0x14"},
+        )
+        safe_info_v1_3_0, invalid_safe_info, safe_info_v1_0_0 = safe_infos
+        self.assertIsNone(invalid_safe_info)
+        for safe_info in (safe_info_v1_3_0, safe_info_v1_0_0):
+            self.assertEqual(safe_info.master_copy, self.master_copy)
+            self.assertEqual(safe_info.modules, [self.module])
+            self.assertEqual(safe_info.owners, self.owners)
+            self.assertEqual(safe_info.threshold, 2)
+            self.assertEqual(safe_info.nonce, 5)
+        self.assertEqual(safe_info_v1_3_0.address, self.safe_v1_3_0_address)
+        self.assertEqual(safe_info_v1_3_0.version, "1.3.0")
+        self.assertEqual(safe_info_v1_3_0.fallback_handler, self.fallback_handler)
+        self.assertEqual(safe_info_v1_0_0.address, self.safe_v1_0_0_address)
+        self.assertEqual(safe_info_v1_0_0.version, "1.0.0")
+        self.assertEqual(safe_info_v1_0_0.fallback_handler, NULL_ADDRESS)
+
+
+class TestSafeEstimateTxGasBatch(TestCase):
+    """Gas estimation with JSON RPC batch requests, no node needed for these tests."""
+
+    required_gas = (
+        150_000  # Gas required by the Safe tx, estimation is less (63/64 problem)
+    )
+    estimated_gas = 100_000
+    block_gas_limit = 30_000_000
+    threshold = 2
+    nonce = 5
+    web3_estimated_gas = 50_000
+    # Safe requests (estimations, threshold, nonce) for addresses in this set fail
+    failing_addresses: Set[str] = set()
+    # `eth_estimateGas` to addresses in this set fail
+    web3_failing_addresses: Set[str] = set()
+    get_threshold_data = "0x" + fast_keccak_text("getThreshold()")[:4].hex()
+    nonce_data = "0x" + fast_keccak_text("nonce()")[:4].hex()
+    simulate_data = "0x" + fast_keccak_text("simulate(address,bytes)")[:4].hex()
+
+    def batch_call_chunk(self, chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Answer ``eth_call`` gas estimations (``requiredTxGas`` or ``SimulateTxAccessor``),
+        with a gas limit they only succeed if it's enough
+        """
+        responses = []
+        error_response = {"code": -32000, "message": "execution reverted"}
+        for query in chunk:
+            if query["method"] == "eth_getBlockByNumber":
+                result: Any = {"gasLimit": hex(self.block_gas_limit)}
+                responses.append(
+                    {"jsonrpc": "2.0", "id": query["id"], "result": result}
+                )
+                continue
+            tx_params = query["params"][0]
+            if query["method"] == "eth_estimateGas":
+                responses.append(
+                    {"jsonrpc": "2.0", "id": query["id"], "error": error_response}
+                    if tx_params["to"] in self.web3_failing_addresses
+                    else {
+                        "jsonrpc": "2.0",
+                        "id": query["id"],
+                        "result": hex(self.web3_estimated_gas),
+                    }
+                )
+                continue
+            failing = any(
+                address.lower()[2:] in tx_params["data"].lower()
+                or address == tx_params["to"]
+                for address in self.failing_addresses
+            )
+            if tx_params["data"] in (self.get_threshold_data, self.nonce_data):
+                value = (
+                    self.threshold
+                    if tx_params["data"] == self.get_threshold_data
+                    else self.nonce
+                )
+                responses.append(
+                    {"jsonrpc": "2.0", "id": query["id"], "error": error_response}
+                    if failing
+                    else {
+                        "jsonrpc": "2.0",
+                        "id": query["id"],
+                        "result": HexBytes(
+                            eth_abi.encode(["uint256"], [value])
+                        ).to_0x_hex(),
+                    }
+                )
+                continue
+            if failing:
+                responses.append(
+                    {"jsonrpc": "2.0", "id": query["id"], "error": error_response}
+                )
+                continue
+            if (
+                "gas" in tx_params
+                and int(tx_params["gas"], 16) - 32_000 < self.required_gas
+            ):
+                responses.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": query["id"],
+                        "error": {"code": -32000, "message": "out of gas"},
+                    }
+                )
+                continue
+            if tx_params["data"].startswith(self.simulate_data):
+                result = HexBytes(
+                    eth_abi.encode(
+                        ["bytes"],
+                        [
+                            eth_abi.encode(
+                                ["uint256", "bool", "bytes"],
+                                [self.estimated_gas, True, b""],
+                            )
+                        ],
+                    )
+                ).to_0x_hex()
+                responses.append(
+                    {"jsonrpc": "2.0", "id": query["id"], "result": result}
+                )
+            else:
+                revert_data = HexBytes(
+                    bytes.fromhex("08c379a0")
+                    + eth_abi.encode(
+                        ["bytes"], [eth_abi.encode(["uint256"], [self.estimated_gas])]
+                    )[:64]
+                    + eth_abi.encode(["uint256"], [self.estimated_gas])
+                ).to_0x_hex()
+                responses.append(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": query["id"],
+                        "error": {
+                            "code": 3,
+                            "message": "execution reverted",
+                            "data": revert_data,
+                        },
+                    }
+                )
+        return responses
+
+    def test_estimate_tx_gas_by_trying(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        to = Account.create().address
+        for version in ("1.3.0", "1.5.0"):
+            with self.subTest(version=version):
+                safe = Safe.from_version(
+                    version, Account.create().address, ethereum_client
+                )
+                with mock.patch.object(
+                    BatchCallManager,
+                    "_batch_call_chunk",
+                    side_effect=self.batch_call_chunk,
+                ) as batch_call_chunk_mock:
+                    safe_tx_gas = safe.estimate_tx_gas_by_trying(to, 0, b"", 0)
+                # Estimation + estimated gas limit + increasing gas limits + refinement
+                self.assertEqual(batch_call_chunk_mock.call_count, 4)
+                self.assertGreaterEqual(safe_tx_gas, self.required_gas)
+                self.assertLessEqual(
+                    safe_tx_gas,
+                    self.required_gas * (1 + Safe.ESTIMATE_TX_GAS_PRECISION),
+                )
+                # Less than the first successful increasing step (100_000 * 1.03 * 1.06 * 1.09 * 1.12 * 1.15)
+                self.assertLess(safe_tx_gas, 152_000)
+
+                # Estimation is enough
+                with (
+                    mock.patch.object(self, "required_gas", self.estimated_gas),
+                    mock.patch.object(
+                        BatchCallManager,
+                        "_batch_call_chunk",
+                        side_effect=self.batch_call_chunk,
+                    ) as batch_call_chunk_mock,
+                ):
+                    self.assertEqual(
+                        safe.estimate_tx_gas_by_trying(to, 0, b"", 0),
+                        self.estimated_gas,
+                    )
+                # Only the estimated gas limit is tried
+                self.assertEqual(batch_call_chunk_mock.call_count, 2)
+                self.assertEqual(
+                    len(batch_call_chunk_mock.call_args_list[1].args[0]), 1
+                )
+
+                # Tx cannot be executed with the block gas limit
+                with (
+                    mock.patch.object(self, "required_gas", self.block_gas_limit * 2),
+                    mock.patch.object(
+                        BatchCallManager,
+                        "_batch_call_chunk",
+                        side_effect=self.batch_call_chunk,
+                    ),
+                ):
+                    self.assertEqual(
+                        safe.estimate_tx_gas_by_trying(to, 0, b"", 0),
+                        self.block_gas_limit,
+                    )
+
+                with mock.patch.object(
+                    BatchCallManager,
+                    "_batch_call_chunk",
+                    side_effect=ValueError("Batch request error"),
+                ):
+                    with self.assertRaises(CannotEstimateGas):
+                        safe.estimate_tx_gas_by_trying(to, 0, b"", 0)
+
+    def test_estimate_many(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        safe_v130 = Safe.from_version(
+            "1.3.0", Account.create().address, ethereum_client
+        )
+        safe_v150 = Safe.from_version(
+            "1.5.0", Account.create().address, ethereum_client
+        )
+        not_a_safe = Safe.from_version(
+            "1.3.0", Account.create().address, ethereum_client
+        )
+        to = Account.create().address
+        not_estimable_with_safe_to = Account.create().address
+        not_estimable_to = Account.create().address
+        data = HexBytes("0xabcdef")
+
+        self.assertEqual(Safe.estimate_many([]), [])
+        txs = [
+            (safe_v130, to, 0, data, 0),
+            (safe_v130, not_estimable_with_safe_to, 1, data, 0),
+            (safe_v130, not_estimable_to, 0, data, 0),
+            (safe_v150, to, 0, data, 0),
+            (not_a_safe, to, 0, data, 0),
+        ]
+        with (
+            mock.patch.object(self, "required_gas", self.estimated_gas),
+            mock.patch.object(
+                self,
+                "failing_addresses",
+                {not_a_safe.address, not_estimable_with_safe_to, not_estimable_to},
+            ),
+            mock.patch.object(self, "web3_failing_addresses", {not_estimable_to}),
+            mock.patch.object(
+                BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+            ) as batch_call_chunk_mock,
+        ):
+            estimations = Safe.estimate_many(txs)
+
+        # Estimations + threshold and nonce, then check of the estimations
+        self.assertEqual(batch_call_chunk_mock.call_count, 2)
+        estimations_chunk = batch_call_chunk_mock.call_args_list[0].args[0]
+        # Threshold and nonce once per Safe
+        self.assertEqual(len(estimations_chunk), 3 * 2 + len(txs))
+        self.assertEqual(len(estimations), len(txs))
+
+        expected_safe_tx_gas = self.estimated_gas + 36_000
+        self.assertIsNone(estimations[0].error)
+        self.assertEqual(estimations[0].safe_tx_gas, expected_safe_tx_gas)
+        self.assertEqual(
+            estimations[0].base_gas,
+            safe_v130._calculate_tx_base_gas(
+                to,
+                0,
+                data,
+                0,
+                NULL_ADDRESS,
+                expected_safe_tx_gas,
+                self.threshold,
+                self.nonce,
+            ),
+        )
+        # `eth_estimateGas` is used if Safe cannot estimate
+        self.assertIsNone(estimations[1].error)
+        self.assertEqual(
+            estimations[1].safe_tx_gas, self.web3_estimated_gas + 36_000 + 23_000
+        )
+        self.assertGreater(estimations[1].base_gas, 0)
+        self.assertIsInstance(estimations[2].error, CannotEstimateGas)
+        self.assertIsNone(estimations[2].safe_tx_gas)
+        self.assertIsNone(estimations[2].base_gas)
+        self.assertIsNone(estimations[3].error)
+        self.assertEqual(estimations[3].safe_tx_gas, expected_safe_tx_gas)
+        self.assertEqual(estimations[3].base_gas, estimations[0].base_gas)
+        self.assertIsInstance(estimations[4].error, CannotEstimateGas)
+
+        # Estimation is not enough (63/64 problem), `estimate_tx_gas_by_trying` is used
+        with mock.patch.object(
+            BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+        ):
+            (estimation,) = Safe.estimate_many([(safe_v130, to, 0, data, 0)])
+        self.assertIsNone(estimation.error)
+        self.assertGreaterEqual(estimation.safe_tx_gas, self.required_gas + 36_000)
+        self.assertLess(estimation.safe_tx_gas, 152_000 + 36_000)
+
+        # `eth_estimateGas` is used if `estimate_tx_gas_by_trying` fails, as `estimate_tx_gas` does
+        with (
+            mock.patch.object(
+                BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+            ),
+            mock.patch.object(
+                Safe, "estimate_tx_gas_by_trying", side_effect=CannotEstimateGas
+            ),
+            mock.patch.object(Safe, "estimate_tx_gas_with_web3", return_value=50_000),
+        ):
+            (estimation,) = Safe.estimate_many([(safe_v130, to, 0, data, 0)])
+        self.assertIsNone(estimation.error)
+        self.assertEqual(estimation.safe_tx_gas, 50_000 + 36_000 + 23_000)
+
+        with mock.patch.object(
+            BatchCallManager,
+            "_batch_call_chunk",
+            side_effect=ValueError("Batch request error"),
+        ):
+            with self.assertRaises(CannotEstimateGas):
+                Safe.estimate_many(txs)
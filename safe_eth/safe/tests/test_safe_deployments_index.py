@@ -0,0 +1,191 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from safe_eth.eth import EthereumNetwork
+from safe_eth.safe import ProxyFactory, Safe
+from safe_eth.safe.addresses import (
+    MASTER_COPIES,
+    PROXY_FACTORIES,
+    get_master_copy,
+    get_proxy_factory,
+)
+from safe_eth.safe.safe_deployments import get_safe_deployment_addresses
+from safe_eth.safe.safe_deployments_index import (
+    get_proxy_factories,
+    get_proxy_factory_deployment,
+    get_singleton_deployment,
+    get_singletons,
+    lookup,
+)
+
+
+class TestSafeDeploymentsIndex(TestCase):
+    def test_lookup(self):
+        self.assertEqual(lookup("0x0000000000000000000000000000000000000000"), ())
+
+        (deployment,) = lookup("0x3E5c63644E683549055b9Be8653de26E0B4CD36E")
+        self.assertEqual(deployment.contract_name, "GnosisSafeL2")
+        self.assertEqual(deployment.version, "1.3.0")
+        self.assertEqual(deployment.extended_version, "1.3.0+L2")
+        self.assertTrue(deployment.is_l2)
+        self.assertTrue(deployment.is_singleton)
+        self.assertFalse(deployment.is_proxy_factory)
+        self.assertIn(EthereumNetwork.MAINNET.value, deployment.chains)
+        self.assertEqual(deployment.get_deployment_block(1), 12504423)
+        self.assertIsNone(deployment.get_deployment_block(-1))
+        with self.assertRaises(TypeError):
+            deployment.deployment_blocks[1] = 0
+
+        (deployment,) = lookup("0xA238CBeb142c10Ef7Ad8442C6D1f9E89e07e7761")
+        self.assertEqual(deployment.contract_name, "MultiSend")
+        self.assertFalse(deployment.is_singleton)
+        self.assertFalse(deployment.is_proxy_factory)
+
+        # Not included in safe-deployments, only in `MASTER_COPIES`
+        deployment = get_singleton_deployment(
+            "0x2CB0ebc503dE87CFD8f0eCEED8197bF7850184ae"
+        )
+        self.assertEqual(deployment.contract_name, "GnosisSafe")
+        self.assertEqual(deployment.version, "1.1.1+Circles")
+        self.assertEqual(deployment.chains, {EthereumNetwork.GNOSIS.value})
+
+    def test_lookup_master_copies_and_proxy_factories(self):
+        for ethereum_network, master_copies in MASTER_COPIES.items():
+            for address, block_number, version in master_copies:
+                deployment = get_singleton_deployment(address)
+                self.assertEqual(deployment.extended_version, version)
+                self.assertIn(ethereum_network.value, deployment.chains)
+                self.assertIsNotNone(
+                    deployment.get_deployment_block(ethereum_network.value)
+                )
+
+        for ethereum_network, proxy_factories in PROXY_FACTORIES.items():
+            for address, block_number in proxy_factories:
+                deployment = get_proxy_factory_deployment(address)
+                if deployment:
+                    self.assertIn(ethereum_network.value, deployment.chains)
+
+        for address in get_safe_deployment_addresses("SafeProxyFactory", "1.4.1"):
+            self.assertEqual(get_proxy_factory_deployment(address).version, "1.4.1")
+        self.assertIsNone(
+            get_proxy_factory_deployment("0x3E5c63644E683549055b9Be8653de26E0B4CD36E")
+        )
+
+    def test_lookup_duplicated_entries(self):
+        # Same address listed more than once for a network, earliest block must be kept
+        for ethereum_network, address, block_number in (
+            (
+                EthereumNetwork.CRONOS_ZKEVM_TESTNET,
+                "0xB00ce5CCcdEf57e539ddcEd01DF43a13855d9910",
+                19013,
+            ),
+            (
+                EthereumNetwork.ETHEREAL_TESTNET,
+                "0xd9Db270c1B5E3Bd161E8c8503c55cEABeE709552",
+                102779,
+            ),
+            (
+                EthereumNetwork.ETHEREAL_TESTNET,
+                "0x41675C099F32341bf84BFc5382aF534df5C7461a",
+                74171,
+            ),
+        ):
+            with self.subTest(ethereum_network=ethereum_network, address=address):
+                self.assertEqual(
+                    get_singleton_deployment(address).get_deployment_block(
+                        ethereum_network.value
+                    ),
+                    block_number,
+                )
+                self.assertEqual(
+                    get_master_copy(ethereum_network, address)[1], block_number
+                )
+
+        for ethereum_network, address, block_number in (
+            (
+                EthereumNetwork.CRONOS_ZKEVM_TESTNET,
+                "0xDAec33641865E4651fB43181C6DB6f7232Ee91c2",
+                18997,
+            ),
+            (
+                EthereumNetwork.ETHEREAL_TESTNET,
+                "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
+                102765,
+            ),
+        ):
+            with self.subTest(ethereum_network=ethereum_network, address=address):
+                self.assertEqual(
+                    get_proxy_factory(ethereum_network, address),
+                    (address, block_number),
+                )
+
+        for ethereum_network, master_copies in MASTER_COPIES.items():
+            for address, _, _ in master_copies:
+                self.assertEqual(
+                    get_master_copy(ethereum_network, address)[1],
+                    min(
+                        master_copy[1]
+                        for master_copy in master_copies
+                        if master_copy[0] == address
+                    ),
+                )
+
+    def test_is_l2(self):
+        for address in get_safe_deployment_addresses("SafeToL2Setup", "1.4.1"):
+            for deployment in lookup(address):
+                self.assertFalse(deployment.is_l2)
+                self.assertEqual(deployment.extended_version, "1.4.1")
+        for address in get_safe_deployment_addresses("SafeL2", "1.4.1"):
+            self.assertTrue(get_singleton_deployment(address).is_l2)
+
+    def test_get_singletons(self):
+        self.assertEqual(get_singletons(-1), ())
+        singletons = get_singletons(EthereumNetwork.MAINNET.value)
+        self.assertEqual(
+            {singleton.address for singleton in singletons},
+            {master_copy[0] for master_copy in MASTER_COPIES[EthereumNetwork.MAINNET]}
+            | {
+                address
+                for contract_name in ("GnosisSafe", "GnosisSafeL2")
+                for address in get_safe_deployment_addresses(contract_name, "1.3.0", 1)
+            },
+        )
+        for singleton in singletons:
+            self.assertTrue(singleton.is_singleton)
+
+        proxy_factories = get_proxy_factories(EthereumNetwork.MAINNET.value)
+        self.assertIn(
+            "0xa6B71E26C5e0845f74c812102Ca7114b6a896AB2",
+            [proxy_factory.address for proxy_factory in proxy_factories],
+        )
+        for proxy_factory in proxy_factories:
+            self.assertTrue(proxy_factory.is_proxy_factory)
+
+    def test_detect_version(self):
+        ethereum_client = MagicMock()
+        for master_copy, expected_version in (
+            ("0x3E5c63644E683549055b9Be8653de26E0B4CD36E", "1.3.0"),
+            ("0x41675C099F32341bf84BFc5382aF534df5C7461a", "1.4.1"),
+            ("0x2CB0ebc503dE87CFD8f0eCEED8197bF7850184ae", "1.1.1"),
+        ):
+            with self.subTest(master_copy=master_copy):
+                self.assertEqual(
+                    Safe.detect_version(
+                        "0x5aC255889882aCd3da2aA939679E3f3d4cea221e",
+                        ethereum_client,
+                        master_copy=master_copy,
+                    ),
+                    expected_version,
+                )
+        self.assertEqual(ethereum_client.mock_calls, [])
+
+        self.assertEqual(
+            ProxyFactory.detect_version_from_address(
+                "0xC22834581EbC8527d974F8a1c97E1bEA4EF910BC"
+            ),
+            "1.3.0",
+        )
+        with self.assertRaisesRegex(ValueError, "Unknown ProxyFactory address"):
+            ProxyFactory.detect_version_from_address(
+                "0x3E5c63644E683549055b9Be8653de26E0B4CD36E"
+            )
@@ -1,6 +1,9 @@
 import asyncio
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence
+from unittest import mock
 
 from django.test import TestCase
 
@@ -12,6 +15,9 @@ from eth_account.messages import defunct_hash_message
 from hexbytes import HexBytes
 from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
 
+from safe_eth.eth import EthereumClient
+from safe_eth.eth.ethereum_client import BatchCallManager
+from safe_eth.eth.tests.test_ethereum_client import UNREACHABLE_NODE_URL
 from safe_eth.eth.utils import (
     fast_bytes_to_checksum_address,
     fast_keccak,
@@ -21,6 +27,7 @@ from safe_eth.eth.utils import (
 
 from ...eth.contracts import (
     get_compatibility_fallback_handler_contract,
+    get_compatibility_fallback_handler_V1_4_1_contract,
     get_sign_message_lib_contract,
 )
 from ...eth.tests.ethereum_test_case import EthereumTestCaseMixin
@@ -39,8 +46,9 @@ from ..safe_signature import (
     SafeSignatureP256,
     SafeSignatureP256Async,
     SafeSignatureType,
+    _recover_owner,
 )
-from ..signatures import signature_to_bytes
+from ..signatures import get_signing_address, signature_to_bytes
 from .safe_test_case import SafeTestCaseMixin
 
 logger = logging.getLogger(__name__)
@@ -437,6 +445,241 @@ class TestSafeSignatureP256(TestCase):
         self.assertTrue(asyncio.run(parsed.is_valid()))
 
 
+class TestSafeSignatureParse(TestCase):
+    def build_signatures(self, safe_hash: bytes):
+        """
+        :return: EOA, eth_sign and contract signatures for ``safe_hash`` and their owners
+        """
+        eoa_account, eth_sign_account = Account.create(), Account.create()
+        contract_owner = Account.create().address
+        eth_sign_signature = eth_sign_account.unsafe_sign_hash(
+            defunct_hash_message(primitive=safe_hash)
+        )["signature"]
+        signatures = SafeSignature.export_signatures(
+            [
+                SafeSignatureEOA(
+                    eoa_account.unsafe_sign_hash(safe_hash)["signature"], safe_hash
+                ),
+                SafeSignatureEthSign(
+                    eth_sign_signature[:64] + bytes([eth_sign_signature[64] + 4]),
+                    safe_hash,
+                ),
+                SafeSignatureContract.from_values(
+                    contract_owner, safe_hash, safe_hash, b"contract signature"
+                ),
+            ]
+        )
+        return signatures, {
+            eoa_account.address,
+            eth_sign_account.address,
+            contract_owner,
+        }
+
+    def test_parse_signature_memoryview(self):
+        safe_hash = fast_keccak_text("test")
+        signatures, owners = self.build_signatures(safe_hash)
+        for safe_signature_cls in (SafeSignature, SafeSignatureAsync):
+            with self.subTest(safe_signature_cls=safe_signature_cls):
+                safe_signatures = safe_signature_cls.parse_signature(
+                    memoryview(signatures), safe_hash
+                )
+                self.assertEqual(
+                    [
+                        (
+                            safe_signature.signature_type,
+                            safe_signature.signature,
+                            safe_signature.owner,
+                        )
+                        for safe_signature in safe_signatures
+                    ],
+                    [
+                        (
+                            safe_signature.signature_type,
+                            safe_signature.signature,
+                            safe_signature.owner,
+                        )
+                        for safe_signature in safe_signature_cls.parse_signature(
+                            signatures, safe_hash
+                        )
+                    ],
+                )
+                self.assertEqual(
+                    {safe_signature.owner for safe_signature in safe_signatures},
+                    owners,
+                )
+                (contract_signature,) = [
+                    safe_signature
+                    for safe_signature in safe_signatures
+                    if safe_signature.signature_type
+                    == SafeSignatureType.CONTRACT_SIGNATURE
+                ]
+                self.assertEqual(
+                    contract_signature.contract_signature, b"contract signature"
+                )
+                for safe_signature in safe_signatures:
+                    self.assertFalse(hasattr(safe_signature, "__dict__"))
+
+        with self.assertRaisesMessage(
+            ValueError, "Signature must be at least 65 bytes"
+        ):
+            SafeSignature.parse_signature(
+                memoryview(signatures[:64]), safe_hash, ignore_trailing=False
+            )
+
+    def test_recover_owners(self):
+        safe_hash = fast_keccak_text("test")
+        signatures, owners = self.build_signatures(safe_hash)
+        _recover_owner.cache_clear()
+        with mock.patch(
+            "safe_eth.safe.safe_signature.get_signing_address",
+            wraps=get_signing_address,
+        ) as get_signing_address_mock:
+            safe_signatures = SafeSignature.parse_signature(signatures, safe_hash)
+            self.assertEqual(
+                set(SafeSignature.recover_owners(safe_signatures)),
+                owners,
+            )
+            # Only EOA and eth_sign signatures require `ecrecover`
+            self.assertEqual(get_signing_address_mock.call_count, 2)
+            # Owners are memoized on the signatures
+            self.assertEqual(
+                {safe_signature.owner for safe_signature in safe_signatures}, owners
+            )
+            self.assertEqual(get_signing_address_mock.call_count, 2)
+            # And for the same hash and signature
+            for safe_signature in SafeSignature.parse_signature(signatures, safe_hash):
+                self.assertIn(safe_signature.owner, owners)
+            self.assertEqual(get_signing_address_mock.call_count, 2)
+
+        safe_signatures = SafeSignature.parse_signature(signatures, safe_hash)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(
+                SafeSignature.recover_owners(safe_signatures, executor=executor),
+                [safe_signature.owner for safe_signature in safe_signatures],
+            )
+        self.assertEqual(SafeSignature.recover_owners([]), [])
+
+
+class TestSafeSignatureIsValidMany(TestCase):
+    """EIP1271 validation using JSON RPC batch requests, no node needed for these tests."""
+
+    def setUp(self):
+        self.valid_owner = Account.create().address  # Implements updated EIP1271
+        self.legacy_owner = Account.create().address  # Implements legacy EIP1271
+        self.invalid_owner = Account.create().address  # Not a contract
+        self.safe_hash = fast_keccak_text("test")
+        self.safe_hash_preimage = b"test preimage"
+        self.contract_signature = HexBytes("0x1234")
+        self.is_valid_signature_data = {
+            self.valid_owner: get_compatibility_fallback_handler_contract(
+                Web3(), self.valid_owner
+            )
+            .get_function_by_signature("isValidSignature(bytes32,bytes)")(
+                self.safe_hash, self.contract_signature
+            )
+            ._encode_transaction_data(),
+            self.legacy_owner: get_compatibility_fallback_handler_V1_4_1_contract(
+                Web3(), self.legacy_owner
+            )
+            .get_function_by_signature("isValidSignature(bytes,bytes)")(
+                self.safe_hash_preimage, self.contract_signature
+            )
+            ._encode_transaction_data(),
+        }
+
+    def eth_call(self, tx_params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        :return: JSON RPC response for ``isValidSignature`` ``eth_call``
+        """
+        if tx_params["to"] == self.invalid_owner:
+            return {"error": {"code": -32000, "message": "execution reverted"}}
+        if self.is_valid_signature_data[tx_params["to"]] == tx_params["data"]:
+            return {
+                "result": HexBytes(
+                    encode_abi(
+                        ["bytes4"], [SafeSignatureContract.EIP1271_MAGIC_VALUE_UPDATED]
+                    )
+                ).to_0x_hex()
+            }
+        return {"result": HexBytes(encode_abi(["bytes4"], [b"\0" * 4])).to_0x_hex()}
+
+    def batch_call_chunk(self, chunk: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {"jsonrpc": "2.0", "id": query["id"], **self.eth_call(query["params"][0])}
+            for query in chunk
+        ]
+
+    def build_signatures(self, contract_signature_cls, eoa_signature_cls) -> List:
+        eoa_account = Account.create()
+        return [
+            contract_signature_cls.from_values(
+                owner, self.safe_hash, self.safe_hash_preimage, self.contract_signature
+            )
+            for owner in (self.valid_owner, self.invalid_owner)
+        ] + [
+            eoa_signature_cls(
+                eoa_account.unsafe_sign_hash(self.safe_hash)["signature"],
+                self.safe_hash,
+            ),
+            contract_signature_cls.from_values(
+                self.legacy_owner,
+                self.safe_hash,
+                self.safe_hash_preimage,
+                self.contract_signature,
+            ),
+        ]
+
+    def test_is_valid_many(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        self.assertEqual(SafeSignature.is_valid_many([], ethereum_client), [])
+        signatures = self.build_signatures(SafeSignatureContract, SafeSignatureEOA)
+        with mock.patch.object(
+            BatchCallManager, "_batch_call_chunk", side_effect=self.batch_call_chunk
+        ) as batch_call_chunk_mock:
+            self.assertEqual(
+                SafeSignature.is_valid_many(signatures, ethereum_client),
+                [True, False, True, True],
+            )
+        # Both `isValidSignature` variants for every contract signature in one batch
+        batch_call_chunk_mock.assert_called_once()
+        self.assertEqual(len(batch_call_chunk_mock.call_args.args[0]), 6)
+
+    def test_is_valid_many_async(self):
+        web3 = AsyncWeb3(AsyncHTTPProvider(UNREACHABLE_NODE_URL))
+        signatures = self.build_signatures(
+            SafeSignatureContractAsync, SafeSignatureEOAAsync
+        )
+
+        async def make_batch_request(requests):
+            return [self.eth_call(params[0]) for _, params in requests]
+
+        with mock.patch.object(
+            web3.provider, "make_batch_request", side_effect=make_batch_request
+        ) as make_batch_request_mock:
+            self.assertEqual(
+                asyncio.run(SafeSignatureAsync.is_valid_many(signatures, web3)),
+                [True, False, True, True],
+            )
+        make_batch_request_mock.assert_called_once()
+
+        # Provider not supporting batch requests, `is_valid` is used for every signature
+        with (
+            mock.patch.object(
+                web3.provider,
+                "make_batch_request",
+                side_effect=NotImplementedError,
+            ),
+            mock.patch.object(
+                SafeSignatureContractAsync, "is_valid", return_value=True
+            ) as is_valid_mock,
+        ):
+            self.assertEqual(
+                asyncio.run(SafeSignatureAsync.is_valid_many(signatures, web3)),
+                [True, True, True, True],
+            )
+        self.assertEqual(is_valid_mock.call_count, 3)
+
+
 class TestSafeContractSignature(SafeTestCaseMixin, TestCase):
     def test_contract_signature_for_message(self):
         (
@@ -653,6 +896,17 @@ class TestSafeContractSignature(SafeTestCaseMixin, TestCase):
         )[0]
         self.assertEqual(contract_signature, safe_signature.contract_signature)
         self.assertTrue(safe_signature.is_valid(self.ethereum_client, None))
+        self.assertEqual(
+            SafeSignature.is_valid_many(
+                [
+                    safe_signature,
+                    SafeSignature.parse_signature(signature, safe_tx_hash)[0],
+                    SafeSignature.parse_signature(signature, safe_tx_hash_2)[0],
+                ],
+                self.ethereum_client,
+            ),
+            [True, True, False],
+        )
 
     def test_contract_multiple_signatures_deprecated(self):
         """
@@ -1078,6 +1332,21 @@ class TestSafeContractSignatureAsync(AsyncSignatureTestMixin, SafeTestCaseMixin)
         )[0]
         self.assertEqual(contract_signature, safe_signature.contract_signature)
         self.assertTrue(self._is_valid_async(safe_signature, None))
+        self.assertEqual(
+            self._run_async(
+                SafeSignatureAsync.is_valid_many(
+                    [
+                        safe_signature,
+                        SafeSignatureAsync.parse_signature(signature, safe_tx_hash)[0],
+                        SafeSignatureAsync.parse_signature(signature, safe_tx_hash_2)[
+                            0
+                        ],
+                    ],
+                    self.async_w3,
+                )
+            ),
+            [True, True, False],
+        )
 
     def test_contract_multiple_signatures_deprecated(self):
         """
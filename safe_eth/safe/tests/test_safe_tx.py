@@ -1,16 +1,20 @@
 import logging
+from unittest import mock
 
 from django.test import TestCase
 
 from eth_account import Account
 from hexbytes import HexBytes
 
+from ...eth import EthereumClient
+from ...eth.eip712 import eip712_encode_hash
+from ...eth.tests.test_ethereum_client import UNREACHABLE_NODE_URL
 from ...eth.utils import get_empty_tx_params
 from ...util.util import to_0x_hex_str
 from ..enums import SafeOperationEnum
 from ..exceptions import NotEnoughSafeTransactionGas, SignaturesDataTooShort
 from ..multi_send import MultiSendOperation, MultiSendTx
-from ..safe_tx import SafeTx
+from ..safe_tx import SafeTx, compute_safe_tx_hashes
 from .safe_test_case import SafeTestCaseMixin
 
 logger = logging.getLogger(__name__)
@@ -467,3 +471,115 @@ class TestSafeTx(SafeTestCaseMixin, TestCase):
             safe_nonce,
         ).call()
         self.assertEqual(HexBytes(expected_hash), safe_tx_hash)
+
+
+class TestSafeTxHash(TestCase):
+    """``safe_tx_hash`` calculation, no node needed for these tests."""
+
+    def build_safe_tx(self, ethereum_client: EthereumClient, **kwargs) -> SafeTx:
+        params = {
+            "safe_address": Account.create().address,
+            "to": Account.create().address,
+            "value": 5212459,
+            "data": HexBytes("0x1212"),
+            "operation": 1,
+            "safe_tx_gas": 123456,
+            "base_gas": 122,
+            "gas_price": 12345,
+            "gas_token": Account.create().address,
+            "refund_receiver": Account.create().address,
+            "safe_nonce": 10789,
+            "safe_version": "1.3.0",
+            "chain_id": 1,
+        }
+        params.update(kwargs)
+        return SafeTx(ethereum_client, **params)
+
+    def test_safe_tx_hash(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        for safe_version in ("0.1.0", "1.0.0", "1.1.1", "1.3.0", "1.4.1", "1.5.0"):
+            with self.subTest(safe_version=safe_version):
+                safe_tx = self.build_safe_tx(ethereum_client, safe_version=safe_version)
+                self.assertEqual(
+                    safe_tx.safe_tx_hash,
+                    eip712_encode_hash(safe_tx.eip712_structured_data),
+                )
+
+        # Same as `test_hash_safe_multisig_tx_1_3`
+        safe_tx = SafeTx(
+            ethereum_client,
+            "0x2B0b9cBDA3D7b0F760187c52A8FFB18C48E5d96A",
+            "0x79613FD49472C3C7a32188e45ff00e7bdC8a897d",
+            2,
+            HexBytes("0x1212"),
+            0,
+            0,
+            0,
+            0,
+            "0xFA995c7a0d32A4e7497508a5C380369BE8dB49Db",
+            "0x6b92f5E5360bfCa8F5d3FcE65D87382967847983",
+            safe_nonce=17,
+            safe_version="1.3.0",
+            chain_id=4,
+        )
+        self.assertEqual(
+            safe_tx.safe_tx_hash,
+            HexBytes(
+                "0x01d42a801ac44d3ebd43592be980dea0756d7f7b27d718d3016a42ea7ce85587"
+            ),
+        )
+
+    def test_safe_tx_hash_memoized(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        safe_tx = self.build_safe_tx(ethereum_client)
+        safe_tx_hash = safe_tx.safe_tx_hash
+        with mock.patch(
+            "safe_eth.safe.safe_tx.fast_keccak", side_effect=AssertionError
+        ):
+            self.assertEqual(safe_tx.safe_tx_hash, safe_tx_hash)
+            self.assertEqual(safe_tx.signers, [])
+
+        # Changing a field invalidates the hash
+        for field, value in (
+            ("value", 1),
+            ("data", HexBytes("0x34")),
+            ("data", "0x1234"),
+            ("value", "2"),
+            ("to", Account.create().address),
+            ("safe_nonce", 1),
+            ("chain_id", 5),
+            ("safe_version", "1.1.1"),
+        ):
+            with self.subTest(field=field):
+                setattr(safe_tx, field, value)
+                self.assertNotEqual(safe_tx.safe_tx_hash, safe_tx_hash)
+                self.assertEqual(
+                    safe_tx.safe_tx_hash,
+                    eip712_encode_hash(safe_tx.eip712_structured_data),
+                )
+                safe_tx_hash = safe_tx.safe_tx_hash
+
+    def test_compute_safe_tx_hashes(self):
+        ethereum_client = EthereumClient(UNREACHABLE_NODE_URL)
+        safe_txs = [
+            self.build_safe_tx(ethereum_client, chain_id=None, safe_nonce=nonce)
+            for nonce in range(3)
+        ] + [
+            self.build_safe_tx(ethereum_client, chain_id=None, safe_version="1.1.1"),
+            self.build_safe_tx(ethereum_client, chain_id=10),
+        ]
+        with mock.patch.object(
+            EthereumClient, "get_chain_id", return_value=5
+        ) as get_chain_id_mock:
+            safe_tx_hashes = compute_safe_tx_hashes(safe_txs)
+        get_chain_id_mock.assert_called_once()
+        self.assertEqual(
+            safe_tx_hashes,
+            [
+                eip712_encode_hash(safe_tx.eip712_structured_data)
+                for safe_tx in safe_txs
+            ],
+        )
+        self.assertEqual(safe_txs[0].chain_id, 5)
+        self.assertEqual(safe_txs[-1].chain_id, 10)
+        self.assertEqual(compute_safe_tx_hashes([]), [])
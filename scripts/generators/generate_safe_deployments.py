@@ -3,8 +3,9 @@ import logging
 import os
 import shutil
 from contextlib import contextmanager
-from typing import Dict, List
+from typing import Any, Dict, List
 
+from eth_utils import to_checksum_address
 from git import Repo
 
 logging.basicConfig(level=logging.INFO)
@@ -17,8 +18,8 @@ SAFE_DEPLOYMENTS_FOLDER = (
 )  # folder where the deployments are
 CURRENT_DIRECTORY = os.path.dirname(__file__)
 SAFE_ETH_PY_DEPLOYMENTS_FILE = os.path.join(
-    CURRENT_DIRECTORY, "../../safe_eth/safe/safe_deployments.py"
-)  # deployment dictionary to be stored
+    CURRENT_DIRECTORY, "../../safe_eth/safe/safe_deployments.json"
+)  # deployments file to be stored
 
 
 def clean_resources():
@@ -40,58 +41,70 @@ def get_safe_deployments(*args, **kwds):
         clean_resources()
 
 
-def get_network_addresses_by_chain(safe_deployment: Dict) -> Dict[str, List[str]]:
+def get_compact_deployment(safe_deployment: Dict) -> Dict[str, Any]:
     """
-    Generates a dictionary mapping chains to their respective addresses.
+    Generates the compact representation of a deployment, with every address checksummed:
+    the default ``addresses`` and, for every chain, the indexes of the addresses deployed there.
     Translates address types to actual addresses from the safe_deployment dictionary.
 
     :param safe_deployment:
-    :return: a dictionary of chains with lists of corresponding addresses.
+    :return: a dictionary with ``addresses`` and ``chains``
     """
-    network_addresses_by_chain = {}
+    # Ignoring if is canonical, eip155 or zksync
+    addresses: List[str] = [
+        to_checksum_address(address_dict["address"])
+        for address_dict in safe_deployment["deployments"].values()
+    ]
+    chains: Dict[str, List[int]] = {}
 
     # Applying list because networkAddresses is not list for all networks
     for chain_id, address_types in safe_deployment["networkAddresses"].items():
-        addresses: List[str] = []
         if not isinstance(address_types, list):
             address_types = [address_types]
+        indexes: List[int] = []
         for address_type in address_types:
-            address = safe_deployment["deployments"][address_type]["address"]
-            addresses.append(address)
+            address = to_checksum_address(
+                safe_deployment["deployments"][address_type]["address"]
+            )
+            if address not in addresses:
+                addresses.append(address)
+            indexes.append(addresses.index(address))
 
-        network_addresses_by_chain[chain_id] = addresses
+        chains[chain_id] = indexes
 
-    return network_addresses_by_chain
+    return {"addresses": addresses, "chains": chains}
 
 
-def get_default_network_addresses(deployments: Dict) -> List[str]:
+def dump_safe_deployments(safe_deployments: Dict[str, Dict[str, Dict]]) -> str:
     """
-    Get default safe addresses from the provided deployments dict.
-
-    :param deployments:
-    :return: list of addresses
+    :param safe_deployments: Version -> Contract name -> Compact deployment
+    :return: JSON with one line for the addresses and other for the chains of every deployment,
+        so it's compact but changes are still easy to review
     """
-    addresses: List[str] = []
-
-    # Ignoring if is canonical, eip155 or zksync
-    for _, address_dict in deployments.items():
-        addresses.append(address_dict["address"])
-
-    return addresses
+    versions = []
+    for version, contracts in safe_deployments.items():
+        deployments = []
+        for contract_name, deployment in contracts.items():
+            deployments.append(
+                f"        {json.dumps(contract_name)}: {{\n"
+                f'            "addresses": {json.dumps(deployment["addresses"])},\n'
+                f'            "chains": {json.dumps(deployment["chains"])}\n'
+                "        }"
+            )
+        versions.append(
+            f"    {json.dumps(version)}: {{\n" + ",\n".join(deployments) + "\n    }"
+        )
+    return "{\n" + ",\n".join(versions) + "\n}\n"
 
 
 def generate_safe_deployments_py():
     """
-    Get safe deployments addresses from https://github.com/safe-global/safe-deployments/ and generate python dictionary file
+    Get safe deployments addresses from https://github.com/safe-global/safe-deployments/ and generate
+    the JSON file loaded by ``safe_eth.safe.safe_deployments``
     """
 
-    # Store the version with list of addresses
-    safe_deployments: Dict[str, Dict[str, Dict[str, List[str]]]] = (
-        {}
-    )  # Version -> Contract name -> ChainId -> List of addresses
-    default_safe_addresses: Dict[str, Dict[str, List[str]]] = (
-        {}
-    )  # Version -> Contract name -> List of addresses
+    # Version -> Contract name -> Compact deployment
+    safe_deployments: Dict[str, Dict[str, Dict[str, Any]]] = {}
     # Clone repo
     with get_safe_deployments() as repo:
         logging.info(
@@ -103,20 +116,11 @@ def generate_safe_deployments_py():
                 repo_safe_deployment = json.load(open(os.path.join(root, filename)))
                 safe_deployments.setdefault(repo_safe_deployment["version"], {})[
                     repo_safe_deployment["contractName"]
-                ] = get_network_addresses_by_chain(repo_safe_deployment)
-                default_safe_addresses.setdefault(repo_safe_deployment["version"], {})[
-                    repo_safe_deployment["contractName"]
-                ] = get_default_network_addresses(repo_safe_deployment["deployments"])
+                ] = get_compact_deployment(repo_safe_deployment)
 
         # Write file
         with open(SAFE_ETH_PY_DEPLOYMENTS_FILE, "w") as file:
-            file.write(
-                "safe_deployments = " + json.dumps(safe_deployments, indent=4) + "\n"
-            )
-            file.write(
-                "default_safe_deployments = "
-                + json.dumps(default_safe_addresses, indent=4)
-            )
+            file.write(dump_safe_deployments(safe_deployments))
 
 
 if __name__ == "__main__":